@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Offline rendering of many independent voices with 1, 2 and 4 processing threads.
+
+Each voice (SineLoop -> Biquad -> Delay) is an independent chain of the streams
+graph, so the voices can be computed in parallel. The rendered files should be
+identical, only the rendering time changes. Launch this script from a terminal.
+
+"""
+import time
+from pyo import *
+
+VOICES = 64
+DUR = 10
+
+def render(threads):
+    s = Server(audio="offline", nchnls=2, threads=threads).boot()
+    s.setGlobalSeed(1)
+    s.recordOptions(dur=DUR, filename="parallel_voices_%d.wav" % threads)
+    lfo = Sine(freq=.3, mul=200, add=400)
+    voices = []
+    for i in range(VOICES):
+        src = SineLoop(freq=lfo*(1+i*0.01), feedback=0.05, mul=0.005)
+        filt = Biquad(src, freq=1000+i*10, q=2)
+        voices.append(Delay(filt, delay=0.01*(i+1), feedback=0.3).out(i%2))
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.shutdown()
+    return elapsed
+
+for threads in [1, 2, 4]:
+    print "%d thread(s): %.3f seconds for %d seconds of audio" % (threads, render(threads), DUR)
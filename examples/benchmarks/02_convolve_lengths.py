@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Offline rendering time of Convolve for impulse responses of 256 to 262144 samples.
+
+Convolve computes the first block of the impulse response directly and the
+remaining of it with uniformly partitioned FFT convolution, so the cost grows
+slowly with the impulse length. Launch this script from a terminal.
+
+"""
+import time, random
+from pyo import *
+
+DUR = 5
+
+def render(size):
+    s = Server(audio="offline", nchnls=1).boot()
+    s.recordOptions(dur=DUR, filename="convolve_%d.wav" % size)
+    # Exponentially decaying noise as impulse response.
+    decay = 1.0 / size
+    imp = [random.uniform(-1, 1) * pow(0.001, i * decay) for i in range(size)]
+    table = DataTable(size, init=imp)
+    src = Noise(.5)
+    conv = Convolve(src, table, size=size, mul=.01).out()
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.shutdown()
+    return elapsed
+
+for i in range(8, 19, 2):
+    size = 2 ** i
+    print "impulse of %6d samples: %.3f seconds for %d seconds of audio" % (size, render(size), DUR)
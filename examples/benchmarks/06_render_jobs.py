@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Jobs per minute of render_jobs versus one script launched per soundfile.
+
+The usual way to render many stems is to launch a python interpreter for
+each of them, paying for interpreter startup, pyo import and server boot
+every time. render_jobs keeps a pool of warmed-up workers, each one
+reusing its offline server from job to job. Launch this script from a
+terminal.
+
+"""
+import os, sys, time, tempfile, subprocess
+from pyo import *
+
+NUM_JOBS = 40
+DUR = 2
+OUTDIR = tempfile.mkdtemp()
+
+SCRIPT = """
+from pyo import *
+s = Server(audio="offline").boot()
+s.setVerbosity(5)
+s.recordOptions(dur=%f, filename=%r)
+a = SuperSaw(freq=[%f, %f], detune=.6, mul=.2)
+b = Freeverb(a, size=.8).out()
+s.start()
+"""
+
+def stem(freq):
+    a = SuperSaw(freq=[freq, freq * 1.01], detune=.6, mul=.2)
+    b = Freeverb(a, size=.8).out()
+    return a, b
+
+def freq(i):
+    return 100 + i * 10
+
+def one_script_per_job():
+    path = os.path.join(OUTDIR, "job.py")
+    for i in range(NUM_JOBS):
+        f = open(path, "w")
+        f.write(SCRIPT % (DUR, os.path.join(OUTDIR, "script_%d.wav" % i), freq(i), freq(i) * 1.01))
+        f.close()
+        subprocess.call([sys.executable, path])
+
+def progress(index, result):
+    filename, elapsed, error = result
+    if error != None:
+        print error
+
+if __name__ == "__main__":
+    t = time.time()
+    one_script_per_job()
+    elapsed = time.time() - t
+    print "one script per job: %6.1f jobs/minute" % (NUM_JOBS * 60 / elapsed)
+
+    jobs = [{"func": stem, "args": (freq(i),), "dur": DUR,
+             "filename": os.path.join(OUTDIR, "batch_%d.wav" % i)} for i in range(NUM_JOBS)]
+    for processes in [1, 2, 4]:
+        t = time.time()
+        render_jobs(jobs, processes=processes, callback=progress)
+        elapsed = time.time() - t
+        print "render_jobs, %d processes: %6.1f jobs/minute" % (processes, NUM_JOBS * 60 / elapsed)
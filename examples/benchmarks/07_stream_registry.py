@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Creation and destruction of 100000 short-lived objects.
+
+Every audio object registers its stream in the server when it is created
+and removes it when it is deleted. The server keeps its streams in a slot
+array indexed by stream id, so both operations take constant time however
+many objects are already alive. Launch this script from a terminal.
+
+"""
+import time, random
+from pyo import *
+
+NUM = 100000
+
+s = Server(audio="offline").boot()
+
+for alive in [0, 1000, 10000]:
+    background = [Sig(0) for i in range(alive)]
+
+    # Objects are deleted right after their creation (the newest stream).
+    t = time.time()
+    for i in range(NUM):
+        a = Sig(0)
+        del a
+    newest = time.time() - t
+
+    # A pool of voices is kept and a random one is replaced at each step.
+    voices = [Sig(0) for i in range(100)]
+    t = time.time()
+    for i in range(NUM):
+        voices[random.randint(0, 99)] = Sig(0)
+    randomly = time.time() - t
+
+    print "%5d streams alive: newest deleted %.3f sec, random voice replaced %.3f sec" % (alive, newest, randomly)
+    del background, voices
+
+s.shutdown()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Rendering time of a large polyphonic patch with and without the pull mode.
+
+Each voice is a SuperSaw oscillator through a Biquadx filter, the filter
+being multiplied by an Adsr envelope. Only a few voices are playing at a
+time, the envelopes of the other ones are at rest. In pull mode, the server
+puts the filters with a silent envelope to sleep, and the oscillators only
+read by these filters are not computed at all. Launch this script from a
+terminal.
+
+"""
+import time, random
+from pyo import *
+
+NUM_VOICES = 200
+DUR = 10
+
+def render(pull):
+    s = Server(audio="offline").boot()
+    s.setPullMode(pull)
+    random.seed(1)
+    envs, voices = [], []
+    for i in range(NUM_VOICES):
+        env = Adsr(attack=.01, decay=.1, sustain=.5, release=.2, dur=.4)
+        osc = SuperSaw(freq=random.uniform(100, 800), detune=.6)
+        filt = Biquadx(osc, freq=random.uniform(1000, 4000), stages=4, mul=env)
+        envs.append(env)
+        voices.append((osc, filt))
+    mix = Mix([filt for osc, filt in voices], voices=2, mul=.2)
+    rev = Freeverb(mix, size=.8).out()
+
+    def note():
+        random.choice(envs).play()
+
+    pat = Pattern(note, time=.05).play()
+    s.recordOptions(dur=DUR, filename="pull_mode_%d.wav" % pull)
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.shutdown()
+    return elapsed
+
+for pull in [False, True]:
+    print "pull mode %-5s: %.3f sec to render %d seconds" % (pull, render(pull), DUR)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Overhead of the profiler and example of its report.
+
+The same patch is rendered without the profiler, with the profiler and
+with the profiler recording a trace. The report of the last run is printed
+and its trace saved in profile_trace.json, which can be opened in
+chrome://tracing. Launch this script from a terminal.
+
+"""
+import time, random
+from pyo import *
+
+DUR = 10
+
+def render(mode):
+    s = Server(audio="offline").boot()
+    random.seed(1)
+    oscs = [SuperSaw(freq=random.uniform(100, 800), detune=.6, mul=.01) for i in range(50)]
+    filts = [Biquadx(osc, freq=random.uniform(1000, 4000), stages=2) for osc in oscs]
+    rev = WGVerb(Mix(filts, voices=2), feedback=.8).out()
+    if mode > 0:
+        s.startProfiling(trace=(mode == 2), events=1000000)
+    s.recordOptions(dur=DUR, filename="profiler_%d.wav" % mode)
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    if mode == 2:
+        print s.getProfileReport(10)
+        s.writeProfileTrace("profile_trace.json")
+    s.shutdown()
+    return elapsed
+
+times = [render(mode) for mode in range(3)]
+print
+print "without profiler: %.3f sec" % times[0]
+print "with profiler   : %.3f sec" % times[1]
+print "with trace      : %.3f sec" % times[2]
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Number of streams while an expression is rebuilt one million times.
+
+A callback that reassigns the frequency and the amplitude of an oscillator
+with arithmetic expressions creates new Dummy objects at each call. A Dummy
+is released as soon as it is no more referenced, read by another object or
+sent to the output, so the number of streams computed by the server stays
+the same however many times the expression is evaluated. Launch this script
+from a terminal.
+
+"""
+import time
+from pyo import *
+
+NUM = 1000000
+
+s = Server(audio="offline").boot()
+
+lfo = Sine(freq=.2)
+env = Sine(freq=4)
+osc = Sine(freq=200)
+
+t = time.time()
+for i in range(NUM):
+    osc.setFreq(lfo * 100 + 200 + (i % 4) * 50)
+    osc.setMul((env * .5 + .5) * .2)
+    if (i + 1) % (NUM / 10) == 0:
+        print "%7d evaluations: %3d streams, %.3f sec" % (i + 1, s.getNumberOfStreams(), time.time() - t)
+
+s.shutdown()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost of slow python callbacks for the audio thread, with and without the dispatcher.
+
+A Pattern calls a function every 20 milliseconds. The function spends 2
+milliseconds waiting on i/o (simulated with time.sleep), as a function
+sending network messages or writing to a file would. Called synchronously,
+it stalls every buffer in which it is triggered. With asynchronous
+callbacks, the audio thread only queues it and the dispatcher thread waits
+instead. The server renders with the non-blocking offline mode, faster
+than real time, so the callbacks are late compared to the rendering. The
+heaviest buffer is given by the profiler. Launch this script from a
+terminal.
+
+"""
+import time
+from pyo import *
+
+DUR = 10
+
+def render(async):
+    s = Server(audio="offline_nb").boot()
+    s.setAsyncCallbacks(async)
+    s.recordOptions(dur=DUR, filename="async_callbacks_%d.wav" % async)
+    a = SuperSaw(freq=[100, 101], detune=.6, mul=.2)
+    b = Freeverb(a, size=.8).out()
+
+    def io():
+        time.sleep(.002)
+
+    pat = Pattern(io, time=.02).play()
+    s.startProfiling()
+    t = time.time()
+    s.start()
+    while s.getIsStarted():
+        time.sleep(.01)
+    elapsed = time.time() - t
+    # Rendering is faster than real time, wait for the queued callbacks.
+    while s.getCallbackStats()["depth"] > 0:
+        time.sleep(.01)
+    profile = s.getProfile()
+    stats = s.getCallbackStats()
+    s.shutdown()
+    return elapsed, profile["maxload"], stats
+
+for async in [False, True]:
+    elapsed, maxload, stats = render(async)
+    print "async callbacks %-5s: %.3f sec to render %d seconds, heaviest buffer %.1f%% of its duration" % \
+          (async, elapsed, DUR, maxload)
+    if async:
+        print "    %d callbacks queued, %d late, longest delay %.3f sec" % (stats["queued"], stats["late"], stats["maxdelay"])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Tail versus mean buffer cost of 32 phase vocoders.
+
+Every PVAnal computes a whole fft frame at the sample where its input frame
+is full. Without frame balancing, the frames of all instances fall in the
+same buffers and the other buffers are almost free. With frame balancing,
+each instance is offset to the least loaded buffer of its hop, so the 99th
+percentile of the buffer cost gets closer to the mean cost, which rises a
+little since the frames are computed separately. The server renders offline
+and the buffer costs are read from the profiler trace. Launch this script
+from a terminal.
+
+"""
+import time, json
+from pyo import *
+
+DUR = 10
+VOICES = 32
+SIZE = 2048
+OLAPS = 4
+EVENTS = 500000
+
+def render(balance):
+    s = Server(audio="offline", buffersize=64).boot()
+    s.setFrameBalancing(balance)
+    s.recordOptions(dur=DUR, filename="frame_balancing_%d.wav" % balance)
+    src = Noise(.1)
+    anals = [PVAnal(src, size=SIZE, overlaps=OLAPS) for i in range(VOICES)]
+    synth = PVSynth(anals[0]).out()
+    s.startProfiling(trace=True, events=EVENTS)
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.writeProfileTrace("frame_balancing_%d.json" % balance)
+    s.shutdown()
+    f = open("frame_balancing_%d.json" % balance)
+    trace = json.load(f)["traceEvents"]
+    f.close()
+    costs = sorted([e["dur"] for e in trace if e["cat"] == "buffer"])
+    mean = sum(costs) / len(costs)
+    return elapsed, mean, costs[int(len(costs) * .99)], costs[-1]
+
+print "%d PVAnal, size %d, %d overlaps, buffer size 64" % (VOICES, SIZE, OLAPS)
+for balance in [False, True]:
+    elapsed, mean, p99, peak = render(balance)
+    print "frame balancing %-5s: %.3f sec, buffer cost mean %.0f us, p99 %.0f us (%.1f x mean), max %.0f us" % \
+          (balance, elapsed, mean, p99, p99 / mean, peak)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Creation time of a spectral patch with shared twiddle factors and windows.
+
+The twiddle factors and the windows are computed once per fft size and
+window type, and shared by every object using them. The first voice of a
+given size pays for the tables, the following ones only allocate their own
+frames. Tables are freed when the last object using them is deleted. The
+second part changes the size of all voices back and forth while another
+object holds the tables of both sizes, so no table is computed.
+Launch this script from a terminal.
+
+"""
+import time
+from pyo import *
+
+VOICES = 64
+SIZES = [1024, 4096, 16384]
+
+s = Server(audio="offline").boot()
+src = Noise(.1)
+
+for size in SIZES:
+    t = time.time()
+    first = PVAnal(src, size=size)
+    first_time = time.time() - t
+    t = time.time()
+    anals = [PVAnal(src, size=size) for i in range(VOICES - 1)]
+    synths = [PVSynth(a) for a in anals]
+    others_time = (time.time() - t) / (VOICES - 1)
+    print "size %5d: first PVAnal %.3f ms, next PVAnal + PVSynth %.3f ms per voice" % \
+          (size, first_time * 1000, others_time * 1000)
+    del first, anals, synths
+
+keep = [PVAnal(src, size=1024), PVAnal(src, size=4096)]
+anals = [PVAnal(src, size=1024) for i in range(VOICES)]
+t = time.time()
+for i in range(10):
+    for a in anals:
+        a.size = 4096
+    for a in anals:
+        a.size = 1024
+print "%d voices switching between sizes 1024 and 4096: %.3f ms per switch" % \
+      (VOICES, (time.time() - t) * 1000 / 20)
+
+s.shutdown()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost and accuracy of the control-rate coefficients of the audio-rate filters.
+
+Each filter has its frequency modulated by an audio-rate LFO. With a
+coefficient rate of 1, the coefficients are computed at every sample with
+the exact trigonometric functions. With a higher rate, they are computed
+every `coeffrate` samples, with the table-based approximations, and linearly
+interpolated in between. The cost of each filter is given by the profiler
+and the accuracy is the largest difference with the output at rate 1
+(the noise source is seeded, every render gets the same input).
+Launch this script from a terminal.
+
+"""
+from pyo import *
+
+DUR = 5
+VOICES = 16
+RATES = [1, 8, 32]
+SEED = 1234
+FILTERS = [Biquad, Biquadx, EQ, Reson, ButLP, ButHP, ButBP, ButBR, SVF, Phaser]
+
+def render(cls, rate):
+    s = Server(audio="offline").boot()
+    s.setGlobalSeed(SEED)
+    s.recordOptions(dur=DUR, filename="coeff_rate_%s_%d.wav" % (cls.__name__, rate))
+    src = Noise(.1)
+    lfo = Sine(freq=[4 + i * .1 for i in range(VOICES)], mul=800, add=1200)
+    filt = cls(src, freq=lfo)
+    filt.coeffrate = rate
+    tab = NewTable(DUR)
+    rec = TableRec(filt[0], tab).play()
+    filt.out()
+    s.startProfiling()
+    s.start()
+    profile = s.getProfile()
+    s.shutdown()
+    cost = sum([c["time"] for c in profile["classes"] if c["class"] == cls.__name__])
+    return cost, tab.getTable()
+
+print "%d voices, frequencies modulated by audio-rate LFOs, %d seconds" % (VOICES, DUR)
+for cls in FILTERS:
+    ref = None
+    for rate in RATES:
+        cost, samples = render(cls, rate)
+        if ref is None:
+            ref, refcost = samples, cost
+            print "%-8s coeffrate %2d: %.3f sec" % (cls.__name__, rate, cost)
+        else:
+            err = max([abs(a - b) for a, b in zip(ref, samples)])
+            print "%-8s coeffrate %2d: %.3f sec (%.2f x faster), max error %.6f" % \
+                  (cls.__name__, rate, cost, refcost / max(cost, 1e-9), err)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Rendering time of large Biquad banks, per stream and multichannel.
+
+A Biquad object with at least Server.getBankThreshold() streams and
+constant frequencies and Qs is computed by a single multichannel object.
+The same banks are rendered with the multichannel objects disabled
+(threshold 0), where every stream is an independent object, and enabled.
+The bank with audio-rate frequencies keeps one object per stream in both
+cases, the multichannel object being slower for it. The source is a
+deterministic FM signal and the largest difference between the two outputs
+is printed to check that the results are the same (up to the rounding of
+the normalized coefficients). Launch this script from a terminal.
+
+"""
+import time
+from pyo import *
+
+DUR = 10
+BANKS = [("Biquad", 32, lambda src, n: Biquad(src, freq=[100 * (i + 1) for i in range(n)], q=10, type=2)),
+         ("Biquad", 128, lambda src, n: Biquad(src, freq=[50 * (i + 1) for i in range(n)], q=10, type=2)),
+         ("Biquad (lowpass)", 64, lambda src, n: Biquad(src, freq=[200 + i * 50 for i in range(n)], type=0)),
+         ("Biquad (audio freq)", 32, lambda src, n: Biquad(src, freq=Sine([.1 * (i + 1) for i in range(n)], mul=500, add=1000)))]
+
+def render(create, num, threshold):
+    s = Server(audio="offline").boot()
+    s.setBankThreshold(threshold)
+    s.recordOptions(dur=DUR, filename="filter_banks_%d.wav" % threshold)
+    src = FM(carrier=50, ratio=1.1233, index=40, mul=.1)
+    bank = create(src, num)
+    tab = NewTable(DUR)
+    rec = TableRec(bank[num - 1], tab).play()
+    mix = bank.mix(2).out()
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.shutdown()
+    return elapsed, tab.getTable()
+
+for name, num, create in BANKS:
+    t1, ref = render(create, num, 0)
+    t2, samples = render(create, num, num)
+    err = max([abs(a - b) for a, b in zip(ref, samples)])
+    print "%-20s %2d streams: per stream %.3f sec, multichannel %.3f sec (%.2f x), max difference %.6f" % \
+          (name, num, t1, t2, t1 / t2, err)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost of the table readers for every interpolation type.
+
+Osc, OscTrig, Pointer2, TableRead, TrigEnv and the SfPlayer family compute
+the reading positions of a whole buffer first, then interpolate the buffer
+with a single call to the block kernel of the interpolation type. Each
+reader is rendered offline with interp 1 (none), 2 (linear), 3 (cosine)
+and 4 (cubic), with a scalar and an audio-rate argument, and its cost is
+given by the profiler. Launch this script from a terminal.
+
+"""
+from pyo import *
+
+DUR = 10
+VOICES = 32
+INTERPS = {1: "none", 2: "linear", 3: "cosine", 4: "cubic"}
+FREQS = [100 + i * 3.3 for i in range(VOICES)]
+
+def make_osc(t, audio):
+    freq = Sine(.2, mul=50, add=FREQS) if audio else FREQS
+    return Osc(t, freq=freq)
+
+def make_pointer2(t, audio):
+    index = Phasor(Sine(.2, mul=.1, add=[.5 + i * .01 for i in range(VOICES)]) if audio else [.5 + i * .01 for i in range(VOICES)])
+    return Pointer2(t, index, autosmooth=False)
+
+def make_tableread(t, audio):
+    freq = Sine(.2, mul=.1, add=[.5 + i * .01 for i in range(VOICES)]) if audio else [.5 + i * .01 for i in range(VOICES)]
+    return TableRead(t, freq=freq, loop=True).play()
+
+def make_trigenv(t, audio):
+    dur = Sine(.2, mul=.05, add=.2) if audio else .2
+    return TrigEnv(Metro([.05 + i * .005 for i in range(VOICES)]).play(), t, dur=dur)
+
+def make_sfplayer(t, audio):
+    speed = Sine(.2, mul=.1, add=[1 + i * .01 for i in range(VOICES)]) if audio else [1 + i * .01 for i in range(VOICES)]
+    return SfPlayer(SNDS_PATH + "/transparent.aif", speed=speed, loop=True)
+
+READERS = [("Osc", make_osc), ("Pointer2", make_pointer2), ("TableRead", make_tableread),
+           ("TrigEnv", make_trigenv), ("SfPlayer", make_sfplayer)]
+
+def render(name, create, interp, audio):
+    s = Server(audio="offline").boot()
+    s.recordOptions(dur=DUR, filename="interp_kernels.wav")
+    t = HarmTable([1, .5, .33, .25, .2, .16, .14, .12], size=8192)
+    reader = create(t, audio)
+    reader.interp = interp
+    reader.out()
+    s.startProfiling()
+    s.start()
+    profile = s.getProfile()
+    s.shutdown()
+    return sum([c["time"] for c in profile["classes"] if c["class"] == name])
+
+print "%d voices, %d seconds" % (VOICES, DUR)
+for name, create in READERS:
+    for audio in [False, True]:
+        costs = ["%s %.3f" % (INTERPS[interp], render(name, create, interp, audio)) for interp in sorted(INTERPS)]
+        print "%-10s %-6s argument: %s sec" % (name, ["scalar", "audio"][audio], ", ".join(costs))
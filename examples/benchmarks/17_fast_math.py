@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost and accuracy of the approximated trigonometric functions of the
+spectral objects, against the C math library.
+
+A phase vocoder chain (PVAnal -> PVSynth) with a large fft size and 8
+overlaps, and a CarToPol -> PolToCar round trip, are rendered offline with
+Server.setFastMath(False) and Server.setFastMath(True). The cost of each
+class is given by the profiler and the accuracy is the largest difference
+between the two outputs. Give "64" as argument to run the benchmark with
+the double precision build (pyo64). Launch this script from a terminal.
+
+"""
+import sys
+if "64" in sys.argv[1:]:
+    from pyo64 import *
+else:
+    from pyo import *
+
+DUR = 10
+VOICES = 8
+SIZE = 4096
+OLAPS = 8
+CLASSES = ["PVAnal", "PVSynth", "CarToPol", "PolToCar"]
+
+def render(fast):
+    s = Server(audio="offline").boot()
+    s.setFastMath(fast)
+    s.recordOptions(dur=DUR, filename="fast_math_%d.wav" % fast)
+    src = FM(carrier=[50 + i * 11.3 for i in range(VOICES)], ratio=1.1233, index=10, mul=.1)
+    pva = PVAnal(src, size=SIZE, overlaps=OLAPS)
+    pvs = PVSynth(pva)
+    pol = CarToPol(src, Sine([100 + i * 7 for i in range(VOICES)], mul=.1))
+    car = PolToCar(pol["mag"], pol["ang"])
+    tab1, tab2 = NewTable(DUR), NewTable(DUR)
+    rec1 = TableRec(pvs[0], tab1).play()
+    rec2 = TableRec(car["imag"][0], tab2).play()
+    out = Mix([pvs, car["real"]], voices=2).out()
+    s.startProfiling()
+    s.start()
+    profile = s.getProfile()
+    s.shutdown()
+    costs = {}
+    for c in profile["classes"]:
+        if c["class"] in CLASSES:
+            costs[c["class"]] = costs.get(c["class"], 0) + c["time"]
+    return costs, tab1.getTable(), tab2.getTable()
+
+print "%s build, %d voices, fft size %d, %d overlaps, %d seconds" % \
+      (["float", "double"]["64" in sys.argv[1:]], VOICES, SIZE, OLAPS, DUR)
+ref, pv_ref, conv_ref = render(False)
+fast, pv_fast, conv_fast = render(True)
+for name in CLASSES:
+    print "%-9s libm %.3f sec, fast math %.3f sec (%.2f x)" % \
+          (name, ref.get(name, 0), fast.get(name, 0), ref.get(name, 0) / max(fast.get(name, 0), 1e-9))
+print "largest difference, phase vocoder: %.9f" % max([abs(a - b) for a, b in zip(pv_ref, pv_fast)])
+print "largest difference, CarToPol -> PolToCar: %.9f" % max([abs(a - b) for a, b in zip(conv_ref, conv_fast)])
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Python throughput while the audio thread computes a heavy patch, with and without the GIL.
+
+The server renders a bank of reverberated oscillators with the non-blocking
+offline mode. Meanwhile, the main thread runs a python loop which changes
+the frequency of an oscillator at every iteration, as a GUI or a network
+listener would. When the audio thread holds the GIL, the loop only runs
+between the buffers. With Server.setReleaseGIL(True), it runs during the
+processing and its frequency changes are queued and applied at the
+beginning of the next buffer. Launch this script from a terminal.
+
+"""
+import time
+from pyo import *
+
+DUR = 10
+VOICES = 32
+
+def render(release):
+    s = Server(audio="offline_nb").boot()
+    s.setReleaseGIL(release)
+    s.recordOptions(dur=DUR, filename="release_gil_%d.wav" % release)
+    a = SuperSaw(freq=[50 + i * 7.3 for i in range(VOICES)], detune=.6, mul=.05)
+    b = Freeverb(a, size=.8).mix(2).out()
+    lfo = Sine(freq=1)
+    s.start()
+    t = time.time()
+    count = 0
+    while s.getIsStarted():
+        lfo.freq = 1 + (count % 100) * .01
+        count += 1
+    elapsed = time.time() - t
+    stats = s.getCommandStats()
+    s.shutdown()
+    return elapsed, count, stats
+
+for release in [False, True]:
+    elapsed, count, stats = render(release)
+    print "release GIL %-5s: %.3f sec to render %d seconds, %d frequency changes (%.0f per second)" % \
+          (release, elapsed, DUR, count, count / elapsed)
+    if release:
+        print "    %d changes queued, %d applied, %d waits for a full queue" % (stats["posted"], stats["applied"], stats["waits"])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Throughput of the random generators with 1000 noise voices.
+
+Every noise and random object owns a counter-based generator, seeded from
+Server.setGlobalSeed, and fills its buffer with a block of variates. 1000
+Noise voices are rendered offline with each generation algorithm (uniform,
+linear congruential and gaussian), then with 4 threads. The last test
+renders Randi voices twice, with other random objects created before them
+in the second run, and checks that the outputs are identical. Launch this
+script from a terminal.
+
+"""
+import time
+from pyo import *
+
+DUR = 10
+VOICES = 1000
+SEED = 1234
+
+def render(create, threads=1, extra=False):
+    s = Server(audio="offline")
+    s.setThreads(threads)
+    s.boot()
+    s.setGlobalSeed(SEED)
+    s.recordOptions(dur=DUR, filename="noise_voices.wav")
+    if extra:
+        others = [Noise(), TrigRand(Metro(.01).play()), Xnoise(dist=1, freq=100)]
+    voices = create()
+    tab = NewTable(DUR)
+    rec = TableRec(voices[VOICES / 2], tab).play()
+    mix = voices.mix(2).out()
+    t = time.time()
+    s.start()
+    elapsed = time.time() - t
+    s.shutdown()
+    return elapsed, tab.getTable()
+
+def noise(type):
+    def create():
+        n = Noise(mul=[.001] * VOICES)
+        n.type = type
+        return n
+    return create
+
+for type, name in enumerate(["uniform", "lcg", "gaussian"]):
+    elapsed, samples = render(noise(type))
+    print "Noise %-8s : %.3f sec to render %d voices for %d seconds (%.1f M variates per second)" % \
+          (name, elapsed, VOICES, DUR, VOICES * DUR * 44100 / elapsed / 1e6)
+elapsed, samples = render(noise(0), threads=4)
+print "Noise uniform, 4 threads: %.3f sec" % elapsed
+
+randi = lambda: Randi(min=-1, max=1, freq=[100 + i * .1 for i in range(VOICES)], mul=.001)
+t1, ref = render(randi)
+t2, samples = render(randi, extra=True)
+print "Randi voices: %.3f sec, identical with other random objects created before: %s" % (t1, ref == samples)
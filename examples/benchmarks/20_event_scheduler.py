@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Timing accuracy of the sample accurate event scheduler.
+
+A sequence of events at irregular times is rendered offline, for several
+buffer sizes, with a Timeline object (events scheduled in advance by the
+server) and with a Sig object changed by CallAfter callbacks (events
+applied between the buffers). The position of every step is found in the
+recorded signal and compared with the exact sample of its time. The
+Timeline error is 0 for every buffer size, the error of the callbacks
+grows with the buffer size. Launch this script from a terminal.
+
+"""
+import random
+from pyo import *
+
+SR = 44100
+DUR = 5
+EVENTS = 200
+random.seed(19)
+TIMES = sorted([random.uniform(0.01, DUR - 0.5) for i in range(EVENTS)])
+
+def positions(samples):
+    # The signal holds i + 1 from event i on. An event overwritten by the
+    # next one in the same buffer never shows its own value, its position
+    # is the first sample where a later value appears.
+    pos, j = [], 0
+    for i in range(EVENTS):
+        while j < len(samples) and samples[j] < i + 1:
+            j += 1
+        pos.append(j)
+    return pos
+
+def render(bs, native):
+    s = Server(sr=SR, buffersize=bs, audio="offline").boot()
+    s.recordOptions(dur=DUR, filename="event_scheduler.wav")
+    if native:
+        sig = Timeline(init=0)
+        for i, t in enumerate(TIMES):
+            sig.schedule(t, i + 1)
+    else:
+        sig = Sig(0)
+        def change(i):
+            sig.value = i + 1
+        calls = [CallAfter(change, t, i) for i, t in enumerate(TIMES)]
+    tab = NewTable(DUR)
+    rec = TableRec(sig, tab).play()
+    out = Sine(mul=.1).out()
+    s.start()
+    stats = s.getEventStats()
+    s.shutdown()
+    errors = [abs(p - int(t * SR + 0.5)) for p, t in zip(positions(tab.getTable()), TIMES)]
+    return max(errors), sum(errors) / float(len(errors)), stats
+
+print "%d events, %d seconds" % (EVENTS, DUR)
+for bs in [64, 256, 1024]:
+    merr, aerr, stats = render(bs, True)
+    print "buffer %4d: Timeline  max error %4d samples, mean %7.2f samples (%d events applied, %d late)" % \
+          (bs, merr, aerr, stats["applied"], stats["late"])
+    merr, aerr, stats = render(bs, False)
+    print "buffer %4d: CallAfter max error %4d samples, mean %7.2f samples" % (bs, merr, aerr)
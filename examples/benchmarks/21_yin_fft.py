@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost and accuracy of the Yin pitch tracker.
+
+Yin computes the difference function of the algorithm with FFTs. The cost
+of several Yin objects is rendered offline for window sizes of 1024 and
+2048 samples, with one analysis per window, with a hop size of 256
+samples and with the analyses spread over several buffers. The profiler
+gives the total time of the class and the time of its heaviest buffer.
+
+The accuracy is checked against a direct computation of the difference
+function, in python, of the frames analysed by the first Yin object (the
+algorithm of the previous implementation). Launch this script from a
+terminal.
+
+"""
+import math
+from pyo import *
+
+SR = 44100
+BS = 256
+DUR = 10
+VOICES = 8
+CUTOFF = 1000
+TOLERANCE = 0.2
+MINFREQ, MAXFREQ = 40, 1000
+CONFIGS = [(1024, 0, False), (1024, 256, False), (1024, 256, True),
+           (2048, 0, False), (2048, 256, False), (2048, 256, True)]
+
+def render(winsize, hopsize, spread, dur=DUR):
+    s = Server(sr=SR, buffersize=BS, audio="offline").boot()
+    s.recordOptions(dur=dur, filename="yin_fft.wav")
+    lfo = Randh(min=100, max=500, freq=[3 + i * .1 for i in range(VOICES)])
+    src = SineLoop(freq=lfo, feedback=0.1, mul=.3)
+    pit = Yin(src, tolerance=TOLERANCE, minfreq=MINFREQ, maxfreq=MAXFREQ, cutoff=CUTOFF,
+              winsize=winsize, hopsize=hopsize, spread=spread)
+    tin, tout = NewTable(dur), NewTable(dur)
+    rec1 = TableRec(src[0], tin).play()
+    rec2 = TableRec(pit[0], tout).play()
+    out = src.out()
+    s.startProfiling()
+    s.start()
+    profile = s.getProfile()
+    s.shutdown()
+    cost = [(c["time"], c["max"]) for c in profile["classes"] if c["class"] == "Yin"][0]
+    return cost, tin.getTable(), tout.getTable()
+
+def direct_yin(frame):
+    half = len(frame) / 2
+    yin = [1.0] * half
+    tmp2 = 0.0
+    found = None
+    for tau in range(1, half):
+        d = 0.0
+        for j in range(half):
+            tmp = frame[j] - frame[j+tau]
+            d += tmp * tmp
+        tmp2 += d
+        yin[tau] = d * tau / tmp2 if tmp2 > 0 else 1.0
+        period = tau - 3
+        if tau > 4 and yin[period] < TOLERANCE and yin[period] < yin[period+1]:
+            found = period
+            break
+    if found is None:
+        found = yin.index(min(yin))
+    if 0 < found < half - 1:
+        s0, s1, s2 = yin[found-1], yin[found], yin[found+1]
+        return SR / (found + 0.5 * (s2 - s0) / (s2 - 2.0 * s1 + s0))
+    return SR / float(max(found, 1))
+
+def accuracy(winsize, frames=20):
+    hop = winsize
+    cost, samples, pitches = render(winsize, 0, False, dur=float(hop * (frames + 2)) / SR)
+    b = 2.0 - math.cos(2 * math.pi * CUTOFF / SR)
+    c2 = b - math.sqrt(b * b - 1.0)
+    y1, filtered = 0.0, []
+    for x in samples:
+        y1 = x + (y1 - x) * c2
+        filtered.append(y1)
+    err = 0.0
+    for k in range(1, frames):
+        end = (k + 1) * hop
+        ref = direct_yin(filtered[end-winsize:end])
+        if MINFREQ < ref < MAXFREQ:
+            err = max(err, abs(ref - pitches[end-1]))
+    return err
+
+print "%d voices, buffer size %d, %d seconds" % (VOICES, BS, DUR)
+for winsize, hopsize, spread in CONFIGS:
+    (total, heaviest), tin, tout = render(winsize, hopsize, spread)
+    print "winsize %4d, hopsize %4d, spread %-5s: %.3f sec, heaviest buffer %.6f sec" % \
+          (winsize, hopsize or winsize, spread, total, heaviest)
+for winsize in [1024, 2048]:
+    print "winsize %4d: largest difference with the direct computation: %.6f Hz" % (winsize, accuracy(winsize))
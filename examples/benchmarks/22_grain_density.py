@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Cost of the granular synthesis objects as a function of the grain density.
+
+Granule and Particle keep their grains in a pool of free and active slots:
+starting a grain takes a slot from the free stack and the rendering only
+visits the grains playing, each one over the whole buffer. Both objects
+are rendered offline with densities from 10 to 20000 grains per second
+(grains of 100 ms, so up to 2000 grains playing at once), in asynchronous
+mode for Granule and with 2 channels for Particle. The cost of each
+object is given by the profiler. Launch this script from a terminal.
+
+"""
+from pyo import *
+
+DUR = 10
+DENSITIES = [10, 100, 1000, 5000, 10000, 20000]
+
+def make_granule(snd, env, dens):
+    gr = Granule(snd, env, dens=dens, pitch=[1, 1.001], pos=Phasor(.1, mul=snd.getSize() * .8),
+                 dur=Noise(.02, add=.1), mul=.01)
+    gr.setSync(False)
+    return gr
+
+def make_particle(snd, env, dens):
+    return Particle(snd, env, dens=dens, pitch=1, pos=Phasor(.1, mul=snd.getSize() * .8),
+                    dur=.1, dev=.1, pan=Noise(.5, add=.5), chnls=2, mul=.01)
+
+OBJECTS = [("Granule", ["Granule"], make_granule),
+           ("Particle", ["MainParticle", "Particle"], make_particle)]
+
+def render(classes, create, dens):
+    s = Server(audio="offline").boot()
+    s.recordOptions(dur=DUR, filename="grain_density.wav")
+    snd = SndTable(SNDS_PATH + "/transparent.aif")
+    env = HannTable()
+    gr = create(snd, env, dens).out()
+    s.startProfiling()
+    s.start()
+    profile = s.getProfile()
+    s.shutdown()
+    return sum([c["time"] for c in profile["classes"] if c["class"] in classes])
+
+print "%d seconds" % DUR
+for name, classes, create in OBJECTS:
+    for dens in DENSITIES:
+        cost = render(classes, create, dens)
+        print "%-8s %5d grains/sec: %.3f sec (%.3f usec per grain)" % \
+              (name, dens, cost, cost * 1e6 / (dens * DUR))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Throughput and peak memory of the sampling rate conversions.
+
+upsamp(), downsamp() and SndTable(..., sr=...) use a streaming polyphase
+resampler: the sound is read, filtered and written block by block, and
+the channels are converted in parallel, so the memory does not grow with
+the length of the file. A long stereo sound is rendered offline, then
+every conversion runs in a child process whose elapsed time and peak
+resident memory (as reported by the system) are printed. Launch this
+script from a terminal.
+
+"""
+import os, time
+from pyo import *
+
+DUR = 300
+SR = 44100
+PATH = "resampler_src.wav"
+
+def render_source():
+    s = Server(sr=SR, nchnls=2, audio="offline").boot()
+    s.recordOptions(dur=DUR, filename=PATH, fileformat=0, sampletype=1)
+    a = FM(carrier=[100, 101.3], ratio=[1.01, .499], index=8, mul=.2).out()
+    s.start()
+    s.shutdown()
+
+def measure(func):
+    t = time.time()
+    pid = os.fork()
+    if pid == 0:
+        func()
+        os._exit(0)
+    pid, status, usage = os.wait4(pid, 0)
+    return time.time() - t, usage.ru_maxrss / 1024.
+
+def load_table(sr):
+    t = SndTable(PATH, sr=sr)
+
+JOBS = [("upsamp x2", lambda: upsamp(PATH, "resampler_up.wav", up=2, order=128)),
+        ("upsamp x4", lambda: upsamp(PATH, "resampler_up.wav", up=4, order=128)),
+        ("downsamp /2", lambda: downsamp(PATH, "resampler_down.wav", down=2, order=128)),
+        ("downsamp /4", lambda: downsamp(PATH, "resampler_down.wav", down=4, order=128)),
+        ("SndTable 44100", lambda: load_table(None)),
+        ("SndTable 48000", lambda: load_table(48000)),
+        ("SndTable 22050", lambda: load_table(22050))]
+
+render_source()
+size = os.path.getsize(PATH) / 1048576.
+print "stereo source of %d seconds at %d Hz (%.1f MB)" % (DUR, SR, size)
+for name, func in JOBS:
+    elapsed, peak = measure(func)
+    print "%-15s %.3f sec (%.1f x realtime), peak memory %.1f MB" % (name, elapsed, DUR / elapsed, peak)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Loading time and memory of SndTable objects sharing the sample cache.
+
+Every channel decoded by a SndTable stays in a process-wide cache keyed
+by the path, modification time, size, channel, region and sampling rate of the
+sound. A "kit" of long sounds is loaded by many voices, the scene is
+deleted and loaded again, then one voice modifies its table, which makes
+a private copy of the samples. The loading times and the cache statistics
+are printed after each step. Launch this script from a terminal.
+
+"""
+import os, time
+from pyo import *
+
+DUR = 30
+VOICES = 32
+KIT = ["cache_kit_%d.wav" % i for i in range(4)]
+
+def render_kit():
+    for i, path in enumerate(KIT):
+        s = Server(nchnls=2, audio="offline").boot()
+        s.recordOptions(dur=DUR, filename=path)
+        a = FM(carrier=[50 * (i + 1), 50.3 * (i + 1)], ratio=[1.01, .499], index=8, mul=.2).out()
+        s.start()
+        s.shutdown()
+
+def load_scene():
+    t = time.time()
+    tables = [SndTable(KIT[i % len(KIT)]) for i in range(VOICES)]
+    return tables, time.time() - t
+
+def show(label, elapsed):
+    st = getSndCacheStats()
+    print "%-22s %.3f sec, hits %d, misses %d, evictions %d, %d channels (%d in use), %.1f MB resident" % \
+          (label, elapsed, st["hits"], st["misses"], st["evictions"], st["entries"], st["active"],
+           st["resident"] / 1048576.)
+
+render_kit()
+s = Server(audio="offline").boot()
+print "%d voices loading %d stereo sounds of %d seconds" % (VOICES, len(KIT), DUR)
+
+tables, elapsed = load_scene()
+show("first scene", elapsed)
+del tables
+tables, elapsed = load_scene()
+show("scene reloaded", elapsed)
+
+t = time.time()
+tables[0].normalize()
+show("copy-on-write", time.time() - t)
+print "table 0 shared: %s, table 1 shared: %s" % (tables[0]._base_objs[0].isShared(), tables[1]._base_objs[0].isShared())
+
+del tables
+setSndCacheSize(0)
+tables, elapsed = load_scene()
+show("budget 0, scene loaded", elapsed)
+del tables
+tables, elapsed = load_scene()
+show("budget 0, reloaded", elapsed)
+
+for path in KIT:
+    os.remove(path)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Audio processing stalls while a new sound is loaded in a SndTable.
+
+SndTable.setSound() decodes the file on the calling thread and
+SndTable.setSoundAsync() on a background thread, both without the python
+global lock, and setSoundAsync() replaces the samples at the beginning of
+a block. A patch reading the table with TableRead, Looper and Granulator
+is rendered in non-blocking offline mode while sounds are swapped in the
+table from the main thread, with each method. The time spent in the load
+call and the heaviest buffer, given by the profiler, are printed. Launch
+this script from a terminal.
+
+"""
+import os, time
+from pyo import *
+
+DUR = 120
+SWAPS = 8
+PATHS = ["async_load_%d.wav" % i for i in range(2)]
+
+def render_sounds():
+    for i, path in enumerate(PATHS):
+        s = Server(nchnls=2, audio="offline").boot()
+        s.recordOptions(dur=DUR, filename=path)
+        a = FM(carrier=[60 * (i + 1), 60.5 * (i + 1)], ratio=[1.01, .499], index=6, mul=.2).out()
+        s.start()
+        s.shutdown()
+
+def run(asynchronous):
+    s = Server(audio="offline_nb").boot()
+    s.recordOptions(dur=DUR, filename="async_load_out.wav")
+    t = SndTable(PATHS[0])
+    env = HannTable()
+    reader = TableRead(t, freq=t.getRate(), loop=True).out()
+    looper = Looper(t, dur=1, mul=.3).out()
+    gran = Granulator(t, env, grains=16, pos=Phasor(.05, mul=t.getSize() * .9), dur=.1, mul=.05).out()
+    s.startProfiling()
+    s.start()
+    calls = []
+    for i in range(SWAPS):
+        path = PATHS[(i + 1) % len(PATHS)]
+        start = time.time()
+        if asynchronous:
+            future = t.setSoundAsync(path)
+            calls.append(time.time() - start)
+            future.wait()
+        else:
+            t.setSound(path)
+            calls.append(time.time() - start)
+    s.stop()
+    time.sleep(.1)
+    profile = s.getProfile()
+    s.shutdown()
+    return max(calls), profile["maxload"], profile["blocks"]
+
+render_sounds()
+print "%d swaps of stereo sounds of %d seconds" % (SWAPS, DUR)
+for asynchronous in [False, True]:
+    call, maxload, blocks = run(asynchronous)
+    print "%-14s longest call %.3f sec, heaviest buffer %.1f%% of its duration (%d buffers)" % \
+          (["setSound", "setSoundAsync"][asynchronous], call, maxload, blocks)
+for path in PATHS:
+    os.remove(path)
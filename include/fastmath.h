@@ -0,0 +1,43 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+#include "pyomodule.h"
+
+#ifndef _FASTMATH_
+#define _FASTMATH_
+
+/* Polynomial approximations of atan2, sin and cos computed over arrays.
+   The loops have no data dependent branch, so the compiler can vectorise
+   them. Maximum absolute errors, not counting the rounding of MYFLT:
+       fast_atan2_block: 2e-8 radian (odd series of degree 15 after
+                         reduction of the ratio to [-tan(pi/8), tan(pi/8)])
+       fast_sincos_block: double, 2e-9 for |phase| < 2^20 (series of degree
+                          9 and 10 after reduction to [-pi/4, pi/4]). Float,
+                          1e-7 for |phase| < 3000 and 1e-6 up to 1e5 (minimax
+                          polynomials of degree 7 and 8, reduction in float).
+   With floats, the rounding of the result (about 6e-8) dominates the
+   error of fast_atan2_block. */
+
+/* out[i] = atan2(y[i], x[i]) */
+void fast_atan2_block(MYFLT *y, MYFLT *x, MYFLT *out, int num);
+/* re[i] = mag[i] * cos(phase[i]), im[i] = mag[i] * sin(phase[i]).
+   re or im may be NULL if not needed. */
+void fast_sincos_block(MYFLT *mag, MYFLT *phase, MYFLT *re, MYFLT *im, int num);
+
+#endif
@@ -32,4 +32,9 @@ void irealfft_packed(MYFLT *data, MYFLT *outdata, int size, MYFLT *twiddle);
 /* Prototype for array generation of twiddle factors */
 void fft_compute_split_twiddle(MYFLT **twiddle, int size);
 void fft_compute_radix2_twiddle(MYFLT *twiddle, int size);
+/* Shared, reference-counted twiddle factors tables */
+MYFLT ** fft_get_split_twiddle(int size);
+void fft_release_split_twiddle(MYFLT **twiddle);
+MYFLT * fft_get_radix2_twiddle(int size);
+void fft_release_radix2_twiddle(MYFLT *twiddle);
 #endif
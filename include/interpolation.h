@@ -27,4 +27,9 @@ MYFLT linear(MYFLT *buf, int index, MYFLT frac, int size);
 MYFLT cosine(MYFLT *buf, int index, MYFLT frac, int size);
 MYFLT cubic(MYFLT *buf, int index, MYFLT frac, int size);
 
+void nointerp_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num);
+void linear_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num);
+void cosine_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num);
+void cubic_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num);
+
 #endif
@@ -28,6 +28,10 @@ typedef struct {
     int width;
     int height;
     MYFLT **data;
+    PyObject *owner; /* matrix owning data, borrowed, NULL if none */
+    int exports; /* buffer views of data still alive */
+    Py_ssize_t shape[2]; /* buffer protocol */
+    Py_ssize_t strides[2];
 } MatrixStream;
 
 
@@ -35,7 +39,15 @@ typedef struct {
 (self) = (MatrixStream *)(type)->tp_alloc((type), 0);	\
 if ((self) == rt_error) { return rt_error; }	\
 \
-(self)->width = (self)->height = 0
+(self)->width = (self)->height = (self)->exports = 0; \
+(self)->owner = NULL
+
+/* The samples of a matrix can't be reallocated while buffer views use them. */
+#define MATRIX_CHECK_EXPORTS(rt_error) \
+if (self->matrixstream->exports > 0) { \
+    PyErr_SetString(PyExc_BufferError, "The samples of the matrix are exported, release the buffers before resizing the matrix."); \
+    return rt_error; \
+}
 
 #else
 
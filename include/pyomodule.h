@@ -51,6 +51,10 @@
 #define TYPE_O_IF "O|if"
 #define TYPE_O_IFS "O|ifs"
 #define TYPE_S_IFF "s|iff"
+#define TYPE_S_IFFI "s|iffi"
+#define TYPE_S_IFFII "s|iffii"
+#define TYPE_SO_FF "sO|ff"
+#define TYPE_SO_FFO "sO|ffO"
 #define TYPE_S_FIFF "s|fiff"
 #define TYPE_S_FFIFF "s|ffiff"
 #define TYPE_S__OIFI "s|Oifi"
@@ -74,11 +78,13 @@
 #define TYPE__OFFI "|Offi"
 #define TYPE__OFII "|Ofii"
 #define TYPE__FIIOO "|fiiOO"
+#define TYPE__FIOO "|fiOO"
 #define TYPE_O_OFOO "O|OfOO"
 #define TYPE_O_OOOOFF "O|OOOOff"
 #define TYPE_O_IFFO "O|iffO"
 #define TYPE_O_OOIF "O|OOif"
 #define TYPE_O_FFFFIOO "O|ffffiOO"
+#define TYPE_O_FFFFIIIOO "O|ffffiiiOO"
 #define TYPE_OO_FOO "OO|fOO"
 #define TYPE_OO_FFOO "OO|ffOO"
 #define TYPE_O_IFIOO "O|ifiOO"
@@ -90,6 +96,7 @@
 
 #define SF_WRITE sf_write_float
 #define SF_READ sf_read_float
+#define MYFLT_BUFFER_FORMAT "f" /* buffer protocol format */
 
 #define MYSQRT sqrtf
 #define MYLOG logf
@@ -135,6 +142,10 @@
 #define TYPE_O_IF "O|id"
 #define TYPE_O_IFS "O|ids"
 #define TYPE_S_IFF "s|idd"
+#define TYPE_S_IFFI "s|iddi"
+#define TYPE_S_IFFII "s|iddii"
+#define TYPE_SO_FF "sO|dd"
+#define TYPE_SO_FFO "sO|ddO"
 #define TYPE_S_FIFF "s|didd"
 #define TYPE_S_FFIFF "s|ddidd"
 #define TYPE_S__OIFI "s|Oidi"
@@ -158,11 +169,13 @@
 #define TYPE__OFFI "|Oddi"
 #define TYPE__OFII "|Odii"
 #define TYPE__FIIOO "|diiOO"
+#define TYPE__FIOO "|diOO"
 #define TYPE_O_OFOO "O|OdOO"
 #define TYPE_O_OOOOFF "O|OOOOdd"
 #define TYPE_O_IFFO "O|iddO"
 #define TYPE_O_OOIF "O|OOid"
 #define TYPE_O_FFFFIOO "O|ddddiOO"
+#define TYPE_O_FFFFIIIOO "O|ddddiiiOO"
 #define TYPE_OO_FOO "OO|dOO"
 #define TYPE_OO_FFOO "OO|ddOO"
 #define TYPE_O_IFIOO "O|idiOO"
@@ -174,6 +187,7 @@
 
 #define SF_WRITE sf_write_double
 #define SF_READ sf_read_double
+#define MYFLT_BUFFER_FORMAT "d" /* buffer protocol format */
 
 #define MYSQRT sqrt
 #define MYLOG log
@@ -375,6 +389,7 @@ extern PyTypeObject TrigXnoiseType;
 extern PyTypeObject TrigXnoiseMidiType;
 extern PyTypeObject PatternType;
 extern PyTypeObject CallAfterType;
+extern PyTypeObject TimelineType;
 extern PyTypeObject BandSplitterType;
 extern PyTypeObject BandSplitType;
 extern PyTypeObject FourBandMainType;
@@ -485,6 +500,8 @@ extern PyTypeObject PeakAmpType;
 extern PyTypeObject MainParticleType;
 extern PyTypeObject ParticleType;
 extern PyTypeObject AtanTableType;
+extern PyTypeObject BiquadBankType;
+extern PyTypeObject BiquadBankStreamType;
 
 /* Constants */
 #define E M_E
@@ -595,6 +612,10 @@ extern PyTypeObject AtanTableType;
         Py_INCREF(self->server); \
         Py_CLEAR(self->server); \
     } \
+    if (self->tablestream != NULL) { \
+        self->tablestream->owner = NULL; \
+        self->tablestream->data = NULL; \
+    } \
     Py_CLEAR(self->tablestream); \
 
 #define pyo_matrix_CLEAR \
@@ -602,6 +623,10 @@ extern PyTypeObject AtanTableType;
         Py_INCREF(self->server); \
         Py_CLEAR(self->server); \
     } \
+    if (self->matrixstream != NULL) { \
+        self->matrixstream->owner = NULL; \
+        self->matrixstream->data = NULL; \
+    } \
     Py_CLEAR(self->matrixstream); \
 
 #define pyo_DEALLOC \
@@ -648,7 +673,8 @@ extern PyTypeObject AtanTableType;
     Stream_setStreamObject(self->stream, (PyObject *)self); \
     Stream_setStreamId(self->stream, Stream_getNewStreamId()); \
     Stream_setBufferSize(self->stream, self->bufsize); \
-    Stream_setData(self->stream, self->data);
+    Stream_setData(self->stream, self->data); \
+    Stream_setStreamSilent(self->stream, 1);
 
 #define SET_INTERP_POINTER \
     if (self->interp == 0) \
@@ -662,6 +688,17 @@ extern PyTypeObject AtanTableType;
     else if (self->interp == 4) \
         self->interp_func_ptr = cubic; \
 
+/* Set the block interpolation function, after SET_INTERP_POINTER */
+#define SET_INTERP_BLOCK_POINTER \
+    if (self->interp == 1) \
+        self->interp_block_func_ptr = nointerp_block; \
+    else if (self->interp == 2) \
+        self->interp_block_func_ptr = linear_block; \
+    else if (self->interp == 3) \
+        self->interp_block_func_ptr = cosine_block; \
+    else if (self->interp == 4) \
+        self->interp_block_func_ptr = cubic_block; \
+
 /* Set data */
 #define SET_TABLE_DATA \
     int i; \
@@ -669,6 +706,7 @@ extern PyTypeObject AtanTableType;
         PyErr_SetString(PyExc_TypeError, "The data must be a list of floats."); \
         return PyInt_FromLong(-1); \
     } \
+    TABLE_CHECK_EXPORTS(NULL) \
     self->size = PyList_Size(arg); \
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT)); \
     TableStream_setSize(self->tablestream, self->size+1); \
@@ -684,17 +722,20 @@ extern PyTypeObject AtanTableType;
 
 #define SET_MATRIX_DATA \
     int i, j; \
+    MYFLT *block; \
     PyObject *innerlist; \
  \
     if (! PyList_Check(arg)) { \
         PyErr_SetString(PyExc_TypeError, "The data must be a list of list of floats."); \
         return PyInt_FromLong(-1); \
     } \
+    MATRIX_CHECK_EXPORTS(NULL) \
     self->height = PyList_Size(arg); \
     self->width = PyList_Size(PyList_GetItem(arg, 0)); \
-    self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT)); \
+    block = (MYFLT *)realloc(self->data[0], (self->height + 1) * (self->width + 1) * sizeof(MYFLT)); \
+    self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT *)); \
     for (i=0; i<(self->height+1); i++) { \
-        self->data[i] = (MYFLT *)realloc(self->data[i], (self->width + 1) * sizeof(MYFLT)); \
+        self->data[i] = block + i * (self->width + 1); \
     } \
     MatrixStream_setWidth(self->matrixstream, self->width); \
     MatrixStream_setHeight(self->matrixstream, self->height); \
@@ -834,6 +875,12 @@ extern PyTypeObject AtanTableType;
         PyErr_SetString(PyExc_TypeError, "Cannot delete the list attribute."); \
         return PyInt_FromLong(-1); \
     } \
+    if (Stream_checkBuffer(arg)) { \
+        if (Stream_copyFromBuffer(arg, self->data, self->size) < 0) \
+            return NULL; \
+        self->data[self->size] = self->data[0]; \
+        Py_RETURN_NONE; \
+    } \
     if (! PyList_Check(arg)) { \
         PyErr_SetString(PyExc_TypeError, "arg must be a list."); \
         return PyInt_FromLong(-1); \
@@ -1274,6 +1321,14 @@ extern PyTypeObject AtanTableType;
     Py_INCREF(self->tablestream); \
     return (PyObject *)self->tablestream; \
 
+/* Called by the objects writing in a table from the audio thread. A SndTable
+   then keeps its samples private instead of sharing them through the sample cache. */
+#define MAKE_TABLE_WRITABLE(table) \
+    if (PyObject_HasAttrString((PyObject *)table, "makeWritable")) { \
+        PyObject *writable = PyObject_CallMethod((PyObject *)table, "makeWritable", NULL); \
+        Py_XDECREF(writable); \
+    }
+
 #define GET_MATRIX_STREAM \
     if (self->matrixstream == NULL) { \
         PyErr_SetString(PyExc_TypeError, "No matrix stream founded!"); \
@@ -1487,6 +1542,7 @@ extern PyTypeObject AtanTableType;
         Stream_setStreamActive(self->stream, 0); \
         for (i=0; i<self->bufsize; i++) \
             self->data[i] = 0.0; \
+        Stream_setStreamSilent(self->stream, 1); \
         nearestBuf = (int)roundf((del * self->sr) / self->bufsize); \
         Stream_setBufferCountWait(self->stream, nearestBuf); \
     } \
@@ -1521,6 +1577,7 @@ extern PyTypeObject AtanTableType;
         Stream_setStreamActive(self->stream, 0); \
         for (i=0; i<self->bufsize; i++) \
             self->data[i] = 0.0; \
+        Stream_setStreamSilent(self->stream, 1); \
         nearestBuf = (int)roundf((del * self->sr) / self->bufsize); \
         Stream_setBufferCountWait(self->stream, nearestBuf); \
     } \
@@ -1541,6 +1598,7 @@ extern PyTypeObject AtanTableType;
     for (i=0; i<self->bufsize; i++) { \
         self->data[i] = 0; \
     } \
+    Stream_setStreamSilent(self->stream, 1); \
     Py_INCREF(Py_None); \
     return Py_None;
 
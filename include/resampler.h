@@ -0,0 +1,66 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+#include "pyomodule.h"
+
+#ifndef _RESAMPLER_
+#define _RESAMPLER_
+
+/* Largest number of phases of a polyphase filter. A ratio whose reduced
+   numerator is larger is approximated (relative error below 1 / 2048). */
+#define RESAMPLER_MAX_PHASES 1024
+
+/* Streaming polyphase sampling rate converter, by a rational factor up / down,
+   for one channel. The prototype is a windowed sinc lowpass at the rate
+   `up` times the input rate, split in `up` filters of `taps` coefficients, so
+   the zeros inserted by the upsampling are never multiplied. The output is
+   aligned with the input (the delay of the filter is compensated). */
+typedef struct {
+    int up;
+    int down;
+    int taps; /* coefficients per phase */
+    MYFLT *coeffs; /* coeffs[phase * taps + k] */
+    long long delay; /* filter delay, in samples at the upsampled rate */
+    long long bufstart; /* input index of buf[0] */
+    long long outpos; /* number of samples produced */
+    MYFLT *buf; /* input samples still needed */
+    long buflen;
+    long bufsize;
+} PyoResampler;
+
+/* sinc function windowed by a Blackman window, normalized to a gain of 1 at DC. */
+void gen_lp_impulse(MYFLT *array, int size, float freq);
+
+/* `order` is the length of the lowpass filter at the higher of the two rates. */
+PyoResampler * PyoResampler_new(int up, int down, int order);
+void PyoResampler_free(PyoResampler *rs);
+/* Number of output samples for `frames` input samples. */
+long long PyoResampler_length(PyoResampler *rs, long long frames);
+/* Pushes `frames` input samples, read every `instride` items from `in` (zeros if
+   `in` is NULL), and writes at most `maxout` output samples every `outstride`
+   items in `out`. Returns the number of samples written. */
+long PyoResampler_process(PyoResampler *rs, MYFLT *in, int instride, long frames, MYFLT *out, int outstride, long maxout);
+/* Pushes zeros until `num` more output samples are written. */
+void PyoResampler_flush(PyoResampler *rs, MYFLT *out, int outstride, long num);
+
+/* Converts the sampling rate of a sound file by up / down, block by block,
+   the channels being computed in parallel. Returns 0 on success, -1 on error. */
+int pyo_resample_file(char *inpath, char *outpath, int up, int down, int order, const char *caller);
+
+#endif
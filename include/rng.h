@@ -0,0 +1,65 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+#include "pyomodule.h"
+#include <stdint.h>
+
+#ifndef _RNG_
+#define _RNG_
+
+/* Random generator owned by an object. The state is a 64 bits counter and
+   every variate is a bijective mix of the counter (splitmix64), so the stream
+   of an object only depends on its seed: neither the other objects nor the
+   processing order (see Server.setThreads) change it, and no lock is taken. */
+typedef struct {
+    uint64_t state;
+} PyoRand;
+
+/* Largest value returned by pyorand_int. */
+#define PYORAND_MAX 2147483647
+
+static inline uint64_t pyorand_next(PyoRand *r) {
+    uint64_t z = (r->state += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+/* Uniform integer in [0, PYORAND_MAX], replaces rand(). */
+static inline int pyorand_int(PyoRand *r) {
+    return (int)(pyorand_next(r) >> 33);
+}
+
+/* Uniform in [0, 1), with the full precision of MYFLT. */
+static inline MYFLT pyorand_uniform(PyoRand *r) {
+#ifndef USE_DOUBLE
+    return (MYFLT)(pyorand_next(r) >> 40) * 5.9604644775390625e-08f;
+#else
+    return (MYFLT)(pyorand_next(r) >> 11) * 1.1102230246251565e-16;
+#endif
+}
+
+/* Starts the stream of the `index`th object of the class `cls` for the seed `seed`. */
+void pyorand_seed(PyoRand *r, unsigned int seed, unsigned int cls, unsigned int index);
+/* out[i] = uniform [0, 1) * mul + add */
+void pyorand_uniform_block(PyoRand *r, MYFLT *out, int num, MYFLT mul, MYFLT add);
+/* out[i] = standard normal * mul + add (Box-Muller, two variates per pair of uniforms) */
+void pyorand_gauss_block(PyoRand *r, MYFLT *out, int num, MYFLT mul, MYFLT add);
+
+#endif
@@ -32,6 +32,7 @@ extern "C" {
 #include "portmidi.h"
 #include "sndfile.h"
 #include "pyomodule.h"
+#include "rng.h"
 
 #ifdef USE_JACK
 #include <jack/jack.h>
@@ -62,9 +63,46 @@ typedef struct {
 #endif
 } PyoJackBackendData;
 
+/* Streams registry. The server's streams are chained, in processing order, in
+   an array of slots recycled through a free-list. A hash table maps stream ids
+   to slots, so adding, removing and moving a stream take constant time. */
+typedef struct {
+    PyObject *stream; /* Stream object, NULL if the slot is free */
+    int prev;
+    int next;
+} PyoStreamSlot;
+
+typedef struct {
+    PyoStreamSlot *slots;
+    int size;
+    int head;
+    int tail;
+    int free; /* free-list, chained by `next` */
+    int pending; /* slots removed while the streams are processed, chained by `prev` */
+    int busy; /* the streams are being processed */
+    int added; /* streams were added while processing */
+    int hsize;
+    int *hkeys; /* stream ids, -1 for empty entries */
+    int *hslots;
+} PyoStreamRegistry;
+
+/* Number of consecutive blocks over which the fft frames are balanced. */
+#define PYO_FRAME_SLOTS 64
+
+/* Block reserved by an object computing a fft frame every `hopsize` samples. */
+typedef struct {
+    int slot; /* index of the block in the hop, -1 if none */
+    int nslots; /* number of blocks in the hop */
+    double cost;
+} PyoFrameSlot;
+
+/* Function of a scheduled event, called at the beginning of the block holding
+   the event, with its offset in the block. See Server_scheduleEvent. */
+typedef void (*PyoEventFunc)(PyObject *target, int offset, MYFLT value, int arg);
+
 typedef struct {
     PyObject_HEAD
-    PyObject *streams;
+    PyoStreamRegistry streams;
     PyoAudioBackendType audio_be_type;
     void *audio_be_data;
     char *serverName; /* Only used for jack client name */
@@ -139,6 +177,27 @@ typedef struct {
     int verbosity; /* a sum of values to display different levels: 1 = error */
                    /* 2 = message, 4 = warning , 8 = debug. Default 7.*/
     int globalSeed; /* initial seed for random objects. If -1, objects are seeded with the clock. */
+
+    /* Parallel processing */
+    int threads; /* number of threads computing the streams graph. 1 means serial processing. */
+    void *pool; /* worker pool and streams graph, only allocated if threads > 1 or in pull mode */
+    int pull; /* only compute the streams needed by the outputs */
+    /* Python callbacks of Pattern, TrigFunc and CallAfter */
+    int async_callbacks; /* called by the dispatcher thread instead of the audio thread */
+    void *dispatcher; /* callbacks queue and thread, only allocated if async_callbacks is on */
+    int balance_frames; /* offsets the fft frames of the objects to spread them over the blocks */
+    double frame_load[PYO_FRAME_SLOTS]; /* cost of the fft frames computed in each block, modulo PYO_FRAME_SLOTS */
+    int fast_math; /* new spectral objects use the polynomial approximations of fastmath.h */
+    int release_gil; /* streams are computed without the GIL, setters called by other threads are queued */
+    void *commands; /* queue of the setters, allocated by the first setReleaseGIL(True) */
+    void *scheduler; /* sample accurate events, allocated by the first scheduled event */
+    /* Profiler counters, see Server.startProfiling */
+    long prof_blocks;
+    long prof_misses; /* blocks computed in more time than their duration */
+    long prof_xruns; /* underflows and overflows reported by the audio backend */
+    double prof_busy;
+    double prof_maxblock;
+    PyObject *prof_removed; /* class name -> (time, calls, max, count) of the removed streams */
 } Server;
 
 PyObject * PyServer_get_server();
@@ -147,7 +206,16 @@ extern MYFLT * Server_getInputBuffer(Server *self);
 extern PmEvent * Server_getMidiEventBuffer(Server *self);
 extern int Server_getMidiEventCount(Server *self);
 extern int Server_generateSeed(Server *self, int oid);
+extern void Server_seedRandom(Server *self, int oid, PyoRand *rng);
+extern int Server_useFastMath(Server *self);
+extern int Server_callback(Server *self, PyObject *callable, PyObject *arg, int offset);
+extern PyObject * Server_getattro(PyObject *obj, PyObject *name);
+extern int Server_scheduleEvent(Server *self, unsigned long delay, PyoEventFunc func, PyObject *target, MYFLT value, int arg);
+extern void Server_unscheduleEvents(Server *self, PyObject *target);
+extern int Server_scheduleFrames(Server *self, PyoFrameSlot *frames, int hopsize, double cost);
+extern void Server_unscheduleFrames(Server *self, PyoFrameSlot *frames);
 extern PyTypeObject ServerType;
+extern PyTypeObject DeferredCallType;
 
 #ifdef __cplusplus
 }
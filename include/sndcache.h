@@ -0,0 +1,87 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+#include "pyomodule.h"
+
+#ifndef _SNDCACHE_
+#define _SNDCACHE_
+
+/* Default memory budget of the sample cache, in bytes. */
+#define SNDCACHE_DEFAULT_BUDGET 268435456
+
+/* Identity of the file content: the modification time, to the nanosecond where
+   the system gives it, the size and the inode of the file. A file rewritten
+   within the same second almost always changes one of them. */
+typedef struct {
+    long long mtime;
+    long mtime_ns;
+    long long size;
+    unsigned long long ino;
+} SndCacheStamp;
+
+/* Decoded channel of a sound, shared by all the SndTable objects loading the
+   same file region. An entry is identified by the path and stamp of the
+   file, the channel, the first and last frames read and the sampling
+   rate of the samples (which differs from the file's one if the sound was
+   converted). `data` holds `size` samples plus the guard point and must never
+   be written: a table makes a private copy before modifying its samples. */
+typedef struct _SndCacheEntry {
+    char *path;
+    SndCacheStamp stamp;
+    int chnl;
+    unsigned int start;
+    unsigned int stop;
+    int sr;
+    MYFLT *data;
+    unsigned int size;
+    int refcount;
+    struct _SndCacheEntry *prev; /* LRU list, most recently used first */
+    struct _SndCacheEntry *next;
+} SndCacheEntry;
+
+typedef struct {
+    long long hits;
+    long long misses;
+    long long evictions;
+    long long resident; /* bytes held by all entries */
+    long long budget;
+    int entries;
+    int active; /* entries used by at least one table */
+} SndCacheStats;
+
+/* Fills `stamp` with the identity of `path`. Returns -1 if the file can't be
+   stat'ed (such files are never cached, a NULL stamp is given to the cache). */
+int SndCache_stamp(const char *path, SndCacheStamp *stamp);
+/* Returns the entry matching the key, with a new reference, or NULL. */
+SndCacheEntry * SndCache_lookup(const char *path, const SndCacheStamp *stamp, int chnl, unsigned int start, unsigned int stop, int sr);
+/* Adds a decoded channel to the cache. The cache takes ownership of `data`
+   (allocated with malloc, `size` + 1 samples). Returns the entry, with one
+   reference. If the key is already cached, `data` is freed and the existing
+   entry is returned. */
+SndCacheEntry * SndCache_insert(const char *path, const SndCacheStamp *stamp, int chnl, unsigned int start, unsigned int stop, int sr,
+                                MYFLT *data, unsigned int size);
+/* Drops a reference. Unused entries stay resident until the budget is exceeded. */
+void SndCache_release(SndCacheEntry *entry);
+/* Sets the memory budget in bytes. 0 keeps only the entries in use. */
+void SndCache_setBudget(long long bytes);
+/* Frees all the entries that are not used by a table. */
+void SndCache_clear(void);
+void SndCache_getStats(SndCacheStats *stats);
+
+#endif
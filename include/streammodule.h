@@ -33,9 +33,42 @@ typedef struct {
     int duration;
     int bufferCountWait;
     int bufferCount;
+    int silent; /* data only holds zeros, until the next call of the function */
+    int stop_requested; /* see Stream_requestStop */
+    int exports; /* buffer views of data still alive */
+    long calls; /* profiler: number of calls, time spent in the function */
+    double cputime;
+    double maxtime;
     MYFLT *data;
+    Py_ssize_t shape[1]; /* buffer protocol */
+    Py_ssize_t strides[1];
 } Stream;
 
+/* Profiler, see Server.startProfiling */
+typedef struct {
+    int sid; /* stream id, 0 for a whole block */
+    int thread;
+    const char *name;
+    double start; /* seconds since the beginning of the profiling */
+    double dur;
+} PyoTraceEvent;
+
+typedef struct {
+    int active;
+    double origin;
+    PyoTraceEvent *events; /* NULL if the trace is not recorded */
+    int size;
+    int count; /* number of events, can be larger than size if some were dropped */
+} PyoProfiler;
+
+extern PyoProfiler stream_profiler;
+extern double Stream_getProfileTime();
+extern void Stream_addTraceEvent(int sid, const char *name, double start, double dur);
+
+/* Number of streams whose stop has been requested during the current block. */
+extern int stream_stop_requests;
+extern void Stream_requestStop(Stream *self);
+
 extern int Stream_getNewStreamId();
 extern PyObject * Stream_getStreamObject(Stream *self);
 extern int Stream_getStreamId(Stream *self);
@@ -44,19 +77,25 @@ extern int Stream_getBufferCountWait(Stream *self);
 extern int Stream_getDuration(Stream *self);
 extern int Stream_getStreamChnl(Stream *self);
 extern int Stream_getStreamToDac(Stream *self);
+extern int Stream_getStreamSilent(Stream *self);
 extern MYFLT * Stream_getData(Stream *self);
 extern void Stream_setData(Stream * self, MYFLT *data);
 extern void Stream_setFunctionPtr(Stream *self, void *ptr);
 extern void Stream_callFunction(Stream *self);
 extern void Stream_IncrementBufferCount(Stream *self);
 extern void Stream_IncrementDurationCount(Stream *self);
+extern int Stream_fillBuffer(Py_buffer *view, PyObject *obj, MYFLT *buf, int ndim, Py_ssize_t *shape, Py_ssize_t *strides, int readonly, int flags);
+extern void Stream_holdExport(int *exports, PyObject *owner);
+extern void Stream_releaseExport(int *exports, PyObject *owner);
+extern int Stream_checkBuffer(PyObject *obj);
+extern int Stream_copyFromBuffer(PyObject *obj, MYFLT *data, Py_ssize_t size);
 extern PyTypeObject StreamType;
 
 #define MAKE_NEW_STREAM(self, type, rt_error) \
   (self) = (Stream *)(type)->tp_alloc((type), 0); \
   if ((self) == rt_error) { return rt_error; } \
  \
-  (self)->sid = (self)->chnl = (self)->todac = (self)->bufferCountWait = (self)->bufferCount = (self)->bufsize = (self)->duration = 0; \
+  (self)->sid = (self)->chnl = (self)->todac = (self)->bufferCountWait = (self)->bufferCount = (self)->bufsize = (self)->duration = (self)->silent = (self)->stop_requested = (self)->exports = 0; \
   (self)->active = 1;
 
 
@@ -87,6 +126,7 @@ extern PyTypeObject TriggerStreamType;
 #define Stream_setBufferCountWait(op, v) (((Stream *)(op))->bufferCountWait = (v))
 #define Stream_setDuration(op, v) (((Stream *)(op))->duration = (v))
 #define Stream_setBufferSize(op, v) (((Stream *)(op))->bufsize = (v))
+#define Stream_setStreamSilent(op, v) (((Stream *)(op))->silent = (v))
 
 #endif
 /* __STREAMMODULE */
\ No newline at end of file
@@ -28,6 +28,10 @@ typedef struct {
     int size;
     double samplingRate;
     MYFLT *data;
+    PyObject *owner; /* table owning data, borrowed, NULL if none */
+    int exports; /* buffer views of data still alive */
+    Py_ssize_t shape[1]; /* buffer protocol */
+    Py_ssize_t strides[1];
 } TableStream;
 
 
@@ -35,7 +39,15 @@ typedef struct {
 (self) = (TableStream *)(type)->tp_alloc((type), 0);	\
 if ((self) == rt_error) { return rt_error; }	\
 \
-(self)->size = 0
+(self)->size = (self)->exports = 0; \
+(self)->owner = NULL
+
+/* The samples of a table can't be reallocated while buffer views use them. */
+#define TABLE_CHECK_EXPORTS(rt_error) \
+if (self->tablestream->exports > 0) { \
+    PyErr_SetString(PyExc_BufferError, "The samples of the table are exported, release the buffers before resizing the table or loading a new sound."); \
+    return rt_error; \
+}
 
 #else
 
@@ -34,4 +34,7 @@
 #ifndef _WIND_
 #define _WIND_
 void gen_window(MYFLT *window, int size, int wintype);
+/* Shared, reference-counted windows */
+MYFLT * get_window(int size, int wintype);
+void release_window(MYFLT *window);
 #endif
@@ -18,10 +18,10 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
-from types import ListType, TupleType, SliceType, FloatType, StringType, UnicodeType, NoneType
+from types import ListType, TupleType, SliceType, IntType, LongType, FloatType, StringType, UnicodeType, NoneType
 import random, os, sys, inspect, tempfile
 from subprocess import call
-from weakref import proxy
+from weakref import proxy, ref
 
 import __builtin__
 if hasattr(__builtin__, 'pyo_use_double'):
@@ -34,6 +34,12 @@ else:
 from _maps import *
 from _widgets import createCtrlWindow, createViewTableWindow, createViewMatrixWindow
 
+try:
+    import numpy
+    WITH_NUMPY = True
+except:
+    WITH_NUMPY = False
+
 ######################################################################
 ### Utilities
 ######################################################################
@@ -54,11 +60,13 @@ FUNCTIONS_INIT_LINES = {"pa_count_host_apis": "pa_count_host_apis()", "pa_list_h
                         "sndinfo": "sndinfo(path, print=False)", "savefile": "savefile(samples, path, sr=44100, channels=1, fileformat=0, sampletype=0)",
                         "savefileFromTable": "savefileFromTable(table, path, fileformat=0, sampletype=0)",
                         "upsamp": "upsamp(path, outfile, up=4, order=128)", "downsamp": "downsamp(path, outfile, down=4, order=128)",
+                        "setSndCacheSize": "setSndCacheSize(size)", "getSndCacheStats": "getSndCacheStats()", "clearSndCache": "clearSndCache()",
                         "midiToHz": "midiToHz(x)", "hzToMidi": "hzToMidi(x)", "midiToTranspo": "midiToTranspo(x)", "sampsToSec": "sampsToSec(x)",
                         "secToSamps": "secToSamps(x)", "linToCosCurve": "linToCosCurve(data, yrange=[0, 1], totaldur=1, points=1024, log=False)",
                         "rescale": "rescale(data, xmin=0.0, xmax=1.0, ymin=0.0, ymax=1.0, xlog=False, ylog=False)",
                         "distanceToSegment": "distanceToSegment(p, p1, p2, xmin=0.0, xmax=1.0, ymin=0.0, ymax=1.0, xlog=False, ylog=False)",
                         "reducePoints": "reducePoints(pointlist, tolerance=0.02)", "serverCreated": "serverCreated()", "serverBooted": "serverBooted()",
+                        "render_jobs": "render_jobs(jobs, processes=None, callback=None)",
                         "example": "example(cls, dur=5, toprint=True, double=False)", "class_args": "class_args(cls)", "getVersion": "getVersion()",
                         "convertStringToSysEncoding": "convertStringToSysEncoding(str)", "convertArgsToLists": "convertArgsToLists(*args)",
                         "wrap": "wrap(arg, i)", "floatmap": "floatmap(x, min=0, max=1, exp=1)"
@@ -97,6 +105,18 @@ def convertArgsToLists(*args):
     max_length = max(len(i) for i in converted)
     return tuple(converted + [max_length])
 
+def isNumberList(arg):
+    """
+    Return True if `arg`, as returned by convertArgsToLists, holds only numbers.
+
+    """
+    if isinstance(arg, PyoObjectBase):
+        return False
+    for x in arg:
+        if type(x) not in [IntType, LongType, FloatType]:
+            return False
+    return True
+
 def wrap(arg, i):
     """
     Return value at position `i` from `arg` with wrap around `arg` length.
@@ -422,6 +442,9 @@ class PyoObject(PyoObjectBase):
     """
 
     _STREAM_TYPE = 'audio'
+    # Number of streams from which the objects having a multichannel
+    # version use it. Set with Server.setBankThreshold.
+    _BANK_THRESHOLD = 32
 
     def __init__(self, mul=1.0, add=0.0):
         PyoObjectBase.__init__(self)
@@ -432,28 +455,38 @@ class PyoObject(PyoObjectBase):
         self._add = add
         self._op_duplicate = 1
         self._map_list = []
-        self._zeros = None
+
+    def _useBank(self, lmax, *params):
+        # True if `lmax` streams must be computed by a multichannel object.
+        # Only banks with constant parameters are faster than the streams.
+        if self._BANK_THRESHOLD <= 0 or lmax < self._BANK_THRESHOLD:
+            return False
+        for param in params:
+            if not isNumberList(param):
+                return False
+        return True
 
     def __add__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("add", x, lmax)
+        if self.__len__() < lmax and isinstance(x, PyoObject):
+            return x + self
         if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj + wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj + wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
         else:
-            if isinstance(x, PyoObject):
-                _add_dummy = x + self
-            else:
-                _add_dummy = Dummy([wrap(self._base_objs,i) + obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_add_dummy)
-        return _add_dummy
+            objs = [wrap(self._base_objs,i) + obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __radd__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("add", x, lmax)
         if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj + wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj + wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
         else:
-            _add_dummy = Dummy([wrap(self._base_objs,i) + obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_add_dummy)
-        return _add_dummy
+            objs = [wrap(self._base_objs,i) + obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __iadd__(self, x):
         self.setAdd(x)
@@ -461,34 +494,29 @@ class PyoObject(PyoObjectBase):
 
     def __sub__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("sub", x, lmax)
         if self.__len__() >= lmax:
-            _add_dummy = Dummy([obj - wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj - wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
+        elif isinstance(x, PyoObject):
+            objs = [wrap(self._base_objs,i) - wrap(x,i) for i in range(lmax)]
         else:
-            if isinstance(x, PyoObject):
-                _add_dummy = Dummy([wrap(self._base_objs,i) - wrap(x,i) for i in range(lmax)])
-            else:
-                _add_dummy = Dummy([wrap(self._base_objs,i) - obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_add_dummy)
-        return _add_dummy
+            objs = [wrap(self._base_objs,i) - obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __rsub__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("rsub", x, lmax)
         if self.__len__() >= lmax:
-            tmp = []
-            for i, obj in enumerate(self._base_objs):
-                sub_upsamp = Sig(wrap(x, i/self._op_duplicate))
-                self._keep_trace.append(sub_upsamp)
-                tmp.append(sub_upsamp - obj)
-            _add_dummy = Dummy(tmp)
+            sigs = [Sig(wrap(x, i/self._op_duplicate)) for i in range(self.__len__())]
+            objs = [sig[0] - obj for sig, obj in zip(sigs, self._base_objs)]
         else:
-            tmp = []
-            for i, obj in enumerate(x):
-                sub_upsamp = Sig(obj)
-                self._keep_trace.append(sub_upsamp)
-                tmp.append(sub_upsamp - wrap(self._base_objs,i))
-            _add_dummy = Dummy(tmp)
-        self._keep_trace.append(_add_dummy)
-        return _add_dummy
+            sigs = [Sig(obj) for obj in x]
+            objs = [sig[0] - wrap(self._base_objs,i) for i, sig in enumerate(sigs)]
+        node = self._keepNode(Dummy(objs))
+        node._operands = sigs
+        return node
 
     def __isub__(self, x):
         self.setSub(x)
@@ -496,24 +524,25 @@ class PyoObject(PyoObjectBase):
 
     def __mul__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("mul", x, lmax)
+        if self.__len__() < lmax and isinstance(x, PyoObject):
+            return x * self
         if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj * wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj * wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
         else:
-            if isinstance(x, PyoObject):
-                _mul_dummy = x * self
-            else:
-                _mul_dummy = Dummy([wrap(self._base_objs,i) * obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_mul_dummy)
-        return _mul_dummy
+            objs = [wrap(self._base_objs,i) * obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __rmul__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("mul", x, lmax)
         if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj * wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj * wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
         else:
-            _mul_dummy = Dummy([wrap(self._base_objs,i) * obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_mul_dummy)
-        return _mul_dummy
+            objs = [wrap(self._base_objs,i) * obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __imul__(self, x):
         self.setMul(x)
@@ -521,34 +550,28 @@ class PyoObject(PyoObjectBase):
 
     def __div__(self, x):
         x, lmax = convertArgsToLists(x)
+        if isNumberList(x):
+            return self._affineOp("div", x, lmax)
         if self.__len__() >= lmax:
-            _mul_dummy = Dummy([obj / wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)])
+            objs = [obj / wrap(x,i/self._op_duplicate) for i, obj in enumerate(self._base_objs)]
+        elif isinstance(x, PyoObject):
+            objs = [wrap(self._base_objs,i) / wrap(x,i) for i in range(lmax)]
         else:
-            if isinstance(x, PyoObject):
-                _mul_dummy = Dummy([wrap(self._base_objs,i) / wrap(x,i) for i in range(lmax)])
-            else:
-                _mul_dummy = Dummy([wrap(self._base_objs,i) / obj for i, obj in enumerate(x)])
-        self._keep_trace.append(_mul_dummy)
-        return _mul_dummy
+            objs = [wrap(self._base_objs,i) / obj for i, obj in enumerate(x)]
+        return self._keepNode(Dummy(objs))
 
     def __rdiv__(self, x):
         x, lmax = convertArgsToLists(x)
         if self.__len__() >= lmax:
-            tmp = []
-            for i, obj in enumerate(self._base_objs):
-                div_upsamp = Sig(wrap(x, i/self._op_duplicate))
-                self._keep_trace.append(div_upsamp)
-                tmp.append(div_upsamp / obj)
-            _mul_dummy = Dummy(tmp)
+            values = [wrap(x, i/self._op_duplicate) for i in range(self.__len__())]
+            bases = self._base_objs
         else:
-            tmp = []
-            for i, obj in enumerate(x):
-                div_upsamp = Sig(obj)
-                self._keep_trace.append(div_upsamp)
-                tmp.append(div_upsamp / wrap(self._base_objs,i))
-            _mul_dummy = Dummy(tmp)
-        self._keep_trace.append(_mul_dummy)
-        return _mul_dummy
+            values = x
+            bases = [wrap(self._base_objs,i) for i in range(lmax)]
+        sigs = [Sig(v) for v in values]
+        node = self._keepNode(Dummy([sig[0] / obj for sig, obj in zip(sigs, bases)]))
+        node._operands = sigs
+        return node
 
     def __idiv__(self, x):
         self.setDiv(x)
@@ -564,9 +587,44 @@ class PyoObject(PyoObjectBase):
         return Wrap(self, 0, x)
 
     def __neg__(self):
-        if self._zeros == None:
-            self._zeros = Sig(0)
-        return self._zeros - self
+        return self._affineOp("neg", [0], 1)
+
+    def _keepNode(self, node):
+        # Each operation returns a new node, owned by the caller, whose
+        # streams are kept alive by the objects reading them. Only while it
+        # is sent to the output is the node owned by this object, see
+        # Dummy.out().
+        node._owner = ref(self)
+        return node
+
+    def _affineOp(self, op, x, lmax):
+        # Scalar operations are computed by a single node per channel, as
+        # an affine expression (mul, add) of this object.
+        chnls = [(i, 1.0, 0.0) for i in range(self.__len__())]
+        if self.__len__() >= lmax:
+            values = [wrap(x, i/self._op_duplicate) for i in range(len(chnls))]
+        else:
+            values = x
+            chnls = [wrap(chnls, i) for i in range(lmax)]
+        objs = []
+        for (i, m, a), y in zip(chnls, values):
+            if op == "add":
+                a = a + y
+            elif op == "sub":
+                a = a - y
+            elif op == "rsub":
+                m, a = -m, y - a
+            elif op == "mul":
+                m, a = m * y, a * y
+            elif op == "div" and y != 0:
+                m, a = m * (1. / y), a * (1. / y)
+            elif op == "neg":
+                m, a = -m, -a
+            obj = self._base_objs[i] * float(m)
+            if a != 0:
+                obj.setAdd(float(a))
+            objs.append(obj)
+        return self._keepNode(Dummy(objs))
 
     def __lt__(self, x):
         return self.__do_comp__(comp=x, mode="<")
@@ -656,6 +714,52 @@ class PyoObject(PyoObjectBase):
         else:
             return [obj._getStream().getValue() for obj in self._base_objs]
 
+    def getBuffer(self, all=False):
+        """
+        Return the current buffer of samples as a read-only memoryview.
+
+        The view gives direct access, without copying, to the memory
+        where the object writes its samples, and keeps the object alive.
+        It is refreshed by the server at every buffer.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a view of each object's stream will be
+                returned as a list.
+
+                If False, only the view of the first object's stream
+                will be returned.
+
+        """
+        if not all:
+            return memoryview(self._base_objs[0]._getStream())
+        else:
+            return [memoryview(obj._getStream()) for obj in self._base_objs]
+
+    def asarray(self, all=False):
+        """
+        Return the current buffer of samples as a read-only numpy array.
+
+        The array shares the memory of the object's stream. Requires numpy.
+
+        :Args:
+
+            all : boolean, optional
+                If True, an array for each object's stream will be
+                returned as a list.
+
+                If False, only the array of the first object's stream
+                will be returned.
+
+        """
+        if not WITH_NUMPY:
+            raise ImportError("asarray() requires numpy.")
+        if not all:
+            return numpy.asarray(self.getBuffer())
+        else:
+            return [numpy.asarray(view) for view in self.getBuffer(True)]
+
     def play(self, dur=0, delay=0):
         """
         Start processing without sending samples to output.
@@ -741,6 +845,94 @@ class PyoObject(PyoObjectBase):
         [obj.stop() for obj in self._base_objs]
         return self
 
+    def playAt(self, time):
+        """
+        Start processing, without sending samples to output, at a given time.
+
+        The action is scheduled by the server, `time` seconds after the
+        beginning of the next buffer, and applied at the beginning of the
+        buffer containing this time. Unlike the `delay` argument of the
+        play() method, the time does not depend on the moment the method
+        is called from python. See Server.getEventStats().
+
+        This method returns `self`, allowing it to be applied at the object
+        creation.
+
+        :Args:
+
+            time : float
+                Time, in seconds, of the activation.
+
+        """
+        server = self.getServer()
+        if hasattr(self, "_trig_objs"):
+            self._trig_objs.playAt(time)
+        if hasattr(self, "_base_players"):
+            [server.scheduleAction(obj, time, 0) for obj in self._base_players]
+        [server.scheduleAction(obj, time, 0) for obj in self._base_objs]
+        return self
+
+    def outAt(self, time, chnl=0, inc=1):
+        """
+        Start processing and send samples to audio output at a given time.
+
+        The action is scheduled by the server, `time` seconds after the
+        beginning of the next buffer, and applied at the beginning of the
+        buffer containing this time. See playAt().
+
+        This method returns `self`, allowing it to be applied at the object
+        creation.
+
+        :Args:
+
+            time : float
+                Time, in seconds, of the activation.
+            chnl : int, optional
+                Physical output assigned to the first audio stream of the object.
+                Defaults to 0.
+            inc : int, optional
+                Output channel increment value. Defaults to 1.
+
+        If `chnl` is a list, successive values in the list will be
+        assigned to successive streams.
+
+        """
+        server = self.getServer()
+        if hasattr(self, "_trig_objs"):
+            self._trig_objs.playAt(time)
+        if hasattr(self, "_base_players"):
+            [server.scheduleAction(obj, time, 0) for obj in self._base_players]
+        if type(chnl) == ListType:
+            [server.scheduleAction(obj, time, 1, wrap(chnl,i)) for i, obj in enumerate(self._base_objs)]
+        else:
+            [server.scheduleAction(obj, time, 1, chnl+i*inc) for i, obj in enumerate(self._base_objs)]
+        return self
+
+    def stopAt(self, time):
+        """
+        Stop processing at a given time.
+
+        The action is scheduled by the server, `time` seconds after the
+        beginning of the next buffer, and applied at the beginning of the
+        buffer containing this time. See playAt().
+
+        This method returns `self`, allowing it to be applied at the object
+        creation.
+
+        :Args:
+
+            time : float
+                Time, in seconds, of the deactivation.
+
+        """
+        server = self.getServer()
+        if hasattr(self, "_trig_objs"):
+            self._trig_objs.stopAt(time)
+        if hasattr(self, "_base_players"):
+            [server.scheduleAction(obj, time, 2) for obj in self._base_players]
+        [server.scheduleAction(obj, time, 2) for obj in self._base_objs]
+        return self
+
     def mix(self, voices=1):
         """
         Mix the object's audio streams into `voices` streams and return
@@ -1066,8 +1258,8 @@ class PyoTableObject(PyoObjectBase):
                 New table size in samples.
 
         """
-        self._size = size
         [obj.setSize(size) for obj in self._base_objs]
+        self._size = size
         self.refreshView()
 
     def getSize(self, all=False):
@@ -1146,6 +1338,50 @@ class PyoTableObject(PyoObjectBase):
         else:
             return self._base_objs[0].getTable()
 
+    def getBuffer(self, all=False):
+        """
+        Returns the samples of the table as a writable memoryview.
+
+        The view gives direct access, without copying, to the memory of
+        the table, and keeps the table alive. Until all the views are
+        deleted, resizing the table raises a BufferError.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a view of each table stream is returned in a list.
+
+                If False, only the view of the first table stream (or the
+                only one) is returned.
+
+        """
+        if all:
+            return [memoryview(obj.getTableStream()) for obj in self._base_objs]
+        else:
+            return memoryview(self._base_objs[0].getTableStream())
+
+    def asarray(self, all=False):
+        """
+        Returns the samples of the table as a numpy array sharing the table memory.
+
+        Modifying the array modifies the table. Requires numpy.
+
+        :Args:
+
+            all : boolean, optional
+                If True, an array for each table stream is returned in a list.
+
+                If False, only the array of the first table stream (or the
+                only one) is returned.
+
+        """
+        if not WITH_NUMPY:
+            raise ImportError("asarray() requires numpy.")
+        if all:
+            return [numpy.asarray(view) for view in self.getBuffer(True)]
+        else:
+            return numpy.asarray(self.getBuffer())
+
     def normalize(self):
         """
         Normalize table samples between -1 and 1.
@@ -1482,6 +1718,52 @@ class PyoMatrixObject(PyoObjectBase):
         """
         return self._size
 
+    def getBuffer(self, all=False):
+        """
+        Returns the samples of the matrix as a writable 2 dimensions memoryview.
+
+        The view gives direct access, without copying, to the memory of
+        the matrix, and keeps the matrix alive. Its shape is (height,
+        width). Until all the views are deleted, resizing the matrix
+        raises a BufferError.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a view of each matrix stream is returned in a list.
+
+                If False, only the view of the first matrix stream (or the
+                only one) is returned.
+
+        """
+        if all:
+            return [memoryview(obj.getMatrixStream()) for obj in self._base_objs]
+        else:
+            return memoryview(self._base_objs[0].getMatrixStream())
+
+    def asarray(self, all=False):
+        """
+        Returns the samples of the matrix as a numpy array sharing the matrix memory.
+
+        The array's shape is (height, width). Modifying the array modifies
+        the matrix. Requires numpy.
+
+        :Args:
+
+            all : boolean, optional
+                If True, an array for each matrix stream is returned in a list.
+
+                If False, only the array of the first matrix stream (or the
+                only one) is returned.
+
+        """
+        if not WITH_NUMPY:
+            raise ImportError("asarray() requires numpy.")
+        if all:
+            return [numpy.asarray(view) for view in self.getBuffer(True)]
+        else:
+            return numpy.asarray(self.getBuffer())
+
     def normalize(self):
         """
         Normalize matrix samples between -1 and 1.
@@ -1829,6 +2111,11 @@ class Dummy(PyoObject):
         >>> print b
         <pyolib._core.Dummy object at 0x11fd710>
 
+        Each operation returns a new Dummy. It lives as long as it is
+        referenced or read by another object, and, once sent to the output
+        with out(), until it is stopped. Rebuilding expressions over and
+        over thus does not accumulate audio streams.
+
     >>> s = Server().boot()
     >>> s.start()
     >>> m = Metro(time=0.25).play()
@@ -1848,6 +2135,29 @@ class Dummy(PyoObject):
             else:
                 tmp_list.append(x)
         self._base_objs = tmp_list
+        self._owner = None
+        self._operands = []
+
+    def _keep(self, keep):
+        # Registers the node in, or removes it from, the nodes kept alive by
+        # the object it was created from.
+        owner = self._owner and self._owner()
+        if owner is not None:
+            owner._keep_trace = [node for node in owner._keep_trace if node is not self]
+            if keep:
+                owner._keep_trace.append(self)
+
+    def out(self, chnl=0, inc=1, dur=0, delay=0):
+        self._keep(True)
+        return PyoObject.out(self, chnl, inc, dur, delay)
+
+    def outAt(self, time, chnl=0, inc=1):
+        self._keep(True)
+        return PyoObject.outAt(self, time, chnl, inc)
+
+    def stop(self):
+        self._keep(False)
+        return PyoObject.stop(self)
 
 class InputFader(PyoObject):
     """
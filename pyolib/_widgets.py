@@ -132,6 +132,12 @@ def wxShowWindow(f, title, root):
     if root != None:
         root.MainLoop()
 
+def callInGuiThread(function):
+    # Runs `function` later, from the thread of the wx main loop. The views
+    # are only refreshed by their objects with wx, nothing to do otherwise.
+    if PYO_USE_WX and wx.GetApp() != None:
+        wx.CallAfter(function)
+
 def wxCreateDelayedCtrlWindows():
     for win in CTRLWINDOWS:
         f = PyoObjectControl(None, win[0], win[1])
@@ -350,7 +350,21 @@ class Yin(PyoObject):
             of the lowest desired frequency.
 
             Available at initialization time only.  Defaults to 1024.
+        hopsize : int, optional
+            Number of samples between two analyses of the last `winsize`
+            samples. A hop size smaller than the window size gives more
+            frequent estimations. If 0, the hop size is equal to the window
+            size. Defaults to 0.
+        spread : boolean, optional
+            If True, an analysis is split in four stages computed at the
+            beginning of the following buffers, spreading the cost over
+            several buffers. The estimation is delayed by four buffers.
+            Defaults to False.
 
+    .. note::
+
+        The difference function of the Yin algorithm is computed with
+        FFTs, its cost grows with `winsize` * log2(`winsize`).
 
     >>> s = Server(duplex=1).boot()
     >>> s.start()
@@ -362,16 +376,18 @@ class Yin(PyoObject):
     >>> a = LFO(freq*1.5, type=2, mul=0.2).out(1)
 
     """
-    def __init__(self, input, tolerance=0.2, minfreq=40, maxfreq=1000, cutoff=1000, winsize=1024, mul=1, add=0):
+    def __init__(self, input, tolerance=0.2, minfreq=40, maxfreq=1000, cutoff=1000, winsize=1024, hopsize=0, spread=False, mul=1, add=0):
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._tolerance = tolerance
         self._minfreq = minfreq
         self._maxfreq = maxfreq
         self._cutoff = cutoff
+        self._hopsize = hopsize
+        self._spread = spread
         self._in_fader = InputFader(input)
-        in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, mul, add, lmax = convertArgsToLists(self._in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, mul, add)
-        self._base_objs = [Yin_base(wrap(in_fader,i), wrap(tolerance,i), wrap(minfreq,i), wrap(maxfreq,i), wrap(cutoff,i), wrap(winsize,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, hopsize, spread, mul, add, lmax = convertArgsToLists(self._in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, hopsize, spread, mul, add)
+        self._base_objs = [Yin_base(wrap(in_fader,i), wrap(tolerance,i), wrap(minfreq,i), wrap(maxfreq,i), wrap(cutoff,i), wrap(winsize,i), wrap(hopsize,i), int(wrap(spread,i)), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -444,6 +460,35 @@ class Yin(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setCutoff(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setHopsize(self, x):
+        """
+        Replace the `hopsize` attribute.
+
+        :Args:
+
+            x : int
+                New number of samples between two analyses. If 0, the
+                hop size is equal to the window size.
+
+        """
+        self._hopsize = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setHopsize(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
+    def setSpread(self, x):
+        """
+        Replace the `spread` attribute.
+
+        :Args:
+
+            x : boolean
+                If True, an analysis is spread over the following buffers.
+
+        """
+        self._spread = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setSpread(int(wrap(x,i))) for i, obj in enumerate(self._base_objs)]
+
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
@@ -489,6 +534,20 @@ class Yin(PyoObject):
     @cutoff.setter
     def cutoff(self, x): self.setCutoff(x)
 
+    @property
+    def hopsize(self):
+        """int. Number of samples between two analyses."""
+        return self._hopsize
+    @hopsize.setter
+    def hopsize(self, x): self.setHopsize(x)
+
+    @property
+    def spread(self):
+        """boolean. If True, an analysis is spread over the following buffers."""
+        return self._spread
+    @spread.setter
+    def spread(self, x): self.setSpread(x)
+
 class Centroid(PyoObject):
     """
     Computes the spectral centroid of an input signal.
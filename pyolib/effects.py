@@ -754,8 +754,19 @@ class Convolve(PyoObject):
 
     .. note::
 
-        Convolution is very expensive to compute, so the impulse response must
-        be kept very short to run in real time.
+        Convolution is computed with a zero-latency partitioned algorithm, the
+        first samples of the impulse response are convolved directly and the
+        rest of it with uniformly partitioned FFT convolution. The partition
+        size depends on the length of the impulse and on the buffer size. If
+        the buffer size is not a multiple of 16, the convolution is computed
+        directly, which is very expensive, and the impulse response must be
+        kept very short to run in real time.
+
+        With the partitioned algorithm, the impulse response is copied when
+        the object is created, when the `table` attribute is replaced, when
+        the table is resized and when `refresh` is called. Call `refresh`
+        after any other modification of the samples of the table (ie. with
+        its `replace` method, a new sound of the same length or a TableRec).
 
         Usually convolution generates a high amplitude level, take care of the
         `mul` parameter!
@@ -809,6 +820,16 @@ class Convolve(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setTable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def refresh(self):
+        """
+        Reads the impulse response again from the table.
+
+        Must be called after the samples of the table have been modified
+        in place. The changes are applied at the beginning of the next buffer.
+
+        """
+        [obj.refresh() for obj in self._base_objs]
+
     @property
     def input(self):
         """PyoObject. Input signal to filter."""
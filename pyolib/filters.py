@@ -74,9 +74,16 @@ class Biquad(PyoObject):
         self._freq = freq
         self._q = q
         self._type = type
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, type, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, type, mul, add)
-        self._base_objs = [Biquad_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(type,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        if self._useBank(lmax, freq, q):
+            chnls = range(lmax)
+            self._base_players = [BiquadBank_base([wrap(in_fader,i) for i in chnls], [wrap(freq,i) for i in chnls],
+                                                  [wrap(q,i) for i in chnls], [wrap(type,i) for i in chnls])]
+            self._base_objs = [BiquadBankStream_base(self._base_players[0], i, wrap(mul,i), wrap(add,i)) for i in chnls]
+        else:
+            self._base_objs = [Biquad_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(type,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -140,6 +147,25 @@ class Biquad(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapQ(self._q),
                           SLMap(0, 4, 'lin', 'type', self._type, res="int", dataOnly=True),
@@ -174,6 +200,13 @@ class Biquad(PyoObject):
     @type.setter
     def type(self, x): self.setType(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Biquadx(PyoObject):
     """
     A multi-stages sweepable general purpose biquadratic digital filter.
@@ -218,6 +251,7 @@ class Biquadx(PyoObject):
         self._q = q
         self._type = type
         self._stages = stages
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, type, stages, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, type, stages, mul, add)
         self._base_objs = [Biquadx_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(type,i), wrap(stages,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -298,6 +332,25 @@ class Biquadx(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setStages(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapQ(self._q),
                           SLMap(0, 4, 'lin', 'type', self._type, res="int", dataOnly=True),
@@ -339,6 +392,13 @@ class Biquadx(PyoObject):
     @stages.setter
     def stages(self, x): self.setStages(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Biquada(PyoObject):
     """
     A general purpose biquadratic digital filter (floating-point arguments).
@@ -607,6 +667,7 @@ class EQ(PyoObject):
         self._q = q
         self._boost = boost
         self._type = type
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, boost, type, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, boost, type, mul, add)
         self._base_objs = [EQ_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(boost,i), wrap(type,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -685,6 +746,25 @@ class EQ(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapQ(self._q),
                           SLMap(-40.0, 40.0, "lin", "boost", self._boost),
@@ -727,6 +807,13 @@ class EQ(PyoObject):
     @type.setter
     def type(self, x): self.setType(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Tone(PyoObject):
     """
     A first-order recursive low-pass filter with variable frequency response.
@@ -1661,6 +1748,7 @@ class Phaser(PyoObject):
         self._q = q
         self._feedback = feedback
         self._num= num
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, spread, q, feedback, num, mul, add, lmax = convertArgsToLists(self._in_fader, freq, spread, q, feedback, num, mul, add)
         self._base_objs = [Phaser_base(wrap(in_fader,i), wrap(freq,i), wrap(spread,i), wrap(q,i), wrap(feedback,i), wrap(num,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -1736,6 +1824,25 @@ class Phaser(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setFeedback(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(20, 2000, "log", "freq", self._freq),
                           SLMap(0.5, 2, "lin", "spread", self._spread),
@@ -1779,6 +1886,13 @@ class Phaser(PyoObject):
     @feedback.setter
     def feedback(self, x): self.setFeedback(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Vocoder(PyoObject):
     """
     Applies the spectral envelope of a first sound to the spectrum of a second sound.
@@ -2582,6 +2696,7 @@ class SVF(PyoObject):
         self._freq = freq
         self._q = q
         self._type = type
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, type, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, type, mul, add)
         self._base_objs = [SVF_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(type,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -2647,6 +2762,25 @@ class SVF(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(20, 7350, "log", "freq", self._freq),
                           SLMap(0.5, 10, "log", "q", self._q),
@@ -2682,6 +2816,13 @@ class SVF(PyoObject):
     @type.setter
     def type(self, x): self.setType(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Average(PyoObject):
     """
     Moving average filter.
@@ -2798,6 +2939,7 @@ class Reson(PyoObject):
         self._input = input
         self._freq = freq
         self._q = q
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, mul, add)
         self._base_objs = [Reson_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -2845,6 +2987,25 @@ class Reson(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setQ(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapQ(self._q), SLMapMul(self._mul)]
         PyoObject.ctrl(self, map_list, title, wxnoserver)
@@ -2870,6 +3031,13 @@ class Reson(PyoObject):
     @q.setter
     def q(self, x): self.setQ(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class Resonx(PyoObject):
     """
     A multi-stages second-order resonant bandpass filter.
@@ -3031,6 +3199,7 @@ class ButLP(PyoObject):
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._freq = freq
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, mul, add, lmax = convertArgsToLists(self._in_fader, freq, mul, add)
         self._base_objs = [ButLP_base(wrap(in_fader,i), wrap(freq,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -3064,6 +3233,25 @@ class ButLP(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setFreq(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapMul(self._mul)]
         PyoObject.ctrl(self, map_list, title, wxnoserver)
@@ -3082,6 +3270,13 @@ class ButLP(PyoObject):
     @freq.setter
     def freq(self, x): self.setFreq(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class ButHP(PyoObject):
     """
     A second-order Butterworth highpass filter.
@@ -3110,6 +3305,7 @@ class ButHP(PyoObject):
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._freq = freq
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, mul, add, lmax = convertArgsToLists(self._in_fader, freq, mul, add)
         self._base_objs = [ButHP_base(wrap(in_fader,i), wrap(freq,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -3143,6 +3339,25 @@ class ButHP(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setFreq(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq), SLMapMul(self._mul)]
         PyoObject.ctrl(self, map_list, title, wxnoserver)
@@ -3161,6 +3376,13 @@ class ButHP(PyoObject):
     @freq.setter
     def freq(self, x): self.setFreq(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class ButBP(PyoObject):
     """
     A second-order Butterworth bandpass filter.
@@ -3193,6 +3415,7 @@ class ButBP(PyoObject):
         self._input = input
         self._freq = freq
         self._q = q
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, mul, add)
         self._base_objs = [ButBP_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -3240,6 +3463,25 @@ class ButBP(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setQ(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq),
                           SLMap(1, 100, "log", "q", self._q), SLMapMul(self._mul)]
@@ -3266,6 +3508,13 @@ class ButBP(PyoObject):
     @q.setter
     def q(self, x): self.setQ(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class ButBR(PyoObject):
     """
     A second-order Butterworth band-reject filter.
@@ -3298,6 +3547,7 @@ class ButBR(PyoObject):
         self._input = input
         self._freq = freq
         self._q = q
+        self._coeffrate = 1
         self._in_fader = InputFader(input)
         in_fader, freq, q, mul, add, lmax = convertArgsToLists(self._in_fader, freq, q, mul, add)
         self._base_objs = [ButBR_base(wrap(in_fader,i), wrap(freq,i), wrap(q,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
@@ -3345,6 +3595,25 @@ class ButBR(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setQ(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setCoeffRate(self, x):
+        """
+        Replace the `coeffrate` attribute.
+
+        When the frequency (or any other parameter used to compute the
+        coefficients) is an audio signal, the coefficients are computed
+        every `coeffrate` samples and linearly interpolated in between.
+        1 means that they are computed at every sample.
+
+        :Args:
+
+            x : int
+                New `coeffrate` attribute.
+
+        """
+        self._coeffrate = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setCoeffRate(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapFreq(self._freq),
                           SLMap(1, 100, "log", "q", self._q), SLMapMul(self._mul)]
@@ -3371,6 +3640,13 @@ class ButBR(PyoObject):
     @q.setter
     def q(self, x): self.setQ(x)
 
+    @property
+    def coeffrate(self):
+        """int. Number of samples between two computations of the coefficients."""
+        return self._coeffrate
+    @coeffrate.setter
+    def coeffrate(self, x): self.setCoeffRate(x)
+
 class ComplexRes(PyoObject):
     """
     Complex one-pole resonator filter.
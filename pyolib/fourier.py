@@ -485,6 +485,7 @@ class CarToPol(PyoObject):
         for i in range(lmax):
             self._base_objs.append(CarToPol_base(wrap(in_fader,i), wrap(in_fader2,i), 0, wrap(mul,i), wrap(add,i)))
             self._base_objs.append(CarToPol_base(wrap(in_fader,i), wrap(in_fader2,i), 1, wrap(mul,i), wrap(add,i)))
+        self._fastmath = bool(self.getServer().getFastMath())
 
     def __len__(self):
         return len(self._inreal)
@@ -553,6 +554,21 @@ class CarToPol(PyoObject):
         self._inimag = x
         self._in_fader2.setInput(x, fadetime)
 
+    def setFastMath(self, x):
+        """
+        Replace the `fastmath` attribute.
+
+        :Args:
+
+            x : boolean
+                True computes the angles with the polynomial
+                approximations (see Server.setFastMath), False with the
+                functions of the C math library.
+
+        """
+        self._fastmath = x
+        [obj.setFastMath(int(x)) for obj in self._base_objs]
+
     @property
     def inreal(self):
         """PyoObject. Real input signal."""
@@ -567,6 +583,13 @@ class CarToPol(PyoObject):
     @inimag.setter
     def inimag(self, x): self.setInImag(x)
 
+    @property
+    def fastmath(self):
+        """boolean. Approximated trigonometric functions."""
+        return self._fastmath
+    @fastmath.setter
+    def fastmath(self, x): self.setFastMath(x)
+
 class PolToCar(PyoObject):
     """
     Performs the polar to cartesian conversion.
@@ -628,6 +651,7 @@ class PolToCar(PyoObject):
         for i in range(lmax):
             self._base_objs.append(PolToCar_base(wrap(in_fader,i), wrap(in_fader2,i), 0, wrap(mul,i), wrap(add,i)))
             self._base_objs.append(PolToCar_base(wrap(in_fader,i), wrap(in_fader2,i), 1, wrap(mul,i), wrap(add,i)))
+        self._fastmath = bool(self.getServer().getFastMath())
 
     def __len__(self):
         return len(self._inmag)
@@ -696,6 +720,21 @@ class PolToCar(PyoObject):
         self._inang = x
         self._in_fader2.setInput(x, fadetime)
 
+    def setFastMath(self, x):
+        """
+        Replace the `fastmath` attribute.
+
+        :Args:
+
+            x : boolean
+                True computes the real and imaginary parts with the polynomial
+                approximations (see Server.setFastMath), False with the
+                functions of the C math library.
+
+        """
+        self._fastmath = x
+        [obj.setFastMath(int(x)) for obj in self._base_objs]
+
     @property
     def inmag(self):
         """PyoObject. Magnitude input signal."""
@@ -710,6 +749,13 @@ class PolToCar(PyoObject):
     @inang.setter
     def inang(self, x): self.setInAng(x)
 
+    @property
+    def fastmath(self):
+        """boolean. Approximated trigonometric functions."""
+        return self._fastmath
+    @fastmath.setter
+    def fastmath(self, x): self.setFastMath(x)
+
 class FrameDelta(PyoObject):
     """
     Computes the phase differences between successive frames.
@@ -336,9 +336,12 @@ class Noise(PyoObject):
 
         :Args:
 
-            x : int, {0, 1}
-                0 uses the system rand() method to generate number. Used as default.
-                1 uses a simple linear congruential generator, cheaper than rand().
+            x : int, {0, 1, 2}
+                0 uses the random generator of the object to generate uniform
+                numbers. Used as default.
+                1 uses a simple linear congruential generator, cheaper but
+                of lower quality.
+                2 generates a gaussian noise (standard deviation of 0.33).
 
         """
         self._type = x
@@ -351,7 +354,7 @@ class Noise(PyoObject):
 
     @property
     def type(self):
-        """int {0, 1}. Sets the generation algorithm."""
+        """int {0, 1, 2}. Sets the generation algorithm."""
         return self._type
     @type.setter
     def type(self, x): self.setType(x)
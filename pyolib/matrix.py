@@ -73,9 +73,13 @@ class NewMatrix(PyoMatrixObject):
 
         :Args:
 
-            x : list of list of floats
+            x : list of list of floats or buffer
                 New matrix. Must be of the same size as the actual matrix.
 
+                Any 2 dimensions object supporting the buffer protocol (ie.
+                a numpy array of shape (height, width)) of floats or doubles
+                is accepted.
+
         """
         [obj.setMatrix(x) for obj in self._base_objs]
         self.refreshView()
@@ -284,4 +284,81 @@ class CallAfter(PyoObject):
         pass
 
     def setDiv(self, x):
-        pass
\ No newline at end of file
+        pass
+
+class Timeline(PyoObject):
+    """
+    Signal driven by sample accurate events.
+
+    The events, scheduled with the `schedule` method, are kept by the
+    server and delivered to the object at the exact sample of their time,
+    whatever the buffer size. The timing does not depend on the moment
+    the method is called from python, so a whole sequence can be
+    scheduled in advance without jitter.
+
+    In step mode (the default), the signal holds the value of the last
+    event. In trigger mode, the signal is 0 except at the samples of the
+    events, where it takes their value, and can be used as the trigger of
+    TrigEnv, TrigRand and the other trigger objects.
+
+    :Parent: :py:class:`PyoObject`
+
+    :Args:
+
+        init : float, optional
+            Initial value of the signal in step mode. Defaults to 0.
+        trig : boolean, optional
+            If True, the object outputs triggers instead of steps. Defaults
+            to False.
+
+    .. note::
+
+        Events scheduled while the object is stopped are not lost in step
+        mode (the value is updated) but triggers are dropped.
+
+        Event times are relative to the beginning of the next buffer
+        when the server is running, or to the start of the server otherwise.
+
+    >>> s = Server().boot()
+    >>> s.start()
+    >>> tl = Timeline(trig=True)
+    >>> for i in range(16):
+    ...     tl.schedule(i * 0.125, 1)
+    >>> env = TrigEnv(tl, HannTable(), dur=0.1, mul=.3)
+    >>> a = Sine(freq=1000, mul=env).out()
+
+    """
+    def __init__(self, init=0, trig=False, mul=1, add=0):
+        PyoObject.__init__(self, mul, add)
+        self._init = init
+        self._trig = trig
+        init, trig, mul, add, lmax = convertArgsToLists(init, trig, mul, add)
+        self._base_objs = [Timeline_base(wrap(init,i), int(wrap(trig,i)), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+
+    def schedule(self, time, value=1):
+        """
+        Schedules an event.
+
+        :Args:
+
+            time : float
+                Time of the event, in seconds, from the beginning of the
+                next buffer.
+            value : float, optional
+                Value of the signal, in step mode, or of the trigger, in
+                trigger mode, at the time of the event. Defaults to 1.
+
+        """
+        time, value, lmax = convertArgsToLists(time, value)
+        [obj.schedule(wrap(time,i), wrap(value,i)) for i, obj in enumerate(self._base_objs)]
+
+    def unschedule(self):
+        """
+        Drops the pending events.
+
+        """
+        [obj.unschedule() for obj in self._base_objs]
+
+    def ctrl(self, map_list=None, title=None, wxnoserver=False):
+        self._map_list = [SLMapMul(self._mul)]
+        PyoObject.ctrl(self, map_list, title, wxnoserver)
@@ -90,6 +90,7 @@ class PVAnal(PyoPVObject):
         self._in_fader = InputFader(input)
         in_fader, size, overlaps, wintype, lmax = convertArgsToLists(self._in_fader, size, overlaps, wintype)
         self._base_objs = [PVAnal_base(wrap(in_fader,i), wrap(size,i), wrap(overlaps,i), wrap(wintype,i)) for i in range(lmax)]
+        self._fastmath = bool(self.getServer().getFastMath())
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -148,6 +149,21 @@ class PVAnal(PyoPVObject):
         x, lmax = convertArgsToLists(x)
         [obj.setWinType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setFastMath(self, x):
+        """
+        Replace the `fastmath` attribute.
+
+        :Args:
+
+            x : boolean
+                True computes the phases of the bins with the polynomial
+                approximations (see Server.setFastMath), False with the
+                functions of the C math library.
+
+        """
+        self._fastmath = x
+        [obj.setFastMath(int(x)) for obj in self._base_objs]
+
     @property
     def input(self):
         """PyoObject. Input signal to process."""
@@ -176,6 +192,13 @@ class PVAnal(PyoPVObject):
     @wintype.setter
     def wintype(self, x): self.setWinType(x)
 
+    @property
+    def fastmath(self):
+        """boolean. Approximated trigonometric functions."""
+        return self._fastmath
+    @fastmath.setter
+    def fastmath(self, x): self.setFastMath(x)
+
 class PVSynth(PyoObject):
     """
     Phase Vocoder synthesis object.
@@ -217,6 +240,7 @@ class PVSynth(PyoObject):
         self._wintype = wintype
         input, wintype, mul, add, lmax = convertArgsToLists(self._input, wintype, mul, add)
         self._base_objs = [PVSynth_base(wrap(input,i), wrap(wintype,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        self._fastmath = bool(self.getServer().getFastMath())
 
     def setInput(self, x):
         """
@@ -250,6 +274,21 @@ class PVSynth(PyoObject):
         self._map_list = [SLMapMul(self._mul)]
         PyoObject.ctrl(self, map_list, title, wxnoserver)
 
+    def setFastMath(self, x):
+        """
+        Replace the `fastmath` attribute.
+
+        :Args:
+
+            x : boolean
+                True computes the real and imaginary parts of the bins with the polynomial
+                approximations (see Server.setFastMath), False with the
+                functions of the C math library.
+
+        """
+        self._fastmath = x
+        [obj.setFastMath(int(x)) for obj in self._base_objs]
+
     @property
     def input(self):
         """PyoPVObject. Input signal to process."""
@@ -264,6 +303,13 @@ class PVSynth(PyoObject):
     @wintype.setter
     def wintype(self, x): self.setWinType(x)
 
+    @property
+    def fastmath(self):
+        """boolean. Approximated trigonometric functions."""
+        return self._fastmath
+    @fastmath.setter
+    def fastmath(self, x): self.setFastMath(x)
+
 class PVAddSynth(PyoObject):
     """
     Phase Vocoder additive synthesis object.
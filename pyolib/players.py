@@ -76,6 +76,15 @@ class SfPlayer(PyoObject):
         >>> sf = SfPlayer(SNDS_PATH + "/transparent.aif").out()
         >>> trig = TrigRand(sf['trig'])
 
+    .. note::
+
+        The sound is streamed from disk by a pool of background threads,
+        shared by all SfPlayer objects, so the audio thread only copies
+        samples from memory. If the samples are not in memory in time
+        (underrun), they are replaced by silence. With an offline server,
+        they are read from the file instead. See the getFillLevel() and
+        getUnderruns() methods to monitor the streaming.
+
     >>> s = Server().boot()
     >>> s.start()
     >>> snd = SNDS_PATH + "/transparent.aif"
@@ -207,6 +216,52 @@ class SfPlayer(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setInterp(wrap(x,i)) for i, obj in enumerate(self._base_players)]
 
+    def getFillLevel(self, all=False):
+        """
+        Returns the duration, in seconds, of sound in memory ahead of the read head.
+
+        Sounds are streamed from disk by background threads, which keep
+        the portion of the file around the read head (and the loop point)
+        in memory. The audio thread reads the file itself only when the
+        needed samples are not yet loaded.
+
+        :Args:
+
+            all : boolean, optional
+                If True, the fill level of each player will be returned
+                as a list.
+
+                If False, only the fill level of the first player will
+                be returned as a float.
+
+        """
+        if not all:
+            return self._base_players[0].getFillLevel()
+        else:
+            return [obj.getFillLevel() for obj in self._base_players]
+
+    def getUnderruns(self, all=False):
+        """
+        Returns the number of buffers with samples missing from memory.
+
+        In real time, the missing samples are replaced by silence. With
+        an offline server, they are read directly from disk.
+
+        :Args:
+
+            all : boolean, optional
+                If True, the number of underruns of each player will be
+                returned as a list.
+
+                If False, only the number of underruns of the first player
+                will be returned as an int.
+
+        """
+        if not all:
+            return self._base_players[0].getUnderruns()
+        else:
+            return [obj.getUnderruns() for obj in self._base_players]
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-2., 2., 'lin', 'speed', self._speed),
                           SLMap(1, 4, 'lin', 'interp', self._interp, res="int", dataOnly=True),
@@ -18,7 +18,7 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
-import os, time
+import os, time, gc, json, traceback, multiprocessing
 from _core import *
 from _widgets import createServerGUI
 
@@ -74,6 +74,16 @@ class Server(object):
             Name of jack client. Defaults to 'pyo'
         ichnls : int, optional
             Number of input channels if different of output channels. If None (default), ichnls = nchnls.
+        threads : int, optional
+            Number of threads used to compute the audio objects. Defaults to 1.
+
+            With more than one thread, the server derives the dependency graph of
+            the audio objects from their inputs and computes independent objects
+            in parallel on a pool of worker threads. Objects calling python functions
+            (Pattern, TrigFunc, CallAfter, ...) are always computed by the audio
+            thread and keep their order relative to all other objects. The output
+            is summed in the creation order, so the result is identical to the
+            serial processing.
 
     .. note::
 
@@ -92,6 +102,7 @@ class Server(object):
         - setNchnls(x) : Set the number of output (and input if `ichnls` = None) channels used by the server.
         - setIchnls(x) : Set the number of input channels (if different of output channels) used by the server.
         - setDuplex(x) : Set the duplex mode used by the server.
+        - setThreads(x) : Set the number of threads used to compute the audio objects.
         - setVerbosity(x) : Set the server's verbosity.
         - reinit(sr, nchnls, buffersize, duplex, audio, jackname) : Reinit the server's settings.
 
@@ -102,7 +113,7 @@ class Server(object):
 
     """
     def __init__(self, sr=44100, nchnls=2, buffersize=256, duplex=1,
-                 audio='portaudio', jackname='pyo', ichnls=None):
+                 audio='portaudio', jackname='pyo', ichnls=None, threads=1):
         if os.environ.has_key("PYO_SERVER_AUDIO") and "offline" not in audio and "embedded" not in audio:
             audio = os.environ["PYO_SERVER_AUDIO"]
         self._time = time
@@ -118,7 +129,9 @@ class Server(object):
         self._filename = None
         self._fileformat = 0
         self._sampletype = 0
+        self._threads = threads
         self._server = Server_base(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls)
+        self._server.setThreads(threads)
         self._server._setDefaultRecPath(os.path.join(os.path.expanduser("~"), "pyo_rec.wav"))
 
     def __del__(self):
@@ -132,7 +145,7 @@ class Server(object):
             self._time.sleep(.25)
 
     def reinit(self, sr=44100, nchnls=2, buffersize=256, duplex=1,
-               audio='portaudio', jackname='pyo', ichnls=None):
+               audio='portaudio', jackname='pyo', ichnls=None, threads=1):
         """
         Reinit the server'settings. Useful to alternate between real-time and offline server.
 
@@ -154,7 +167,9 @@ class Server(object):
         self._fileformat = 0
         self._sampletype = 0
         self._globalseed = 0
+        self._threads = threads
         self._server.__init__(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls)
+        self._server.setThreads(threads)
 
     def gui(self, locals=None, meter=True, timer=True, exit=True):
         """
@@ -408,6 +423,23 @@ class Server(object):
         """
         self._server.setDuplex(x)
 
+    def setThreads(self, x):
+        """
+        Set the number of threads used to compute the audio objects.
+
+        With 1 thread (the default), objects are computed serially, in
+        their creation order, by the audio callback. With more threads,
+        independent parts of the processing graph are computed in parallel.
+
+        :Args:
+
+            x : int
+                New number of threads.
+
+        """
+        self._threads = x
+        self._server.setThreads(x)
+
     def setVerbosity(self, x):
         """
         Set the server's verbosity.
@@ -469,6 +501,15 @@ class Server(object):
         """
         Set the server's global seed used by random objects.
 
+        The noise generators and the random objects (Noise, PinkNoise,
+        BrownNoise, Randi, Randh, Choice, RandInt, RandDur, Xnoise, Urn,
+        TrigRand, TrigChoice, TrigXnoise, Percent, Cloud, Beater, ...) own
+        their random generator. With a global seed, the numbers drawn by an
+        object only depend on the seed, its class and its rank among the
+        objects of the same class created since the boot. They don't depend
+        on the objects of the other classes, nor on the processing order
+        (see setThreads).
+
         :Args:
 
             x : int
@@ -480,6 +521,153 @@ class Server(object):
         self._globalseed = x
         self._server.setGlobalSeed(x)
 
+    def setPullMode(self, x):
+        """
+        Only compute the audio objects needed by the outputs.
+
+        In pull mode, the server computes the objects sent to the output
+        (with the `out()` method) or having side effects (writing to a
+        table, calling a python function, recording, analysis objects read
+        by no other object) and, through their inputs, everything they read.
+        Shared inputs are still computed once per buffer.
+
+        An object whose multiplier holds only zeros (mul=0, or an envelope at
+        rest like a stopped Adsr or Fader or a TrigEnv waiting for a trigger)
+        is put to sleep: its output is cleared and neither the object nor
+        the inputs only it reads are computed until the multiplier wakes up.
+        Sleeping and skipped objects don't advance their internal state
+        (oscillator phases, filter memories).
+
+        :Args:
+
+            x : boolean
+                True activates the pull mode, False (the default) computes
+                every playing object at every buffer.
+
+        """
+        self._server.setPullMode(int(x))
+
+    def setAsyncCallbacks(self, x):
+        """
+        Call the python functions of Pattern, TrigFunc and CallAfter from a dispatcher thread.
+
+        By default, these functions are called by the audio thread while it
+        computes the buffer in which they are triggered, so a slow function
+        delays the whole buffer. With asynchronous callbacks, the audio
+        thread only queues the function, with the time of the trigger, and a
+        dispatcher thread calls it between the buffers. The function may then
+        be called a few buffers after its trigger (see getCallbackStats).
+
+        The blocking offline server (audio="offline") always calls the
+        functions synchronously, to keep the rendering deterministic.
+
+        :Args:
+
+            x : boolean
+                True calls the functions from the dispatcher thread, False
+                (the default) calls them from the audio thread.
+
+        """
+        self._server.setAsyncCallbacks(int(x))
+
+    def setReleaseGIL(self, x):
+        """
+        Compute the audio objects without holding the python interpreter lock.
+
+        By default, the audio thread holds the GIL while it computes a
+        buffer, so python threads (a GUI, a network listener, a sequencer)
+        only run between the buffers. When the GIL is released, python code
+        runs in parallel with the audio processing and the objects calling
+        python functions (TrigFunc, Pattern, ...) take the lock back only
+        for their own computation.
+
+        In this mode, the `set...`, `play`, `out` and `stop` methods of the
+        audio objects called from a python thread while the server is
+        running are not applied immediately: they are queued and the audio
+        thread applies them, in order, at the beginning of the next buffer
+        (see getCommandStats). Objects created or deleted while a buffer
+        is computed are added to, or removed from, the server once the
+        buffer is done. The other methods of the tables and matrices must
+        not be called from a python thread while the server is running.
+
+        :Args:
+
+            x : boolean
+                True computes the objects without the GIL, False (the
+                default) holds the GIL during the whole buffer.
+
+        """
+        self._server.setReleaseGIL(int(x))
+
+    def setFrameBalancing(self, x):
+        """
+        Spread the fft frames of the spectral objects over the buffers.
+
+        PVAnal (and the phase vocoder chain that follows it) and CvlVerb
+        compute a whole fft frame at the single sample where their input
+        frame is full. With frame balancing, every new object starts with an
+        offset so that its frames fall in the buffer of its hop which holds
+        the fewest frames, instead of in the same buffers as the frames of
+        the other objects. The latency of the objects is unchanged. Only
+        objects created (or resized) after the call are affected.
+
+        FFT and IFFT keep their phase, because the bins produced by an FFT
+        must stay aligned, sample by sample, with the IFFT reading them.
+
+        :Args:
+
+            x : boolean
+                True (the default) offsets the frames, False computes the
+                frames of all objects in the same buffers.
+
+        """
+        self._server.setFrameBalancing(int(x))
+
+    def setFastMath(self, x):
+        """
+        Use polynomial approximations of atan2, sin and cos in the spectral objects.
+
+        PVAnal computes the phase of every bin with atan2, PVSynth the real
+        and imaginary parts with sin and cos, at every frame. CarToPol and
+        PolToCar do the same for every sample. With fast math, these
+        functions are replaced by polynomial approximations computed over
+        the whole half-spectrum (or buffer) at once, which the compiler can
+        vectorise. The largest errors are 2e-8 radian for atan2 and 2e-9
+        for sin and cos (for phases smaller than 2^20), below the rounding
+        of the single precision build. Only objects created after the call
+        are affected, the `fastmath` attribute of each object changes its
+        own setting.
+
+        :Args:
+
+            x : boolean
+                True uses the approximations, False (the default) uses the
+                functions of the C math library.
+
+        """
+        self._server.setFastMath(int(x))
+
+    def setBankThreshold(self, x):
+        """
+        Set the number of streams from which Biquad filters are multichannel.
+
+        Biquad objects with at least `x` streams, and with numbers as
+        frequencies and Qs, are computed by a single multichannel object
+        instead of one object per stream. The channels are processed
+        together, in the same loop, which is faster for large banks. Filters
+        with audio-rate parameters keep one object per stream, which is
+        faster for them. The object's interface is unchanged. Only objects
+        created after the call are affected.
+
+        :Args:
+
+            x : int
+                Minimum number of streams. 0 disables the multichannel
+                objects. Defaults to 32.
+
+        """
+        PyoObject._BANK_THRESHOLD = int(x)
+
     def setStartOffset(self, x):
         """
         Set the server's starting time offset. First `x` seconds will be rendered
@@ -828,6 +1016,115 @@ class Server(object):
         """
         return self._server.getGlobalSeed()
 
+    def getThreads(self):
+        """
+        Return the number of threads used to compute the audio objects.
+
+        """
+        return self._server.getThreads()
+
+    def getPullMode(self):
+        """
+        Return True if only the audio objects needed by the outputs are computed.
+
+        """
+        return bool(self._server.getPullMode())
+
+    def getAsyncCallbacks(self):
+        """
+        Return True if the python callbacks are called from the dispatcher thread.
+
+        """
+        return bool(self._server.getAsyncCallbacks())
+
+    def getReleaseGIL(self):
+        """
+        Return True if the audio objects are computed without the GIL.
+
+        """
+        return bool(self._server.getReleaseGIL())
+
+    def getFrameBalancing(self):
+        """
+        Return True if the fft frames of the spectral objects are spread over the buffers.
+
+        """
+        return bool(self._server.getFrameBalancing())
+
+    def getFastMath(self):
+        """
+        Return True if new spectral objects use the approximated trigonometric functions.
+
+        """
+        return bool(self._server.getFastMath())
+
+    def getBankThreshold(self):
+        """
+        Return the number of streams from which Biquad filters are multichannel.
+
+        """
+        return PyoObject._BANK_THRESHOLD
+
+    def getCallbackStats(self):
+        """
+        Return the counters of the callback dispatcher as a dictionary.
+
+        Counters start when the dispatcher thread is created, at boot time
+        or by setAsyncCallbacks(True) on a booted server. The keys are:
+
+            - 'queued' : number of callbacks queued by the audio thread.
+            - 'dispatched' : number of callbacks called by the dispatcher thread.
+            - 'late' : number of callbacks called more than a buffer after their trigger.
+            - 'overflows' : number of callbacks called by the audio thread
+              because the queue was full.
+            - 'depth' : number of callbacks currently waiting in the queue.
+            - 'maxdepth' : maximum number of callbacks waiting in the queue.
+            - 'maxdelay' : longest delay, in seconds, between a trigger and its callback.
+
+        """
+        queued, dispatched, late, overflows, depth, maxdepth, maxdelay, sr = self._server.getCallbackStats()
+        return {'queued': queued, 'dispatched': dispatched, 'late': late, 'overflows': overflows,
+                'depth': depth, 'maxdepth': maxdepth, 'maxdelay': maxdelay / sr}
+
+    def getEventStats(self):
+        """
+        Return the counters of the sample accurate event scheduler as a dictionary.
+
+        Events are scheduled by the playAt(), outAt() and stopAt() methods
+        of the audio objects and by the Timeline object. The keys are:
+
+            - 'scheduled' : number of events scheduled.
+            - 'applied' : number of events applied by the audio thread.
+            - 'late' : number of events applied after their time, at the
+              beginning of the next buffer.
+            - 'depth' : number of events currently waiting.
+            - 'maxdepth' : maximum number of events waiting.
+            - 'resolution' : duration, in seconds, of a buffer. The play, out
+              and stop actions are applied at the beginning of the buffer
+              containing their time, the Timeline events at their sample.
+
+        """
+        scheduled, applied, late, depth, maxdepth, bs = self._server.getEventStats()
+        return {'scheduled': scheduled, 'applied': applied, 'late': late, 'depth': depth,
+                'maxdepth': maxdepth, 'resolution': bs / self.getSamplingRate()}
+
+    def getCommandStats(self):
+        """
+        Return the counters of the commands queue of the release GIL mode as a dictionary.
+
+        Counters start with the first call to setReleaseGIL(True). The keys are:
+
+            - 'posted' : number of method calls queued by the python threads.
+            - 'applied' : number of queued calls applied.
+            - 'waits' : number of calls which waited for the audio thread
+              because the queue was full.
+            - 'depth' : number of calls currently waiting in the queue.
+            - 'maxdepth' : maximum number of calls waiting in the queue.
+
+        """
+        posted, applied, waits, depth, maxdepth = self._server.getCommandStats()
+        return {'posted': posted, 'applied': applied, 'waits': waits, 'depth': depth, 'maxdepth': maxdepth}
+
     def getIsStarted(self):
         """
         Returns 1 if the server is started, otherwise returns 0.
@@ -861,7 +1158,137 @@ class Server(object):
         Returns the number of streams currently in the Server memory.
 
         """
-        return len(self._server.getStreams())
+        return self._server.getNumberOfStreams()
+
+    def startProfiling(self, trace=False, events=100000):
+        """
+        Reset and start the profiler.
+
+        While the profiler runs, the server measures the time spent in every
+        audio object at every buffer, and the time needed to compute the
+        whole buffer, from which the cpu load and the deadline misses (buffers
+        computed in more time than their duration) are derived. Underflows
+        and overflows reported by the audio driver are counted as xruns.
+        When the profiler is not running, its overhead is one test per object.
+
+        :Args:
+
+            trace : boolean, optional
+                If True, every object call and every buffer are also recorded
+                as events, to be saved with `writeProfileTrace`. Defaults to False.
+            events : int, optional
+                Maximum number of recorded events. Defaults to 100000.
+
+        """
+        if trace:
+            self._server.startProfiling(events)
+        else:
+            self._server.startProfiling(0)
+
+    def stopProfiling(self):
+        """
+        Stop the profiler. The measurements are kept until the next call to `startProfiling`.
+
+        """
+        self._server.stopProfiling()
+
+    def getProfile(self):
+        """
+        Return the profiler measurements as a dictionary.
+
+        Times are in seconds and percentages are relative to the total
+        computing time of the buffers. The keys are:
+
+            - 'blocks' : number of buffers computed.
+            - 'time' : total time spent computing the buffers.
+            - 'load' : mean cpu load, in percent of the buffer duration.
+            - 'maxload' : cpu load of the heaviest buffer.
+            - 'misses' : number of buffers computed in more time than their duration.
+            - 'xruns' : number of underflows and overflows reported by the audio driver.
+            - 'objects' : one dictionary per living object (keys 'id', 'class',
+              'calls', 'time', 'mean', 'max', 'percent'), heaviest first.
+            - 'classes' : one dictionary per class, deleted objects included
+              (keys 'class', 'count', 'calls', 'time', 'mean', 'max', 'percent'),
+              heaviest first.
+
+        """
+        (active, blocks, misses, xruns, busy, maxblock, period), streams, removed = self._server.getProfile()
+        total = busy if busy > 0 else 1.0
+        objects, classes = [], {}
+        for sid, name, cputime, calls, maxtime in streams:
+            name = _profile_class_name(name)
+            objects.append({'id': sid, 'class': name, 'calls': calls, 'time': cputime, 'mean': cputime / calls,
+                            'max': maxtime, 'percent': cputime * 100. / total})
+            t, c, m, n = classes.get(name, (0.0, 0, 0.0, 0))
+            classes[name] = (t + cputime, c + calls, max(m, maxtime), n + 1)
+        for name, (cputime, calls, maxtime, count) in removed.items():
+            name = _profile_class_name(name)
+            t, c, m, n = classes.get(name, (0.0, 0, 0.0, 0))
+            classes[name] = (t + cputime, c + calls, max(m, maxtime), n + count)
+        classes = [{'class': name, 'count': n, 'calls': c, 'time': t, 'mean': t / c, 'max': m,
+                    'percent': t * 100. / total} for name, (t, c, m, n) in classes.items()]
+        objects.sort(key=lambda x: x['time'], reverse=True)
+        classes.sort(key=lambda x: x['time'], reverse=True)
+        if blocks > 0:
+            load, maxload = busy * 100. / (blocks * period), maxblock * 100. / period
+        else:
+            load = maxload = 0.0
+        return {'blocks': blocks, 'time': busy, 'load': load, 'maxload': maxload, 'misses': misses,
+                'xruns': xruns, 'objects': objects, 'classes': classes}
+
+    def getProfileReport(self, num=20):
+        """
+        Return the profiler measurements as a text report.
+
+        :Args:
+
+            num : int, optional
+                Maximum number of classes and objects listed. Defaults to 20.
+
+        """
+        prof = self.getProfile()
+        lines = ["%d buffers in %.3f sec, load: %.1f%% (max %.1f%%), deadline misses: %d, xruns: %d" % \
+                 (prof['blocks'], prof['time'], prof['load'], prof['maxload'], prof['misses'], prof['xruns']), ""]
+        lines.append("%-24s %8s %10s %10s %10s %8s" % ("Class", "Objects", "Time (ms)", "Mean (us)", "Max (us)", "%"))
+        for c in prof['classes'][:num]:
+            lines.append("%-24s %8d %10.3f %10.3f %10.3f %8.2f" % (c['class'], c['count'], c['time'] * 1000,
+                         c['mean'] * 1e6, c['max'] * 1e6, c['percent']))
+        lines.append("")
+        lines.append("%-24s %8s %10s %10s %10s %8s" % ("Object", "Id", "Time (ms)", "Mean (us)", "Max (us)", "%"))
+        for o in prof['objects'][:num]:
+            lines.append("%-24s %8d %10.3f %10.3f %10.3f %8.2f" % (o['class'], o['id'], o['time'] * 1000,
+                         o['mean'] * 1e6, o['max'] * 1e6, o['percent']))
+        return "\n".join(lines)
+
+    def writeProfileTrace(self, filename):
+        """
+        Save the events recorded by the profiler in the Chrome trace format.
+
+        The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+        Every buffer and every object call appear on the timeline of the
+        thread which computed them. The profiler must have been started with
+        `trace` set to True.
+
+        :Args:
+
+            filename : string
+                Path of the json file to write.
+
+        """
+        events, dropped = self._server.getProfileTrace()
+        trace = []
+        for name, sid, thread, start, dur in events:
+            if sid == 0:
+                event = {'name': name, 'cat': 'buffer', 'args': {}}
+            else:
+                event = {'name': _profile_class_name(name), 'cat': 'object', 'args': {'id': sid}}
+            event.update({'ph': 'X', 'pid': 1, 'tid': thread, 'ts': start * 1e6, 'dur': dur * 1e6})
+            trace.append(event)
+        if dropped > 0:
+            print "Profile trace: %d events were not recorded, the buffer was full." % dropped
+        f = open(filename, "w")
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+        f.close()
 
     def setServer(self):
         """
@@ -939,4 +1366,123 @@ class Server(object):
         if (type(x) == int):
             self.setGlobalSeed(x)
         else:
-            raise Exception("global seed must be an integer")
\ No newline at end of file
+            raise Exception("global seed must be an integer")
+
+def _profile_class_name(name):
+    # Class name of a stream's object, without the module and the _base suffix.
+    name = name.split(".")[-1]
+    if name.endswith("_base"):
+        name = name[:-5]
+    return name
+
+######################################################################
+### Batch offline rendering
+######################################################################
+_render_server = None
+
+def _render_init():
+    # Each worker process boots its own offline server once and reuses
+    # it for all the jobs it receives.
+    global _render_server
+    _render_server = Server(audio="offline")
+
+def _render_job(index_and_job):
+    index, job = index_and_job
+    s = _render_server
+    start = time.time()
+    error = None
+    objs = None
+    try:
+        s.reinit(sr=job.get("sr", 44100), nchnls=job.get("nchnls", 2),
+                 buffersize=job.get("buffersize", 256), duplex=0, audio="offline")
+        s.setVerbosity(5)
+        s.boot()
+        try:
+            if "script" in job:
+                objs = dict(current_pyo.__dict__)
+                objs.update({"__name__": "__pyo_job__", "s": s})
+                execfile(job["script"], objs)
+            else:
+                objs = job["func"](*job.get("args", ()), **job.get("kwargs", {}))
+            s.recordOptions(dur=job["dur"], filename=job["filename"],
+                            fileformat=job.get("fileformat", 0), sampletype=job.get("sampletype", 0))
+            s.start()
+        finally:
+            objs = None
+            gc.collect()
+            s.shutdown()
+    except:
+        error = traceback.format_exc()
+    return index, job.get("filename"), time.time() - start, error
+
+def render_jobs(jobs, processes=None, callback=None):
+    """
+    Renders many offline jobs in a pool of worker processes.
+
+    Each worker process boots its own offline server once and reuses it
+    for every job it receives, so there is no interpreter startup nor
+    pyo import cost per job. A job is a dictionary with these keys:
+
+        - func : callable
+            Function creating the processing chain. It is called, with
+            the job's `args` and `kwargs`, once the server is booted. It must
+            return the objects to keep alive during the rendering. It must
+            be defined at the top level of a module to be sent to a worker.
+        - script : string
+            Instead of `func`, path of a python script creating the processing
+            chain. It is executed with pyo already imported and the booted
+            server available as `s`. It must not create, boot or start a server.
+        - filename : string
+            Path of the soundfile to create.
+        - dur : float
+            Duration, in seconds, of the soundfile.
+        - sr, nchnls, buffersize : optional
+            Server settings. Default to 44100, 2 and 256.
+        - fileformat, sampletype : int, optional
+            Soundfile format, as in Server.recordOptions. Default to 0.
+        - args, kwargs : optional
+            Positional and keyword arguments given to `func`.
+
+    Returns a list of (filename, time, error) tuples, in the order of the
+    jobs, where `time` is the rendering time of the job in seconds and `error`
+    is None or the traceback of the exception raised by the job.
+
+    Must be called from a process that has not created a Server, and,
+    on Windows, from the `if __name__ == "__main__":` block of the script.
+
+    :Args:
+
+        jobs : list of dictionaries
+            Jobs to render.
+        processes : int, optional
+            Number of worker processes. The default, None, uses the number
+            of CPU cores.
+        callback : callable, optional
+            Function called in the calling process each time a job is done,
+            with the job's index and its (filename, time, error) tuple as
+            arguments. Jobs finish in any order.
+
+    >>> def synth(freq):
+    ...     return Sine(freq=freq, mul=0.3).out()
+    >>> jobs = [{"func": synth, "args": (f,), "dur": 2,
+    ...          "filename": "/tmp/sine_%d.wav" % f} for f in range(100, 1100, 100)]
+    >>> results = render_jobs(jobs, processes=4)
+
+    """
+    if serverCreated():
+        raise RuntimeError("render_jobs() must be called before creating a Server.")
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    pool = multiprocessing.Pool(processes, _render_init)
+    try:
+        for index, filename, elapsed, error in pool.imap_unordered(_render_job, enumerate(jobs)):
+            results[index] = (filename, elapsed, error)
+            if callback != None:
+                callback(index, results[index])
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
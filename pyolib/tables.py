@@ -19,10 +19,11 @@ License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
 from _core import *
 from _maps import *
-from _widgets import createGraphWindow, createDataGraphWindow, createSndViewTableWindow
+from _widgets import createGraphWindow, createDataGraphWindow, createSndViewTableWindow, callInGuiThread
 from types import ListType
+from array import ArrayType
 from math import pi
-import copy
+import copy, threading
 
 ######################################################################
 ### Tables
@@ -1319,6 +1320,89 @@ class ExpTable(PyoTableObject):
     @list.setter
     def list(self, x): self.replace(x)
 
+class SndLoadFuture(object):
+    """
+    Pending load of a sound started by SndTable.setSoundAsync().
+
+    :Args:
+
+        table : SndTable
+            The table receiving the sound.
+        parts : int
+            Number of loads to wait for (one per path if a list is given).
+        callback : callable
+            Function called, with a boolean, once all the loads are done.
+            The boolean is False if a load failed or was superseded.
+
+    """
+    def __init__(self, table, parts, callback=None):
+        self._table = table
+        self._pending = parts
+        self._ok = True
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+
+    def _loaded(self, ok):
+        # Called by the loading threads, once the samples are in the table
+        # or dropped.
+        self._lock.acquire()
+        self._pending -= 1
+        self._ok = self._ok and ok
+        last = self._pending == 0
+        self._lock.release()
+        if last:
+            self._table._updateSizes()
+            # The GUI is only touched from its own thread.
+            if self._table.viewFrame != None:
+                callInGuiThread(self._table.refreshView)
+            self._event.set()
+            if self._callback is not None:
+                self._callback(self._ok)
+
+    def done(self):
+        """
+        Returns True if the new sound is in the table (or the load failed).
+
+        """
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Waits until the new sound is in the table.
+
+        Returns True if the load is done, False if `timeout` expired.
+
+        :Args:
+
+            timeout : float, optional
+                Maximum time to wait, in seconds. The default, None, waits
+                without limit.
+
+        """
+        self._event.wait(timeout)
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """
+        Waits until the new sound is in the table and returns the table.
+
+        Raises RuntimeError if `timeout` expired and IOError if the sound
+        could not be read or if the load was superseded by a later one.
+
+        :Args:
+
+            timeout : float, optional
+                Maximum time to wait, in seconds. The default, None, waits
+                without limit.
+
+        """
+        if not self.wait(timeout):
+            raise RuntimeError("SndTable: the sound is not loaded yet.")
+        if not self._ok:
+            raise IOError("SndTable: the sound could not be loaded.")
+        return self._table
+
 class SndTable(PyoTableObject):
     """
     Transfers data from a soundfile into a function table.
@@ -1343,6 +1427,45 @@ class SndTable(PyoTableObject):
             Stops reading at `stop` seconds into the file. Available at
             initialization time only. The default (None) means the end of
             the file.
+        initchnls : int, optional
+            Number of channels of the empty table created when `path` is
+            None. Defaults to 1.
+        mode : int {0, 1, 2}, optional
+            How the samples are brought in memory. Available at
+            initialization time only.
+                0. The sound is decoded in memory (default).
+                1. Memory-mapped. The file is mapped in the table and
+                   the system reads it ahead in the background, so the
+                   table is available instantly.
+                2. Lazy. The file is mapped in the table but only the
+                   regions actually read (by TableRead, Granulator,
+                   Looper, ...) are paged in memory. Useful to open very
+                   large sample libraries.
+
+            Modes 1 and 2 apply to mono WAV files whose samples are stored
+            in the floating-point format used by pyo (32-bit floats, or
+            64-bit floats with pyo64). Other sounds are decoded in memory.
+            Mapped samples are copy-on-write: the file on disk is never
+            modified.
+        sr : int, optional
+            If given, the sound is converted to this sampling rate while it
+            is loaded, with a polyphase lowpass resampler, and getRate()
+            and getDur() refer to the converted table. Also applies to
+            sounds loaded later with setSound(). A converted sound is
+            always decoded in memory. Available at initialization time
+            only. The default (None) keeps the sampling rate of the file.
+
+    .. note::
+
+        All channels of a sound are decoded in a single pass over the file.
+
+        Decoded sounds are kept in a cache shared by all the SndTable
+        objects (see setSndCacheSize), so loading a sound already used by
+        another table doesn't read the file again and doesn't take more
+        memory. A table makes its own copy of the samples the first time
+        it modifies them (normalize, reverse, fadein, put, ...). A table
+        given to an object writing in it from the audio thread (TableWrite,
+        TableScale, ...) keeps private samples for all its sounds.
 
     >>> s = Server().boot()
     >>> s.start()
@@ -1352,31 +1475,38 @@ class SndTable(PyoTableObject):
     >>> a = Osc(table=t, freq=[freq, freq*.995], mul=.3).out()
 
     """
-    def __init__(self, path=None, chnl=None, start=0, stop=None, initchnls=1):
+    def __init__(self, path=None, chnl=None, start=0, stop=None, initchnls=1, mode=0, sr=None):
         PyoTableObject.__init__(self)
         self._path = path
         self._chnl = chnl
         self._start = start
         self._stop = stop
+        self._mode = mode
+        self._sr = sr
+        if sr == None:
+            sr = 0
         self._size = []
         self._dur = []
         self._base_objs = []
         path, lmax = convertArgsToLists(path)
         if self._path == None:
-            self._base_objs = [SndTable_base("", 0, 0) for i in range(initchnls)]
+            self._base_objs = [SndTable_base("", 0, 0, -1, mode, sr) for i in range(initchnls)]
         else:
             for p in path:
                 _size, _dur, _snd_sr, _snd_chnls, _format, _type = sndinfo(p)
                 if chnl == None:
+                    objs = [SndTable_base("", i, 0, -1, mode, sr) for i in range(_snd_chnls)]
                     if stop == None:
-                        self._base_objs.extend([SndTable_base(p, i, start) for i in range(_snd_chnls)])
+                        objs[0].setSoundChannels(p, objs[1:], start)
                     else:
-                        self._base_objs.extend([SndTable_base(p, i, start, stop) for i in range(_snd_chnls)])
+                        objs[0].setSoundChannels(p, objs[1:], start, stop)
+                    self._base_objs.extend(objs)
                 else:
                     if stop == None:
-                        self._base_objs.append(SndTable_base(p, chnl, start))
+                        self._base_objs.append(SndTable_base(p, chnl, start, -1, mode, sr))
                     else:
-                        self._base_objs.append(SndTable_base(p, chnl, start, stop))
+                        self._base_objs.append(SndTable_base(p, chnl, start, stop, mode, sr))
+                _snd_sr = sr or _snd_sr
                 self._size.append(self._base_objs[-1].getSize())
                 self._dur.append(self._size[-1] / float(_snd_sr))
             if lmax == 1:
@@ -1411,22 +1541,112 @@ class SndTable(PyoTableObject):
             for i, obj in enumerate(self._base_objs):
                 p = path[i%lmax]
                 _size, _dur, _snd_sr, _snd_chnls, _format, _type = sndinfo(p)
-                self._size.append(_size)
-                self._dur.append(_dur)
                 if stop == None:
                     obj.setSound(p, 0, start)
                 else:
                     obj.setSound(p, 0, start, stop)
+                self._size.append(obj.getSize())
+                self._dur.append(self._size[-1] / float(self._sr or _snd_sr))
         else:
             _size, _dur, _snd_sr, _snd_chnls, _format, _type = sndinfo(path)
-            self._size = _size
-            self._dur = _dur
             if stop == None:
-                [obj.setSound(path, (i%_snd_chnls), start) for i, obj in enumerate(self._base_objs)]
+                self._base_objs[0].setSoundChannels(path, self._base_objs[1:], start)
             else:
-                [obj.setSound(path, (i%_snd_chnls), start, stop) for i, obj in enumerate(self._base_objs)]
+                self._base_objs[0].setSoundChannels(path, self._base_objs[1:], start, stop)
+            self._size = self._base_objs[0].getSize()
+            self._dur = self._size / float(self._sr or _snd_sr)
         self.refreshView()
 
+    def setSoundAsync(self, path, start=0, stop=None, callback=None):
+        """
+        Load a new sound in the table without blocking.
+
+        The sound is decoded by a background thread, without the python
+        global lock, so neither the caller nor the audio processing wait
+        for the file. The new samples then replace the old ones at the
+        beginning of an audio block: the objects reading the table
+        (TableRead, Looper, Granulator, ...) get the new sound, with its
+        size and sampling rate, between two blocks, never in the middle of
+        one. If the server is not running, the samples are replaced as
+        soon as they are decoded. The last request always wins: a load is
+        dropped if, before its samples are installed, another sound is
+        loaded in the table (setSound, setSoundAsync, append, insert) or
+        the table is modified with setSize or setData.
+
+        Keeps the number of channels of the sound loaded at initialization,
+        like setSound().
+
+        Returns a SndLoadFuture object, whose done(), wait() and result()
+        methods tell when the new sound is in the table.
+
+        :Args:
+
+            path : string
+                Full path of the new sound.
+            start : float, optional
+                Begins reading at `start` seconds into the file. Defaults to 0.
+            stop : float, optional
+                Stops reading at `stop` seconds into the file. The default (None)
+                means the end of the file.
+            callback : callable, optional
+                Function called once the new sound is in the table, from the
+                loading thread, with True as argument, or False if the file
+                could not be read or if the load was superseded. Defaults
+                to None.
+
+        >>> s = Server().boot()
+        >>> s.start()
+        >>> t = SndTable(SNDS_PATH + '/transparent.aif')
+        >>> a = Looper(t, dur=.5, mul=.3).out()
+        >>> f = t.setSoundAsync(SNDS_PATH + '/accord.aif')
+        >>> print f.wait()
+        True
+
+        """
+        self._path = path
+        if stop == None:
+            stop = -1
+        if type(path) == ListType:
+            path, lmax = convertArgsToLists(path)
+            future = SndLoadFuture(self, len(self._base_objs), callback)
+            for i, obj in enumerate(self._base_objs):
+                obj.setSoundAsync(path[i%lmax], [], start, stop, future._loaded)
+        else:
+            future = SndLoadFuture(self, 1, callback)
+            self._base_objs[0].setSoundAsync(path, self._base_objs[1:], start, stop, future._loaded)
+        return future
+
+    def _updateSizes(self):
+        # Size and duration after an asynchronous load.
+        if type(self._path) == ListType:
+            self._size = [obj.getSize() for obj in self._base_objs]
+            self._dur = [1.0 / obj.getRate() for obj in self._base_objs]
+        else:
+            self._size = self._base_objs[0].getSize()
+            self._dur = 1.0 / self._base_objs[0].getRate()
+
+    def getBuffer(self, all=False):
+        """
+        Returns the samples of the table as a writable memoryview.
+
+        The view gives direct access, without copying, to the memory of
+        the table, and keeps the table alive. Until all the views are
+        deleted, resizing the table or loading a new sound in it raises
+        a BufferError, and the asynchronous loads are dropped. Samples
+        shared with other tables through the sample cache are first
+        copied, so writing in the view only modifies this table.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a view of each table stream is returned in a list.
+
+                If False, only the view of the first table stream (or the
+                only one) is returned.
+
+        """
+        return PyoTableObject.getBuffer(self, all)
+
     def append(self, path, crossfade=0, start=0, stop=None):
         """
         Append a sound to the one already in the table with crossfade.
@@ -1755,14 +1975,21 @@ class NewTable(PyoTableObject):
 
         :Args:
 
-            x : list of floats
+            x : list of floats or buffer
                 New table. Must be of the same size as the actual table.
 
                 List of list can match the number of channels, otherwise,
                 the list will be loaded in all tablestreams.
 
+                Any object supporting the buffer protocol (ie. a numpy
+                array or an array.array) of floats or doubles is copied
+                at once. A 2 dimensions buffer gives one row per channel.
+
         """
-        if type(x[0]) != ListType:
+        if type(x) == ListType:
+            if type(x[0]) != ListType:
+                x = [x]
+        elif type(x) == ArrayType or memoryview(x).ndim == 1:
             x = [x]
         [obj.setTable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
         self.refreshView()
@@ -1941,14 +2168,21 @@ class DataTable(PyoTableObject):
 
         :Args:
 
-            x : list of floats
+            x : list of floats or buffer
                 New table. Must be of the same size as the actual table.
 
                 List of list can match the number of channels, otherwise,
                 the list will be loaded in all tablestreams.
 
+                Any object supporting the buffer protocol (ie. a numpy
+                array or an array.array) of floats or doubles is copied
+                at once. A 2 dimensions buffer gives one row per channel.
+
         """
-        if type(x[0]) != ListType:
+        if type(x) == ListType:
+            if type(x[0]) != ListType:
+                x = [x]
+        elif type(x) == ArrayType or memoryview(x).ndim == 1:
             x = [x]
         [obj.setTable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
         self.refreshView()
@@ -67,7 +67,8 @@ if sys.platform == "darwin":
 
 path = 'src/engine/'
 files = ['pyomodule.c', 'servermodule.c', 'pvstreammodule.c', 'streammodule.c', 'dummymodule.c', 
-        'mixmodule.c', 'inputfadermodule.c', 'interpolation.c', 'fft.c', "wind.c"]
+        'mixmodule.c', 'inputfadermodule.c', 'interpolation.c', 'fft.c', "wind.c",
+        'fastmath.c', 'rng.c', 'resampler.c', 'sndcache.c']
 source_files = [path + f for f in files]
 
 path = 'src/objects/'
@@ -79,7 +80,7 @@ files = ['granulatormodule.c', 'tablemodule.c', 'wgverbmodule.c', 'freeverbmodul
         'metromodule.c', 'trigmodule.c', 'patternmodule.c', 'bandsplitmodule.c', 'hilbertmodule.c', 'panmodule.c',
         'selectmodule.c', 'compressmodule.c', 'utilsmodule.c',
         'convolvemodule.c', 'arithmeticmodule.c', 'sigmodule.c',
-        'matrixprocessmodule.c', 'harmonizermodule.c', 'chorusmodule.c']
+        'matrixprocessmodule.c', 'harmonizermodule.c', 'chorusmodule.c', 'bankmodule.c']
 
 if compile_externals:
     source_files = source_files + ["externals/externalmodule.c"] + [path + f for f in files]
@@ -0,0 +1,132 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+
+#include "fastmath.h"
+#include <math.h>
+
+#define TAN_PI_8 0.41421356237309503
+#define PI_4 0.78539816339744828
+#define PI_2 1.5707963267948966
+#define TWO_ON_PI 0.63661977236758138
+/* pi/2 split in parts whose products by the quadrant are exact, for an
+   accurate range reduction in MYFLT */
+#ifdef USE_DOUBLE
+#define PI_2_A 1.5707963267341256
+#define PI_2_B 6.0771005065061922e-11
+#define PI_2_C 0.0
+#else
+#define PI_2_A 1.5703125
+#define PI_2_B 4.8387050628662109375e-4
+#define PI_2_C -4.3711390001862428e-8
+#endif
+
+void fast_atan2_block(MYFLT *y, MYFLT *x, MYFLT *out, int num) {
+    int i;
+    MYFLT ax, ay, mn, mx, a, t, t2, base, r;
+    for (i=0; i<num; i++) {
+        ax = MYFABS(x[i]);
+        ay = MYFABS(y[i]);
+        mn = ax < ay ? ax : ay;
+        mx = ax < ay ? ay : ax;
+        a = mx > 0.0 ? mn / mx : 0.0;
+        /* atan(a) = pi/4 + atan((a - 1) / (a + 1)) */
+        t = a > TAN_PI_8 ? (a - 1.0) / (a + 1.0) : a;
+        base = a > TAN_PI_8 ? PI_4 : 0.0;
+        t2 = t * t;
+        r = t * (1.0 + t2 * (-1.0/3.0 + t2 * (1.0/5.0 + t2 * (-1.0/7.0 + t2 * (1.0/9.0 +
+            t2 * (-1.0/11.0 + t2 * (1.0/13.0 + t2 * (-1.0/15.0))))))));
+        r += base;
+        r = ay > ax ? PI_2 - r : r;
+        r = x[i] < 0.0 ? PI - r : r;
+        out[i] = y[i] < 0.0 ? -r : r;
+    }
+}
+
+/* Reduces the phase to [-pi/4, pi/4], returns the quadrant and the sine and
+   cosine of the reduced phase. */
+static inline int
+fast_sincos_reduce(MYFLT phase, MYFLT *s, MYFLT *c) {
+    int n;
+    MYFLT q, r, r2;
+    q = phase * (MYFLT)TWO_ON_PI;
+    /* rounding to the nearest integer */
+    n = (int)(q + (MYFLT)0.5) - (q < (MYFLT)-0.5);
+    r = ((phase - n * (MYFLT)PI_2_A) - n * (MYFLT)PI_2_B) - n * (MYFLT)PI_2_C;
+    r2 = r * r;
+#ifdef USE_DOUBLE
+    *s = r * (1.0 + r2 * (-1.0/6.0 + r2 * (1.0/120.0 + r2 * (-1.0/5040.0 + r2 * (1.0/362880.0)))));
+    *c = 1.0 + r2 * (-0.5 + r2 * (1.0/24.0 + r2 * (-1.0/720.0 + r2 * (1.0/40320.0 + r2 * (-1.0/3628800.0)))));
+#else
+    /* minimax polynomials for single precision */
+    *s = r + r * r2 * (-1.6666654611e-1f + r2 * (8.3321608736e-3f + r2 * -1.9515295891e-4f));
+    *c = 1.0f - 0.5f * r2 + r2 * r2 * (4.166664568298827e-2f + r2 * (-1.388731625493765e-3f + r2 * 2.443315711809948e-5f));
+#endif
+    return n;
+}
+
+/* Quadrant n & 3: (sin, cos) = (s, c), (c, -s), (-s, -c), (-c, s). The float
+   version selects with products by 0 and 1, which the compiler vectorises,
+   the double one can't be vectorised with the int conversion and uses
+   conditional moves. */
+static inline MYFLT
+fast_sin_quadrant(int n, MYFLT s, MYFLT c) {
+#ifdef USE_DOUBLE
+    s = (n & 1) ? c : s;
+    return (n & 2) ? -s : s;
+#else
+    MYFLT swap = (MYFLT)(n & 1);
+    return (1 - (n & 2)) * (swap * c + (1 - swap) * s);
+#endif
+}
+
+static inline MYFLT
+fast_cos_quadrant(int n, MYFLT s, MYFLT c) {
+#ifdef USE_DOUBLE
+    c = (n & 1) ? s : c;
+    return ((n + 1) & 2) ? -c : c;
+#else
+    MYFLT swap = (MYFLT)(n & 1);
+    return (1 - ((n + 1) & 2)) * (swap * s + (1 - swap) * c);
+#endif
+}
+
+void fast_sincos_block(MYFLT *mag, MYFLT *phase, MYFLT *re, MYFLT *im, int num) {
+    int i, n;
+    MYFLT s, c;
+    if (im == NULL) {
+        for (i=0; i<num; i++) {
+            n = fast_sincos_reduce(phase[i], &s, &c);
+            re[i] = mag[i] * fast_cos_quadrant(n, s, c);
+        }
+    }
+    else if (re == NULL) {
+        for (i=0; i<num; i++) {
+            n = fast_sincos_reduce(phase[i], &s, &c);
+            im[i] = mag[i] * fast_sin_quadrant(n, s, c);
+        }
+    }
+    else {
+        for (i=0; i<num; i++) {
+            n = fast_sincos_reduce(phase[i], &s, &c);
+            re[i] = mag[i] * fast_cos_quadrant(n, s, c);
+            im[i] = mag[i] * fast_sin_quadrant(n, s, c);
+        }
+    }
+}
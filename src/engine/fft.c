@@ -40,6 +40,8 @@
 #include "fft.h"
 #include "pyomodule.h"
 #include <math.h>
+#include <stdlib.h>
+#include <pthread.h>
 
 void fft_compute_split_twiddle(MYFLT **twiddle, int size) {
     /* pre-compute split-radix twiddle factors in 2d array of length [4][size>>3] */
@@ -70,6 +72,125 @@ void fft_compute_radix2_twiddle(MYFLT *twiddle, int size) {
     }
 
 }
+
+/* Twiddle factors are shared by all the objects using the same fft size.
+   Tables are kept in a list, with the number of objects using them, and
+   freed when the last one releases them. The list is protected by a mutex
+   because PVSynth resizes its tables in the audio thread. */
+typedef struct fft_twiddle_entry {
+    int size;
+    MYFLT **split; /* split-radix table, NULL if not yet computed */
+    MYFLT *radix2; /* radix-2 table, NULL if not yet computed */
+    int split_refs;
+    int radix2_refs;
+    struct fft_twiddle_entry *next;
+} fft_twiddle_entry;
+
+static fft_twiddle_entry *fft_twiddles = NULL;
+static pthread_mutex_t fft_twiddles_lock = PTHREAD_MUTEX_INITIALIZER;
+
+static fft_twiddle_entry * fft_twiddle_entry_get(int size) {
+    fft_twiddle_entry *entry;
+    for (entry=fft_twiddles; entry!=NULL; entry=entry->next) {
+        if (entry->size == size)
+            return entry;
+    }
+    entry = (fft_twiddle_entry *)calloc(1, sizeof(fft_twiddle_entry));
+    entry->size = size;
+    entry->next = fft_twiddles;
+    fft_twiddles = entry;
+    return entry;
+}
+
+static void fft_twiddle_entry_release(fft_twiddle_entry *entry) {
+    fft_twiddle_entry **prev;
+    if (entry->split_refs == 0 && entry->split != NULL) {
+        free(entry->split[0]);
+        free(entry->split);
+        entry->split = NULL;
+    }
+    if (entry->radix2_refs == 0 && entry->radix2 != NULL) {
+        free(entry->radix2);
+        entry->radix2 = NULL;
+    }
+    if (entry->split != NULL || entry->radix2 != NULL)
+        return;
+    for (prev=&fft_twiddles; *prev!=NULL; prev=&(*prev)->next) {
+        if (*prev == entry) {
+            *prev = entry->next;
+            break;
+        }
+    }
+    free(entry);
+}
+
+MYFLT ** fft_get_split_twiddle(int size) {
+    /* returns the shared split-radix twiddle factors of an fft of length size */
+    int i, n8 = size >> 3;
+    MYFLT **twiddle;
+    fft_twiddle_entry *entry;
+    pthread_mutex_lock(&fft_twiddles_lock);
+    entry = fft_twiddle_entry_get(size);
+    if (entry->split == NULL) {
+        entry->split = (MYFLT **)malloc(4 * sizeof(MYFLT *));
+        entry->split[0] = (MYFLT *)malloc((4 * n8 + 1) * sizeof(MYFLT));
+        for (i=1; i<4; i++)
+            entry->split[i] = entry->split[0] + i * n8;
+        fft_compute_split_twiddle(entry->split, size);
+    }
+    entry->split_refs++;
+    twiddle = entry->split;
+    pthread_mutex_unlock(&fft_twiddles_lock);
+    return twiddle;
+}
+
+void fft_release_split_twiddle(MYFLT **twiddle) {
+    /* releases a table returned by fft_get_split_twiddle, NULL is ignored */
+    fft_twiddle_entry *entry;
+    if (twiddle == NULL)
+        return;
+    pthread_mutex_lock(&fft_twiddles_lock);
+    for (entry=fft_twiddles; entry!=NULL; entry=entry->next) {
+        if (entry->split == twiddle) {
+            entry->split_refs--;
+            fft_twiddle_entry_release(entry);
+            break;
+        }
+    }
+    pthread_mutex_unlock(&fft_twiddles_lock);
+}
+
+MYFLT * fft_get_radix2_twiddle(int size) {
+    /* returns the shared radix-2 twiddle factors of an fft of length size */
+    MYFLT *twiddle;
+    fft_twiddle_entry *entry;
+    pthread_mutex_lock(&fft_twiddles_lock);
+    entry = fft_twiddle_entry_get(size);
+    if (entry->radix2 == NULL) {
+        entry->radix2 = (MYFLT *)malloc(size * sizeof(MYFLT));
+        fft_compute_radix2_twiddle(entry->radix2, size);
+    }
+    entry->radix2_refs++;
+    twiddle = entry->radix2;
+    pthread_mutex_unlock(&fft_twiddles_lock);
+    return twiddle;
+}
+
+void fft_release_radix2_twiddle(MYFLT *twiddle) {
+    /* releases a table returned by fft_get_radix2_twiddle, NULL is ignored */
+    fft_twiddle_entry *entry;
+    if (twiddle == NULL)
+        return;
+    pthread_mutex_lock(&fft_twiddles_lock);
+    for (entry=fft_twiddles; entry!=NULL; entry=entry->next) {
+        if (entry->radix2 == twiddle) {
+            entry->radix2_refs--;
+            fft_twiddle_entry_release(entry);
+            break;
+        }
+    }
+    pthread_mutex_unlock(&fft_twiddles_lock);
+}
 /****************************************************************
 ** Sorensen in-place split-radix FFT for real values
 ** data: array of doubles:
@@ -65,4 +65,64 @@ MYFLT cubic(MYFLT *buf, int index, MYFLT frac, int size) {
     a0 *= frac; a1 *= frac; a2 *= frac; a3 *= frac; a1 += 1.0;
 
     return (a0*x0+a1*x1+a2*x2+a3*x3);
-}
\ No newline at end of file
+}
+/* Block versions, one call per buffer. `index` and `frac` hold the integer
+   and fractional parts of the positions computed by the caller. Arithmetic
+   is the same as the per-sample functions, so the results are identical. */
+void nointerp_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num) {
+    int i;
+    for (i=0; i<num; i++) {
+        out[i] = buf[index[i]];
+    }
+}
+
+void linear_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num) {
+    int i;
+    MYFLT x1, x2;
+    for (i=0; i<num; i++) {
+        x1 = buf[index[i]];
+        x2 = buf[index[i]+1];
+        out[i] = x1 + (x2 - x1) * frac[i];
+    }
+}
+
+void cosine_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num) {
+    int i;
+    MYFLT x1, x2, frac2;
+    for (i=0; i<num; i++) {
+        x1 = buf[index[i]];
+        x2 = buf[index[i]+1];
+        frac2 = (1.0 - MYCOS(frac[i] * M_PI)) * 0.5;
+        out[i] = x1 + (x2 - x1) * frac2;
+    }
+}
+
+void cubic_block(MYFLT *buf, int *index, MYFLT *frac, int size, MYFLT *out, int num) {
+    int i, ind;
+    MYFLT x0, x1, x2, x3, a0, a1, a2, a3, f;
+    for (i=0; i<num; i++) {
+        ind = index[i];
+        f = frac[i];
+        x1 = buf[ind];
+        x2 = buf[ind+1];
+        if (ind == 0) {
+            x0 = x1 + (x1 - x2);
+            x3 = buf[ind + 2];
+        }
+        else if (ind >= (size-2)) {
+            x0 = buf[ind - 1];
+            x3 = x2 + (x2 - x1);
+        }
+        else {
+            x0 = buf[ind - 1];
+            x3 = buf[ind + 2];
+        }
+
+        a3 = f * f; a3 -= 1.0; a3 *= (1.0 / 6.0);
+        a2 = (f + 1.0) * 0.5; a0 = a2 - 1.0;
+        a1 = a3 * 3.0; a2 -= a1; a0 -= a3; a1 -= f;
+        a0 *= f; a1 *= f; a2 *= f; a3 *= f; a1 += 1.0;
+
+        out[i] = a0*x0+a1*x1+a2*x2+a3*x3;
+    }
+}
@@ -0,0 +1,48 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+
+#include "rng.h"
+#include <math.h>
+
+void pyorand_seed(PyoRand *r, unsigned int seed, unsigned int cls, unsigned int index) {
+    r->state = ((uint64_t)seed << 32) ^ ((uint64_t)(cls & 0xFF) << 24) ^ (uint64_t)(index & 0xFFFFFF);
+    /* Spread the neighbouring keys over the whole period. */
+    r->state = pyorand_next(r);
+}
+
+void pyorand_uniform_block(PyoRand *r, MYFLT *out, int num, MYFLT mul, MYFLT add) {
+    int i;
+    for (i=0; i<num; i++) {
+        out[i] = pyorand_uniform(r) * mul + add;
+    }
+}
+
+void pyorand_gauss_block(PyoRand *r, MYFLT *out, int num, MYFLT mul, MYFLT add) {
+    int i;
+    MYFLT rad, ang;
+    for (i=0; i<num; i+=2) {
+        /* 1 - u is in (0, 1], its log is finite. */
+        rad = MYSQRT(-2.0 * MYLOG(1.0 - pyorand_uniform(r))) * mul;
+        ang = TWOPI * pyorand_uniform(r);
+        out[i] = rad * MYCOS(ang) + add;
+        if (i+1 < num)
+            out[i+1] = rad * MYSIN(ang) + add;
+    }
+}
@@ -25,6 +25,7 @@
 #include <time.h>
 #include <stdlib.h>
 #include <pthread.h>
+#include <unistd.h>
 
 #include "structmember.h"
 #include "portaudio.h"
@@ -34,6 +35,7 @@
 #include "streammodule.h"
 #include "pyomodule.h"
 #include "servermodule.h"
+#include "dummymodule.h"
 
 
 #define MAX_NBR_SERVER 256
@@ -167,7 +169,9 @@ pa_callback_interleaved( const void *inputBuffer, void *outputBuffer,
 
     /* avoid unused variable warnings */
     (void) timeInfo;
-    (void) statusFlags;
+
+    if (stream_profiler.active && (statusFlags & (paInputUnderflow | paInputOverflow | paOutputUnderflow | paOutputOverflow)))
+        server->prof_xruns++;
 
     if (server->withPortMidi == 1) {
         portmidiGetEvents(server);
@@ -219,7 +223,9 @@ pa_callback_nonInterleaved( const void *inputBuffer, void *outputBuffer,
 
     /* avoid unused variable warnings */
     (void) timeInfo;
-    (void) statusFlags;
+
+    if (stream_profiler.active && (statusFlags & (paInputUnderflow | paInputOverflow | paOutputUnderflow | paOutputOverflow)))
+        server->prof_xruns++;
 
     if (server->withPortMidi == 1) {
         portmidiGetEvents(server);
@@ -1294,41 +1300,1819 @@ Server_embedded_ni_start(Server *self)
 int
 Server_embedded_ni_startIdx(int idx)
 {
-    Server_embedded_ni_start(my_server[idx]);
-    return 0;
+    Server_embedded_ni_start(my_server[idx]);
+    return 0;
+}
+
+void
+*Server_embedded_thread(void *arg)
+{
+    Server *self;
+    self = (Server *)arg;
+
+    Server_process_buffers(self);
+
+    return NULL;
+}
+
+int
+Server_embedded_nb_start(Server *self)
+{
+    pthread_t offthread;
+    pthread_create(&offthread, NULL, Server_embedded_thread, self);
+    return 0;
+}
+
+/* this stop function is not very useful since the processing is stopped at the end
+of every processing callback, but function put to not break pyo */
+int
+Server_embedded_stop(Server *self)
+{
+    self->server_started = 0;
+    self->server_stopped = 1;
+    return 0;
+}
+
+/***************************************************/
+/*  Streams registry                               */
+
+/* The registry is emptied before the streams are released, in case releasing
+   a stream deletes objects that try to remove their own stream. */
+static void
+Server_registry_clear(PyoStreamRegistry *reg)
+{
+    int i, size = reg->size;
+    PyoStreamSlot *slots = reg->slots;
+
+    free(reg->hkeys);
+    free(reg->hslots);
+    reg->slots = NULL;
+    reg->hkeys = reg->hslots = NULL;
+    reg->size = reg->hsize = 0;
+    reg->head = reg->tail = reg->free = reg->pending = -1;
+    reg->busy = reg->added = 0;
+
+    for (i=0; i<size; i++)
+        Py_XDECREF(slots[i].stream);
+    free(slots);
+}
+
+static inline unsigned int
+Server_registry_hash(int id, int hsize)
+{
+    return ((unsigned int)id * 2654435761u) & (hsize - 1);
+}
+
+static int
+Server_registry_find(PyoStreamRegistry *reg, int id)
+{
+    unsigned int h;
+
+    if (reg->hsize == 0)
+        return -1;
+    h = Server_registry_hash(id, reg->hsize);
+    while (reg->hkeys[h] != -1) {
+        if (reg->hkeys[h] == id)
+            return reg->hslots[h];
+        h = (h + 1) & (reg->hsize - 1);
+    }
+    return -1;
+}
+
+static void
+Server_registry_hash_insert(PyoStreamRegistry *reg, int id, int slot)
+{
+    unsigned int h = Server_registry_hash(id, reg->hsize);
+    while (reg->hkeys[h] != -1 && reg->hkeys[h] != id)
+        h = (h + 1) & (reg->hsize - 1);
+    reg->hkeys[h] = id;
+    reg->hslots[h] = slot;
+}
+
+/* Linear probing removal, entries following the removed one are shifted back. */
+static void
+Server_registry_hash_remove(PyoStreamRegistry *reg, int id)
+{
+    unsigned int h, i, home;
+
+    h = Server_registry_hash(id, reg->hsize);
+    while (reg->hkeys[h] != id) {
+        if (reg->hkeys[h] == -1)
+            return;
+        h = (h + 1) & (reg->hsize - 1);
+    }
+    i = h;
+    while (1) {
+        i = (i + 1) & (reg->hsize - 1);
+        if (reg->hkeys[i] == -1)
+            break;
+        home = Server_registry_hash(reg->hkeys[i], reg->hsize);
+        if (((i - home) & (reg->hsize - 1)) >= ((i - h) & (reg->hsize - 1))) {
+            reg->hkeys[h] = reg->hkeys[i];
+            reg->hslots[h] = reg->hslots[i];
+            h = i;
+        }
+    }
+    reg->hkeys[h] = -1;
+}
+
+/* Doubles the number of slots and rebuilds the hash table. */
+static void
+Server_registry_grow(PyoStreamRegistry *reg)
+{
+    int i, oldsize = reg->size;
+
+    reg->size = oldsize == 0 ? 256 : oldsize * 2;
+    reg->slots = (PyoStreamSlot *)realloc(reg->slots, reg->size * sizeof(PyoStreamSlot));
+    for (i=reg->size-1; i>=oldsize; i--) {
+        reg->slots[i].stream = NULL;
+        reg->slots[i].prev = -1;
+        reg->slots[i].next = reg->free;
+        reg->free = i;
+    }
+
+    reg->hsize = reg->size * 2;
+    reg->hkeys = (int *)realloc(reg->hkeys, reg->hsize * sizeof(int));
+    reg->hslots = (int *)realloc(reg->hslots, reg->hsize * sizeof(int));
+    for (i=0; i<reg->hsize; i++)
+        reg->hkeys[i] = -1;
+    for (i=0; i<oldsize; i++) {
+        if (reg->slots[i].stream != NULL)
+            Server_registry_hash_insert(reg, Stream_getStreamId((Stream *)reg->slots[i].stream), i);
+    }
+}
+
+static void
+Server_registry_unlink(PyoStreamRegistry *reg, int slot)
+{
+    PyoStreamSlot *sl = &reg->slots[slot];
+    if (sl->prev >= 0)
+        reg->slots[sl->prev].next = sl->next;
+    else
+        reg->head = sl->next;
+    if (sl->next >= 0)
+        reg->slots[sl->next].prev = sl->prev;
+    else
+        reg->tail = sl->prev;
+}
+
+/* Inserts `slot` before `before`, or at the end of the chain if `before` is -1. */
+static void
+Server_registry_link(PyoStreamRegistry *reg, int slot, int before)
+{
+    PyoStreamSlot *sl = &reg->slots[slot];
+    if (before < 0) {
+        sl->prev = reg->tail;
+        sl->next = -1;
+        if (reg->tail >= 0)
+            reg->slots[reg->tail].next = slot;
+        else
+            reg->head = slot;
+        reg->tail = slot;
+    }
+    else {
+        sl->prev = reg->slots[before].prev;
+        sl->next = before;
+        if (sl->prev >= 0)
+            reg->slots[sl->prev].next = slot;
+        else
+            reg->head = slot;
+        reg->slots[before].prev = slot;
+    }
+}
+
+static void
+Server_registry_add(PyoStreamRegistry *reg, Stream *stream)
+{
+    int slot;
+
+    if (reg->free < 0)
+        Server_registry_grow(reg);
+    slot = reg->free;
+    reg->free = reg->slots[slot].next;
+    Py_INCREF(stream);
+    reg->slots[slot].stream = (PyObject *)stream;
+    if (reg->busy)
+        reg->added = 1;
+    Server_registry_link(reg, slot, -1);
+    Server_registry_hash_insert(reg, Stream_getStreamId(stream), slot);
+}
+
+/* Returns the address of the removed stream, only usable as a key, or NULL if
+   the stream was not registered. While the streams are processed, the slot keeps
+   its successor, so the loop can go on, and is recycled when the loop is over. */
+static void *
+Server_registry_remove(PyoStreamRegistry *reg, int id)
+{
+    int slot;
+    PyObject *stream;
+
+    slot = Server_registry_find(reg, id);
+    if (slot < 0)
+        return NULL;
+    Server_registry_hash_remove(reg, id);
+    Server_registry_unlink(reg, slot);
+    stream = reg->slots[slot].stream;
+    reg->slots[slot].stream = NULL;
+    if (reg->busy) {
+        reg->slots[slot].prev = reg->pending;
+        reg->pending = slot;
+    }
+    else {
+        reg->slots[slot].next = reg->free;
+        reg->free = slot;
+    }
+    Py_DECREF(stream);
+    return (void *)stream;
+}
+
+static void
+Server_registry_release_pending(PyoStreamRegistry *reg)
+{
+    int slot;
+    reg->busy = reg->added = 0;
+    while (reg->pending >= 0) {
+        slot = reg->pending;
+        reg->pending = reg->slots[slot].prev;
+        reg->slots[slot].next = reg->free;
+        reg->free = slot;
+    }
+}
+
+/***************************************************/
+/*  Parallel processing of the streams graph       */
+
+/* Objects writing into a table or a matrix. Any other object holding a
+   reference to a table or matrix stream is considered as a reader. */
+static const char *table_writers[] = {"_pyo.TableRec_base", "_pyo.TrigTableRec_base", "_pyo.TableMorph_base",
+                                      "_pyo.TablePut_base", "_pyo.TableWrite_base", "_pyo.TableScale_base",
+                                      "_pyo.MatrixRec_base", "_pyo.MatrixRecLoop_base", "_pyo.MatrixMorph_base", NULL};
+
+/* Objects using the python API in their processing functions (method calls,
+   new python objects, dict lookups, osc handlers, python code). They are
+   computed with the GIL, like the objects holding a callable. The objects
+   stopping themselves use Stream_requestStop. Any new processing function
+   touching a python object must be added here. */
+static const char *python_callers[] = {"_pyo.TableWrite_base", "_pyo.TableMorph_base", "_pyo.MatrixMorph_base",
+                                       "_pyo.Mixer_base", "_pyo.Selector_base", "_pyo.FrameDeltaMain_base",
+                                       "_pyo.FrameAccumMain_base", "_pyo.VectralMain_base", "_pyo.ControlRec_base",
+                                       "_pyo.NoteinRec_base", "_pyo.Linseg_base", "_pyo.Expseg_base",
+                                       "_pyo.TrigLinseg_base", "_pyo.TrigExpseg_base", "_pyo.Seqer_base",
+                                       "_pyo.Mix_base", "_pyo.Record_base", "_pyo.Score_base",
+                                       "_pyo.OscSend_base", "_pyo.OscDataSend_base", "_pyo.OscReceiver_base",
+                                       "_pyo.OscReceive_base", "_pyo.OscDataReceive_base",
+                                       "_pyo.OscListReceiver_base", "_pyo.OscListReceive_base", NULL};
+
+typedef struct {
+    void *key;
+    int last_writer;
+    int readers; /* head of the readers list (index in reader_node/reader_next), -1 if empty */
+} PyoGraphResource;
+
+typedef struct {
+    Server *server;
+    int nworkers;
+    pthread_t *workers;
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    int quit;
+
+    /* Streams graph, rebuilt at the beginning of every block */
+    int size; /* allocated number of nodes */
+    int count; /* number of nodes in the current block */
+    Stream **nodes;
+    int *gil; /* node must be computed by the audio thread, with the GIL */
+    int *called; /* node's function has been called during this block */
+    int *pending; /* number of predecessors not yet computed */
+    int *stamp; /* avoid duplicated edges */
+    int *succ_start;
+    int *succ;
+    int nedges;
+    int esize;
+    int *edge_from;
+    int *edge_to;
+
+    /* Object address -> node index */
+    int hsize;
+    void **hkeys;
+    int *hvals;
+
+    /* Shared resources (tables, matrices) */
+    int rsize;
+    int rcount;
+    PyoGraphResource *res;
+    int nreaders;
+    int readsize;
+    int *reader_node;
+    int *reader_next;
+
+    /* Ready queues */
+    int *ready;
+    int ready_head;
+    int ready_tail;
+    int *gil_ready;
+    int gil_head;
+    int gil_tail;
+    int remaining;
+
+    /* Pull mode: inputs of every node and nodes needed by the outputs */
+    int pull;
+    int ndeps;
+    int dsize;
+    int *dep_from;
+    int *dep_to;
+    int *dep_start;
+    int *dep;
+    int *consumers; /* number of nodes reading the node */
+    int *sink; /* node has side effects (writes a table) */
+    int *needed;
+    int *mark; /* evaluation state during the block */
+    int *stack;
+    int stsize;
+
+    /* Release GIL mode: the nodes are computed without the GIL */
+    int release;
+    PyThreadState *tstate; /* audio thread's state while the GIL is released */
+} PyoThreadPool;
+
+/* Common head of the objects owning a stream. */
+typedef struct {
+    pyo_audio_HEAD
+} PyoAudioObject;
+
+typedef struct {
+    PyoThreadPool *pool;
+    int node;
+    int depth;
+    int writer;
+} PyoGraphVisit;
+
+static inline unsigned int
+Server_pool_hash(void *key, int size)
+{
+    size_t x = (size_t)key;
+    x ^= x >> 4;
+    x *= 2654435761u;
+    return (unsigned int)(x ^ (x >> 16)) & (size - 1);
+}
+
+static void
+Server_pool_hash_insert(PyoThreadPool *pool, void *key, int value)
+{
+    unsigned int h = Server_pool_hash(key, pool->hsize);
+    while (pool->hkeys[h] != NULL && pool->hkeys[h] != key)
+        h = (h + 1) & (pool->hsize - 1);
+    pool->hkeys[h] = key;
+    pool->hvals[h] = value;
+}
+
+static int
+Server_pool_hash_lookup(PyoThreadPool *pool, void *key)
+{
+    unsigned int h = Server_pool_hash(key, pool->hsize);
+    while (pool->hkeys[h] != NULL) {
+        if (pool->hkeys[h] == key)
+            return pool->hvals[h];
+        h = (h + 1) & (pool->hsize - 1);
+    }
+    return -1;
+}
+
+static void
+Server_pool_add_edge(PyoThreadPool *pool, int from, int to)
+{
+    if (from == to)
+        return;
+    if (pool->nedges >= pool->esize) {
+        pool->esize = pool->esize * 2 + 64;
+        pool->edge_from = (int *)realloc(pool->edge_from, pool->esize * sizeof(int));
+        pool->edge_to = (int *)realloc(pool->edge_to, pool->esize * sizeof(int));
+    }
+    pool->edge_from[pool->nedges] = from;
+    pool->edge_to[pool->nedges] = to;
+    pool->nedges++;
+}
+
+/* Records that `node` reads the output of `other`. */
+static void
+Server_pool_add_dep(PyoThreadPool *pool, int node, int other)
+{
+    if (node == other)
+        return;
+    if (pool->ndeps >= pool->dsize) {
+        pool->dsize = pool->dsize * 2 + 64;
+        pool->dep_from = (int *)realloc(pool->dep_from, pool->dsize * sizeof(int));
+        pool->dep_to = (int *)realloc(pool->dep_to, pool->dsize * sizeof(int));
+    }
+    pool->dep_from[pool->ndeps] = node;
+    pool->dep_to[pool->ndeps] = other;
+    pool->ndeps++;
+}
+
+/* Adds an ordering constraint between the current node and another one, in the
+   order of the server's streams list, which is the serial processing order. */
+static void
+Server_pool_link(PyoThreadPool *pool, int node, int other)
+{
+    if (other == node || pool->stamp[other] == node)
+        return;
+    pool->stamp[other] = node;
+    if (other < node)
+        Server_pool_add_edge(pool, other, node);
+    else
+        Server_pool_add_edge(pool, node, other);
+}
+
+static void
+Server_pool_resource(PyoThreadPool *pool, void *key, int node, int writer)
+{
+    int i, r;
+    PyoGraphResource *res = NULL;
+
+    for (i=0; i<pool->rcount; i++) {
+        if (pool->res[i].key == key) {
+            res = &pool->res[i];
+            break;
+        }
+    }
+    if (res == NULL) {
+        if (pool->rcount >= pool->rsize) {
+            pool->rsize = pool->rsize * 2 + 16;
+            pool->res = (PyoGraphResource *)realloc(pool->res, pool->rsize * sizeof(PyoGraphResource));
+        }
+        res = &pool->res[pool->rcount++];
+        res->key = key;
+        res->last_writer = -1;
+        res->readers = -1;
+    }
+
+    if (res->last_writer >= 0)
+        Server_pool_link(pool, node, res->last_writer);
+
+    if (writer) {
+        for (r=res->readers; r>=0; r=pool->reader_next[r])
+            Server_pool_link(pool, node, pool->reader_node[r]);
+        res->readers = -1;
+        res->last_writer = node;
+    }
+    else {
+        if (pool->nreaders >= pool->readsize) {
+            pool->readsize = pool->readsize * 2 + 64;
+            pool->reader_node = (int *)realloc(pool->reader_node, pool->readsize * sizeof(int));
+            pool->reader_next = (int *)realloc(pool->reader_next, pool->readsize * sizeof(int));
+        }
+        pool->reader_node[pool->nreaders] = node;
+        pool->reader_next[pool->nreaders] = res->readers;
+        res->readers = pool->nreaders++;
+    }
+}
+
+/* tp_traverse callback: every object referenced by a stream's owner is an input. */
+static int
+Server_pool_visit(PyObject *obj, void *arg)
+{
+    int i, other;
+    PyoGraphVisit *v = (PyoGraphVisit *)arg;
+    PyoThreadPool *pool = v->pool;
+
+    if (obj == NULL || obj == Py_None || obj == (PyObject *)pool->server)
+        return 0;
+    if (PyFloat_Check(obj) || PyInt_Check(obj) || PyLong_Check(obj) || PyString_Check(obj) || PyUnicode_Check(obj))
+        return 0;
+
+    other = Server_pool_hash_lookup(pool, (void *)obj);
+    if (other >= 0) {
+        Server_pool_link(pool, v->node, other);
+        if (pool->pull)
+            Server_pool_add_dep(pool, v->node, other);
+        return 0;
+    }
+
+    if (PyList_Check(obj) || PyTuple_Check(obj)) {
+        if (v->depth < 2) {
+            v->depth++;
+            for (i=0; i<PySequence_Fast_GET_SIZE(obj); i++)
+                Server_pool_visit(PySequence_Fast_GET_ITEM(obj, i), arg);
+            v->depth--;
+        }
+    }
+    else if (PyCallable_Check(obj)) {
+        /* The object calls back into python. */
+        pool->gil[v->node] = 1;
+    }
+    else {
+        Server_pool_resource(pool, (void *)obj, v->node, v->writer);
+        /* Table and matrix objects share their data through a stream object,
+           which is what readers hold, so the members are resources too. */
+        if (v->depth < 2 && obj->ob_type->tp_traverse != NULL && !PyDict_Check(obj) && !PyType_Check(obj)) {
+            v->depth++;
+            obj->ob_type->tp_traverse(obj, Server_pool_visit, arg);
+            v->depth--;
+        }
+    }
+    return 0;
+}
+
+static void
+Server_pool_build_graph(PyoThreadPool *pool)
+{
+    int i, j, n, slot, last_barrier = -1;
+    traverseproc traverse;
+    PyObject *owner;
+    PyoGraphVisit visit;
+    Server *server = pool->server;
+
+    n = pool->count = server->stream_count;
+    pool->pull = server->pull;
+
+    if (n > pool->size) {
+        pool->size = n * 2;
+        pool->nodes = (Stream **)realloc(pool->nodes, pool->size * sizeof(Stream *));
+        pool->gil = (int *)realloc(pool->gil, pool->size * sizeof(int));
+        pool->called = (int *)realloc(pool->called, pool->size * sizeof(int));
+        pool->pending = (int *)realloc(pool->pending, pool->size * sizeof(int));
+        pool->stamp = (int *)realloc(pool->stamp, pool->size * sizeof(int));
+        pool->succ_start = (int *)realloc(pool->succ_start, (pool->size + 1) * sizeof(int));
+        pool->ready = (int *)realloc(pool->ready, pool->size * sizeof(int));
+        pool->gil_ready = (int *)realloc(pool->gil_ready, pool->size * sizeof(int));
+        pool->dep_start = (int *)realloc(pool->dep_start, (pool->size + 1) * sizeof(int));
+        pool->consumers = (int *)realloc(pool->consumers, pool->size * sizeof(int));
+        pool->sink = (int *)realloc(pool->sink, pool->size * sizeof(int));
+        pool->needed = (int *)realloc(pool->needed, pool->size * sizeof(int));
+        pool->mark = (int *)realloc(pool->mark, pool->size * sizeof(int));
+        pool->hsize = 16;
+        while (pool->hsize < pool->size * 4)
+            pool->hsize *= 2;
+        pool->hkeys = (void **)realloc(pool->hkeys, pool->hsize * sizeof(void *));
+        pool->hvals = (int *)realloc(pool->hvals, pool->hsize * sizeof(int));
+    }
+
+    memset(pool->hkeys, 0, pool->hsize * sizeof(void *));
+    for (i=0, slot=server->streams.head; i<n; i++, slot=server->streams.slots[slot].next) {
+        pool->nodes[i] = (Stream *)server->streams.slots[slot].stream;
+        pool->gil[i] = pool->called[i] = pool->pending[i] = 0;
+        pool->stamp[i] = -1;
+        Server_pool_hash_insert(pool, (void *)pool->nodes[i], i);
+        Server_pool_hash_insert(pool, (void *)pool->nodes[i]->streamobject, i);
+    }
+
+    pool->nedges = pool->rcount = pool->nreaders = pool->ndeps = 0;
+    visit.pool = pool;
+    for (i=0; i<n; i++) {
+        owner = pool->nodes[i]->streamobject;
+        visit.node = i;
+        visit.depth = 0;
+        visit.writer = 0;
+        for (j=0; table_writers[j] != NULL; j++) {
+            if (strcmp(owner->ob_type->tp_name, table_writers[j]) == 0) {
+                visit.writer = 1;
+                break;
+            }
+        }
+        pool->sink[i] = visit.writer;
+        for (j=0; python_callers[j] != NULL; j++) {
+            if (strcmp(owner->ob_type->tp_name, python_callers[j]) == 0) {
+                pool->gil[i] = 1;
+                break;
+            }
+        }
+        traverse = owner->ob_type->tp_traverse;
+        if (traverse == NULL)
+            pool->gil[i] = 1;
+        else
+            traverse(owner, Server_pool_visit, &visit);
+
+        /* Nodes calling python are barriers, everything else keeps the serial order around them. */
+        if (pool->gil[i]) {
+            for (j=last_barrier+1; j<i; j++)
+                Server_pool_link(pool, i, j);
+            if (last_barrier >= 0)
+                Server_pool_link(pool, i, last_barrier);
+            last_barrier = i;
+        }
+        else if (last_barrier >= 0)
+            Server_pool_link(pool, i, last_barrier);
+    }
+
+    /* Successors lists */
+    for (i=0; i<=n; i++)
+        pool->succ_start[i] = 0;
+    for (i=0; i<pool->nedges; i++) {
+        pool->succ_start[pool->edge_from[i]+1]++;
+        pool->pending[pool->edge_to[i]]++;
+    }
+    for (i=0; i<n; i++)
+        pool->succ_start[i+1] += pool->succ_start[i];
+    pool->succ = (int *)realloc(pool->succ, (pool->nedges + 1) * sizeof(int));
+    for (i=0; i<n; i++)
+        pool->stamp[i] = pool->succ_start[i];
+    for (i=0; i<pool->nedges; i++)
+        pool->succ[pool->stamp[pool->edge_from[i]]++] = pool->edge_to[i];
+
+    if (pool->pull) {
+        /* Inputs lists */
+        for (i=0; i<=n; i++)
+            pool->dep_start[i] = 0;
+        for (i=0; i<n; i++)
+            pool->consumers[i] = 0;
+        for (i=0; i<pool->ndeps; i++) {
+            pool->dep_start[pool->dep_from[i]+1]++;
+            pool->consumers[pool->dep_to[i]]++;
+        }
+        for (i=0; i<n; i++)
+            pool->dep_start[i+1] += pool->dep_start[i];
+        pool->dep = (int *)realloc(pool->dep, (pool->ndeps + 1) * sizeof(int));
+        for (i=0; i<n; i++)
+            pool->stamp[i] = pool->dep_start[i];
+        for (i=0; i<pool->ndeps; i++)
+            pool->dep[pool->stamp[pool->dep_from[i]]++] = pool->dep_to[i];
+        if (pool->stsize < pool->ndeps + n * 3 + 1) {
+            pool->stsize = (pool->ndeps + n * 3 + 1) * 2;
+            pool->stack = (int *)realloc(pool->stack, pool->stsize * sizeof(int));
+        }
+    }
+}
+
+/* Returns 1 if the output of the stream's object is known to be zero: nothing
+   is added and its multiplier, or the input of a Dummy, only holds zeros. */
+static int
+Server_stream_muted(Stream *stream)
+{
+    PyoAudioObject *obj = (PyoAudioObject *)stream->streamobject;
+
+    if (!PyFloat_Check(obj->add) || PyFloat_AS_DOUBLE(obj->add) != 0)
+        return 0;
+    if (PyFloat_Check(obj->mul)) {
+        if (PyFloat_AS_DOUBLE(obj->mul) == 0)
+            return 1;
+    }
+    else if (obj->mul_stream != NULL && Stream_getStreamSilent(obj->mul_stream))
+        return 1;
+    if (obj->ob_type == &DummyType && ((Dummy *)obj)->input_stream != NULL &&
+        Stream_getStreamSilent(((Dummy *)obj)->input_stream))
+        return 1;
+    return 0;
+}
+
+/* In the release GIL mode, the GIL is taken back around the nodes calling python,
+   which are always computed by the audio thread. */
+static inline void
+Server_pool_call(PyoThreadPool *pool, Stream *stream, int node)
+{
+    if (pool->tstate != NULL && pool->gil[node]) {
+        PyEval_RestoreThread(pool->tstate);
+        Stream_callFunction(stream);
+        pool->tstate = PyEval_SaveThread();
+    }
+    else
+        Stream_callFunction(stream);
+}
+
+static inline void
+Server_pool_release(PyoThreadPool *pool)
+{
+    if (pool->release)
+        pool->tstate = PyEval_SaveThread();
+}
+
+static inline void
+Server_pool_reacquire(PyoThreadPool *pool)
+{
+    if (pool->tstate != NULL) {
+        PyEval_RestoreThread(pool->tstate);
+        pool->tstate = NULL;
+    }
+}
+
+/* Nodes deciding if a node is muted. */
+static int
+Server_pool_gates(PyoThreadPool *pool, Stream *stream, int *gates)
+{
+    int node, n = 0;
+    PyoAudioObject *obj = (PyoAudioObject *)stream->streamobject;
+
+    if (!PyFloat_Check(obj->mul) && obj->mul_stream != NULL) {
+        node = Server_pool_hash_lookup(pool, (void *)obj->mul_stream);
+        if (node >= 0)
+            gates[n++] = node;
+    }
+    if (obj->ob_type == &DummyType && ((Dummy *)obj)->input_stream != NULL) {
+        node = Server_pool_hash_lookup(pool, (void *)((Dummy *)obj)->input_stream);
+        if (node >= 0)
+            gates[n++] = node;
+    }
+    return n;
+}
+
+/* A muted node is not computed, its output is cleared once. */
+static inline void
+Server_stream_sleep(Stream *stream)
+{
+    if (stream->silent == 0) {
+        memset(stream->data, 0, stream->bufsize * sizeof(MYFLT));
+        stream->silent = 1;
+    }
+}
+
+/* Marks the nodes needed by the sinks: streams sent to the dac, nodes calling
+   python or writing tables, and nodes read by no other node. Stopped nodes
+   need nothing and muted nodes only need the nodes deciding their silence. */
+static void
+Server_pull_mark(PyoThreadPool *pool)
+{
+    int i, node, ngates, gates[2], top = 0;
+    Stream *stream;
+
+    for (i=0; i<pool->count; i++) {
+        pool->needed[i] = pool->mark[i] = 0;
+        stream = pool->nodes[i];
+        if (stream->todac || pool->gil[i] || pool->sink[i] || pool->consumers[i] == 0)
+            pool->stack[top++] = i;
+    }
+
+    while (top > 0) {
+        node = pool->stack[--top];
+        if (pool->needed[node])
+            continue;
+        pool->needed[node] = 1;
+        stream = pool->nodes[node];
+        if (stream->active == 0)
+            continue;
+        if (Server_stream_muted(stream)) {
+            ngates = Server_pool_gates(pool, stream, gates);
+            for (i=0; i<ngates; i++) {
+                if (pool->needed[gates[i]] == 0)
+                    pool->stack[top++] = gates[i];
+            }
+        }
+        else {
+            for (i=pool->dep_start[node]; i<pool->dep_start[node+1]; i++) {
+                if (pool->needed[pool->dep[i]] == 0)
+                    pool->stack[top++] = pool->dep[i];
+            }
+        }
+    }
+}
+
+/* Computes a node in pull mode. The nodes it reads, earlier in the serial order,
+   are computed first if they were skipped, which happens when a muted node wakes
+   up during the block. Nodes later in the order give their previous block. */
+static void
+Server_pull_node(PyoThreadPool *pool, int node)
+{
+    int i, n, ngates, gates[2], top = 0;
+    Stream *stream;
+
+    pool->stack[top++] = node;
+    while (top > 0) {
+        n = pool->stack[top-1];
+        stream = pool->nodes[n];
+        if (stream == NULL || stream->active == 0 || pool->mark[n] == 3) {
+            pool->mark[n] = 3;
+            top--;
+            continue;
+        }
+        switch (pool->mark[n]) {
+            case 0: /* Nodes deciding the silence first */
+                pool->mark[n] = 1;
+                ngates = Server_pool_gates(pool, stream, gates);
+                for (i=0; i<ngates; i++) {
+                    if (gates[i] < n && pool->mark[gates[i]] == 0)
+                        pool->stack[top++] = gates[i];
+                }
+                break;
+            case 1:
+                if (Server_stream_muted(stream)) {
+                    Server_stream_sleep(stream);
+                    pool->mark[n] = 3;
+                    top--;
+                }
+                else {
+                    pool->mark[n] = 2;
+                    for (i=pool->dep_start[n]; i<pool->dep_start[n+1]; i++) {
+                        if (pool->dep[i] < n && pool->mark[pool->dep[i]] == 0)
+                            pool->stack[top++] = pool->dep[i];
+                    }
+                }
+                break;
+            case 2:
+                Server_pool_call(pool, stream, n);
+                pool->called[n] = 1;
+                pool->mark[n] = 3;
+                top--;
+                break;
+        }
+    }
+}
+
+/* Computes the streams of the current block in pull mode, on the audio thread. */
+static void
+Server_pull_process(PyoThreadPool *pool)
+{
+    int i;
+
+    Server_pool_build_graph(pool);
+    Server_pull_mark(pool);
+    Server_pool_release(pool);
+    for (i=0; i<pool->count; i++) {
+        pool->called[i] = 0;
+        if (pool->nodes[i] != NULL && (pool->needed[i] || pool->nodes[i]->todac))
+            Server_pull_node(pool, i);
+    }
+    Server_pool_reacquire(pool);
+}
+
+static void Server_pool_pull_inputs(PyoThreadPool *pool, int node);
+
+/* Computes, once, a node skipped by Server_pull_mark and read by a node waking up
+   during the block. Its slot in the graph is already done, so the only other
+   thread which can reach it is another consumer doing the same, waited for with
+   the mark (1: being computed, 3: done). Inputs are earlier in the serial order,
+   which makes the waits acyclic. */
+static void
+Server_pool_pull_input(PyoThreadPool *pool, int node)
+{
+    int i, ngates, gates[2];
+    Stream *stream = pool->nodes[node];
+
+    pthread_mutex_lock(&pool->lock);
+    while (pool->mark[node] == 1)
+        pthread_cond_wait(&pool->cond, &pool->lock);
+    if (pool->mark[node] == 3) {
+        pthread_mutex_unlock(&pool->lock);
+        return;
+    }
+    pool->mark[node] = 1;
+    pthread_mutex_unlock(&pool->lock);
+
+    if (stream != NULL && Stream_getStreamActive(stream) == 1) {
+        ngates = Server_pool_gates(pool, stream, gates);
+        for (i=0; i<ngates; i++) {
+            if (gates[i] < node && pool->needed[gates[i]] == 0)
+                Server_pool_pull_input(pool, gates[i]);
+        }
+        if (Server_stream_muted(stream))
+            Server_stream_sleep(stream);
+        else {
+            Server_pool_pull_inputs(pool, node);
+            Server_pool_call(pool, stream, node);
+            pool->called[node] = 1;
+        }
+    }
+
+    pthread_mutex_lock(&pool->lock);
+    pool->mark[node] = 3;
+    pthread_cond_broadcast(&pool->cond);
+    pthread_mutex_unlock(&pool->lock);
+}
+
+/* Computes the skipped inputs of a node, as Server_pull_node does in the serial order. */
+static void
+Server_pool_pull_inputs(PyoThreadPool *pool, int node)
+{
+    int i, other;
+
+    for (i=pool->dep_start[node]; i<pool->dep_start[node+1]; i++) {
+        other = pool->dep[i];
+        if (other < node && pool->needed[other] == 0)
+            Server_pool_pull_input(pool, other);
+    }
+}
+
+static inline void
+Server_pool_run_node(PyoThreadPool *pool, int node)
+{
+    Stream *stream = pool->nodes[node];
+    if (stream != NULL && Stream_getStreamActive(stream) == 1) {
+        if (pool->pull) {
+            if (pool->needed[node] == 0 && Stream_getStreamToDac(stream) == 0)
+                return;
+            if (Server_stream_muted(stream)) {
+                Server_stream_sleep(stream);
+                return;
+            }
+            /* Woken up during the block, its inputs may have been skipped. */
+            Server_pool_pull_inputs(pool, node);
+        }
+        Server_pool_call(pool, stream, node);
+        pool->called[node] = 1;
+    }
+}
+
+static inline void
+Server_pool_push(PyoThreadPool *pool, int node)
+{
+    if (pool->gil[node])
+        pool->gil_ready[pool->gil_tail++] = node;
+    else
+        pool->ready[pool->ready_tail++] = node;
+}
+
+/* Must be called with the pool's lock held. */
+static void
+Server_pool_complete_node(PyoThreadPool *pool, int node)
+{
+    int i, next;
+    for (i=pool->succ_start[node]; i<pool->succ_start[node+1]; i++) {
+        next = pool->succ[i];
+        if (--pool->pending[next] == 0)
+            Server_pool_push(pool, next);
+    }
+    pool->remaining--;
+    pthread_cond_broadcast(&pool->cond);
+}
+
+static void *
+Server_pool_worker(void *arg)
+{
+    int node;
+    PyoThreadPool *pool = (PyoThreadPool *)arg;
+
+    pthread_mutex_lock(&pool->lock);
+    while (1) {
+        while (pool->ready_head == pool->ready_tail && pool->quit == 0)
+            pthread_cond_wait(&pool->cond, &pool->lock);
+        if (pool->quit)
+            break;
+        node = pool->ready[pool->ready_head++];
+        pthread_mutex_unlock(&pool->lock);
+        Server_pool_run_node(pool, node);
+        pthread_mutex_lock(&pool->lock);
+        Server_pool_complete_node(pool, node);
+    }
+    pthread_mutex_unlock(&pool->lock);
+    return NULL;
+}
+
+/* Computes all streams of the current block. Called from the audio thread with the GIL held. */
+static void
+Server_pool_process(PyoThreadPool *pool)
+{
+    int i, node;
+
+    Server_pool_build_graph(pool);
+    if (pool->pull)
+        Server_pull_mark(pool);
+    Server_pool_release(pool);
+
+    pthread_mutex_lock(&pool->lock);
+    pool->ready_head = pool->ready_tail = pool->gil_head = pool->gil_tail = 0;
+    pool->remaining = pool->count;
+    for (i=0; i<pool->count; i++) {
+        if (pool->pending[i] == 0)
+            Server_pool_push(pool, i);
+    }
+    pthread_cond_broadcast(&pool->cond);
+
+    while (pool->remaining > 0) {
+        if (pool->gil_head < pool->gil_tail)
+            node = pool->gil_ready[pool->gil_head++];
+        else if (pool->ready_head < pool->ready_tail)
+            node = pool->ready[pool->ready_head++];
+        else {
+            pthread_cond_wait(&pool->cond, &pool->lock);
+            continue;
+        }
+        pthread_mutex_unlock(&pool->lock);
+        Server_pool_run_node(pool, node);
+        pthread_mutex_lock(&pool->lock);
+        Server_pool_complete_node(pool, node);
+    }
+    pthread_mutex_unlock(&pool->lock);
+    Server_pool_reacquire(pool);
+}
+
+/* A stream removed during the block, by python code run from a node with the GIL,
+   is dropped from the graph. Worker threads are idle while such a node runs. */
+static void
+Server_pool_forget(PyoThreadPool *pool, void *stream)
+{
+    int node = Server_pool_hash_lookup(pool, stream);
+    if (node >= 0 && node < pool->count && pool->nodes[node] == (Stream *)stream)
+        pool->nodes[node] = NULL;
+}
+
+static PyoThreadPool *
+Server_pool_new(Server *server, int nworkers)
+{
+    int i;
+    PyoThreadPool *pool = (PyoThreadPool *)calloc(1, sizeof(PyoThreadPool));
+
+    pool->server = server;
+    pthread_mutex_init(&pool->lock, NULL);
+    pthread_cond_init(&pool->cond, NULL);
+    pool->workers = (pthread_t *)malloc(nworkers * sizeof(pthread_t));
+    for (i=0; i<nworkers; i++) {
+        if (pthread_create(&pool->workers[i], NULL, Server_pool_worker, pool) != 0) {
+            Server_warning(server, "Could only start %d processing threads.\n", i+1);
+            break;
+        }
+    }
+    pool->nworkers = i;
+    return pool;
+}
+
+static void
+Server_pool_free(PyoThreadPool *pool)
+{
+    int i;
+
+    pthread_mutex_lock(&pool->lock);
+    pool->quit = 1;
+    pthread_cond_broadcast(&pool->cond);
+    pthread_mutex_unlock(&pool->lock);
+    for (i=0; i<pool->nworkers; i++)
+        pthread_join(pool->workers[i], NULL);
+    pthread_mutex_destroy(&pool->lock);
+    pthread_cond_destroy(&pool->cond);
+
+    free(pool->workers);
+    free(pool->nodes);
+    free(pool->gil);
+    free(pool->called);
+    free(pool->pending);
+    free(pool->stamp);
+    free(pool->succ_start);
+    free(pool->succ);
+    free(pool->edge_from);
+    free(pool->edge_to);
+    free(pool->hkeys);
+    free(pool->hvals);
+    free(pool->res);
+    free(pool->reader_node);
+    free(pool->reader_next);
+    free(pool->ready);
+    free(pool->gil_ready);
+    free(pool->dep_from);
+    free(pool->dep_to);
+    free(pool->dep_start);
+    free(pool->dep);
+    free(pool->consumers);
+    free(pool->sink);
+    free(pool->needed);
+    free(pool->mark);
+    free(pool->stack);
+    free(pool);
+}
+
+/***************************************************/
+/*  Python callbacks dispatcher                    */
+
+/* Pattern, TrigFunc and CallAfter callbacks are pushed by the audio thread,
+   which holds the GIL, in a single-producer single-consumer ring, and called
+   by the dispatcher thread between the blocks. The audio thread never waits
+   for the dispatcher: when the ring is full, the callback is called in place. */
+#define DISPATCHER_SIZE 1024
+
+typedef struct {
+    PyObject *callable;
+    PyObject *arg; /* NULL to call without argument */
+    unsigned long time; /* elapsed samples at the trigger */
+} PyoCallbackEvent;
+
+typedef struct {
+    Server *server;
+    pthread_t thread;
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    int quit;
+    PyoCallbackEvent ring[DISPATCHER_SIZE];
+    volatile unsigned long head; /* only written by the dispatcher thread */
+    volatile unsigned long tail; /* only written by the audio thread */
+
+    /* Counters, see Server.getCallbackStats */
+    long queued;
+    long dispatched;
+    long late; /* called more than a buffer after their trigger */
+    long overflows; /* called by the audio thread because the ring was full */
+    unsigned long maxdepth;
+    unsigned long maxdelay; /* in samples */
+} PyoDispatcher;
+
+static int
+Server_call(PyObject *callable, PyObject *arg)
+{
+    PyObject *result;
+
+    if (arg == NULL)
+        result = PyObject_CallObject(callable, NULL);
+    else
+        result = PyObject_CallFunctionObjArgs(callable, arg, NULL);
+    if (result == NULL) {
+        PyErr_Print();
+        return -1;
+    }
+    Py_DECREF(result);
+    return 0;
+}
+
+static void *
+Server_dispatcher_thread(void *arg)
+{
+    PyoDispatcher *disp = (PyoDispatcher *)arg;
+    PyoCallbackEvent ev;
+    PyGILState_STATE s;
+    struct timespec deadline;
+    unsigned long delay;
+
+    for (;;) {
+        pthread_mutex_lock(&disp->lock);
+        while (!disp->quit && disp->head == disp->tail) {
+            /* The audio thread signals without waiting for the lock, a missed
+               wake-up only delays the callbacks until the timeout. */
+            clock_gettime(CLOCK_REALTIME, &deadline);
+            deadline.tv_nsec += 5000000;
+            if (deadline.tv_nsec >= 1000000000) {
+                deadline.tv_sec++;
+                deadline.tv_nsec -= 1000000000;
+            }
+            pthread_cond_timedwait(&disp->cond, &disp->lock, &deadline);
+        }
+        if (disp->quit) {
+            pthread_mutex_unlock(&disp->lock);
+            break;
+        }
+        pthread_mutex_unlock(&disp->lock);
+
+        s = PyGILState_Ensure();
+        while (disp->head != disp->tail) {
+            __sync_synchronize();
+            ev = disp->ring[disp->head % DISPATCHER_SIZE];
+            __sync_synchronize();
+            disp->head++;
+            delay = disp->server->elapsedSamples - ev.time;
+            if (delay > (unsigned long)disp->server->bufferSize)
+                disp->late++;
+            if (delay > disp->maxdelay)
+                disp->maxdelay = delay;
+            disp->dispatched++;
+            Server_call(ev.callable, ev.arg);
+            Py_DECREF(ev.callable);
+            Py_XDECREF(ev.arg);
+        }
+        PyGILState_Release(s);
+    }
+    return NULL;
+}
+
+static PyoDispatcher *
+Server_dispatcher_new(Server *server)
+{
+    PyoDispatcher *disp = (PyoDispatcher *)calloc(1, sizeof(PyoDispatcher));
+
+    disp->server = server;
+    pthread_mutex_init(&disp->lock, NULL);
+    pthread_cond_init(&disp->cond, NULL);
+    if (pthread_create(&disp->thread, NULL, Server_dispatcher_thread, disp) != 0) {
+        Server_warning(server, "Could not start the callback thread, callbacks will be called synchronously.\n");
+        pthread_mutex_destroy(&disp->lock);
+        pthread_cond_destroy(&disp->cond);
+        free(disp);
+        return NULL;
+    }
+    return disp;
+}
+
+/* Stops the dispatcher thread and drops the pending callbacks. Called with the GIL. */
+static void
+Server_dispatcher_free(PyoDispatcher *disp)
+{
+    pthread_mutex_lock(&disp->lock);
+    disp->quit = 1;
+    pthread_cond_signal(&disp->cond);
+    pthread_mutex_unlock(&disp->lock);
+    Py_BEGIN_ALLOW_THREADS
+    pthread_join(disp->thread, NULL);
+    Py_END_ALLOW_THREADS
+    while (disp->head != disp->tail) {
+        Py_DECREF(disp->ring[disp->head % DISPATCHER_SIZE].callable);
+        Py_XDECREF(disp->ring[disp->head % DISPATCHER_SIZE].arg);
+        disp->head++;
+    }
+    pthread_mutex_destroy(&disp->lock);
+    pthread_cond_destroy(&disp->cond);
+    free(disp);
+}
+
+/* Calls `callable`, with `arg` if not NULL, for a trigger occuring `offset`
+   samples into the current block. Called from the audio thread with the GIL.
+   Returns -1 if a synchronous call raised an exception. */
+int
+Server_callback(Server *self, PyObject *callable, PyObject *arg, int offset)
+{
+    PyoDispatcher *disp = (PyoDispatcher *)self->dispatcher;
+    PyoCallbackEvent *ev;
+    unsigned long depth;
+
+    if (disp == NULL || !self->async_callbacks || self->audio_be_type == PyoOffline)
+        return Server_call(callable, arg);
+
+    depth = disp->tail - disp->head;
+    if (depth >= DISPATCHER_SIZE) {
+        disp->overflows++;
+        return Server_call(callable, arg);
+    }
+    ev = &disp->ring[disp->tail % DISPATCHER_SIZE];
+    Py_INCREF(callable);
+    Py_XINCREF(arg);
+    ev->callable = callable;
+    ev->arg = arg;
+    ev->time = self->elapsedSamples + offset;
+    __sync_synchronize();
+    disp->tail++;
+    disp->queued++;
+    if (depth + 1 > disp->maxdepth)
+        disp->maxdepth = depth + 1;
+    if (pthread_mutex_trylock(&disp->lock) == 0) {
+        pthread_cond_signal(&disp->cond);
+        pthread_mutex_unlock(&disp->lock);
+    }
+    return 0;
+}
+
+/***************************************************/
+/*  Parameter commands of the release GIL mode     */
+
+/* In the release GIL mode, the streams are computed without the GIL, so python
+   threads run while the audio thread computes a block. The setters, play, out
+   and stop methods of the audio objects, called from another thread while the
+   server is running, are posted in a ring and applied by the audio thread at
+   the beginning of the next block. Both ends of the ring hold the GIL, so the
+   ring needs no lock. The streams registry is only changed between the blocks:
+   the audio thread holds `dsp_lock` during a block and the other threads wait
+   for it, without the GIL, before adding or removing a stream. */
+#define COMMANDS_SIZE 4096
+
+typedef struct {
+    PyObject *method; /* bound method of an audio object */
+    PyObject *args;
+    PyObject *kwds; /* NULL without keyword arguments */
+} PyoCommand;
+
+typedef struct {
+    PyoCommand ring[COMMANDS_SIZE];
+    volatile unsigned long head; /* only written by the thread applying the commands */
+    volatile unsigned long tail; /* only written by the threads posting the commands */
+    pthread_mutex_t dsp_lock; /* recursive, held by the audio thread during a block */
+    pthread_t audio_thread;
+    volatile int in_block; /* audio_thread is computing a block */
+    int locked; /* dsp_lock has been taken at the beginning of the current block */
+
+    /* Counters, see Server.getCommandStats */
+    long posted;
+    long applied;
+    long waits; /* posts which waited for the audio thread because the ring was full */
+    unsigned long maxdepth;
+} PyoCommandQueue;
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *method;
+    int returns_self; /* play and out return their object */
+} DeferredCall;
+
+static PyoCommandQueue *
+Server_commands_new(void)
+{
+    pthread_mutexattr_t attr;
+    PyoCommandQueue *q = (PyoCommandQueue *)calloc(1, sizeof(PyoCommandQueue));
+
+    pthread_mutexattr_init(&attr);
+    pthread_mutexattr_settype(&attr, PTHREAD_MUTEX_RECURSIVE);
+    pthread_mutex_init(&q->dsp_lock, &attr);
+    pthread_mutexattr_destroy(&attr);
+    return q;
+}
+
+static inline int
+Server_commands_audio_thread(PyoCommandQueue *q)
+{
+    return q->in_block && pthread_equal(pthread_self(), q->audio_thread);
+}
+
+/* Takes `dsp_lock`, releasing the GIL while waiting. Called with the GIL. */
+static void
+Server_commands_lock(PyoCommandQueue *q)
+{
+    if (pthread_mutex_trylock(&q->dsp_lock) != 0) {
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&q->dsp_lock);
+        Py_END_ALLOW_THREADS
+    }
+}
+
+/* Applies the pending commands, in the order of their posts. Called with the GIL,
+   by the audio thread or by a thread holding `dsp_lock`. */
+static void
+Server_commands_apply(PyoCommandQueue *q)
+{
+    PyoCommand cmd;
+    PyObject *result;
+
+    while (q->head != q->tail) {
+        cmd = q->ring[q->head % COMMANDS_SIZE];
+        q->head++;
+        result = PyObject_Call(cmd.method, cmd.args, cmd.kwds);
+        if (result == NULL)
+            PyErr_Print();
+        else
+            Py_DECREF(result);
+        Py_DECREF(cmd.method);
+        Py_DECREF(cmd.args);
+        Py_XDECREF(cmd.kwds);
+        q->applied++;
+    }
+}
+
+/* Applies the pending commands outside of the audio thread, between two blocks. */
+static void
+Server_commands_flush(Server *server)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)server->commands;
+
+    if (q == NULL || q->head == q->tail)
+        return;
+    Server_commands_lock(q);
+    Server_commands_apply(q);
+    pthread_mutex_unlock(&q->dsp_lock);
+}
+
+/* Returns 1 if the registry can be changed by the calling thread without waiting
+   for the end of the block, otherwise takes `dsp_lock` and returns 0. */
+static int
+Server_commands_enter(Server *server)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)server->commands;
+
+    if (q == NULL || !server->release_gil || Server_commands_audio_thread(q))
+        return 1;
+    Server_commands_lock(q);
+    return 0;
+}
+
+static void
+Server_commands_leave(Server *server, int owner)
+{
+    if (!owner)
+        pthread_mutex_unlock(&((PyoCommandQueue *)server->commands)->dsp_lock);
+}
+
+/* Beginning of a block, called by the audio thread with the GIL. */
+static void
+Server_commands_begin(Server *server)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)server->commands;
+
+    if (q == NULL)
+        return;
+    if (server->release_gil) {
+        Server_commands_lock(q);
+        q->locked = 1;
+    }
+    q->audio_thread = pthread_self();
+    q->in_block = 1;
+    Server_commands_apply(q);
+}
+
+/* End of a block, called by the audio thread with the GIL. */
+static void
+Server_commands_end(Server *server)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)server->commands;
+
+    if (q == NULL)
+        return;
+    q->in_block = 0;
+    if (q->locked) {
+        q->locked = 0;
+        pthread_mutex_unlock(&q->dsp_lock);
+    }
+}
+
+/* Applies the pending commands and drops the queue. Called with the GIL, the server not running. */
+static void
+Server_commands_free(PyoCommandQueue *q)
+{
+    Server_commands_apply(q);
+    pthread_mutex_destroy(&q->dsp_lock);
+    free(q);
+}
+
+/* The call is posted if another thread computes the blocks without the GIL. */
+static inline int
+Server_commands_deferred(Server *server)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)server->commands;
+    return q != NULL && server->release_gil && server->server_started && !Server_commands_audio_thread(q);
+}
+
+static void
+DeferredCall_dealloc(DeferredCall *self)
+{
+    Py_XDECREF(self->method);
+    self->ob_type->tp_free((PyObject *)self);
+}
+
+static PyObject *
+DeferredCall_call(DeferredCall *self, PyObject *args, PyObject *kwds)
+{
+    PyoCommand *cmd;
+    PyObject *owner;
+    PyoCommandQueue *q;
+    unsigned long depth;
+    Server *server = (Server *)PyServer_get_server();
+
+    if (server == NULL)
+        return PyObject_Call(self->method, args, kwds);
+    q = (PyoCommandQueue *)server->commands;
+    while (Server_commands_deferred(server) && q->tail - q->head >= COMMANDS_SIZE) {
+        /* The ring is full, wait for the next block. */
+        q->waits++;
+        Py_BEGIN_ALLOW_THREADS
+        usleep(1000);
+        Py_END_ALLOW_THREADS
+    }
+    if (!Server_commands_deferred(server)) {
+        /* Earlier posts first. */
+        Server_commands_flush(server);
+        return PyObject_Call(self->method, args, kwds);
+    }
+
+    cmd = &q->ring[q->tail % COMMANDS_SIZE];
+    Py_INCREF(self->method);
+    Py_INCREF(args);
+    Py_XINCREF(kwds);
+    cmd->method = self->method;
+    cmd->args = args;
+    cmd->kwds = kwds;
+    q->tail++;
+    q->posted++;
+    depth = q->tail - q->head;
+    if (depth > q->maxdepth)
+        q->maxdepth = depth;
+
+    if (self->returns_self) {
+        owner = PyCFunction_GET_SELF(self->method);
+        Py_INCREF(owner);
+        return owner;
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+PyTypeObject DeferredCallType = {
+    PyObject_HEAD_INIT(NULL)
+    0,                                              /*ob_size*/
+    "_pyo.DeferredCall",                            /*tp_name*/
+    sizeof(DeferredCall),                           /*tp_basicsize*/
+    0,                                              /*tp_itemsize*/
+    (destructor)DeferredCall_dealloc,               /*tp_dealloc*/
+    0,                                              /*tp_print*/
+    0,                                              /*tp_getattr*/
+    0,                                              /*tp_setattr*/
+    0,                                              /*tp_compare*/
+    0,                                              /*tp_repr*/
+    0,                                              /*tp_as_number*/
+    0,                                              /*tp_as_sequence*/
+    0,                                              /*tp_as_mapping*/
+    0,                                              /*tp_hash */
+    (ternaryfunc)DeferredCall_call,                 /*tp_call*/
+    0,                                              /*tp_str*/
+    0,                                              /*tp_getattro*/
+    0,                                              /*tp_setattro*/
+    0,                                              /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,                             /*tp_flags*/
+    "Method of an audio object applied at the next block in the release GIL mode.", /* tp_doc */
+};
+
+/* tp_getattro of the audio objects. In the release GIL mode, their setters, play,
+   out and stop methods are wrapped to be posted in the commands queue. */
+PyObject *
+Server_getattro(PyObject *obj, PyObject *name)
+{
+    char *str;
+    DeferredCall *call;
+    Server *server;
+    PyObject *attr = PyObject_GenericGetAttr(obj, name);
+
+    if (attr == NULL || !PyCFunction_Check(attr) || !PyString_Check(name))
+        return attr;
+    server = (Server *)PyServer_get_server();
+    if (server == NULL || !server->release_gil)
+        return attr;
+    str = PyString_AS_STRING(name);
+    if (strncmp(str, "set", 3) != 0 && strcmp(str, "play") != 0 && strcmp(str, "out") != 0 && strcmp(str, "stop") != 0)
+        return attr;
+
+    call = PyObject_New(DeferredCall, &DeferredCallType);
+    if (call == NULL) {
+        Py_DECREF(attr);
+        return NULL;
+    }
+    call->method = attr;
+    call->returns_self = strcmp(str, "play") == 0 || strcmp(str, "out") == 0;
+    return (PyObject *)call;
+}
+
+/***************************************************/
+/*  Sample accurate events                         */
+
+/* Timestamped events, in samples since the server started, are kept in a binary
+   heap ordered by time, then by insertion order. At the beginning of every block,
+   the audio thread pops the events falling in the block and calls their function
+   with the offset of the event in the block (0 for a late event). The functions
+   run with the GIL, before the streams are computed, and don't call python code. */
+typedef struct {
+    unsigned long time;
+    unsigned long order;
+    PyoEventFunc func;
+    PyObject *target;
+    MYFLT value;
+    int arg;
+} PyoEvent;
+
+typedef struct {
+    PyoEvent *heap;
+    int count;
+    int size;
+    unsigned long order;
+
+    /* Counters, see Server.getEventStats */
+    long scheduled;
+    long applied;
+    long late; /* applied in a block after the one holding their time */
+    int maxdepth;
+} PyoScheduler;
+
+static inline int
+Server_event_before(PyoEvent *a, PyoEvent *b)
+{
+    return a->time < b->time || (a->time == b->time && a->order < b->order);
+}
+
+static void
+Server_events_sift_up(PyoScheduler *sched, int i)
+{
+    int parent;
+    PyoEvent tmp;
+
+    while (i > 0) {
+        parent = (i - 1) / 2;
+        if (!Server_event_before(&sched->heap[i], &sched->heap[parent]))
+            break;
+        tmp = sched->heap[i];
+        sched->heap[i] = sched->heap[parent];
+        sched->heap[parent] = tmp;
+        i = parent;
+    }
+}
+
+static void
+Server_events_sift_down(PyoScheduler *sched, int i)
+{
+    int child;
+    PyoEvent tmp;
+
+    while ((child = 2 * i + 1) < sched->count) {
+        if (child + 1 < sched->count && Server_event_before(&sched->heap[child+1], &sched->heap[child]))
+            child++;
+        if (!Server_event_before(&sched->heap[child], &sched->heap[i]))
+            break;
+        tmp = sched->heap[i];
+        sched->heap[i] = sched->heap[child];
+        sched->heap[child] = tmp;
+        i = child;
+    }
+}
+
+/* Time, in samples, of the beginning of the next block. */
+static inline unsigned long
+Server_events_now(Server *self)
+{
+    return self->server_started ? self->elapsedSamples : 0;
+}
+
+/* Schedules a call of `func` for the sample `delay` samples after the beginning
+   of the next block (or after the start of the server if it is stopped). The
+   event holds a reference to `target`. Called with the GIL. */
+int
+Server_scheduleEvent(Server *self, unsigned long delay, PyoEventFunc func, PyObject *target, MYFLT value, int arg)
+{
+    PyoEvent *ev;
+    PyoScheduler *sched = (PyoScheduler *)self->scheduler;
+
+    if (sched == NULL)
+        sched = (PyoScheduler *)(self->scheduler = calloc(1, sizeof(PyoScheduler)));
+    if (sched->count >= sched->size) {
+        sched->size = sched->size * 2 + 64;
+        sched->heap = (PyoEvent *)realloc(sched->heap, sched->size * sizeof(PyoEvent));
+    }
+    ev = &sched->heap[sched->count++];
+    ev->time = Server_events_now(self) + delay;
+    ev->order = sched->order++;
+    ev->func = func;
+    Py_INCREF(target);
+    ev->target = target;
+    ev->value = value;
+    ev->arg = arg;
+    Server_events_sift_up(sched, sched->count - 1);
+    sched->scheduled++;
+    if (sched->count > sched->maxdepth)
+        sched->maxdepth = sched->count;
+    return 0;
+}
+
+/* Drops the pending events of `target`. Called with the GIL. */
+void
+Server_unscheduleEvents(Server *self, PyObject *target)
+{
+    int i, j = 0;
+    PyoScheduler *sched = (PyoScheduler *)self->scheduler;
+
+    if (sched == NULL)
+        return;
+    for (i=0; i<sched->count; i++) {
+        if (sched->heap[i].target == target)
+            Py_DECREF(sched->heap[i].target);
+        else
+            sched->heap[j++] = sched->heap[i];
+    }
+    if (j == sched->count)
+        return;
+    sched->count = j;
+    for (i=sched->count/2-1; i>=0; i--)
+        Server_events_sift_down(sched, i);
+}
+
+/* Applies the events of the current block. Called by the audio thread with the GIL. */
+static void
+Server_events_process(Server *server)
+{
+    PyoEvent ev;
+    int offset;
+    unsigned long now = server->elapsedSamples;
+    unsigned long end = now + server->bufferSize;
+    PyoScheduler *sched = (PyoScheduler *)server->scheduler;
+
+    if (sched == NULL)
+        return;
+    while (sched->count > 0 && sched->heap[0].time < end) {
+        ev = sched->heap[0];
+        sched->heap[0] = sched->heap[--sched->count];
+        Server_events_sift_down(sched, 0);
+        if (ev.time < now) {
+            offset = 0;
+            sched->late++;
+        }
+        else
+            offset = (int)(ev.time - now);
+        (*ev.func)(ev.target, offset, ev.value, ev.arg);
+        Py_DECREF(ev.target);
+        sched->applied++;
+    }
+}
+
+static void
+Server_events_free(PyoScheduler *sched)
+{
+    int i;
+    for (i=0; i<sched->count; i++)
+        Py_DECREF(sched->heap[i].target);
+    free(sched->heap);
+    free(sched);
 }
 
-void
-*Server_embedded_thread(void *arg)
+/* play, out and stop actions of the audio objects, applied at the beginning of
+   the block holding their time: the streams are computed a block at a time. */
+#define EVENT_PLAY 0
+#define EVENT_OUT 1
+#define EVENT_STOP 2
+
+static void
+Server_event_action(PyObject *target, int offset, MYFLT value, int arg)
 {
-    Server *self;
-    self = (Server *)arg;
+    PyObject *result = NULL;
 
-    Server_process_buffers(self);
+    switch (arg & 3) {
+        case EVENT_PLAY:
+            result = PyObject_CallMethod(target, "play", NULL);
+            break;
+        case EVENT_OUT:
+            result = PyObject_CallMethod(target, "out", "i", arg >> 2);
+            break;
+        case EVENT_STOP:
+            result = PyObject_CallMethod(target, "stop", NULL);
+            break;
+    }
+    if (result == NULL)
+        PyErr_Print();
+    else
+        Py_DECREF(result);
+}
 
-    return NULL;
+/***************************************************/
+/*  Main Processing functions                      */
+
+/* Adds a block, which started at time `start`, to the profiler counters. */
+static void
+Server_profile_block(Server *server, double start)
+{
+    double dur = Stream_getProfileTime() - start;
+
+    server->prof_blocks++;
+    server->prof_busy += dur;
+    if (dur > server->prof_maxblock)
+        server->prof_maxblock = dur;
+    if (dur > server->bufferSize / server->samplingRate)
+        server->prof_misses++;
+    Stream_addTraceEvent(0, "buffer", start, dur);
 }
 
-int
-Server_embedded_nb_start(Server *self)
+/* Keeps the profile of a stream about to be removed in the totals of its class. */
+static void
+Server_profile_removed(Server *self, Stream *stream)
 {
-    pthread_t offthread;
-    pthread_create(&offthread, NULL, Server_embedded_thread, self);
-    return 0;
+    PyObject *key, *prev, *item;
+    double time = stream->cputime, max = stream->maxtime;
+    long calls = stream->calls, count = 1;
+
+    key = PyString_FromString(stream->streamobject->ob_type->tp_name);
+    prev = PyDict_GetItem(self->prof_removed, key);
+    if (prev != NULL) {
+        time += PyFloat_AsDouble(PyTuple_GET_ITEM(prev, 0));
+        calls += PyInt_AsLong(PyTuple_GET_ITEM(prev, 1));
+        if (PyFloat_AsDouble(PyTuple_GET_ITEM(prev, 2)) > max)
+            max = PyFloat_AsDouble(PyTuple_GET_ITEM(prev, 2));
+        count += PyInt_AsLong(PyTuple_GET_ITEM(prev, 3));
+    }
+    item = Py_BuildValue("(dldl)", time, calls, max, count);
+    PyDict_SetItem(self->prof_removed, key, item);
+    Py_DECREF(key);
+    Py_DECREF(item);
 }
 
-/* this stop function is not very useful since the processing is stopped at the end
-of every processing callback, but function put to not break pyo */
-int
-Server_embedded_stop(Server *self)
+/* Computes the registered streams in order and adds the ones sent to the dac
+   to `buffer` (nchnls * bufferSize). If `pool` is given, the streams already
+   handled by the worker threads are skipped. */
+static void
+Server_process_streams(Server *server, MYFLT *buffer, PyoThreadPool *pool)
 {
-    self->server_started = 0;
-    self->server_stopped = 1;
-    return 0;
+    int j, slot, node;
+    Stream *stream_tmp;
+    MYFLT *data, *out;
+
+    for (slot=server->streams.head; slot>=0; slot=server->streams.slots[slot].next) {
+        stream_tmp = (Stream *)server->streams.slots[slot].stream;
+        if (stream_tmp == NULL)
+            continue;
+        if (pool != NULL) {
+            node = Server_pool_hash_lookup(pool, (void *)stream_tmp);
+            if (node >= 0 && node < pool->count && pool->nodes[node] == stream_tmp)
+                continue;
+        }
+        if (Stream_getStreamActive(stream_tmp) == 1) {
+            Stream_callFunction(stream_tmp);
+            if (Stream_getStreamToDac(stream_tmp) != 0) {
+                data = Stream_getData(stream_tmp);
+                out = buffer + Stream_getStreamChnl(stream_tmp) * server->bufferSize;
+                for (j=0; j < server->bufferSize; j++) {
+                    out[j] += *data++;
+                }
+            }
+            if (Stream_getDuration(stream_tmp) != 0) {
+                Stream_IncrementDurationCount(stream_tmp);
+            }
+        }
+        else if (Stream_getBufferCountWait(stream_tmp) != 0)
+            Stream_IncrementBufferCount(stream_tmp);
+    }
 }
 
-/***************************************************/
-/*  Main Processing functions                      */
+/* Stops the streams which requested it during the block (Stream_requestStop).
+   Called by the audio thread with the GIL, after the streams are computed. */
+static void
+Server_process_stop_requests(Server *server)
+{
+    int slot, next;
+    Stream *stream;
+    PyObject *result;
+
+    if (stream_stop_requests == 0)
+        return;
+    __sync_lock_test_and_set(&stream_stop_requests, 0);
+    for (slot=server->streams.head; slot>=0; slot=next) {
+        next = server->streams.slots[slot].next;
+        stream = (Stream *)server->streams.slots[slot].stream;
+        if (!stream->stop_requested)
+            continue;
+        stream->stop_requested = 0;
+        result = PyObject_CallMethod(stream->streamobject, "stop", NULL);
+        if (result == NULL)
+            PyErr_Print();
+        else
+            Py_DECREF(result);
+    }
+}
 
 static inline void
 Server_process_buffers(Server *server)
@@ -1340,27 +3124,54 @@ Server_process_buffers(Server *server)
     MYFLT amp = server->amp;
     Stream *stream_tmp;
     MYFLT *data;
+    double prof_start = stream_profiler.active ? Stream_getProfileTime() : 0.0;
 
     memset(&buffer, 0, sizeof(buffer));
     PyGILState_STATE s = PyGILState_Ensure();
-    for (i=0; i<server->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(server->streams, i);
-        if (Stream_getStreamActive(stream_tmp) == 1) {
-            Stream_callFunction(stream_tmp);
-            if (Stream_getStreamToDac(stream_tmp) != 0) {
-                data = Stream_getData(stream_tmp);
-                chnl = Stream_getStreamChnl(stream_tmp);
-                for (j=0; j < server->bufferSize; j++) {
-                    buffer[chnl][j] += *data++;
+    Server_commands_begin(server);
+    Server_events_process(server);
+    server->streams.busy = 1;
+    if (server->pool != NULL && server->stream_count > 0 && (server->threads > 1 || server->pull || server->release_gil)) {
+        /* Streams are computed by the worker threads, or pulled from the outputs, then summed in the serial order. */
+        PyoThreadPool *pool = (PyoThreadPool *)server->pool;
+        pool->release = server->commands != NULL && ((PyoCommandQueue *)server->commands)->locked;
+        if (server->threads > 1 || server->pull == 0)
+            Server_pool_process(pool);
+        else
+            Server_pull_process(pool);
+        for (i=0; i<pool->count; i++) {
+            stream_tmp = pool->nodes[i];
+            if (stream_tmp == NULL)
+                continue;
+            if (pool->called[i]) {
+                if (Stream_getStreamToDac(stream_tmp) != 0) {
+                    data = Stream_getData(stream_tmp);
+                    chnl = Stream_getStreamChnl(stream_tmp);
+                    for (j=0; j < server->bufferSize; j++) {
+                        buffer[chnl][j] += *data++;
+                    }
+                }
+                if (Stream_getDuration(stream_tmp) != 0) {
+                    Stream_IncrementDurationCount(stream_tmp);
                 }
             }
-            if (Stream_getDuration(stream_tmp) != 0) {
-                Stream_IncrementDurationCount(stream_tmp);
+            else if (pool->pull && Stream_getStreamActive(stream_tmp) == 1) {
+                /* Skipped by the pull mode, the duration still runs. */
+                if (Stream_getDuration(stream_tmp) != 0) {
+                    Stream_IncrementDurationCount(stream_tmp);
+                }
             }
+            else if (Stream_getBufferCountWait(stream_tmp) != 0)
+                Stream_IncrementBufferCount(stream_tmp);
         }
-        else if (Stream_getBufferCountWait(stream_tmp) != 0)
-            Stream_IncrementBufferCount(stream_tmp);
+        /* Streams created by python callbacks during this block are computed here, like the serial loop does. */
+        if (server->streams.added)
+            Server_process_streams(server, &buffer[0][0], pool);
     }
+    else
+        Server_process_streams(server, &buffer[0][0], NULL);
+    Server_process_stop_requests(server);
+    Server_registry_release_pending(&server->streams);
     if (server->withGUI == 1 && nchnls <= 8) {
         Server_process_gui(server);
     }
@@ -1368,6 +3179,9 @@ Server_process_buffers(Server *server)
         Server_process_time(server);
     }
     server->elapsedSamples += server->bufferSize;
+    if (prof_start != 0.0)
+        Server_profile_block(server, prof_start);
+    Server_commands_end(server);
     PyGILState_Release(s);
     if (amp != server->lastAmp) {
         server->timeCount = 0;
@@ -1525,6 +3339,21 @@ Server_shut_down(Server *self)
         Server_error(self, "Error closing audio backend.\n");
     }
 
+    if (self->pool != NULL) {
+        Server_pool_free((PyoThreadPool *)self->pool);
+        self->pool = NULL;
+    }
+    if (self->commands != NULL)
+        Server_commands_apply((PyoCommandQueue *)self->commands);
+    if (self->scheduler != NULL) {
+        Server_events_free((PyoScheduler *)self->scheduler);
+        self->scheduler = NULL;
+    }
+    if (self->dispatcher != NULL) {
+        Server_dispatcher_free((PyoDispatcher *)self->dispatcher);
+        self->dispatcher = NULL;
+    }
+
     Py_INCREF(Py_None);
     return Py_None;
 }
@@ -1533,19 +3362,24 @@ Server_shut_down(Server *self)
 static int
 Server_traverse(Server *self, visitproc visit, void *arg)
 {
+    int i;
     /* GUI and TIME ? */
-    Py_VISIT(self->streams);
+    for (i=0; i<self->streams.size; i++)
+        Py_VISIT(self->streams.slots[i].stream);
     Py_VISIT(self->jackAutoConnectInputPorts);
     Py_VISIT(self->jackAutoConnectOutputPorts);
+    Py_VISIT(self->prof_removed);
     return 0;
 }
 
 static int
 Server_clear(Server *self)
 {
-    Py_CLEAR(self->streams);
+    Server_registry_clear(&self->streams);
+    self->stream_count = 0;
     Py_CLEAR(self->jackAutoConnectInputPorts);
     Py_CLEAR(self->jackAutoConnectOutputPorts);
+    Py_CLEAR(self->prof_removed);
     return 0;
 }
 
@@ -1554,6 +3388,10 @@ Server_dealloc(Server* self)
 {
     if (self->server_booted == 1)
         Server_shut_down(self);
+    if (self->commands != NULL)
+        Server_commands_free((PyoCommandQueue *)self->commands);
+    if (self->scheduler != NULL)
+        Server_events_free((PyoScheduler *)self->scheduler);
     Server_clear(self);
     free(self->input_buffer);
     free(self->output_buffer);
@@ -1633,6 +3471,21 @@ Server_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->rectype = 0;
     self->startoffset = 0.0;
     self->globalSeed = 0;
+    self->threads = 1;
+    self->pool = NULL;
+    self->pull = 0;
+    self->async_callbacks = 0;
+    self->dispatcher = NULL;
+    self->balance_frames = 1;
+    self->fast_math = 0;
+    self->release_gil = 0;
+    self->commands = NULL;
+    self->scheduler = NULL;
+    memset(self->frame_load, 0, sizeof(self->frame_load));
+    self->prof_removed = PyDict_New();
+    self->streams.slots = NULL;
+    self->streams.hkeys = self->streams.hslots = NULL;
+    Server_registry_clear(&self->streams);
     self->thisServerID = serverID;
     Py_XDECREF(my_server[serverID]);
     my_server[serverID] = (Server *)self;
@@ -1852,6 +3705,112 @@ Server_setBufferSize(Server *self, PyObject *arg)
     return Py_None;
 }
 
+static PyObject *
+Server_setThreads(Server *self, PyObject *arg)
+{
+    if (self->server_booted) {
+        Server_warning(self, "Can't change the number of processing threads for booted server.\n");
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    if (arg != NULL && PyInt_Check(arg)) {
+        self->threads = PyInt_AsLong(arg);
+        if (self->threads < 1)
+            self->threads = 1;
+    }
+    else {
+        Server_error(self, "Number of threads must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setPullMode(Server *self, PyObject *arg)
+{
+    if (arg != NULL && PyInt_Check(arg)) {
+        self->pull = PyInt_AsLong(arg) ? 1 : 0;
+        if (self->pull && self->server_booted && self->pool == NULL)
+            self->pool = (void *)Server_pool_new(self, self->threads - 1);
+    }
+    else {
+        Server_error(self, "Pull mode must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setFastMath(Server *self, PyObject *arg)
+{
+    if (arg != NULL && PyInt_Check(arg)) {
+        self->fast_math = PyInt_AsLong(arg) ? 1 : 0;
+    }
+    else {
+        Server_error(self, "Fast math mode must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setFrameBalancing(Server *self, PyObject *arg)
+{
+    if (arg != NULL && PyInt_Check(arg)) {
+        self->balance_frames = PyInt_AsLong(arg) ? 1 : 0;
+    }
+    else {
+        Server_error(self, "Frame balancing mode must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setReleaseGIL(Server *self, PyObject *arg)
+{
+    PyoCommandQueue *q;
+
+    if (arg != NULL && PyInt_Check(arg)) {
+        if (PyInt_AsLong(arg)) {
+            if (self->commands == NULL)
+                self->commands = (void *)Server_commands_new();
+            self->release_gil = 1;
+            if (self->server_booted && self->pool == NULL)
+                self->pool = (void *)Server_pool_new(self, self->threads - 1);
+        }
+        else if (self->release_gil) {
+            /* Waits for the end of the current block and applies the pending commands. */
+            q = (PyoCommandQueue *)self->commands;
+            Server_commands_lock(q);
+            self->release_gil = 0;
+            Server_commands_apply(q);
+            pthread_mutex_unlock(&q->dsp_lock);
+        }
+    }
+    else {
+        Server_error(self, "Release GIL mode must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setAsyncCallbacks(Server *self, PyObject *arg)
+{
+    if (arg != NULL && PyInt_Check(arg)) {
+        self->async_callbacks = PyInt_AsLong(arg) ? 1 : 0;
+        if (self->async_callbacks && self->server_booted && self->dispatcher == NULL)
+            self->dispatcher = (void *)Server_dispatcher_new(self);
+    }
+    else {
+        Server_error(self, "Async callbacks mode must be an integer.\n");
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
 static PyObject *
 Server_setDuplex(Server *self, PyObject *arg)
 {
@@ -1944,6 +3903,13 @@ Server_setGlobalSeed(Server *self, PyObject *arg)
     return Py_None;
 }
 
+/* Default math backend of the spectral objects created from now on. */
+int
+Server_useFastMath(Server *self)
+{
+    return self->fast_math;
+}
+
 int
 Server_generateSeed(Server *self, int oid)
 {
@@ -1966,6 +3932,78 @@ Server_generateSeed(Server *self, int oid)
     return 0;
 }
 
+/* Seeds the generator of a new object. With a global seed, the stream of an
+   object only depends on the seed, its class and its rank among the objects of
+   its class, whatever the objects of the other classes and the processing order. */
+void
+Server_seedRandom(Server *self, int oid, PyoRand *rng)
+{
+    unsigned int seed;
+    int count = ++rnd_objs_count[oid];
+
+    if (self->globalSeed > 0)
+        seed = (unsigned int)self->globalSeed;
+    else
+        seed = (unsigned int)time(NULL);
+    pyorand_seed(rng, seed, (unsigned int)oid, (unsigned int)count);
+}
+
+/* Objects computing a fft frame every `hopsize` samples call this function to
+   spread their frames over the blocks. Among the `hopsize / bufferSize` blocks
+   of a hop, the one with the lowest load of frames is reserved in `frames`.
+   Returns the number of samples by which the object must advance its frame
+   counter, so that its next frames are computed in this block. With an idle
+   server, the last block of the hop is preferred, which is where the frames
+   fall without offset. */
+int
+Server_scheduleFrames(Server *self, PyoFrameSlot *frames, int hopsize, double cost)
+{
+    int i, s, best, nslots, block, delay;
+    double load, minload = 0.0;
+
+    Server_unscheduleFrames(self, frames);
+    nslots = hopsize / self->bufferSize;
+    if (!self->balance_frames || nslots < 2 || nslots > PYO_FRAME_SLOTS || (hopsize % self->bufferSize) != 0 || (PYO_FRAME_SLOTS % nslots) != 0)
+        return 0;
+
+    best = nslots - 1;
+    for (s=nslots-1; s>=0; s--) {
+        load = 0.0;
+        for (i=s; i<PYO_FRAME_SLOTS; i+=nslots)
+            load += self->frame_load[i];
+        if (s == nslots - 1 || load < minload) {
+            minload = load;
+            best = s;
+        }
+    }
+    for (i=best; i<PYO_FRAME_SLOTS; i+=nslots)
+        self->frame_load[i] += cost;
+    frames->slot = best;
+    frames->nslots = nslots;
+    frames->cost = cost;
+
+    /* Blocks to wait, from the current one, before computing the first frame. */
+    block = (int)((self->elapsedSamples / self->bufferSize) % nslots);
+    delay = (best - block + nslots) % nslots;
+    return hopsize - (delay + 1) * self->bufferSize;
+}
+
+/* Releases the block reserved by Server_scheduleFrames. */
+void
+Server_unscheduleFrames(Server *self, PyoFrameSlot *frames)
+{
+    int i;
+
+    if (frames->slot < 0)
+        return;
+    for (i=frames->slot; i<PYO_FRAME_SLOTS; i+=frames->nslots) {
+        self->frame_load[i] -= frames->cost;
+        if (self->frame_load[i] < 0.0)
+            self->frame_load[i] = 0.0;
+    }
+    frames->slot = -1;
+}
+
 static PyObject *
 Server_setAmp(Server *self, PyObject *arg)
 {
@@ -2259,7 +4297,7 @@ Server_boot(Server *self, PyObject *arg)
         Server_error(self, "The argument to set for a new buffer must be a boolean.\n");
     }
 
-    self->streams = PyList_New(0);
+    Server_registry_clear(&self->streams);
     switch (self->audio_be_type) {
         case PyoPortaudio:
             audioerr = Server_pa_init(self);
@@ -2324,6 +4362,10 @@ Server_boot(Server *self, PyObject *arg)
     }
     if (audioerr == 0) {
         self->server_booted = 1;
+        if (self->threads > 1 || self->pull || self->release_gil)
+            self->pool = (void *)Server_pool_new(self, self->threads - 1);
+        if (self->async_callbacks)
+            self->dispatcher = (void *)Server_dispatcher_new(self);
     }
     else {
         self->server_booted = 0;
@@ -2598,6 +4640,7 @@ Server_stop_rec(Server *self, PyObject *args)
 static PyObject *
 Server_addStream(Server *self, PyObject *args)
 {
+    int owner;
     PyObject *tmp;
 
     if (! PyArg_ParseTuple(args, "O", &tmp))
@@ -2608,9 +4651,11 @@ Server_addStream(Server *self, PyObject *args)
         return PyInt_FromLong(-1);
     }
 
-    PyList_Append(self->streams, tmp);
+    owner = Server_commands_enter(self);
+    Server_registry_add(&self->streams, (Stream *)tmp);
 
     self->stream_count++;
+    Server_commands_leave(self, owner);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2619,19 +4664,22 @@ Server_addStream(Server *self, PyObject *args)
 PyObject *
 Server_removeStream(Server *self, int id)
 {
-    int i, sid;
-    Stream *stream_tmp;
+    void *stream;
+    int slot, owner = Server_commands_enter(self);
 
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == id) {
-            Server_debug(self, "Removed stream id %d\n", id);
-            PySequence_DelItem(self->streams, i);
-            self->stream_count--;
-            break;
-        }
+    slot = Server_registry_find(&self->streams, id);
+    if (slot >= 0 && ((Stream *)self->streams.slots[slot].stream)->calls > 0)
+        Server_profile_removed(self, (Stream *)self->streams.slots[slot].stream);
+
+    stream = Server_registry_remove(&self->streams, id);
+
+    if (stream != NULL) {
+        Server_debug(self, "Removed stream id %d\n", id);
+        self->stream_count--;
+        if (self->pool != NULL && self->streams.busy)
+            Server_pool_forget((PyoThreadPool *)self->pool, stream);
     }
+    Server_commands_leave(self, owner);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2640,36 +4688,26 @@ Server_removeStream(Server *self, int id)
 PyObject *
 Server_changeStreamPosition(Server *self, PyObject *args)
 {
-    int i, rsid, csid, sid;
-    Stream *ref_stream_tmp, *cur_stream_tmp, *stream_tmp;
+    int ref_slot, cur_slot, owner;
+    Stream *ref_stream_tmp, *cur_stream_tmp;
 
     if (! PyArg_ParseTuple(args, "OO", &ref_stream_tmp, &cur_stream_tmp))
         return PyInt_FromLong(-1);
 
-    rsid = Stream_getStreamId(ref_stream_tmp);
-    csid = Stream_getStreamId(cur_stream_tmp);
-
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == csid) {
-            PySequence_DelItem(self->streams, i);
-            self->stream_count--;
-            break;
-        }
+    owner = Server_commands_enter(self);
+    cur_slot = Server_registry_find(&self->streams, Stream_getStreamId(cur_stream_tmp));
+    if (cur_slot < 0) {
+        Server_registry_add(&self->streams, cur_stream_tmp);
+        self->stream_count++;
+        cur_slot = Server_registry_find(&self->streams, Stream_getStreamId(cur_stream_tmp));
     }
 
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == rsid) {
-            break;
-        }
+    ref_slot = Server_registry_find(&self->streams, Stream_getStreamId(ref_stream_tmp));
+    if (ref_slot != cur_slot) {
+        Server_registry_unlink(&self->streams, cur_slot);
+        Server_registry_link(&self->streams, cur_slot, ref_slot);
     }
-
-    Py_INCREF(cur_stream_tmp);
-    PyList_Insert(self->streams, i, (PyObject *)cur_stream_tmp);
-    self->stream_count++;
+    Server_commands_leave(self, owner);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2872,6 +4910,182 @@ Server_getBufferSize(Server *self)
     return PyInt_FromLong(self->bufferSize);
 }
 
+static PyObject *
+Server_getThreads(Server *self)
+{
+    return PyInt_FromLong(self->threads);
+}
+
+static PyObject *
+Server_getFastMath(Server *self)
+{
+    return PyInt_FromLong(self->fast_math);
+}
+
+static PyObject *
+Server_getFrameBalancing(Server *self)
+{
+    return PyInt_FromLong(self->balance_frames);
+}
+
+static PyObject *
+Server_getPullMode(Server *self)
+{
+    return PyInt_FromLong(self->pull);
+}
+
+static PyObject *
+Server_getAsyncCallbacks(Server *self)
+{
+    return PyInt_FromLong(self->async_callbacks);
+}
+
+static PyObject *
+Server_scheduleAction(Server *self, PyObject *args)
+{
+    int action, chnl = 0;
+    double time;
+    PyObject *obj;
+
+    if (! PyArg_ParseTuple(args, "Odi|i", &obj, &time, &action, &chnl))
+        return NULL;
+    if (action < EVENT_PLAY || action > EVENT_STOP) {
+        PyErr_SetString(PyExc_ValueError, "action must be 0 (play), 1 (out) or 2 (stop).");
+        return NULL;
+    }
+    if (time < 0.0)
+        time = 0.0;
+    Server_scheduleEvent(self, (unsigned long)(time * self->samplingRate + 0.5), Server_event_action, obj, 0.0, action | (chnl << 2));
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_getEventStats(Server *self)
+{
+    PyoScheduler *sched = (PyoScheduler *)self->scheduler;
+
+    if (sched == NULL)
+        return Py_BuildValue("(llliii)", 0L, 0L, 0L, 0, 0, self->bufferSize);
+    return Py_BuildValue("(llliii)", sched->scheduled, sched->applied, sched->late,
+                         sched->count, sched->maxdepth, self->bufferSize);
+}
+
+static PyObject *
+Server_getReleaseGIL(Server *self)
+{
+    return PyInt_FromLong(self->release_gil);
+}
+
+static PyObject *
+Server_getCommandStats(Server *self)
+{
+    PyoCommandQueue *q = (PyoCommandQueue *)self->commands;
+
+    if (q == NULL)
+        return Py_BuildValue("(lllkk)", 0L, 0L, 0L, 0UL, 0UL);
+    return Py_BuildValue("(lllkk)", q->posted, q->applied, q->waits, q->tail - q->head, q->maxdepth);
+}
+
+static PyObject *
+Server_getCallbackStats(Server *self)
+{
+    PyoDispatcher *disp = (PyoDispatcher *)self->dispatcher;
+
+    if (disp == NULL)
+        return Py_BuildValue("(llllkkkd)", 0L, 0L, 0L, 0L, 0UL, 0UL, 0UL, self->samplingRate);
+    return Py_BuildValue("(llllkkkd)", disp->queued, disp->dispatched, disp->late, disp->overflows,
+                         disp->tail - disp->head, disp->maxdepth, disp->maxdelay, self->samplingRate);
+}
+
+static PyObject *
+Server_startProfiling(Server *self, PyObject *arg)
+{
+    int slot, owner, events = 0;
+    Stream *stream;
+    PyoTraceEvent *buffer = NULL;
+
+    if (arg != NULL && PyInt_Check(arg))
+        events = PyInt_AsLong(arg);
+    if (events > 0)
+        buffer = (PyoTraceEvent *)malloc(events * sizeof(PyoTraceEvent));
+
+    /* In the release GIL mode, the audio thread may be recording in the trace,
+       the buffers are swapped between two blocks. */
+    owner = Server_commands_enter(self);
+    for (slot=self->streams.head; slot>=0; slot=self->streams.slots[slot].next) {
+        stream = (Stream *)self->streams.slots[slot].stream;
+        stream->calls = 0;
+        stream->cputime = stream->maxtime = 0.0;
+    }
+    PyDict_Clear(self->prof_removed);
+    self->prof_blocks = self->prof_misses = self->prof_xruns = 0;
+    self->prof_busy = self->prof_maxblock = 0.0;
+
+    stream_profiler.active = 0;
+    free(stream_profiler.events);
+    stream_profiler.events = buffer;
+    stream_profiler.size = events;
+    stream_profiler.count = 0;
+    stream_profiler.origin = Stream_getProfileTime();
+    stream_profiler.active = 1;
+    Server_commands_leave(self, owner);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_stopProfiling(Server *self)
+{
+    stream_profiler.active = 0;
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_getProfile(Server *self)
+{
+    int slot;
+    Stream *stream;
+    PyObject *streams, *removed, *profile;
+
+    streams = PyList_New(0);
+    for (slot=self->streams.head; slot>=0; slot=self->streams.slots[slot].next) {
+        stream = (Stream *)self->streams.slots[slot].stream;
+        if (stream->calls == 0)
+            continue;
+        profile = Py_BuildValue("(isdld)", stream->sid, stream->streamobject->ob_type->tp_name,
+                                stream->cputime, stream->calls, stream->maxtime);
+        PyList_Append(streams, profile);
+        Py_DECREF(profile);
+    }
+    removed = PyDict_Copy(self->prof_removed);
+
+    profile = Py_BuildValue("(illlddd)", stream_profiler.active, self->prof_blocks, self->prof_misses,
+                            self->prof_xruns, self->prof_busy, self->prof_maxblock,
+                            self->bufferSize / self->samplingRate);
+    profile = Py_BuildValue("(NNN)", profile, streams, removed);
+    return profile;
+}
+
+static PyObject *
+Server_getProfileTrace(Server *self)
+{
+    int i, count;
+    PyoTraceEvent *event;
+    PyObject *events, *item;
+
+    count = stream_profiler.count < stream_profiler.size ? stream_profiler.count : stream_profiler.size;
+    events = PyList_New(count);
+    for (i=0; i<count; i++) {
+        event = &stream_profiler.events[i];
+        item = Py_BuildValue("(siidd)", event->name, event->sid, event->thread, event->start, event->dur);
+        PyList_SET_ITEM(events, i, item);
+    }
+    return Py_BuildValue("(Ni)", events, stream_profiler.count - count);
+}
+
 static PyObject *
 Server_getIsStarted(Server *self)
 {
@@ -2893,8 +5107,20 @@ Server_getMidiActive(Server *self)
 static PyObject *
 Server_getStreams(Server *self)
 {
-    Py_INCREF(self->streams);
-    return self->streams;
+    int i, slot;
+    PyObject *streams = PyList_New(self->stream_count);
+
+    for (i=0, slot=self->streams.head; slot>=0; i++, slot=self->streams.slots[slot].next) {
+        Py_INCREF(self->streams.slots[slot].stream);
+        PyList_SET_ITEM(streams, i, self->streams.slots[slot].stream);
+    }
+    return streams;
+}
+
+static PyObject *
+Server_getNumberOfStreams(Server *self)
+{
+    return PyInt_FromLong(self->stream_count);
 }
 
 static PyObject *
@@ -2973,6 +5199,12 @@ static PyMethodDef Server_methods[] = {
     {"setBufferSize", (PyCFunction)Server_setBufferSize, METH_O, "Sets the server's buffer size."},
     {"setNchnls", (PyCFunction)Server_setNchnls, METH_O, "Sets the server's number of output/input channels."},
     {"setIchnls", (PyCFunction)Server_setIchnls, METH_O, "Sets the server's number of input channels."},
+    {"setThreads", (PyCFunction)Server_setThreads, METH_O, "Sets the number of threads used to compute the streams."},
+    {"setPullMode", (PyCFunction)Server_setPullMode, METH_O, "Only computes the streams needed by the outputs if True."},
+    {"setAsyncCallbacks", (PyCFunction)Server_setAsyncCallbacks, METH_O, "Calls the python callbacks from a dispatcher thread if True."},
+    {"setReleaseGIL", (PyCFunction)Server_setReleaseGIL, METH_O, "Computes the streams without the GIL and queues the setters called from other threads if True."},
+    {"setFrameBalancing", (PyCFunction)Server_setFrameBalancing, METH_O, "Spreads the fft frames of the objects over the blocks if True."},
+    {"setFastMath", (PyCFunction)Server_setFastMath, METH_O, "Spectral objects created from now on use the polynomial approximations of the trigonometric functions if True."},
     {"setDuplex", (PyCFunction)Server_setDuplex, METH_O, "Sets the server's duplex mode (0 = only out, 1 = in/out)."},
     {"setJackAuto", (PyCFunction)Server_setJackAuto, METH_VARARGS, "Tells the server to auto-connect Jack ports (0 = disable, 1 = enable)."},
     {"setJackAutoConnectInputPorts", (PyCFunction)Server_setJackAutoConnectInputPorts, METH_O, "Sets a list of ports to auto-connect inputs when using Jack."},
@@ -3003,11 +5235,26 @@ static PyMethodDef Server_methods[] = {
     {"pressout", (PyCFunction)Server_pressout, METH_VARARGS, "Send a channel pressure event to Portmidi output stream."},
     {"bendout", (PyCFunction)Server_bendout, METH_VARARGS, "Send a pitch bend event to Portmidi output stream."},
     {"getStreams", (PyCFunction)Server_getStreams, METH_NOARGS, "Returns the list of streams added to the server."},
+    {"getNumberOfStreams", (PyCFunction)Server_getNumberOfStreams, METH_NOARGS, "Returns the number of streams added to the server."},
     {"getSamplingRate", (PyCFunction)Server_getSamplingRate, METH_NOARGS, "Returns the server's sampling rate."},
     {"getNchnls", (PyCFunction)Server_getNchnls, METH_NOARGS, "Returns the server's current number of output channels."},
     {"getIchnls", (PyCFunction)Server_getIchnls, METH_NOARGS, "Returns the server's current number of input channels."},
     {"getGlobalSeed", (PyCFunction)Server_getGlobalSeed, METH_NOARGS, "Returns the server's global seed."},
     {"getBufferSize", (PyCFunction)Server_getBufferSize, METH_NOARGS, "Returns the server's buffer size."},
+    {"getThreads", (PyCFunction)Server_getThreads, METH_NOARGS, "Returns the number of threads used to compute the streams."},
+    {"getPullMode", (PyCFunction)Server_getPullMode, METH_NOARGS, "Returns 1 if only the streams needed by the outputs are computed."},
+    {"getAsyncCallbacks", (PyCFunction)Server_getAsyncCallbacks, METH_NOARGS, "Returns 1 if the python callbacks are called from a dispatcher thread."},
+    {"getFrameBalancing", (PyCFunction)Server_getFrameBalancing, METH_NOARGS, "Returns 1 if the fft frames of the objects are spread over the blocks."},
+    {"getFastMath", (PyCFunction)Server_getFastMath, METH_NOARGS, "Returns 1 if new spectral objects use the polynomial approximations of the trigonometric functions."},
+    {"getCallbackStats", (PyCFunction)Server_getCallbackStats, METH_NOARGS, "Returns the callback dispatcher counters."},
+    {"getReleaseGIL", (PyCFunction)Server_getReleaseGIL, METH_NOARGS, "Returns 1 if the streams are computed without the GIL."},
+    {"getCommandStats", (PyCFunction)Server_getCommandStats, METH_NOARGS, "Returns the commands queue counters."},
+    {"scheduleAction", (PyCFunction)Server_scheduleAction, METH_VARARGS, "Schedules a play, out or stop action of an object."},
+    {"getEventStats", (PyCFunction)Server_getEventStats, METH_NOARGS, "Returns the event scheduler counters."},
+    {"startProfiling", (PyCFunction)Server_startProfiling, METH_O, "Resets and starts the profiler, recording at most x trace events."},
+    {"stopProfiling", (PyCFunction)Server_stopProfiling, METH_NOARGS, "Stops the profiler."},
+    {"getProfile", (PyCFunction)Server_getProfile, METH_NOARGS, "Returns the profiler counters."},
+    {"getProfileTrace", (PyCFunction)Server_getProfileTrace, METH_NOARGS, "Returns the trace events recorded by the profiler."},
     {"getIsBooted", (PyCFunction)Server_getIsBooted, METH_NOARGS, "Returns 1 if the server is booted, otherwise returns 0."},
     {"getIsStarted", (PyCFunction)Server_getIsStarted, METH_NOARGS, "Returns 1 if the server is started, otherwise returns 0."},
     {"getMidiActive", (PyCFunction)Server_getMidiActive, METH_NOARGS, "Returns 1 if midi callback is active, otherwise returns 0."},
@@ -3022,7 +5269,6 @@ static PyMethodDef Server_methods[] = {
 };
 
 static PyMemberDef Server_members[] = {
-    {"streams", T_OBJECT_EX, offsetof(Server, streams), 0, "Server's streams list."},
     {NULL}  /* Sentinel */
 };
 
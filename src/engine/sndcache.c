@@ -0,0 +1,228 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+
+#include "sndcache.h"
+#include <stdlib.h>
+#include <string.h>
+#include <pthread.h>
+#include <sys/types.h>
+#include <sys/stat.h>
+
+/* The entries are kept in a single list ordered by last use. A scene rarely
+   holds more than a few hundred sounds, so the lookup is a linear search. */
+static SndCacheEntry *cache_head = NULL;
+static SndCacheEntry *cache_tail = NULL;
+static SndCacheStats cache_stats = {0, 0, 0, 0, SNDCACHE_DEFAULT_BUDGET, 0, 0};
+static pthread_mutex_t cache_lock = PTHREAD_MUTEX_INITIALIZER;
+
+static long long
+sndcache_bytes(SndCacheEntry *entry) {
+    return (long long)(entry->size + 1) * sizeof(MYFLT);
+}
+
+static void
+sndcache_unlink(SndCacheEntry *entry) {
+    if (entry->prev != NULL)
+        entry->prev->next = entry->next;
+    else
+        cache_head = entry->next;
+    if (entry->next != NULL)
+        entry->next->prev = entry->prev;
+    else
+        cache_tail = entry->prev;
+    entry->prev = entry->next = NULL;
+}
+
+static void
+sndcache_push_front(SndCacheEntry *entry) {
+    entry->prev = NULL;
+    entry->next = cache_head;
+    if (cache_head != NULL)
+        cache_head->prev = entry;
+    cache_head = entry;
+    if (cache_tail == NULL)
+        cache_tail = entry;
+}
+
+static void
+sndcache_free_entry(SndCacheEntry *entry) {
+    sndcache_unlink(entry);
+    cache_stats.resident -= sndcache_bytes(entry);
+    cache_stats.entries--;
+    free(entry->path);
+    free(entry->data);
+    free(entry);
+}
+
+/* Frees the least recently used entries without reference until the resident
+   size fits in `budget`. Called with the lock held. */
+static void
+sndcache_evict(long long budget) {
+    SndCacheEntry *entry, *prev;
+
+    entry = cache_tail;
+    while (entry != NULL && cache_stats.resident > budget) {
+        prev = entry->prev;
+        if (entry->refcount == 0) {
+            sndcache_free_entry(entry);
+            cache_stats.evictions++;
+        }
+        entry = prev;
+    }
+}
+
+static int
+sndcache_same_stamp(const SndCacheStamp *a, const SndCacheStamp *b) {
+    return a->mtime == b->mtime && a->mtime_ns == b->mtime_ns && a->size == b->size && a->ino == b->ino;
+}
+
+static SndCacheEntry *
+sndcache_find(const char *path, const SndCacheStamp *stamp, int chnl, unsigned int start, unsigned int stop, int sr) {
+    SndCacheEntry *entry;
+
+    for (entry = cache_head; entry != NULL; entry = entry->next) {
+        if (sndcache_same_stamp(&entry->stamp, stamp) && entry->chnl == chnl && entry->start == start &&
+            entry->stop == stop && entry->sr == sr && strcmp(entry->path, path) == 0)
+            return entry;
+    }
+    return NULL;
+}
+
+/* Marks a found entry as used by one more table. Called with the lock held. */
+static void
+sndcache_acquire(SndCacheEntry *entry) {
+    if (entry->refcount++ == 0)
+        cache_stats.active++;
+    sndcache_unlink(entry);
+    sndcache_push_front(entry);
+}
+
+int
+SndCache_stamp(const char *path, SndCacheStamp *stamp) {
+    struct stat st;
+
+    if (stat(path, &st) != 0)
+        return -1;
+    stamp->mtime = (long long)st.st_mtime;
+#if defined(__APPLE__)
+    stamp->mtime_ns = (long)st.st_mtimespec.tv_nsec;
+#elif defined(_WIN32) || defined(_WIN64)
+    stamp->mtime_ns = 0;
+#else
+    stamp->mtime_ns = (long)st.st_mtim.tv_nsec;
+#endif
+    stamp->size = (long long)st.st_size;
+    stamp->ino = (unsigned long long)st.st_ino;
+    return 0;
+}
+
+SndCacheEntry *
+SndCache_lookup(const char *path, const SndCacheStamp *stamp, int chnl, unsigned int start, unsigned int stop, int sr) {
+    SndCacheEntry *entry = NULL;
+
+    if (stamp == NULL)
+        return NULL;
+
+    pthread_mutex_lock(&cache_lock);
+    entry = sndcache_find(path, stamp, chnl, start, stop, sr);
+    if (entry != NULL) {
+        sndcache_acquire(entry);
+        cache_stats.hits++;
+    }
+    else
+        cache_stats.misses++;
+    pthread_mutex_unlock(&cache_lock);
+
+    return entry;
+}
+
+SndCacheEntry *
+SndCache_insert(const char *path, const SndCacheStamp *stamp, int chnl, unsigned int start, unsigned int stop, int sr,
+                MYFLT *data, unsigned int size) {
+    SndCacheEntry *entry;
+
+    if (stamp == NULL)
+        return NULL;
+
+    pthread_mutex_lock(&cache_lock);
+    entry = sndcache_find(path, stamp, chnl, start, stop, sr);
+    if (entry != NULL) {
+        /* Decoded twice, by two tables of the same load. */
+        sndcache_acquire(entry);
+        pthread_mutex_unlock(&cache_lock);
+        free(data);
+        return entry;
+    }
+
+    entry = (SndCacheEntry *)malloc(sizeof(SndCacheEntry));
+    entry->path = (char *)malloc(strlen(path) + 1);
+    strcpy(entry->path, path);
+    entry->stamp = *stamp;
+    entry->chnl = chnl;
+    entry->start = start;
+    entry->stop = stop;
+    entry->sr = sr;
+    entry->data = data;
+    entry->size = size;
+    entry->refcount = 1;
+    sndcache_push_front(entry);
+    cache_stats.resident += sndcache_bytes(entry);
+    cache_stats.entries++;
+    cache_stats.active++;
+    sndcache_evict(cache_stats.budget);
+    pthread_mutex_unlock(&cache_lock);
+
+    return entry;
+}
+
+void
+SndCache_release(SndCacheEntry *entry) {
+    if (entry == NULL)
+        return;
+
+    pthread_mutex_lock(&cache_lock);
+    if (--entry->refcount == 0) {
+        cache_stats.active--;
+        sndcache_evict(cache_stats.budget);
+    }
+    pthread_mutex_unlock(&cache_lock);
+}
+
+void
+SndCache_setBudget(long long bytes) {
+    pthread_mutex_lock(&cache_lock);
+    cache_stats.budget = bytes < 0 ? 0 : bytes;
+    sndcache_evict(cache_stats.budget);
+    pthread_mutex_unlock(&cache_lock);
+}
+
+void
+SndCache_clear(void) {
+    pthread_mutex_lock(&cache_lock);
+    sndcache_evict(-1);
+    pthread_mutex_unlock(&cache_lock);
+}
+
+void
+SndCache_getStats(SndCacheStats *stats) {
+    pthread_mutex_lock(&cache_lock);
+    *stats = cache_stats;
+    pthread_mutex_unlock(&cache_lock);
+}
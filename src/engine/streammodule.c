@@ -19,6 +19,10 @@
  *************************************************************************/
 
 #include <Python.h>
+#include <time.h>
+#ifdef _WIN32
+#include <windows.h>
+#endif
 #include "structmember.h"
 #include "pyomodule.h"
 
@@ -28,12 +32,55 @@
 
 int stream_id = 1;
 
+PyoProfiler stream_profiler = {0, 0.0, NULL, 0, 0};
+int stream_stop_requests = 0;
+static int profiler_threads = 0;
+static __thread int profiler_thread = -1;
+
 int
 Stream_getNewStreamId()
 {
     return stream_id++;
 }
 
+/* Monotonic time in seconds, for the profiler. */
+double
+Stream_getProfileTime()
+{
+#ifdef _WIN32
+    LARGE_INTEGER freq, now;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&now);
+    return (double)now.QuadPart / (double)freq.QuadPart;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+#endif
+}
+
+/* Can be called from any processing thread. */
+void
+Stream_addTraceEvent(int sid, const char *name, double start, double dur)
+{
+    int index;
+    PyoTraceEvent *event;
+
+    if (stream_profiler.events == NULL)
+        return;
+    index = __sync_fetch_and_add(&stream_profiler.count, 1);
+    if (index >= stream_profiler.size)
+        return;
+    if (profiler_thread < 0)
+        profiler_thread = __sync_fetch_and_add(&profiler_threads, 1);
+    event = &stream_profiler.events[index];
+    event->sid = sid;
+    event->thread = profiler_thread;
+    event->name = name;
+    event->start = start - stream_profiler.origin;
+    event->dur = dur;
+}
+
 static int
 Stream_traverse(Stream *self, visitproc visit, void *arg)
 {
@@ -80,6 +127,12 @@ Stream_getStreamToDac(Stream *self)
     return self->todac;
 }
 
+int
+Stream_getStreamSilent(Stream *self)
+{
+    return self->silent;
+}
+
 int
 Stream_getBufferCountWait(Stream *self)
 {
@@ -109,9 +162,39 @@ void Stream_setFunctionPtr(Stream *self, void *ptr)
     self->funcptr = ptr;
 }
 
-void Stream_callFunction(Stream *self)
+static void
+Stream_callFunctionProfiled(Stream *self)
 {
+    double start, dur;
+
+    start = Stream_getProfileTime();
     (*self->funcptr)(self->streamobject);
+    dur = Stream_getProfileTime() - start;
+
+    self->calls++;
+    self->cputime += dur;
+    if (dur > self->maxtime)
+        self->maxtime = dur;
+    Stream_addTraceEvent(self->sid, self->streamobject->ob_type->tp_name, start, dur);
+}
+
+void Stream_callFunction(Stream *self)
+{
+    self->silent = 0;
+    if (stream_profiler.active)
+        Stream_callFunctionProfiled(self);
+    else
+        (*self->funcptr)(self->streamobject);
+}
+
+/* Called by an object from its processing function, which may run without the
+   GIL, to stop itself. The server calls its stop method at the end of the block. */
+void Stream_requestStop(Stream *self)
+{
+    if (self->stop_requested)
+        return;
+    self->stop_requested = 1;
+    __sync_fetch_and_add(&stream_stop_requests, 1);
 }
 
 void Stream_IncrementBufferCount(Stream *self)
@@ -175,6 +258,211 @@ Stream_isOutputting(Stream *self)
     }
 }
 
+/* Buffer protocol helpers, shared by the audio, table and matrix streams. The shape
+   and strides arrays belong to the exporting object, as python 2 memoryviews copy
+   the Py_buffer struct they are given. */
+int
+Stream_fillBuffer(Py_buffer *view, PyObject *obj, MYFLT *buf, int ndim, Py_ssize_t *shape, Py_ssize_t *strides, int readonly, int flags)
+{
+    int i;
+
+    if (view == NULL)
+        return 0;
+    if (buf == NULL) {
+        PyErr_SetString(PyExc_BufferError, "No data to export.");
+        return -1;
+    }
+    if (readonly && (flags & PyBUF_WRITABLE) == PyBUF_WRITABLE) {
+        PyErr_SetString(PyExc_BufferError, "Object is not writable.");
+        return -1;
+    }
+    if (ndim > 1 && (flags & PyBUF_STRIDES) != PyBUF_STRIDES) {
+        PyErr_SetString(PyExc_BufferError, "Multi-dimensional data must be exported with strides.");
+        return -1;
+    }
+
+    view->len = sizeof(MYFLT);
+    for (i=0; i<ndim; i++)
+        view->len *= shape[i];
+
+    view->buf = (void *)buf;
+    view->obj = obj;
+    Py_INCREF(obj);
+    view->readonly = readonly;
+    view->itemsize = sizeof(MYFLT);
+    view->format = (flags & PyBUF_FORMAT) == PyBUF_FORMAT ? MYFLT_BUFFER_FORMAT : NULL;
+    view->ndim = ndim;
+    view->shape = (flags & PyBUF_ND) == PyBUF_ND ? shape : NULL;
+    view->strides = (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? strides : NULL;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    return 0;
+}
+
+/* Counts the views exported by a stream. The first view takes a reference to
+   `owner`, the object owning the samples, and the last one releases it, so the
+   samples live as long as a view uses them. */
+void
+Stream_holdExport(int *exports, PyObject *owner)
+{
+    if ((*exports)++ == 0)
+        Py_XINCREF(owner);
+}
+
+void
+Stream_releaseExport(int *exports, PyObject *owner)
+{
+    if (--(*exports) == 0)
+        Py_XDECREF(owner);
+}
+
+/* True if `obj` can be given to Stream_copyFromBuffer, with either buffer interface. */
+int
+Stream_checkBuffer(PyObject *obj)
+{
+    return PyObject_CheckBuffer(obj) || PyObject_CheckReadBuffer(obj);
+}
+
+/* Objects with the old buffer interface only (python 2 array.array) give no
+   format, the type of the values is read from their `typecode` attribute. */
+static int
+Stream_copyFromOldBuffer(PyObject *obj, MYFLT *data, Py_ssize_t size)
+{
+    Py_ssize_t i, len, count;
+    const void *buf;
+    char code = 0;
+    PyObject *typecode;
+
+    typecode = PyObject_GetAttrString(obj, "typecode");
+    if (typecode == NULL)
+        PyErr_Clear();
+    else {
+        if (PyString_Check(typecode) && PyString_GET_SIZE(typecode) == 1)
+            code = PyString_AS_STRING(typecode)[0];
+        Py_DECREF(typecode);
+    }
+    if (code != 'f' && code != 'd') {
+        PyErr_SetString(PyExc_TypeError, "Buffer must contain native float or double values.");
+        return -1;
+    }
+
+    if (PyObject_AsReadBuffer(obj, &buf, &len) < 0)
+        return -1;
+
+    count = len / (code == 'd' ? sizeof(double) : sizeof(float));
+    if (count != size) {
+        PyErr_Format(PyExc_ValueError, "Buffer must contain %ld values, not %ld.", (long)size, (long)count);
+        return -1;
+    }
+
+    if (code == 'd') {
+        for (i=0; i<size; i++)
+            data[i] = ((double *)buf)[i];
+    }
+    else {
+        for (i=0; i<size; i++)
+            data[i] = ((float *)buf)[i];
+    }
+    return 0;
+}
+
+/* Copies the values of any object supporting the buffer protocol in `data`. The
+   object must hold exactly `size` float or double values. */
+int
+Stream_copyFromBuffer(PyObject *obj, MYFLT *data, Py_ssize_t size)
+{
+    Py_ssize_t i, j, count;
+    int isdouble;
+    char *format, *row;
+    Py_buffer view;
+
+    if (!PyObject_CheckBuffer(obj))
+        return Stream_copyFromOldBuffer(obj, data, size);
+
+    if (PyObject_GetBuffer(obj, &view, PyBUF_FULL_RO) < 0)
+        return -1;
+
+    format = view.format == NULL ? "B" : view.format;
+    if (format[0] == '@' || format[0] == '=')
+        format++;
+    if ((format[0] != 'f' && format[0] != 'd') || format[1] != '\0') {
+        PyErr_SetString(PyExc_TypeError, "Buffer must contain native float or double values.");
+        PyBuffer_Release(&view);
+        return -1;
+    }
+    isdouble = format[0] == 'd';
+
+    count = view.len / view.itemsize;
+    if (count != size) {
+        PyErr_Format(PyExc_ValueError, "Buffer must contain %ld values, not %ld.", (long)size, (long)count);
+        PyBuffer_Release(&view);
+        return -1;
+    }
+
+    if (PyBuffer_IsContiguous(&view, 'C')) {
+        if (view.itemsize == sizeof(MYFLT))
+            memcpy(data, view.buf, size * sizeof(MYFLT));
+        else if (isdouble) {
+            for (i=0; i<size; i++)
+                data[i] = ((double *)view.buf)[i];
+        }
+        else {
+            for (i=0; i<size; i++)
+                data[i] = ((float *)view.buf)[i];
+        }
+    }
+    else if (view.ndim <= 2 && view.suboffsets == NULL) {
+        Py_ssize_t rows = view.ndim == 2 ? view.shape[0] : 1;
+        Py_ssize_t cols = view.shape[view.ndim-1];
+        Py_ssize_t rstride = view.ndim == 2 ? view.strides[0] : 0;
+        Py_ssize_t cstride = view.strides[view.ndim-1];
+        for (i=0; i<rows; i++) {
+            row = (char *)view.buf + i * rstride;
+            for (j=0; j<cols; j++) {
+                if (isdouble)
+                    *data++ = *(double *)(row + j * cstride);
+                else
+                    *data++ = *(float *)(row + j * cstride);
+            }
+        }
+    }
+    else {
+        PyErr_SetString(PyExc_TypeError, "Buffer layout not supported.");
+        PyBuffer_Release(&view);
+        return -1;
+    }
+
+    PyBuffer_Release(&view);
+    return 0;
+}
+
+static int
+Stream_getbuffer(Stream *self, Py_buffer *view, int flags)
+{
+    self->shape[0] = self->bufsize;
+    self->strides[0] = sizeof(MYFLT);
+    if (Stream_fillBuffer(view, (PyObject *)self, self->data, 1, self->shape, self->strides, 1, flags) < 0)
+        return -1;
+    if (view != NULL)
+        Stream_holdExport(&self->exports, self->streamobject);
+    return 0;
+}
+
+static void
+Stream_releasebuffer(Stream *self, Py_buffer *view)
+{
+    Stream_releaseExport(&self->exports, self->streamobject);
+}
+
+static PyBufferProcs Stream_as_buffer = {
+    0, /* bf_getreadbuffer */
+    0, /* bf_getwritebuffer */
+    0, /* bf_getsegcount */
+    0, /* bf_getcharbuffer */
+    (getbufferproc)Stream_getbuffer, /* bf_getbuffer */
+    (releasebufferproc)Stream_releasebuffer, /* bf_releasebuffer */
+};
+
 static PyMethodDef Stream_methods[] = {
 {"getValue", (PyCFunction)Stream_getValue, METH_NOARGS, "Returns the first sample of the current buffer."},
 {"getId", (PyCFunction)Stream_getId, METH_NOARGS, "Returns the ID of assigned to this stream."},
@@ -204,8 +492,8 @@ PyTypeObject StreamType = {
     0, /*tp_str*/
     0, /*tp_getattro*/
     0, /*tp_setattro*/
-    0, /*tp_as_buffer*/
-    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+    &Stream_as_buffer, /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
 "\n\
 Audio stream objects. For internal use only. \n\n\
 A Stream object must never be instantiated by the user. \n\n\
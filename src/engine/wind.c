@@ -31,6 +31,8 @@
 #include "wind.h"
 #include "pyomodule.h"
 #include <math.h>
+#include <stdlib.h>
+#include <pthread.h>
 
 void gen_window(MYFLT *window, int size, int wintype) {
     int i;
@@ -122,3 +124,62 @@ void gen_window(MYFLT *window, int size, int wintype) {
     }
     return;
 }
+
+/* Windows are shared by all the objects using the same size and type. They
+   are kept in a list, with the number of objects using them, and freed when
+   the last one releases them. The list is protected by a mutex because
+   PVSynth resizes its window in the audio thread. */
+typedef struct window_entry {
+    int size;
+    int wintype;
+    int refcount;
+    MYFLT *data;
+    struct window_entry *next;
+} window_entry;
+
+static window_entry *windows = NULL;
+static pthread_mutex_t windows_lock = PTHREAD_MUTEX_INITIALIZER;
+
+MYFLT * get_window(int size, int wintype) {
+    MYFLT *window;
+    window_entry *entry;
+    pthread_mutex_lock(&windows_lock);
+    for (entry=windows; entry!=NULL; entry=entry->next) {
+        if (entry->size == size && entry->wintype == wintype)
+            break;
+    }
+    if (entry == NULL) {
+        entry = (window_entry *)malloc(sizeof(window_entry));
+        entry->size = size;
+        entry->wintype = wintype;
+        entry->refcount = 0;
+        entry->data = (MYFLT *)malloc(size * sizeof(MYFLT));
+        gen_window(entry->data, size, wintype);
+        entry->next = windows;
+        windows = entry;
+    }
+    entry->refcount++;
+    window = entry->data;
+    pthread_mutex_unlock(&windows_lock);
+    return window;
+}
+
+void release_window(MYFLT *window) {
+    window_entry *entry, **prev;
+    if (window == NULL)
+        return;
+    pthread_mutex_lock(&windows_lock);
+    for (prev=&windows; *prev!=NULL; prev=&(*prev)->next) {
+        entry = *prev;
+        if (entry->data == window) {
+            entry->refcount--;
+            if (entry->refcount == 0) {
+                *prev = entry->next;
+                free(entry->data);
+                free(entry);
+            }
+            break;
+        }
+    }
+    pthread_mutex_unlock(&windows_lock);
+}
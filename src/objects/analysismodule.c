@@ -1224,14 +1224,30 @@ quadraticInterpolation(MYFLT *buf, int period, int size) {
 /************/
 /* Yin */
 /************/
+/* The difference function d(tau) = sum((x[j] - x[j+tau])^2), 0 <= j < halfsize, is
+   computed as e(0) + e(tau) - 2 * r(tau), where e(tau) is the energy of the window
+   starting at tau, updated incrementally, and r(tau) the cross-correlation of the first
+   half of the frame with the whole frame, computed by FFT. An analysis runs every
+   `hopsize` samples on the last `winsize` samples. With `spread`, it is split in four
+   stages computed at the beginning of the following blocks. */
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     Stream *input_stream;
-    MYFLT *input_buffer;
+    MYFLT *input_buffer; /* circular buffer of the last winsize filtered samples */
+    MYFLT *frame; /* analysed frame, oldest sample first */
+    MYFLT *fftbuf;
+    MYFLT *spec_half;
+    MYFLT *spec_frame;
     MYFLT *yin_buffer;
+    MYFLT **twiddle;
     int winsize;
     int halfsize;
+    int fftsize;
+    int hopsize;
+    int hop_count;
+    int spread;
+    int stage; /* next stage of a spread analysis, 0 if none is pending */
     int input_count;
     MYFLT tolerance;
     MYFLT pitch;
@@ -1244,10 +1260,87 @@ typedef struct {
     int modebuffer[2]; // need at least 2 slots for mul & add
 } Yin;
 
+/* Cumulative mean normalized difference and minima selection. */
+static void
+Yin_detect(Yin *self) {
+    int j, tau, period;
+    MYFLT candidate, e0 = 0.0, etau, diff, sum = 0.0;
+    MYFLT *x = self->frame;
+    MYFLT *r = self->fftbuf;
+    MYFLT scl = 2.0 * self->fftsize;
+
+    for (j=0; j<self->halfsize; j++)
+        e0 += x[j] * x[j];
+    etau = e0;
+
+    self->yin_buffer[0] = 1.0;
+    for (tau = 1; tau < self->halfsize; tau++) {
+        etau += x[tau+self->halfsize-1] * x[tau+self->halfsize-1] - x[tau-1] * x[tau-1];
+        diff = e0 + etau - r[tau] * scl;
+        if (diff < 0.0)
+            diff = 0.0;
+        sum += diff;
+        self->yin_buffer[tau] = sum > 0.0 ? diff * tau / sum : 1.0;
+        period = tau - 3;
+        if (tau > 4 && (self->yin_buffer[period] < self->tolerance) &&
+            (self->yin_buffer[period] < self->yin_buffer[period+1])) {
+            candidate = quadraticInterpolation(self->yin_buffer, period, self->halfsize);
+            goto founded;
+        }
+    }
+    candidate = quadraticInterpolation(self->yin_buffer, min_elem_pos(self->yin_buffer, self->halfsize), self->halfsize);
+
+founded:
+
+    candidate = self->sr / candidate;
+    if (candidate > self->minfreq && candidate < self->maxfreq)
+        self->pitch = candidate;
+}
+
+static void
+Yin_analysis_stage(Yin *self, int stage) {
+    int i, n = self->fftsize;
+    MYFLT ar, ai, xr, xi;
+    MYFLT *a = self->spec_half;
+    MYFLT *x = self->spec_frame;
+
+    switch (stage) {
+        case 1:
+            for (i=0; i<self->halfsize; i++)
+                self->fftbuf[i] = self->frame[i];
+            for (i=self->halfsize; i<n; i++)
+                self->fftbuf[i] = 0.0;
+            realfft_split(self->fftbuf, a, n, self->twiddle);
+            break;
+        case 2:
+            for (i=0; i<self->winsize; i++)
+                self->fftbuf[i] = self->frame[i];
+            for (i=self->winsize; i<n; i++)
+                self->fftbuf[i] = 0.0;
+            realfft_split(self->fftbuf, x, n, self->twiddle);
+            break;
+        case 3:
+            /* Cross-spectrum, conj(half) * frame, then back to the lags. */
+            x[0] = a[0] * x[0];
+            x[n/2] = a[n/2] * x[n/2];
+            for (i=1; i<n/2; i++) {
+                ar = a[i]; ai = a[n-i];
+                xr = x[i]; xi = x[n-i];
+                x[i] = ar * xr + ai * xi;
+                x[n-i] = ar * xi - ai * xr;
+            }
+            irealfft_split(x, self->fftbuf, n, self->twiddle);
+            break;
+        case 4:
+            Yin_detect(self);
+            break;
+    }
+}
+
 static void
 Yin_process(Yin *self) {
-    int i, j, period, tau = 0;
-    MYFLT candidate, tmp = 0.0, tmp2 = 0.0, b = 0.0;
+    int i, j, k;
+    MYFLT b = 0.0;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->cutoff != self->last_cutoff) {
@@ -1260,36 +1353,34 @@ Yin_process(Yin *self) {
         self->c2 = (b - MYSQRT(b * b - 1.0));
     }
 
+    if (self->stage > 0) {
+        Yin_analysis_stage(self, self->stage);
+        self->stage = self->stage == 4 ? 0 : self->stage + 1;
+    }
+
     for (i=0; i<self->bufsize; i++) {
         self->y1 = in[i] + (self->y1 - in[i]) * self->c2;
-        self->input_buffer[self->input_count] = self->y1;
-        if (self->input_count++ == self->winsize) {
+        self->input_buffer[self->input_count++] = self->y1;
+        if (self->input_count == self->winsize)
             self->input_count = 0;
-
-            self->yin_buffer[0] = 1.0;
-            for (tau = 1; tau < self->halfsize; tau++) {
-                self->yin_buffer[tau] = 0.0;
-                for (j = 0; j < self->halfsize; j++) {
-                    tmp = self->input_buffer[j] - self->input_buffer[j+tau];
-                    self->yin_buffer[tau] += tmp*tmp;
-                }
-                tmp2 += self->yin_buffer[tau];
-                self->yin_buffer[tau] *= tau / tmp2;
-                period = tau - 3;
-                if (tau > 4 && (self->yin_buffer[period] < self->tolerance) &&
-                    (self->yin_buffer[period] < self->yin_buffer[period+1])) {
-                    candidate = quadraticInterpolation(self->yin_buffer, period, self->halfsize);
-                    goto founded;
-                }
+        if (++self->hop_count >= self->hopsize) {
+            self->hop_count = 0;
+            /* An analysis still pending is completed before the frame is replaced. */
+            while (self->stage > 0) {
+                Yin_analysis_stage(self, self->stage);
+                self->stage = self->stage == 4 ? 0 : self->stage + 1;
+            }
+            for (j=0, k=self->input_count; j<self->winsize; j++) {
+                self->frame[j] = self->input_buffer[k++];
+                if (k == self->winsize)
+                    k = 0;
+            }
+            if (self->spread)
+                self->stage = 1;
+            else {
+                for (j=1; j<=4; j++)
+                    Yin_analysis_stage(self, j);
             }
-            candidate = quadraticInterpolation(self->yin_buffer, min_elem_pos(self->yin_buffer, self->halfsize), self->halfsize);
-
-        founded:
-
-            candidate = self->sr / candidate;
-            if (candidate > self->minfreq && candidate < self->maxfreq)
-                self->pitch = candidate;
-
         }
         self->data[i] = self->pitch;
     }
@@ -1374,7 +1465,12 @@ Yin_dealloc(Yin* self)
 {
     pyo_DEALLOC
     free(self->input_buffer);
+    free(self->frame);
+    free(self->fftbuf);
+    free(self->spec_half);
+    free(self->spec_frame);
     free(self->yin_buffer);
+    fft_release_split_twiddle(self->twiddle);
     Yin_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -1389,6 +1485,10 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->winsize = 1024;
     self->halfsize = 512;
+    self->hopsize = 0;
+    self->hop_count = 0;
+    self->spread = 0;
+    self->stage = 0;
     self->input_count = 0;
     self->pitch = 0.;
     self->tolerance = 0.15;
@@ -1404,9 +1504,9 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Stream_setFunctionPtr(self->stream, Yin_compute_next_data_frame);
     self->mode_func_ptr = Yin_setProcMode;
 
-    static char *kwlist[] = {"input", "tolerance", "minfreq", "maxfreq", "cutoff", "winsize", "mul", "add", NULL};
+    static char *kwlist[] = {"input", "tolerance", "minfreq", "maxfreq", "cutoff", "winsize", "hopsize", "spread", "mul", "add", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_O_FFFFIOO, kwlist, &inputtmp, &self->tolerance, &self->minfreq, &self->maxfreq, &self->cutoff, &self->winsize, &multmp, &addtmp))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_O_FFFFIIIOO, kwlist, &inputtmp, &self->tolerance, &self->minfreq, &self->maxfreq, &self->cutoff, &self->winsize, &self->hopsize, &self->spread, &multmp, &addtmp))
         Py_RETURN_NONE;
 
     INIT_INPUT_STREAM
@@ -1421,18 +1521,34 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    if (self->winsize % 2 == 1)
+    if (self->winsize < 16)
+        self->winsize = 16;
+    else if (self->winsize % 2 == 1)
         self->winsize += 1;
+    if (self->hopsize <= 0 || self->hopsize > self->winsize)
+        self->hopsize = self->winsize;
 
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->winsize * sizeof(MYFLT));
+    self->frame = (MYFLT *)realloc(self->frame, self->winsize * sizeof(MYFLT));
     for (i=0; i<self->winsize; i++)
-        self->input_buffer[i] = 0.0;
+        self->input_buffer[i] = self->frame[i] = 0.0;
 
     self->halfsize = self->winsize / 2;
     self->yin_buffer = (MYFLT *)realloc(self->yin_buffer, self->halfsize * sizeof(MYFLT));
     for (i=0; i<self->halfsize; i++)
         self->yin_buffer[i] = 0.0;
 
+    /* Frame and first half are zero-padded, the circular correlation never wraps. */
+    self->fftsize = 16;
+    while (self->fftsize < self->winsize)
+        self->fftsize *= 2;
+    self->fftbuf = (MYFLT *)realloc(self->fftbuf, self->fftsize * sizeof(MYFLT));
+    self->spec_half = (MYFLT *)realloc(self->spec_half, self->fftsize * sizeof(MYFLT));
+    self->spec_frame = (MYFLT *)realloc(self->spec_frame, self->fftsize * sizeof(MYFLT));
+    for (i=0; i<self->fftsize; i++)
+        self->fftbuf[i] = self->spec_half[i] = self->spec_frame[i] = 0.0;
+    self->twiddle = fft_get_split_twiddle(self->fftsize);
+
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
@@ -1525,6 +1641,37 @@ Yin_setCutoff(Yin *self, PyObject *arg)
 	Py_RETURN_NONE;
 }
 
+static PyObject *
+Yin_setHopsize(Yin *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+	if (PyInt_Check(arg)) {
+		self->hopsize = PyInt_AsLong(arg);
+		if (self->hopsize <= 0 || self->hopsize > self->winsize)
+			self->hopsize = self->winsize;
+	}
+
+	Py_RETURN_NONE;
+}
+
+static PyObject *
+Yin_setSpread(Yin *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+	if (PyInt_Check(arg))
+		self->spread = PyInt_AsLong(arg);
+
+	Py_RETURN_NONE;
+}
+
 static PyMemberDef Yin_members[] = {
 {"server", T_OBJECT_EX, offsetof(Yin, server), 0, "Pyo server."},
 {"stream", T_OBJECT_EX, offsetof(Yin, stream), 0, "Stream object."},
@@ -1543,6 +1690,8 @@ static PyMethodDef Yin_methods[] = {
 {"setMinfreq", (PyCFunction)Yin_setMinfreq, METH_O, "Sets the minimum frequency in output."},
 {"setMaxfreq", (PyCFunction)Yin_setMaxfreq, METH_O, "Sets the maximum frequency in output."},
 {"setCutoff", (PyCFunction)Yin_setCutoff, METH_O, "Sets the input lowpass filter cutoff frequency."},
+{"setHopsize", (PyCFunction)Yin_setHopsize, METH_O, "Sets the number of samples between two analyses."},
+{"setSpread", (PyCFunction)Yin_setSpread, METH_O, "If true, the analysis is spread over the following blocks."},
 {"setMul", (PyCFunction)Yin_setMul, METH_O, "Sets oscillator mul factor."},
 {"setAdd", (PyCFunction)Yin_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)Yin_setSub, METH_O, "Sets inverse add factor."},
@@ -1656,20 +1805,17 @@ typedef struct {
 
 static void
 Centroid_alloc_memories(Centroid *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
         self->inframe[i] = self->outframe[i] = self->input_buffer[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, 2);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, 2);
 }
 
 static void
@@ -1785,16 +1931,12 @@ Centroid_clear(Centroid *self)
 static void
 Centroid_dealloc(Centroid* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
     free(self->input_buffer);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    fft_release_split_twiddle(self->twiddle);
+    release_window(self->window);
     Centroid_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -0,0 +1,852 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+
+/*
+ * Multichannel versions of the biquad filters. A bank object processes all
+ * the channels of a multichannel pyolib object in a single stream. Its state
+ * is stored as one array per variable, indexed by channel, and the samples of
+ * a buffer are interleaved so that the inner loop runs over the channels
+ * without dependency between iterations. The bank streams read one channel
+ * from the bank and apply mul and add.
+ */
+
+#include <Python.h>
+#include "structmember.h"
+#include <math.h>
+#include "pyomodule.h"
+#include "streammodule.h"
+#include "servermodule.h"
+#include "dummymodule.h"
+
+/* Number of slots used in the `refs` list by each channel: the input, two
+   parameters, and the stream of each of them. */
+#define BANK_SLOTS 6
+
+/* Stores a channel argument, an audio object or a number, at position `pos`
+   of `refs`. Returns the stream of the object, or NULL and the value of the
+   number in `value`. */
+static Stream *
+Bank_setRef(PyObject *refs, int pos, PyObject *arg, MYFLT *value)
+{
+    PyObject *streamtmp;
+
+    if (PyNumber_Check(arg)) {
+        *value = PyFloat_AsDouble(arg);
+        Py_INCREF(Py_None);
+        PyList_SetItem(refs, pos, Py_None);
+        Py_INCREF(Py_None);
+        PyList_SetItem(refs, pos+1, Py_None);
+        return NULL;
+    }
+
+    streamtmp = PyObject_CallMethod(arg, "_getStream", NULL);
+    if (streamtmp == NULL)
+        return NULL;
+    Py_INCREF(arg);
+    PyList_SetItem(refs, pos, arg);
+    PyList_SetItem(refs, pos+1, streamtmp);
+    return (Stream *)streamtmp;
+}
+
+/* Fills the `dyn` array with the channels having an audio parameter. */
+static int
+Bank_dynamicChannels(int *dyn, Stream **first, Stream **second, int channels)
+{
+    int c, num = 0;
+    for (c=0; c<channels; c++) {
+        if (first[c] != NULL || second[c] != NULL)
+            dyn[num++] = c;
+    }
+    return num;
+}
+
+/*****************/
+/* BiquadBank main */
+/*****************/
+typedef struct {
+    pyo_audio_HEAD
+    PyObject *refs; // input, freq and q of every channel, with their streams
+    int channels;
+    int init;
+    MYFLT nyquist;
+    Stream **in_streams;
+    Stream **freq_streams;
+    Stream **q_streams;
+    MYFLT **freq_data;
+    MYFLT **q_data;
+    MYFLT *freq;
+    MYFLT *q;
+    MYFLT *last_freq;
+    MYFLT *last_q;
+    int *type;
+    int *dyn; // channels with an audio-rate freq or q
+    int ndyn;
+    // coefficients ramps
+    int *rate;
+    int *count;
+    MYFLT *inc;
+    MYFLT *target;
+    // sample memories
+    MYFLT *x1;
+    MYFLT *x2;
+    MYFLT *y1;
+    MYFLT *y2;
+    // coefficients normalized by a0, b0, b1, b2, a1 and a2 of every channel
+    MYFLT *coeffs;
+    MYFLT *frame; // interleaved samples of the current buffer
+    MYFLT *buffer_streams;
+} BiquadBank;
+
+static void
+BiquadBank_compute_coeffs(BiquadBank *self, int c, MYFLT freq, MYFLT q, MYFLT *co)
+{
+    int k;
+    MYFLT w0, cs, alpha, norm;
+
+    if (freq <= 1)
+        freq = 1;
+    else if (freq >= self->nyquist)
+        freq = self->nyquist;
+
+    if (q < 0.1)
+        q = 0.1;
+    w0 = TWOPI * freq / self->sr;
+    cs = MYCOS(w0);
+    alpha = MYSIN(w0) / (2 * q);
+    switch (self->type[c]) {
+        case 0:
+            co[0] = co[2] = (1 - cs) / 2;
+            co[1] = 1 - cs;
+            break;
+        case 1:
+            co[0] = co[2] = (1 + cs) / 2;
+            co[1] = -(1 + cs);
+            break;
+        case 2:
+            co[0] = alpha;
+            co[1] = 0;
+            co[2] = -alpha;
+            break;
+        case 3:
+            co[0] = co[2] = 1;
+            co[1] = -2 * cs;
+            break;
+        case 4:
+            co[0] = 1 - alpha;
+            co[1] = -2 * cs;
+            co[2] = 1 + alpha;
+            break;
+    }
+    co[3] = -2 * cs;
+    co[4] = 1 - alpha;
+    norm = 1.0 / (1 + alpha);
+    for (k=0; k<5; k++)
+        co[k] *= norm;
+}
+
+/* Computes the coefficients of a channel with constant parameters. */
+static void
+BiquadBank_setStatic(BiquadBank *self, int c)
+{
+    int k, N = self->channels;
+    MYFLT co[5];
+
+    self->count[c] = 0;
+    if (self->freq_streams[c] != NULL || self->q_streams[c] != NULL) {
+        self->last_freq[c] = self->last_q[c] = -1.0;
+        return;
+    }
+    BiquadBank_compute_coeffs(self, c, self->freq[c], self->q[c], co);
+    for (k=0; k<5; k++)
+        self->coeffs[k*N+c] = co[k];
+}
+
+/* Updates the coefficients of a channel with audio parameters at sample i. */
+static void
+BiquadBank_update(BiquadBank *self, int c, int i)
+{
+    int j, k, n, N = self->channels;
+    MYFLT fr, q, co[5];
+
+    if (self->count[c] > 0) {
+        self->count[c]--;
+        if (self->count[c] == 0) {
+            for (k=0; k<5; k++)
+                self->coeffs[k*N+c] = self->target[k*N+c];
+        }
+        else {
+            for (k=0; k<5; k++)
+                self->coeffs[k*N+c] += self->inc[k*N+c];
+        }
+        return;
+    }
+
+    j = i + self->rate[c] - 1;
+    if (j >= self->bufsize)
+        j = self->bufsize - 1;
+    fr = self->freq_data[c] == NULL ? self->freq[c] : self->freq_data[c][j];
+    q = self->q_data[c] == NULL ? self->q[c] : self->q_data[c][j];
+
+    if (j == i) {
+        if (fr != self->last_freq[c] || q != self->last_q[c]) {
+            self->last_freq[c] = fr;
+            self->last_q[c] = q;
+            BiquadBank_compute_coeffs(self, c, fr, q, co);
+            for (k=0; k<5; k++)
+                self->coeffs[k*N+c] = co[k];
+        }
+        return;
+    }
+
+    /* Ramps from the current coefficients to the ones of sample j. */
+    BiquadBank_compute_coeffs(self, c, fr, q, co);
+    n = j - i + 1;
+    for (k=0; k<5; k++) {
+        self->target[k*N+c] = co[k];
+        self->inc[k*N+c] = (co[k] - self->coeffs[k*N+c]) / n;
+        self->coeffs[k*N+c] += self->inc[k*N+c];
+    }
+    self->count[c] = n - 1;
+    self->last_freq[c] = self->last_q[c] = -1.0;
+}
+
+static void
+BiquadBank_filters(BiquadBank *self) {
+    int i, c, d;
+    MYFLT x, y, *in, *row;
+    int N = self->channels;
+    MYFLT *frame = self->frame;
+    MYFLT *b0 = self->coeffs;
+    MYFLT *b1 = b0 + N;
+    MYFLT *b2 = b1 + N;
+    MYFLT *a1 = b2 + N;
+    MYFLT *a2 = a1 + N;
+    MYFLT *x1 = self->x1;
+    MYFLT *x2 = self->x2;
+    MYFLT *y1 = self->y1;
+    MYFLT *y2 = self->y2;
+
+    for (c=0; c<N; c++) {
+        in = Stream_getData(self->in_streams[c]);
+        for (i=0; i<self->bufsize; i++) {
+            frame[i*N+c] = in[i];
+        }
+    }
+
+    if (self->init == 1) {
+        for (c=0; c<N; c++) {
+            x1[c] = x2[c] = y1[c] = y2[c] = frame[c];
+        }
+        self->init = 0;
+    }
+
+    for (d=0; d<self->ndyn; d++) {
+        c = self->dyn[d];
+        self->freq_data[c] = self->freq_streams[c] == NULL ? NULL : Stream_getData(self->freq_streams[c]);
+        self->q_data[c] = self->q_streams[c] == NULL ? NULL : Stream_getData(self->q_streams[c]);
+    }
+
+    for (i=0; i<self->bufsize; i++) {
+        for (d=0; d<self->ndyn; d++) {
+            BiquadBank_update(self, self->dyn[d], i);
+        }
+        row = frame + i * N;
+        for (c=0; c<N; c++) {
+            x = row[c];
+            y = b0[c] * x + b1[c] * x1[c] + b2[c] * x2[c] - a1[c] * y1[c] - a2[c] * y2[c];
+            x2[c] = x1[c];
+            x1[c] = x;
+            y2[c] = y1[c];
+            y1[c] = y;
+            row[c] = y;
+        }
+    }
+
+    for (c=0; c<N; c++) {
+        row = self->buffer_streams + c * self->bufsize;
+        for (i=0; i<self->bufsize; i++) {
+            row[i] = frame[i*N+c];
+        }
+    }
+}
+
+MYFLT *
+BiquadBank_getSamplesBuffer(BiquadBank *self)
+{
+    return (MYFLT *)self->buffer_streams;
+}
+
+static PyObject *
+BiquadBank_setChannelParam(BiquadBank *self, int param, int c, PyObject *arg)
+{
+    Stream *stream;
+
+	if (arg == NULL || c < 0 || c >= self->channels) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+    if (param == 0) {
+        stream = Bank_setRef(self->refs, c * BANK_SLOTS + 2, arg, &self->freq[c]);
+        if (stream == NULL && PyErr_Occurred())
+            return NULL;
+        self->freq_streams[c] = stream;
+    }
+    else {
+        stream = Bank_setRef(self->refs, c * BANK_SLOTS + 4, arg, &self->q[c]);
+        if (stream == NULL && PyErr_Occurred())
+            return NULL;
+        self->q_streams[c] = stream;
+    }
+
+    self->ndyn = Bank_dynamicChannels(self->dyn, self->freq_streams, self->q_streams, self->channels);
+    BiquadBank_setStatic(self, c);
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+static PyObject *
+BiquadBank_setChannelType(BiquadBank *self, int c, PyObject *arg)
+{
+    int type;
+
+	if (arg != NULL && PyInt_Check(arg) && c >= 0 && c < self->channels) {
+        type = PyInt_AsLong(arg);
+        if (type >= 0 && type <= 4) {
+            self->type[c] = type;
+            BiquadBank_setStatic(self, c);
+        }
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+static PyObject *
+BiquadBank_setChannelCoeffRate(BiquadBank *self, int c, PyObject *arg)
+{
+    int k, N = self->channels;
+
+	if (arg != NULL && PyInt_Check(arg) && c >= 0 && c < N) {
+        /* Ends the current ramp. */
+        if (self->count[c] > 0) {
+            for (k=0; k<5; k++)
+                self->coeffs[k*N+c] = self->target[k*N+c];
+            self->count[c] = 0;
+        }
+        self->rate[c] = PyInt_AsLong(arg);
+        if (self->rate[c] < 1)
+            self->rate[c] = 1;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+static void
+BiquadBank_compute_next_data_frame(BiquadBank *self)
+{
+    BiquadBank_filters(self);
+}
+
+static int
+BiquadBank_traverse(BiquadBank *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->refs);
+    return 0;
+}
+
+static int
+BiquadBank_clear(BiquadBank *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->refs);
+    return 0;
+}
+
+static void
+BiquadBank_dealloc(BiquadBank* self)
+{
+    pyo_DEALLOC
+    free(self->in_streams);
+    free(self->freq_streams);
+    free(self->q_streams);
+    free(self->freq_data);
+    free(self->q_data);
+    free(self->freq);
+    free(self->q);
+    free(self->last_freq);
+    free(self->last_q);
+    free(self->type);
+    free(self->dyn);
+    free(self->rate);
+    free(self->count);
+    free(self->inc);
+    free(self->target);
+    free(self->x1);
+    free(self->x2);
+    free(self->y1);
+    free(self->y2);
+    free(self->coeffs);
+    free(self->frame);
+    free(self->buffer_streams);
+    BiquadBank_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+BiquadBank_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i, c, N;
+    PyObject *inputstmp, *freqstmp, *qstmp, *typestmp, *inputtmp;
+    Stream *stream;
+    MYFLT dummy;
+    BiquadBank *self;
+    self = (BiquadBank *)type->tp_alloc(type, 0);
+
+    self->init = 1;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, BiquadBank_compute_next_data_frame);
+
+    self->nyquist = (MYFLT)self->sr * 0.49;
+
+    static char *kwlist[] = {"inputs", "freqs", "qs", "types", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OOOO", kwlist, &inputstmp, &freqstmp, &qstmp, &typestmp))
+        Py_RETURN_NONE;
+
+    if (! PyList_Check(inputstmp) || ! PyList_Check(freqstmp) || ! PyList_Check(qstmp) || ! PyList_Check(typestmp)) {
+        PyErr_SetString(PyExc_TypeError, "BiquadBank arguments must be lists.");
+        return NULL;
+    }
+
+    N = self->channels = PyList_Size(inputstmp);
+    if (N < 1 || PyList_Size(freqstmp) != N || PyList_Size(qstmp) != N || PyList_Size(typestmp) != N) {
+        PyErr_SetString(PyExc_ValueError, "BiquadBank lists must have the same, non zero, length.");
+        return NULL;
+    }
+
+    self->refs = PyList_New(N * BANK_SLOTS);
+    for (i=0; i<N*BANK_SLOTS; i++) {
+        Py_INCREF(Py_None);
+        PyList_SET_ITEM(self->refs, i, Py_None);
+    }
+
+    self->in_streams = (Stream **)calloc(N, sizeof(Stream *));
+    self->freq_streams = (Stream **)calloc(N, sizeof(Stream *));
+    self->q_streams = (Stream **)calloc(N, sizeof(Stream *));
+    self->freq_data = (MYFLT **)calloc(N, sizeof(MYFLT *));
+    self->q_data = (MYFLT **)calloc(N, sizeof(MYFLT *));
+    self->freq = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->q = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->last_freq = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->last_q = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->type = (int *)calloc(N, sizeof(int));
+    self->dyn = (int *)calloc(N, sizeof(int));
+    self->rate = (int *)calloc(N, sizeof(int));
+    self->count = (int *)calloc(N, sizeof(int));
+    self->inc = (MYFLT *)calloc(N * 5, sizeof(MYFLT));
+    self->target = (MYFLT *)calloc(N * 5, sizeof(MYFLT));
+    self->x1 = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->x2 = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->y1 = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->y2 = (MYFLT *)calloc(N, sizeof(MYFLT));
+    self->coeffs = (MYFLT *)calloc(N * 5, sizeof(MYFLT));
+    self->frame = (MYFLT *)calloc(N * self->bufsize, sizeof(MYFLT));
+    self->buffer_streams = (MYFLT *)calloc(N * self->bufsize, sizeof(MYFLT));
+
+    for (c=0; c<N; c++) {
+        inputtmp = PyList_GET_ITEM(inputstmp, c);
+        if ( PyObject_HasAttrString(inputtmp, "server") == 0 ) {
+            PyErr_SetString(PyExc_TypeError, "\"inputs\" argument must be a list of PyoObjects.\n");
+            return NULL;
+        }
+        stream = Bank_setRef(self->refs, c * BANK_SLOTS, inputtmp, &dummy);
+        if (stream == NULL)
+            return NULL;
+        self->in_streams[c] = stream;
+        self->rate[c] = 1;
+        self->type[c] = PyInt_AsLong(PyList_GET_ITEM(typestmp, c));
+        if (self->type[c] < 0 || self->type[c] > 4)
+            self->type[c] = 0;
+        if (BiquadBank_setChannelParam(self, 0, c, PyList_GET_ITEM(freqstmp, c)) == NULL)
+            return NULL;
+        Py_DECREF(Py_None);
+        if (BiquadBank_setChannelParam(self, 1, c, PyList_GET_ITEM(qstmp, c)) == NULL)
+            return NULL;
+        Py_DECREF(Py_None);
+    }
+
+    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+
+    return (PyObject *)self;
+}
+
+static PyObject * BiquadBank_getServer(BiquadBank* self) { GET_SERVER };
+static PyObject * BiquadBank_getStream(BiquadBank* self) { GET_STREAM };
+
+static PyObject * BiquadBank_play(BiquadBank *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * BiquadBank_stop(BiquadBank *self) { STOP };
+
+static PyMemberDef BiquadBank_members[] = {
+{"server", T_OBJECT_EX, offsetof(BiquadBank, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(BiquadBank, stream), 0, "Stream object."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef BiquadBank_methods[] = {
+{"getServer", (PyCFunction)BiquadBank_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)BiquadBank_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)BiquadBank_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"stop", (PyCFunction)BiquadBank_stop, METH_NOARGS, "Stops computing."},
+{NULL}  /* Sentinel */
+};
+
+PyTypeObject BiquadBankType = {
+PyObject_HEAD_INIT(NULL)
+0,                                              /*ob_size*/
+"_pyo.BiquadBank_base",                                   /*tp_name*/
+sizeof(BiquadBank),                                 /*tp_basicsize*/
+0,                                              /*tp_itemsize*/
+(destructor)BiquadBank_dealloc,                     /*tp_dealloc*/
+0,                                              /*tp_print*/
+0,                                              /*tp_getattr*/
+0,                                              /*tp_setattr*/
+0,                                              /*tp_compare*/
+0,                                              /*tp_repr*/
+0,                              /*tp_as_number*/
+0,                                              /*tp_as_sequence*/
+0,                                              /*tp_as_mapping*/
+0,                                              /*tp_hash */
+0,                                              /*tp_call*/
+0,                                              /*tp_str*/
+0,                                              /*tp_getattro*/
+0,                                              /*tp_setattro*/
+0,                                              /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES, /*tp_flags*/
+"BiquadBank objects. Multichannel biquadratic filters.",           /* tp_doc */
+(traverseproc)BiquadBank_traverse,                  /* tp_traverse */
+(inquiry)BiquadBank_clear,                          /* tp_clear */
+0,                                              /* tp_richcompare */
+0,                                              /* tp_weaklistoffset */
+0,                                              /* tp_iter */
+0,                                              /* tp_iternext */
+BiquadBank_methods,                                 /* tp_methods */
+BiquadBank_members,                                 /* tp_members */
+0,                                              /* tp_getset */
+0,                                              /* tp_base */
+0,                                              /* tp_dict */
+0,                                              /* tp_descr_get */
+0,                                              /* tp_descr_set */
+0,                                              /* tp_dictoffset */
+0,                          /* tp_init */
+0,                                              /* tp_alloc */
+BiquadBank_new,                                     /* tp_new */
+};
+
+/************************************************************************************************/
+/* BiquadBankStream streamer object */
+/************************************************************************************************/
+typedef struct {
+    pyo_audio_HEAD
+    BiquadBank *mainBank;
+    int modebuffer[2];
+    int chnl;
+} BiquadBankStream;
+
+static void BiquadBankStream_postprocessing_ii(BiquadBankStream *self) { POST_PROCESSING_II };
+static void BiquadBankStream_postprocessing_ai(BiquadBankStream *self) { POST_PROCESSING_AI };
+static void BiquadBankStream_postprocessing_ia(BiquadBankStream *self) { POST_PROCESSING_IA };
+static void BiquadBankStream_postprocessing_aa(BiquadBankStream *self) { POST_PROCESSING_AA };
+static void BiquadBankStream_postprocessing_ireva(BiquadBankStream *self) { POST_PROCESSING_IREVA };
+static void BiquadBankStream_postprocessing_areva(BiquadBankStream *self) { POST_PROCESSING_AREVA };
+static void BiquadBankStream_postprocessing_revai(BiquadBankStream *self) { POST_PROCESSING_REVAI };
+static void BiquadBankStream_postprocessing_revaa(BiquadBankStream *self) { POST_PROCESSING_REVAA };
+static void BiquadBankStream_postprocessing_revareva(BiquadBankStream *self) { POST_PROCESSING_REVAREVA };
+
+static void
+BiquadBankStream_setProcMode(BiquadBankStream *self)
+{
+    int muladdmode;
+    muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+
+	switch (muladdmode) {
+        case 0:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_ii;
+            break;
+        case 1:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_ai;
+            break;
+        case 2:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_revai;
+            break;
+        case 10:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_ia;
+            break;
+        case 11:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_aa;
+            break;
+        case 12:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_revaa;
+            break;
+        case 20:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_ireva;
+            break;
+        case 21:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_areva;
+            break;
+        case 22:
+            self->muladd_func_ptr = BiquadBankStream_postprocessing_revareva;
+            break;
+    }
+}
+
+static void
+BiquadBankStream_compute_next_data_frame(BiquadBankStream *self)
+{
+    int i;
+    MYFLT *tmp;
+    int offset = self->chnl * self->bufsize;
+    tmp = BiquadBank_getSamplesBuffer((BiquadBank *)self->mainBank);
+    for (i=0; i<self->bufsize; i++) {
+        self->data[i] = tmp[i + offset];
+    }
+    (*self->muladd_func_ptr)(self);
+}
+
+static int
+BiquadBankStream_traverse(BiquadBankStream *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->mainBank);
+    return 0;
+}
+
+static int
+BiquadBankStream_clear(BiquadBankStream *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->mainBank);
+    return 0;
+}
+
+static void
+BiquadBankStream_dealloc(BiquadBankStream* self)
+{
+    pyo_DEALLOC
+    BiquadBankStream_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+BiquadBankStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
+    BiquadBankStream *self;
+    self = (BiquadBankStream *)type->tp_alloc(type, 0);
+
+    self->chnl = 0;
+	self->modebuffer[0] = 0;
+	self->modebuffer[1] = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, BiquadBankStream_compute_next_data_frame);
+    self->mode_func_ptr = BiquadBankStream_setProcMode;
+
+    static char *kwlist[] = {"mainBank", "chnl", "mul", "add", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|iOO", kwlist, &maintmp, &self->chnl, &multmp, &addtmp))
+        Py_RETURN_NONE;
+
+    Py_XDECREF(self->mainBank);
+    Py_INCREF(maintmp);
+    self->mainBank = (BiquadBank *)maintmp;
+
+    if (multmp) {
+        PyObject_CallMethod((PyObject *)self, "setMul", "O", multmp);
+    }
+
+    if (addtmp) {
+        PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
+    }
+
+    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static PyObject * BiquadBankStream_getServer(BiquadBankStream* self) { GET_SERVER };
+static PyObject * BiquadBankStream_getStream(BiquadBankStream* self) { GET_STREAM };
+static PyObject * BiquadBankStream_setMul(BiquadBankStream *self, PyObject *arg) { SET_MUL };
+static PyObject * BiquadBankStream_setAdd(BiquadBankStream *self, PyObject *arg) { SET_ADD };
+static PyObject * BiquadBankStream_setSub(BiquadBankStream *self, PyObject *arg) { SET_SUB };
+static PyObject * BiquadBankStream_setDiv(BiquadBankStream *self, PyObject *arg) { SET_DIV };
+
+static PyObject * BiquadBankStream_play(BiquadBankStream *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * BiquadBankStream_out(BiquadBankStream *self, PyObject *args, PyObject *kwds) { OUT };
+static PyObject * BiquadBankStream_stop(BiquadBankStream *self) { STOP };
+
+static PyObject * BiquadBankStream_multiply(BiquadBankStream *self, PyObject *arg) { MULTIPLY };
+static PyObject * BiquadBankStream_inplace_multiply(BiquadBankStream *self, PyObject *arg) { INPLACE_MULTIPLY };
+static PyObject * BiquadBankStream_add(BiquadBankStream *self, PyObject *arg) { ADD };
+static PyObject * BiquadBankStream_inplace_add(BiquadBankStream *self, PyObject *arg) { INPLACE_ADD };
+static PyObject * BiquadBankStream_sub(BiquadBankStream *self, PyObject *arg) { SUB };
+static PyObject * BiquadBankStream_inplace_sub(BiquadBankStream *self, PyObject *arg) { INPLACE_SUB };
+static PyObject * BiquadBankStream_div(BiquadBankStream *self, PyObject *arg) { DIV };
+static PyObject * BiquadBankStream_inplace_div(BiquadBankStream *self, PyObject *arg) { INPLACE_DIV };
+
+static PyObject *
+BiquadBankStream_setFreq(BiquadBankStream *self, PyObject *arg)
+{
+    return BiquadBank_setChannelParam(self->mainBank, 0, self->chnl, arg);
+}
+
+static PyObject *
+BiquadBankStream_setQ(BiquadBankStream *self, PyObject *arg)
+{
+    return BiquadBank_setChannelParam(self->mainBank, 1, self->chnl, arg);
+}
+
+static PyObject *
+BiquadBankStream_setType(BiquadBankStream *self, PyObject *arg)
+{
+    return BiquadBank_setChannelType(self->mainBank, self->chnl, arg);
+}
+
+static PyObject *
+BiquadBankStream_setCoeffRate(BiquadBankStream *self, PyObject *arg)
+{
+    return BiquadBank_setChannelCoeffRate(self->mainBank, self->chnl, arg);
+}
+
+static PyMemberDef BiquadBankStream_members[] = {
+{"server", T_OBJECT_EX, offsetof(BiquadBankStream, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(BiquadBankStream, stream), 0, "Stream object."},
+{"mul", T_OBJECT_EX, offsetof(BiquadBankStream, mul), 0, "Mul factor."},
+{"add", T_OBJECT_EX, offsetof(BiquadBankStream, add), 0, "Add factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef BiquadBankStream_methods[] = {
+{"getServer", (PyCFunction)BiquadBankStream_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)BiquadBankStream_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)BiquadBankStream_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"out", (PyCFunction)BiquadBankStream_out, METH_VARARGS|METH_KEYWORDS, "Starts computing and sends sound to soundcard channel speficied by argument."},
+{"stop", (PyCFunction)BiquadBankStream_stop, METH_NOARGS, "Stops computing."},
+{"setFreq", (PyCFunction)BiquadBankStream_setFreq, METH_O, "Sets the filter frequency of the channel."},
+{"setQ", (PyCFunction)BiquadBankStream_setQ, METH_O, "Sets the filter Q of the channel."},
+{"setType", (PyCFunction)BiquadBankStream_setType, METH_O, "Sets the filter type of the channel."},
+{"setCoeffRate", (PyCFunction)BiquadBankStream_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
+{"setMul", (PyCFunction)BiquadBankStream_setMul, METH_O, "Sets BiquadBankStream mul factor."},
+{"setAdd", (PyCFunction)BiquadBankStream_setAdd, METH_O, "Sets BiquadBankStream add factor."},
+{"setSub", (PyCFunction)BiquadBankStream_setSub, METH_O, "Sets inverse add factor."},
+{"setDiv", (PyCFunction)BiquadBankStream_setDiv, METH_O, "Sets inverse mul factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyNumberMethods BiquadBankStream_as_number = {
+(binaryfunc)BiquadBankStream_add,                      /*nb_add*/
+(binaryfunc)BiquadBankStream_sub,                 /*nb_subtract*/
+(binaryfunc)BiquadBankStream_multiply,                 /*nb_multiply*/
+(binaryfunc)BiquadBankStream_div,                   /*nb_divide*/
+0,                /*nb_remainder*/
+0,                   /*nb_divmod*/
+0,                   /*nb_power*/
+0,                  /*nb_neg*/
+0,                /*nb_pos*/
+0,                  /*(unaryfunc)array_abs,*/
+0,                    /*nb_nonzero*/
+0,                    /*nb_invert*/
+0,               /*nb_lshift*/
+0,              /*nb_rshift*/
+0,              /*nb_and*/
+0,              /*nb_xor*/
+0,               /*nb_or*/
+0,                                          /*nb_coerce*/
+0,                       /*nb_int*/
+0,                      /*nb_long*/
+0,                     /*nb_float*/
+0,                       /*nb_oct*/
+0,                       /*nb_hex*/
+(binaryfunc)BiquadBankStream_inplace_add,              /*inplace_add*/
+(binaryfunc)BiquadBankStream_inplace_sub,         /*inplace_subtract*/
+(binaryfunc)BiquadBankStream_inplace_multiply,         /*inplace_multiply*/
+(binaryfunc)BiquadBankStream_inplace_div,           /*inplace_divide*/
+0,        /*inplace_remainder*/
+0,           /*inplace_power*/
+0,       /*inplace_lshift*/
+0,      /*inplace_rshift*/
+0,      /*inplace_and*/
+0,      /*inplace_xor*/
+0,       /*inplace_or*/
+0,             /*nb_floor_divide*/
+0,              /*nb_true_divide*/
+0,     /*nb_inplace_floor_divide*/
+0,      /*nb_inplace_true_divide*/
+0,                     /* nb_index */
+};
+
+PyTypeObject BiquadBankStreamType = {
+PyObject_HEAD_INIT(NULL)
+0,                         /*ob_size*/
+"_pyo.BiquadBankStream_base",         /*tp_name*/
+sizeof(BiquadBankStream),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)BiquadBankStream_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_compare*/
+0,                         /*tp_repr*/
+&BiquadBankStream_as_number,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES,  /*tp_flags*/
+"BiquadBankStream objects. Reads one channel from a BiquadBank process.",           /* tp_doc */
+(traverseproc)BiquadBankStream_traverse,   /* tp_traverse */
+(inquiry)BiquadBankStream_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+BiquadBankStream_methods,             /* tp_methods */
+BiquadBankStream_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+BiquadBankStream_new,                 /* tp_new */
+};
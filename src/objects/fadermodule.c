@@ -46,6 +46,9 @@ static void Fader_internal_stop(Fader *self) {
     for (i=0; i<self->bufsize; i++) {
         self->data[i] = 0;
     }
+    /* The envelope is over, objects using it as multiplier can sleep. */
+    if (self->modebuffer[1] == 0 && PyFloat_AS_DOUBLE(self->add) == 0)
+        Stream_setStreamSilent(self->stream, 1);
 }
 
 static void
@@ -424,6 +427,9 @@ static void Adsr_internal_stop(Adsr *self) {
     for (i=0; i<self->bufsize; i++) {
         self->data[i] = 0;
     }
+    /* The envelope is over, objects using it as multiplier can sleep. */
+    if (self->modebuffer[1] == 0 && PyFloat_AS_DOUBLE(self->add) == 0)
+        Stream_setStreamSilent(self->stream, 1);
 }
 
 static void
@@ -26,6 +26,7 @@
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "fft.h"
+#include "fastmath.h"
 #include "wind.h"
 #include "sndfile.h"
 
@@ -53,9 +54,8 @@ typedef struct {
 
 static void
 FFTMain_realloc_memories(FFTMain *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
@@ -63,14 +63,12 @@ FFTMain_realloc_memories(FFTMain *self) {
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, 3 * self->bufsize * sizeof(MYFLT));
     for (i=0; i<(self->bufsize*3); i++)
         self->buffer_streams[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->twiddle2 = (MYFLT *)realloc(self->twiddle2, self->size * sizeof(MYFLT));
-    fft_compute_radix2_twiddle(self->twiddle2, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    fft_release_radix2_twiddle(self->twiddle2);
+    self->twiddle2 = fft_get_radix2_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, self->wintype);
     self->incount = -self->hopsize;
 }
 
@@ -165,17 +163,13 @@ FFTMain_clear(FFTMain *self)
 static void
 FFTMain_dealloc(FFTMain* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
-    free(self->window);
+    release_window(self->window);
     free(self->buffer_streams);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->twiddle2);
+    fft_release_split_twiddle(self->twiddle);
+    fft_release_radix2_twiddle(self->twiddle2);
     FFTMain_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -244,7 +238,8 @@ FFTMain_setWinType(FFTMain *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        release_window(self->window);
+        self->window = get_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
@@ -587,21 +582,18 @@ typedef struct {
 
 static void
 IFFT_realloc_memories(IFFT *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
         self->inframe[i] = self->outframe[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->twiddle2 = (MYFLT *)realloc(self->twiddle2, self->size * sizeof(MYFLT));
-    fft_compute_radix2_twiddle(self->twiddle2, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    fft_release_radix2_twiddle(self->twiddle2);
+    self->twiddle2 = fft_get_radix2_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, self->wintype);
     self->incount = -self->hopsize;
 }
 
@@ -731,16 +723,12 @@ IFFT_clear(IFFT *self)
 static void
 IFFT_dealloc(IFFT* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
-    free(self->window);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->twiddle2);
+    release_window(self->window);
+    fft_release_split_twiddle(self->twiddle);
+    fft_release_radix2_twiddle(self->twiddle2);
     IFFT_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -846,7 +834,8 @@ IFFT_setWinType(IFFT *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        release_window(self->window);
+        self->window = get_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
@@ -970,6 +959,7 @@ typedef struct {
     Stream *input2_stream;
     int modebuffer[2];
     int chnl; // 0 = mag, 1 = ang
+    int fastmath; /* 1 = polynomial approximations of fastmath.h, 0 = libm */
 } CarToPol;
 
 static void
@@ -983,6 +973,8 @@ CarToPol_generate(CarToPol *self) {
             self->data[i] = MYSQRT(in[i]*in[i] + in2[i]*in2[i]);
         }
     }
+    else if (self->fastmath)
+        fast_atan2_block(in2, in, self->data, self->bufsize);
     else {
         for (i=0; i<self->bufsize; i++) {
             self->data[i] = MYATAN2(in2[i], in[i]);
@@ -1088,6 +1080,7 @@ CarToPol_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->modebuffer[1] = 0;
 
     INIT_OBJECT_COMMON
+    self->fastmath = Server_useFastMath((Server *)self->server);
     Stream_setFunctionPtr(self->stream, CarToPol_compute_next_data_frame);
     self->mode_func_ptr = CarToPol_setProcMode;
 
@@ -1139,6 +1132,17 @@ static PyObject * CarToPol_inplace_sub(CarToPol *self, PyObject *arg) { INPLACE_
 static PyObject * CarToPol_div(CarToPol *self, PyObject *arg) { DIV };
 static PyObject * CarToPol_inplace_div(CarToPol *self, PyObject *arg) { INPLACE_DIV };
 
+static PyObject *
+CarToPol_setFastMath(CarToPol *self, PyObject *arg)
+{
+    if (PyLong_Check(arg) || PyInt_Check(arg)) {
+        self->fastmath = PyInt_AsLong(arg) ? 1 : 0;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyMemberDef CarToPol_members[] = {
     {"server", T_OBJECT_EX, offsetof(CarToPol, server), 0, "Pyo server."},
     {"stream", T_OBJECT_EX, offsetof(CarToPol, stream), 0, "Stream object."},
@@ -1158,6 +1162,7 @@ static PyMethodDef CarToPol_methods[] = {
     {"setAdd", (PyCFunction)CarToPol_setAdd, METH_O, "Sets CarToPol add factor."},
     {"setSub", (PyCFunction)CarToPol_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)CarToPol_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setFastMath", (PyCFunction)CarToPol_setFastMath, METH_O, "Uses the polynomial approximations of the trigonometric functions if True."},
     {NULL}  /* Sentinel */
 };
 
@@ -1253,6 +1258,7 @@ typedef struct {
     Stream *input2_stream;
     int modebuffer[2];
     int chnl; // 0 = real, 1 = imag
+    int fastmath; /* 1 = polynomial approximations of fastmath.h, 0 = libm */
 } PolToCar;
 
 static void
@@ -1261,7 +1267,13 @@ PolToCar_generate(PolToCar *self) {
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *in2 = Stream_getData((Stream *)self->input2_stream);
 
-    if (self->chnl == 0) {
+    if (self->fastmath) {
+        if (self->chnl == 0)
+            fast_sincos_block(in, in2, self->data, NULL, self->bufsize);
+        else
+            fast_sincos_block(in, in2, NULL, self->data, self->bufsize);
+    }
+    else if (self->chnl == 0) {
         for (i=0; i<self->bufsize; i++) {
             self->data[i] = in[i] * MYCOS(in2[i]);
         }
@@ -1371,6 +1383,7 @@ PolToCar_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->modebuffer[1] = 0;
 
     INIT_OBJECT_COMMON
+    self->fastmath = Server_useFastMath((Server *)self->server);
     Stream_setFunctionPtr(self->stream, PolToCar_compute_next_data_frame);
     self->mode_func_ptr = PolToCar_setProcMode;
 
@@ -1422,6 +1435,17 @@ static PyObject * PolToCar_inplace_sub(PolToCar *self, PyObject *arg) { INPLACE_
 static PyObject * PolToCar_div(PolToCar *self, PyObject *arg) { DIV };
 static PyObject * PolToCar_inplace_div(PolToCar *self, PyObject *arg) { INPLACE_DIV };
 
+static PyObject *
+PolToCar_setFastMath(PolToCar *self, PyObject *arg)
+{
+    if (PyLong_Check(arg) || PyInt_Check(arg)) {
+        self->fastmath = PyInt_AsLong(arg) ? 1 : 0;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyMemberDef PolToCar_members[] = {
     {"server", T_OBJECT_EX, offsetof(PolToCar, server), 0, "Pyo server."},
     {"stream", T_OBJECT_EX, offsetof(PolToCar, stream), 0, "Stream object."},
@@ -1441,6 +1465,7 @@ static PyMethodDef PolToCar_methods[] = {
     {"setAdd", (PyCFunction)PolToCar_setAdd, METH_O, "Sets PolToCar add factor."},
     {"setSub", (PyCFunction)PolToCar_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)PolToCar_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setFastMath", (PyCFunction)PolToCar_setFastMath, METH_O, "Uses the polynomial approximations of the trigonometric functions if True."},
     {NULL}  /* Sentinel */
 };
 
@@ -3252,6 +3277,9 @@ typedef struct {
     int incount;
     int num_iter;
     int current_iter;
+    int frame_iter; /* partition of the last frame */
+    int pending; /* next partition of the last frame to accumulate */
+    int share; /* partitions accumulated per block */
     int impulse_len;
     MYFLT *inframe;
     MYFLT *outframe;
@@ -3265,15 +3293,15 @@ typedef struct {
     MYFLT **accum_imag;
     MYFLT *real;
     MYFLT *imag;
+    PyoFrameSlot frames;
     int modebuffer[3];
 } CvlVerb;
 
 static void
 CvlVerb_alloc_memories(CvlVerb *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
     self->size2 = self->size * 2;
-    n8 = self->size2 >> 3;
     self->real = (MYFLT *)realloc(self->real, self->size * sizeof(MYFLT));
     self->imag = (MYFLT *)realloc(self->imag, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size2 * sizeof(MYFLT));
@@ -3285,10 +3313,10 @@ CvlVerb_alloc_memories(CvlVerb *self) {
         self->inframe[i] = self->outframe[i] = self->output_buffer[i] = 0.0;
     for (i=0; i<self->size; i++)
         self->last_half_frame[i] = self->input_buffer[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size2);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size2);
+    /* Instances are offset from each other so that their frames don't fall in the same blocks. */
+    self->incount = Server_scheduleFrames((Server *)self->server, &self->frames, self->size, self->size);
 }
 
 static void
@@ -3368,11 +3396,80 @@ CvlVerb_analyse_impulse(CvlVerb *self) {
     free(tmp2);
     free(inframe);
     free(outframe);
+
+    /* The partitions of a frame are accumulated over the blocks until the next one. */
+    self->pending = self->num_iter;
+    self->share = (self->num_iter - 1) / (self->size / self->bufsize) + 1;
 }
 
+/* Adds the spectrum of the last frame, multiplied by the partitions of the
+   impulse, to the accumulators, up to partition `stop` (excluded). */
 static void
-CvlVerb_process_i(CvlVerb *self) {
+CvlVerb_accumulate(CvlVerb *self, int stop) {
     int i, j, k;
+
+    if (stop > self->num_iter)
+        stop = self->num_iter;
+    for (j=self->pending; j<stop; j++) {
+        k = self->frame_iter + j;
+        if (k >= self->num_iter)
+            k -= self->num_iter;
+        for (i=0; i<self->size; i++) {
+            self->accum_real[k][i] += self->real[i] * self->impulse_real[j][i] - self->imag[i] * self->impulse_imag[j][i];
+            self->accum_imag[k][i] += self->real[i] * self->impulse_imag[j][i] + self->imag[i] * self->impulse_real[j][i];
+        }
+    }
+    if (stop > self->pending)
+        self->pending = stop;
+}
+
+/* Computes a new frame. Only the first partition, needed for the current
+   output, is accumulated here, the other ones are spread over the blocks. */
+static void
+CvlVerb_process_frame(CvlVerb *self) {
+    int i, k;
+
+    CvlVerb_accumulate(self, self->num_iter);
+
+    k = self->current_iter - 1;
+    if (k < 0)
+        k += self->num_iter;
+    for (i=0; i<self->size; i++) {
+        self->accum_real[k][i] = self->accum_imag[k][i] = 0.0;
+        self->inframe[i] = self->last_half_frame[i];
+        self->inframe[i+self->size] = self->last_half_frame[i] = self->input_buffer[i];
+    }
+    realfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+    self->real[0] = self->outframe[0];
+    self->imag[0] = 0.0;
+    for (i=1; i<self->size; i++) {
+        self->real[i] = self->outframe[i];
+        self->imag[i] = self->outframe[self->size2 - i];
+    }
+    self->frame_iter = self->current_iter;
+    self->pending = 0;
+    CvlVerb_accumulate(self, 1);
+
+    self->inframe[0] = self->accum_real[self->current_iter][0];
+    self->inframe[self->size] = 0.0;
+    for (i=1; i<self->size; i++) {
+        self->inframe[i] = self->accum_real[self->current_iter][i];
+        self->inframe[self->size2 - i] = self->accum_imag[self->current_iter][i];
+    }
+    irealfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+
+    for (i=0; i<self->size; i++) {
+        self->output_buffer[i] = self->outframe[i+self->size];
+    }
+
+    self->current_iter++;
+    if (self->current_iter == self->num_iter)
+        self->current_iter = 0;
+}
+
+static void
+CvlVerb_process_i(CvlVerb *self) {
+    int i;
     MYFLT gdry;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT bal = PyFloat_AS_DOUBLE(self->bal);
@@ -3382,6 +3479,8 @@ CvlVerb_process_i(CvlVerb *self) {
         bal = 1.0;
     gdry = 1.0 - bal;
 
+    CvlVerb_accumulate(self, self->pending + self->share);
+
     for (i=0; i<self->bufsize; i++) {
         self->input_buffer[self->incount] = in[i];
         self->data[i] = (self->output_buffer[self->incount] * 100 * bal) + (in[i] * gdry);
@@ -3389,57 +3488,20 @@ CvlVerb_process_i(CvlVerb *self) {
         self->incount++;
         if (self->incount == self->size) {
             self->incount = 0;
-
-            k = self->current_iter - 1;
-            if (k < 0)
-                k += self->num_iter;
-            for (i=0; i<self->size; i++) {
-                self->accum_real[k][i] = self->accum_imag[k][i] = 0.0;
-                self->inframe[i] = self->last_half_frame[i];
-                self->inframe[i+self->size] = self->last_half_frame[i] = self->input_buffer[i];
-            }
-            realfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
-            self->real[0] = self->outframe[0];
-            self->imag[0] = 0.0;
-            for (i=1; i<self->size; i++) {
-                self->real[i] = self->outframe[i];
-                self->imag[i] = self->outframe[self->size2 - i];
-            }
-            for (j=0; j<self->num_iter; j++) {
-                k = self->current_iter + j;
-                if (k >= self->num_iter)
-                    k -= self->num_iter;
-                for (i=0; i<self->size; i++) {
-                    self->accum_real[k][i] += self->real[i] * self->impulse_real[j][i] - self->imag[i] * self->impulse_imag[j][i];
-                    self->accum_imag[k][i] += self->real[i] * self->impulse_imag[j][i] + self->imag[i] * self->impulse_real[j][i];
-                }
-            }
-            self->inframe[0] = self->accum_real[self->current_iter][0];
-            self->inframe[self->size] = 0.0;
-            for (i=1; i<self->size; i++) {
-                self->inframe[i] = self->accum_real[self->current_iter][i];
-                self->inframe[self->size2 - i] = self->accum_imag[self->current_iter][i];
-            }
-            irealfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
-
-            for (i=0; i<self->size; i++) {
-                self->output_buffer[i] = self->outframe[i+self->size];
-            }
-
-            self->current_iter++;
-            if (self->current_iter == self->num_iter)
-                self->current_iter = 0;
+            CvlVerb_process_frame(self);
         }
     }
 }
 
 static void
 CvlVerb_process_a(CvlVerb *self) {
-    int i, j, k;
+    int i;
     MYFLT gwet, gdry;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *bal = Stream_getData((Stream *)self->bal_stream);
 
+    CvlVerb_accumulate(self, self->pending + self->share);
+
     for (i=0; i<self->bufsize; i++) {
         gwet = bal[i];
         if (gwet < 0)
@@ -3453,46 +3515,7 @@ CvlVerb_process_a(CvlVerb *self) {
         self->incount++;
         if (self->incount == self->size) {
             self->incount = 0;
-
-            k = self->current_iter - 1;
-            if (k < 0)
-                k += self->num_iter;
-            for (i=0; i<self->size; i++) {
-                self->accum_real[k][i] = self->accum_imag[k][i] = 0.0;
-                self->inframe[i] = self->last_half_frame[i];
-                self->inframe[i+self->size] = self->last_half_frame[i] = self->input_buffer[i];
-            }
-            realfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
-            self->real[0] = self->outframe[0];
-            self->imag[0] = 0.0;
-            for (i=1; i<self->size; i++) {
-                self->real[i] = self->outframe[i];
-                self->imag[i] = self->outframe[self->size2 - i];
-            }
-            for (j=0; j<self->num_iter; j++) {
-                k = self->current_iter + j;
-                if (k >= self->num_iter)
-                    k -= self->num_iter;
-                for (i=0; i<self->size; i++) {
-                    self->accum_real[k][i] += self->real[i] * self->impulse_real[j][i] - self->imag[i] * self->impulse_imag[j][i];
-                    self->accum_imag[k][i] += self->real[i] * self->impulse_imag[j][i] + self->imag[i] * self->impulse_real[j][i];
-                }
-            }
-            self->inframe[0] = self->accum_real[self->current_iter][0];
-            self->inframe[self->size] = 0.0;
-            for (i=1; i<self->size; i++) {
-                self->inframe[i] = self->accum_real[self->current_iter][i];
-                self->inframe[self->size2 - i] = self->accum_imag[self->current_iter][i];
-            }
-            irealfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
-
-            for (i=0; i<self->size; i++) {
-                self->output_buffer[i] = self->outframe[i+self->size];
-            }
-
-            self->current_iter++;
-            if (self->current_iter == self->num_iter)
-                self->current_iter = 0;
+            CvlVerb_process_frame(self);
         }
     }
 }
@@ -3587,16 +3610,15 @@ static void
 CvlVerb_dealloc(CvlVerb* self)
 {
     int i;
+    if (PyServer_get_server() != NULL)
+        Server_unscheduleFrames((Server *)self->server, &self->frames);
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
     free(self->input_buffer);
     free(self->output_buffer);
     free(self->last_half_frame);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
+    fft_release_split_twiddle(self->twiddle);
     for(i=0; i<self->num_iter; i++) {
         free(self->impulse_real[i]);
         free(self->impulse_imag[i]);
@@ -3626,6 +3648,7 @@ CvlVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->chnl = 0;
     self->incount = 0;
     self->current_iter = 0;
+    self->frames.slot = -1;
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, CvlVerb_compute_next_data_frame);
     self->mode_func_ptr = CvlVerb_setProcMode;
@@ -3861,9 +3884,8 @@ typedef struct {
 
 static void
 Spectrum_realloc_memories(Spectrum *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -3874,12 +3896,10 @@ Spectrum_realloc_memories(Spectrum *self) {
     self->tmpmag = (MYFLT *)realloc(self->tmpmag, (self->hsize+6) * sizeof(MYFLT));
     for (i=0; i<self->hsize; i++)
         self->magnitude[i] = self->last_magnitude[i] = self->tmpmag[i+3] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, self->wintype);
     self->incount = self->hsize;
     self->freqPerBin = self->sr / self->size;
 }
@@ -4040,19 +4060,15 @@ Spectrum_clear(Spectrum *self)
 static void
 Spectrum_dealloc(Spectrum* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->input_buffer);
     free(self->inframe);
     free(self->outframe);
-    free(self->window);
+    release_window(self->window);
     free(self->magnitude);
     free(self->last_magnitude);
     free(self->tmpmag);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
+    fft_release_split_twiddle(self->twiddle);
     Spectrum_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -4134,7 +4150,8 @@ Spectrum_setWinType(Spectrum *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        release_window(self->window);
+        self->window = get_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
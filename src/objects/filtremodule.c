@@ -21,6 +21,7 @@
 #include <Python.h>
 #include "structmember.h"
 #include <math.h>
+#include <stdarg.h>
 #include "pyomodule.h"
 #include "streammodule.h"
 #include "servermodule.h"
@@ -28,6 +29,167 @@
 
 static MYFLT HALF_COS_ARRAY[513] = {1.0, 0.99998110153278696, 0.99992440684545181, 0.99982991808087995, 0.99969763881045715, 0.99952757403393411, 0.99931973017923825, 0.99907411510222999, 0.99879073808640628, 0.99846960984254973, 0.99811074250832332, 0.99771414964781235, 0.99727984625101107, 0.99680784873325645, 0.99629817493460782, 0.99575084411917214, 0.99516587697437664, 0.99454329561018584, 0.99388312355826691, 0.9931853857710996, 0.99245010862103322, 0.99167731989928998, 0.99086704881491472, 0.99001932599367026, 0.98913418347688054, 0.98821165472021921, 0.9872517745924454, 0.98625457937408512, 0.98522010675606064, 0.98414839583826585, 0.98303948712808786, 0.98189342253887657, 0.98071024538836005, 0.97949000039700762, 0.97823273368633901, 0.9769384927771817, 0.97560732658787452, 0.97423928543241856, 0.97283442101857576, 0.97139278644591409, 0.96991443620380113, 0.96839942616934394, 0.96684781360527761, 0.96525965715780015, 0.96363501685435693, 0.96197395410137099, 0.96027653168192206, 0.95854281375337425, 0.95677286584495025, 0.95496675485525528, 0.95312454904974775, 0.95124631805815985, 0.94933213287186513, 0.94738206584119555, 0.94539619067270686, 0.9433745824263926, 0.94131731751284708, 0.9392244736903772, 0.93709613006206383, 0.9349323670727715, 0.93273326650610799, 0.93049891148133324, 0.92822938645021758, 0.92592477719384991, 0.92358517081939495, 0.92121065575680161, 0.91880132175545981, 0.91635725988080907, 0.91387856251089561, 0.91136532333288145, 0.90881763733950294, 0.9062356008254806, 0.90361931138387919, 0.90096886790241915, 0.89828437055973898, 0.89556592082160869, 0.89281362143709486, 0.89002757643467667, 0.88720789111831455, 0.8843546720634694, 0.88146802711307481, 0.87854806537346075, 0.87559489721022943, 0.8726086342440843, 0.86958938934661101, 0.86653727663601088, 0.86345241147278784, 0.86033491045538835, 0.85718489141579368, 0.85400247341506719, 0.8507877767388532, 0.84754092289283123, 0.8442620345981231, 0.84095123578665476, 0.8376086515964718, 0.83423440836700968, 0.83082863363431847, 0.82739145612624232, 0.82392300575755428, 0.82042341362504534, 0.81689281200256991, 0.81333133433604599, 0.80973911523841147, 0.80611629048453592, 0.80246299700608914, 0.79877937288636502, 0.7950655573550629, 0.79132169078302494, 0.78754791467693042, 0.78374437167394739, 0.77991120553634141, 0.77604856114604148, 0.77215658449916424, 0.76823542270049605, 0.76428522395793219, 0.7603061375768756, 0.75629831395459302, 0.75226190457453135, 0.74819706200059122, 0.7441039398713607, 0.73998269289430851, 0.73583347683993672, 0.73165644853589207, 0.72745176586103977, 0.72321958773949491, 0.71896007413461649, 0.71467338604296105, 0.71035968548819706, 0.70601913551498185, 0.70165190018279788, 0.69725814455975277, 0.69283803471633953, 0.68839173771916018, 0.68391942162461061, 0.6794212554725293, 0.67489740927980701, 0.67034805403396192, 0.66577336168667567, 0.66117350514729512, 0.65654865827629605, 0.65189899587871258, 0.64722469369752944, 0.6425259284070397, 0.63780287760616672, 0.63305571981175202, 0.62828463445180749, 0.62348980185873359, 0.61867140326250347, 0.61382962078381298, 0.60896463742719675, 0.60407663707411186, 0.59916580447598711, 0.59423232524724023, 0.58927638585826192, 0.58429817362836856, 0.57929787671872113, 0.57427568412521424, 0.56923178567133192, 0.56416637200097319, 0.55907963457124654, 0.55397176564523298, 0.5488429582847193, 0.5436934063429012, 0.53852330445705543, 0.53333284804118442, 0.52812223327862839, 0.52289165711465235, 0.51764131724900009, 0.51237141212842374, 0.50708214093918114, 0.50177370359950879, 0.49644630075206486, 0.49110013375634509, 0.48573540468107329, 0.48035231629656205, 0.47495107206705045, 0.46953187614301212, 0.46409493335344021, 0.45864044919810504, 0.45316862983978612, 0.44767968209648135, 0.44217381343358825, 0.43665123195606403, 0.43111214640055828, 0.42555676612752463, 0.41998530111330729, 0.41439796194220363, 0.40879495979850627, 0.40317650645851943, 0.39754281428255606, 0.3918940962069094, 0.38623056573580644, 0.38055243693333718, 0.3748599244153632, 0.36915324334140731, 0.36343260940651945, 0.35769823883312568, 0.35195034836285416, 0.34618915524834432, 0.34041487724503472, 0.33462773260293199, 0.32882794005836308, 0.32301571882570607, 0.31719128858910622, 0.31135486949417079, 0.30550668213964982, 0.29964694756909749, 0.29377588726251663, 0.28789372312798917, 0.28200067749328667, 0.27609697309746906, 0.27018283308246382, 0.26425848098463345, 0.25832414072632598, 0.25238003660741054, 0.24642639329680122, 0.24046343582396335, 0.23449138957040974, 0.22851048026118126, 0.22252093395631445, 0.21652297704229864, 0.21051683622351761, 0.20450273851368242, 0.19848091122724945, 0.19245158197082995, 0.18641497863458675, 0.1803713293836198, 0.17432086264934399, 0.16826380712085329, 0.16220039173627876, 0.15613084567413366, 0.1500553983446527, 0.14397427938112045, 0.13788771863119115, 0.13179594614820278, 0.12569919218247999, 0.11959768717263308, 0.11349166173684638, 0.10738134666416307, 0.10126697290576155, 0.095148771566225324, 0.089026973894809708, 0.082901811276699419, 0.076773515224264705, 0.070642317368309157, 0.064508449449316344, 0.058372143308689985, 0.052233630879990445, 0.046093144180169916, 0.039950915300801082, 0.033807176399306589, 0.027662159690182372, 0.021516097436222258, 0.01536922193973846, 0.0092217655337806046, 0.0030739605733557966, -0.0030739605733554522, -0.0092217655337804832, -0.015369221939738116, -0.021516097436222133, -0.027662159690182025, -0.033807176399306464, -0.039950915300800735, -0.046093144180169791, -0.052233630879990098, -0.05837214330868986, -0.064508449449316232, -0.07064231736830906, -0.076773515224264371, -0.082901811276699308, -0.089026973894809375, -0.095148771566225213, -0.10126697290576121, -0.10738134666416296, -0.11349166173684605, -0.11959768717263299, -0.12569919218247966, -0.13179594614820267, -0.13788771863119104, -0.14397427938112034, -0.15005539834465259, -0.15613084567413354, -0.16220039173627843, -0.16826380712085318, -0.17432086264934366, -0.18037132938361969, -0.18641497863458642, -0.19245158197082984, -0.19848091122724912, -0.20450273851368231, -0.21051683622351727, -0.21652297704229853, -0.22252093395631434, -0.22851048026118118, -0.23449138957040966, -0.24046343582396323, -0.24642639329680088, -0.25238003660741043, -0.25832414072632565, -0.26425848098463334, -0.27018283308246349, -0.27609697309746895, -0.28200067749328633, -0.28789372312798905, -0.2937758872625163, -0.29964694756909738, -0.30550668213964971, -0.31135486949417068, -0.31719128858910589, -0.32301571882570601, -0.32882794005836274, -0.33462773260293188, -0.34041487724503444, -0.3461891552483442, -0.35195034836285388, -0.35769823883312557, -0.36343260940651911, -0.3691532433414072, -0.37485992441536287, -0.38055243693333707, -0.38623056573580633, -0.39189409620690935, -0.39754281428255578, -0.40317650645851938, -0.408794959798506, -0.41439796194220352, -0.41998530111330723, -0.42555676612752458, -0.43111214640055795, -0.43665123195606392, -0.44217381343358819, -0.44767968209648107, -0.45316862983978584, -0.45864044919810493, -0.46409493335344015, -0.46953187614301223, -0.47495107206704995, -0.48035231629656183, -0.4857354046810729, -0.49110013375634509, -0.4964463007520647, -0.50177370359950857, -0.5070821409391808, -0.51237141212842352, -0.51764131724899998, -0.52289165711465191, -0.52812223327862795, -0.53333284804118419, -0.53852330445705532, -0.5436934063429012, -0.54884295828471885, -0.55397176564523276, -0.55907963457124621, -0.56416637200097308, -0.5692317856713317, -0.57427568412521401, -0.57929787671872079, -0.58429817362836844, -0.5892763858582617, -0.5942323252472399, -0.59916580447598666, -0.60407663707411174, -0.60896463742719653, -0.61382962078381298, -0.61867140326250303, -0.62348980185873337, -0.62828463445180716, -0.6330557198117519, -0.6378028776061665, -0.64252592840703937, -0.64722469369752911, -0.65189899587871247, -0.65654865827629583, -0.66117350514729478, -0.66577336168667522, -0.67034805403396169, -0.67489740927980679, -0.6794212554725293, -0.68391942162461028, -0.68839173771915996, -0.6928380347163392, -0.69725814455975266, -0.70165190018279777, -0.70601913551498163, -0.71035968548819683, -0.71467338604296105, -0.71896007413461638, -0.72321958773949468, -0.72745176586103955, -0.73165644853589207, -0.73583347683993661, -0.73998269289430874, -0.74410393987136036, -0.74819706200059111, -0.75226190457453113, -0.75629831395459302, -0.76030613757687548, -0.76428522395793208, -0.76823542270049594, -0.77215658449916424, -0.77604856114604126, -0.77991120553634119, -0.78374437167394717, -0.78754791467693031, -0.79132169078302472, -0.7950655573550629, -0.79877937288636469, -0.80246299700608903, -0.80611629048453581, -0.80973911523841147, -0.81333133433604599, -0.8168928120025698, -0.82042341362504512, -0.82392300575755417, -0.82739145612624221, -0.83082863363431825, -0.83423440836700946, -0.8376086515964718, -0.84095123578665465, -0.8442620345981231, -0.84754092289283089, -0.85078777673885309, -0.85400247341506696, -0.85718489141579368, -0.86033491045538824, -0.86345241147278773, -0.86653727663601066, -0.86958938934661101, -0.87260863424408419, -0.87559489721022921, -0.87854806537346053, -0.88146802711307481, -0.88435467206346929, -0.88720789111831455, -0.89002757643467667, -0.89281362143709475, -0.89556592082160857, -0.89828437055973898, -0.90096886790241903, -0.90361931138387908, -0.90623560082548038, -0.90881763733950294, -0.91136532333288134, -0.9138785625108955, -0.91635725988080885, -0.91880132175545981, -0.92121065575680139, -0.92358517081939495, -0.9259247771938498, -0.92822938645021758, -0.93049891148133312, -0.93273326650610799, -0.9349323670727715, -0.93709613006206383, -0.93922447369037709, -0.94131731751284708, -0.9433745824263926, -0.94539619067270697, -0.94738206584119544, -0.94933213287186502, -0.95124631805815973, -0.95312454904974775, -0.95496675485525517, -0.95677286584495025, -0.95854281375337413, -0.96027653168192206, -0.96197395410137099, -0.96363501685435693, -0.96525965715780004, -0.9668478136052775, -0.96839942616934394, -0.96991443620380113, -0.97139278644591398, -0.97283442101857565, -0.97423928543241844, -0.97560732658787452, -0.9769384927771817, -0.9782327336863389, -0.97949000039700751, -0.98071024538836005, -0.98189342253887657, -0.98303948712808775, -0.98414839583826574, -0.98522010675606064, -0.98625457937408501, -0.9872517745924454, -0.98821165472021921, -0.98913418347688054, -0.99001932599367015, -0.99086704881491472, -0.99167731989928998, -0.99245010862103311, -0.99318538577109949, -0.99388312355826691, -0.99454329561018584, -0.99516587697437653, -0.99575084411917214, -0.99629817493460782, -0.99680784873325645, -0.99727984625101107, -0.99771414964781235, -0.99811074250832332, -0.99846960984254973, -0.99879073808640628, -0.99907411510222999, -0.99931973017923825, -0.99952757403393411, -0.99969763881045715, -0.99982991808087995, -0.99992440684545181, -0.99998110153278685, -1.0, -1.0};
 
+/* Sine of x, for x in [0, pi], linearly interpolated in HALF_COS_ARRAY.
+   The error is lower than 5e-6 * sin(x), so the relative precision holds
+   down to the lowest frequencies. */
+static MYFLT
+fast_sin(MYFLT x) {
+    int ipart;
+    MYFLT pos, fpart;
+    pos = MYFABS(x - PI * 0.5) * 511.0 / PI;
+    ipart = (int)pos;
+    fpart = pos - ipart;
+    return HALF_COS_ARRAY[ipart] * (1.0 - fpart) + HALF_COS_ARRAY[ipart+1] * fpart;
+}
+
+/* Cosine of x, for x in [0, pi], as 1 - 2 * sin(x/2)^2. The error is lower
+   than 1e-5 * (1 - cos(x)), which keeps the low cutoff frequencies right. */
+static MYFLT
+fast_cos(MYFLT x) {
+    MYFLT s = fast_sin(x * 0.5);
+    return 1.0 - 2.0 * s * s;
+}
+
+/* Coefficients of the filters driven by audio-rate parameters. With a rate
+   of 1 (the default), the coefficients are computed at every sample. With
+   a greater rate, they are computed every `rate` samples, from the
+   parameters of the last sample of the segment and with fast_sin and
+   fast_cos, and linearly interpolated in between. Segments never cross the
+   end of the buffer.
+
+    for (i=0; i<self->bufsize; i++) {
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            Filter_compute_coeffs(self, freq[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
+        ...
+*/
+typedef struct {
+    int rate;
+    int count; /* samples left in the current segment */
+    int fast; /* 1 while the coefficients of a new segment are computed */
+    int primed; /* 0 until the coefficients have been computed once */
+    int num;
+    MYFLT **coeffs; /* coefficients of the filter, updated in place */
+    MYFLT *target;
+    MYFLT *inc;
+} CoeffsRamp;
+
+static void
+CoeffsRamp_alloc(CoeffsRamp *ramp, int num)
+{
+    ramp->count = ramp->fast = ramp->primed = 0;
+    ramp->num = num;
+    ramp->coeffs = (MYFLT **)realloc(ramp->coeffs, num * sizeof(MYFLT *));
+    ramp->target = (MYFLT *)realloc(ramp->target, num * sizeof(MYFLT));
+    ramp->inc = (MYFLT *)realloc(ramp->inc, num * sizeof(MYFLT));
+}
+
+/* Takes the number of coefficients followed by their addresses. */
+static void
+CoeffsRamp_init(CoeffsRamp *ramp, int num, ...)
+{
+    int k;
+    va_list ap;
+    ramp->rate = 1;
+    CoeffsRamp_alloc(ramp, num);
+    va_start(ap, num);
+    for (k=0; k<num; k++)
+        ramp->coeffs[k] = va_arg(ap, MYFLT *);
+    va_end(ap);
+}
+
+static void
+CoeffsRamp_free(CoeffsRamp *ramp)
+{
+    free(ramp->coeffs);
+    free(ramp->target);
+    free(ramp->inc);
+}
+
+/* Ends the current segment. The next one starts directly on its coefficients,
+   the current ones may be stale (or cached by the filter, after a change of
+   processing mode). */
+static void
+CoeffsRamp_reset(CoeffsRamp *ramp)
+{
+    int k;
+    if (ramp->count > 0) {
+        for (k=0; k<ramp->num; k++)
+            *ramp->coeffs[k] = ramp->target[k];
+        ramp->count = 0;
+    }
+    ramp->primed = 0;
+}
+
+static void
+CoeffsRamp_setRate(CoeffsRamp *ramp, int rate)
+{
+    CoeffsRamp_reset(ramp);
+    ramp->rate = rate < 1 ? 1 : rate;
+}
+
+/* Returns 1 if the coefficients must be computed, from the parameters at
+   sample `*j`, and given to CoeffsRamp_start. Otherwise, moves the
+   coefficients one sample along the current segment and returns 0. */
+static int
+CoeffsRamp_next(CoeffsRamp *ramp, int i, int bufsize, int *j)
+{
+    int k;
+    if (ramp->rate == 1) {
+        *j = i;
+        return 1;
+    }
+    if (ramp->count > 0) {
+        ramp->count--;
+        if (ramp->count == 0) {
+            for (k=0; k<ramp->num; k++)
+                *ramp->coeffs[k] = ramp->target[k];
+        }
+        else {
+            for (k=0; k<ramp->num; k++)
+                *ramp->coeffs[k] += ramp->inc[k];
+        }
+        return 0;
+    }
+    *j = i + ramp->rate - 1;
+    if (*j >= bufsize)
+        *j = bufsize - 1;
+    ramp->count = *j - i + 1;
+    /* Current values, the increments are computed by CoeffsRamp_start. */
+    for (k=0; k<ramp->num; k++)
+        ramp->inc[k] = *ramp->coeffs[k];
+    ramp->fast = 1;
+    return 1;
+}
+
+/* Starts a segment towards the coefficients just computed. */
+static void
+CoeffsRamp_start(CoeffsRamp *ramp)
+{
+    int k;
+    MYFLT start;
+    if (ramp->rate == 1)
+        return;
+    ramp->fast = 0;
+    for (k=0; k<ramp->num; k++) {
+        ramp->target[k] = *ramp->coeffs[k];
+        start = ramp->primed ? ramp->inc[k] : ramp->target[k];
+        ramp->inc[k] = (ramp->target[k] - start) / ramp->count;
+        if (ramp->count > 1)
+            *ramp->coeffs[k] = start + ramp->inc[k];
+    }
+    ramp->primed = 1;
+    ramp->count--;
+}
+
+#define SET_COEFF_RATE \
+    if (arg != NULL && PyInt_Check(arg)) \
+        CoeffsRamp_setRate(&self->ramp, PyInt_AsLong(arg)); \
+    Py_INCREF(Py_None); \
+    return Py_None;
+
+
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
@@ -57,6 +219,7 @@ typedef struct {
     MYFLT a0;
     MYFLT a1;
     MYFLT a2;
+    CoeffsRamp ramp;
 } Biquad;
 
 static void
@@ -120,8 +283,14 @@ Biquad_compute_variables(Biquad *self, MYFLT freq, MYFLT q)
         q = 0.1;
 
     self->w0 = TWOPI * freq / self->sr;
-    self->c = MYCOS(self->w0);
-    self->alpha = MYSIN(self->w0) / (2 * q);
+    if (self->ramp.fast) {
+        self->c = fast_cos(self->w0);
+        self->alpha = fast_sin(self->w0) / (2 * q);
+    }
+    else {
+        self->c = MYCOS(self->w0);
+        self->alpha = MYSIN(self->w0) / (2 * q);
+    }
     (*self->coeffs_func_ptr)(self);
 }
 
@@ -149,7 +318,7 @@ Biquad_filters_ii(Biquad *self) {
 static void
 Biquad_filters_ai(Biquad *self) {
     MYFLT val, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -161,7 +330,10 @@ Biquad_filters_ai(Biquad *self) {
     q = PyFloat_AS_DOUBLE(self->q);
 
     for (i=0; i<self->bufsize; i++) {
-        Biquad_compute_variables(self, fr[i], q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            Biquad_compute_variables(self, fr[j], q);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -174,7 +346,7 @@ Biquad_filters_ai(Biquad *self) {
 static void
 Biquad_filters_ia(Biquad *self) {
     MYFLT val, fr;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -186,7 +358,10 @@ Biquad_filters_ia(Biquad *self) {
     MYFLT *q = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        Biquad_compute_variables(self, fr, q[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            Biquad_compute_variables(self, fr, q[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -199,7 +374,7 @@ Biquad_filters_ia(Biquad *self) {
 static void
 Biquad_filters_aa(Biquad *self) {
     MYFLT val;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -211,7 +386,10 @@ Biquad_filters_aa(Biquad *self) {
     MYFLT *q = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        Biquad_compute_variables(self, fr[i], q[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            Biquad_compute_variables(self, fr[j], q[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -237,6 +415,7 @@ Biquad_setProcMode(Biquad *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
     switch (self->filtertype) {
         case 0:
@@ -339,6 +518,7 @@ static void
 Biquad_dealloc(Biquad* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     Biquad_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -350,6 +530,7 @@ Biquad_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Biquad *self;
     self = (Biquad *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 6, &self->b0, &self->b1, &self->b2, &self->a0, &self->a1, &self->a2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -403,6 +584,7 @@ static PyObject * Biquad_setMul(Biquad *self, PyObject *arg) { SET_MUL };
 static PyObject * Biquad_setAdd(Biquad *self, PyObject *arg) { SET_ADD };
 static PyObject * Biquad_setSub(Biquad *self, PyObject *arg) { SET_SUB };
 static PyObject * Biquad_setDiv(Biquad *self, PyObject *arg) { SET_DIV };
+static PyObject * Biquad_setCoeffRate(Biquad *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * Biquad_play(Biquad *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * Biquad_out(Biquad *self, PyObject *args, PyObject *kwds) { OUT };
@@ -530,6 +712,7 @@ static PyMethodDef Biquad_methods[] = {
 	{"setAdd", (PyCFunction)Biquad_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)Biquad_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)Biquad_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)Biquad_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -647,6 +830,7 @@ typedef struct {
     MYFLT a0;
     MYFLT a1;
     MYFLT a2;
+    CoeffsRamp ramp;
 } Biquadx;
 
 static void
@@ -720,8 +904,14 @@ Biquadx_compute_variables(Biquadx *self, MYFLT freq, MYFLT q)
         q = 0.1;
 
     self->w0 = TWOPI * freq / self->sr;
-    self->c = MYCOS(self->w0);
-    self->alpha = MYSIN(self->w0) / (2 * q);
+    if (self->ramp.fast) {
+        self->c = fast_cos(self->w0);
+        self->alpha = fast_sin(self->w0) / (2 * q);
+    }
+    else {
+        self->c = MYCOS(self->w0);
+        self->alpha = MYSIN(self->w0) / (2 * q);
+    }
     (*self->coeffs_func_ptr)(self);
 }
 
@@ -755,7 +945,7 @@ Biquadx_filters_ii(Biquadx *self) {
 static void
 Biquadx_filters_ai(Biquadx *self) {
     MYFLT vin, vout, q;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -770,7 +960,10 @@ Biquadx_filters_ai(Biquadx *self) {
 
     vout = 0.0;
     for (i=0; i<self->bufsize; i++) {
-        Biquadx_compute_variables(self, fr[i], q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+            Biquadx_compute_variables(self, fr[k], q);
+            CoeffsRamp_start(&self->ramp);
+        }
         vin = in[i];
         for (j=0; j<self->stages; j++) {
             vout = ( (self->b0 * vin) + (self->b1 * self->x1[j]) + (self->b2 * self->x2[j]) - (self->a1 * self->y1[j]) - (self->a2 * self->y2[j]) ) / self->a0;
@@ -786,7 +979,7 @@ Biquadx_filters_ai(Biquadx *self) {
 static void
 Biquadx_filters_ia(Biquadx *self) {
     MYFLT vin, vout, fr;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -801,7 +994,10 @@ Biquadx_filters_ia(Biquadx *self) {
 
     vout = 0.0;
     for (i=0; i<self->bufsize; i++) {
-        Biquadx_compute_variables(self, fr, q[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+            Biquadx_compute_variables(self, fr, q[k]);
+            CoeffsRamp_start(&self->ramp);
+        }
         vin = in[i];
         for (j=0; j<self->stages; j++) {
             vout = ( (self->b0 * vin) + (self->b1 * self->x1[j]) + (self->b2 * self->x2[j]) - (self->a1 * self->y1[j]) - (self->a2 * self->y2[j]) ) / self->a0;
@@ -817,7 +1013,7 @@ Biquadx_filters_ia(Biquadx *self) {
 static void
 Biquadx_filters_aa(Biquadx *self) {
     MYFLT vin, vout;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -832,7 +1028,10 @@ Biquadx_filters_aa(Biquadx *self) {
 
     vout = 0.0;
     for (i=0; i<self->bufsize; i++) {
-        Biquadx_compute_variables(self, fr[i], q[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+            Biquadx_compute_variables(self, fr[k], q[k]);
+            CoeffsRamp_start(&self->ramp);
+        }
         vin = in[i];
         for (j=0; j<self->stages; j++) {
             vout = ( (self->b0 * vin) + (self->b1 * self->x1[j]) + (self->b2 * self->x2[j]) - (self->a1 * self->y1[j]) - (self->a2 * self->y2[j]) ) / self->a0;
@@ -861,6 +1060,7 @@ Biquadx_setProcMode(Biquadx *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
     switch (self->filtertype) {
         case 0:
@@ -963,6 +1163,7 @@ static void
 Biquadx_dealloc(Biquadx* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     free(self->x1);
     free(self->x2);
     free(self->y1);
@@ -978,6 +1179,7 @@ Biquadx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Biquadx *self;
     self = (Biquadx *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 6, &self->b0, &self->b1, &self->b2, &self->a0, &self->a1, &self->a2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -1034,6 +1236,7 @@ static PyObject * Biquadx_setMul(Biquadx *self, PyObject *arg) { SET_MUL };
 static PyObject * Biquadx_setAdd(Biquadx *self, PyObject *arg) { SET_ADD };
 static PyObject * Biquadx_setSub(Biquadx *self, PyObject *arg) { SET_SUB };
 static PyObject * Biquadx_setDiv(Biquadx *self, PyObject *arg) { SET_DIV };
+static PyObject * Biquadx_setCoeffRate(Biquadx *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * Biquadx_play(Biquadx *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * Biquadx_out(Biquadx *self, PyObject *args, PyObject *kwds) { OUT };
@@ -1182,6 +1385,7 @@ static PyMethodDef Biquadx_methods[] = {
 	{"setAdd", (PyCFunction)Biquadx_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)Biquadx_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)Biquadx_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)Biquadx_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -1719,6 +1923,7 @@ typedef struct {
     MYFLT a0;
     MYFLT a1;
     MYFLT a2;
+    CoeffsRamp ramp;
 } EQ;
 
 static void
@@ -1774,8 +1979,14 @@ EQ_compute_variables(EQ *self, MYFLT freq, MYFLT q, MYFLT boost)
 
     self->A = MYPOW(10.0, boost/40.0);
     self->w0 = TWOPI * freq / self->sr;
-    self->c = MYCOS(self->w0);
-    self->alpha = MYSIN(self->w0) / (2 * q);
+    if (self->ramp.fast) {
+        self->c = fast_cos(self->w0);
+        self->alpha = fast_sin(self->w0) / (2 * q);
+    }
+    else {
+        self->c = MYCOS(self->w0);
+        self->alpha = MYSIN(self->w0) / (2 * q);
+    }
     (*self->coeffs_func_ptr)(self);
 }
 
@@ -1803,7 +2014,7 @@ EQ_filters_iii(EQ *self) {
 static void
 EQ_filters_aii(EQ *self) {
     MYFLT val, q, boost;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1816,7 +2027,10 @@ EQ_filters_aii(EQ *self) {
     boost = PyFloat_AS_DOUBLE(self->boost);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr[i], q, boost);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr[j], q, boost);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1829,7 +2043,7 @@ EQ_filters_aii(EQ *self) {
 static void
 EQ_filters_iai(EQ *self) {
     MYFLT val, fr, boost;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1842,7 +2056,10 @@ EQ_filters_iai(EQ *self) {
     boost = PyFloat_AS_DOUBLE(self->boost);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr, q[i], boost);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr, q[j], boost);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1855,7 +2072,7 @@ EQ_filters_iai(EQ *self) {
 static void
 EQ_filters_aai(EQ *self) {
     MYFLT val, boost;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1868,7 +2085,10 @@ EQ_filters_aai(EQ *self) {
     boost = PyFloat_AS_DOUBLE(self->boost);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr[i], q[i], boost);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr[j], q[j], boost);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1881,7 +2101,7 @@ EQ_filters_aai(EQ *self) {
 static void
 EQ_filters_iia(EQ *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1894,7 +2114,10 @@ EQ_filters_iia(EQ *self) {
     MYFLT *boost = Stream_getData((Stream *)self->boost_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr, q, boost[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr, q, boost[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1907,7 +2130,7 @@ EQ_filters_iia(EQ *self) {
 static void
 EQ_filters_aia(EQ *self) {
     MYFLT val, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1920,7 +2143,10 @@ EQ_filters_aia(EQ *self) {
     MYFLT *boost = Stream_getData((Stream *)self->boost_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr[i], q, boost[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr[j], q, boost[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1933,7 +2159,7 @@ EQ_filters_aia(EQ *self) {
 static void
 EQ_filters_iaa(EQ *self) {
     MYFLT val, fr;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1946,7 +2172,10 @@ EQ_filters_iaa(EQ *self) {
     MYFLT *boost = Stream_getData((Stream *)self->boost_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr, q[i], boost[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr, q[j], boost[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1959,7 +2188,7 @@ EQ_filters_iaa(EQ *self) {
 static void
 EQ_filters_aaa(EQ *self) {
     MYFLT val;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->init == 1) {
@@ -1972,7 +2201,10 @@ EQ_filters_aaa(EQ *self) {
     MYFLT *boost = Stream_getData((Stream *)self->boost_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        EQ_compute_variables(self, fr[i], q[i], boost[i]);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            EQ_compute_variables(self, fr[j], q[j], boost[j]);
+            CoeffsRamp_start(&self->ramp);
+        }
         val = ( (self->b0 * in[i]) + (self->b1 * self->x1) + (self->b2 * self->x2) - (self->a1 * self->y1) - (self->a2 * self->y2) ) / self->a0;
         self->y2 = self->y1;
         self->y1 = val;
@@ -1998,6 +2230,7 @@ EQ_setProcMode(EQ *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10 + self->modebuffer[4] * 100;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
     switch (self->filtertype) {
         case 0:
@@ -2110,6 +2343,7 @@ static void
 EQ_dealloc(EQ* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     EQ_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -2121,6 +2355,7 @@ EQ_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *boosttmp=NULL, *multmp=NULL, *addtmp=NULL;
     EQ *self;
     self = (EQ *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 6, &self->b0, &self->b1, &self->b2, &self->a0, &self->a1, &self->a2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -2180,6 +2415,7 @@ static PyObject * EQ_setMul(EQ *self, PyObject *arg) { SET_MUL };
 static PyObject * EQ_setAdd(EQ *self, PyObject *arg) { SET_ADD };
 static PyObject * EQ_setSub(EQ *self, PyObject *arg) { SET_SUB };
 static PyObject * EQ_setDiv(EQ *self, PyObject *arg) { SET_DIV };
+static PyObject * EQ_setCoeffRate(EQ *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * EQ_play(EQ *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * EQ_out(EQ *self, PyObject *args, PyObject *kwds) { OUT };
@@ -2343,6 +2579,7 @@ static PyMethodDef EQ_methods[] = {
 {"setAdd", (PyCFunction)EQ_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)EQ_setSub, METH_O, "Sets inverse add factor."},
 {"setDiv", (PyCFunction)EQ_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)EQ_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
 {NULL}  /* Sentinel */
 };
 
@@ -4950,6 +5187,7 @@ typedef struct {
     // coefficients
     MYFLT *alpha;
     MYFLT *beta;
+    CoeffsRamp ramp;
 } Phaser;
 
 static MYFLT
@@ -5026,7 +5264,7 @@ Phaser_filters_iii(Phaser *self) {
 static void
 Phaser_filters_aii(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT spread = PyFloat_AS_DOUBLE(self->spread);
@@ -5035,7 +5273,10 @@ Phaser_filters_aii(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread, q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread, q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5049,7 +5290,10 @@ Phaser_filters_aii(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread, q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread, q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5065,7 +5309,7 @@ Phaser_filters_aii(Phaser *self) {
 static void
 Phaser_filters_iai(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT freq = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *spread = Stream_getData((Stream *)self->spread_stream);
@@ -5074,7 +5318,10 @@ Phaser_filters_iai(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread[i], q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread[k], q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5088,7 +5335,10 @@ Phaser_filters_iai(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread[i], q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread[k], q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5104,7 +5354,7 @@ Phaser_filters_iai(Phaser *self) {
 static void
 Phaser_filters_aai(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT *spread = Stream_getData((Stream *)self->spread_stream);
@@ -5113,7 +5363,10 @@ Phaser_filters_aai(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread[i], q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread[k], q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5127,7 +5380,10 @@ Phaser_filters_aai(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread[i], q);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread[k], q);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5143,7 +5399,7 @@ Phaser_filters_aai(Phaser *self) {
 static void
 Phaser_filters_iia(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT freq = PyFloat_AS_DOUBLE(self->freq);
     MYFLT spread = PyFloat_AS_DOUBLE(self->spread);
@@ -5152,7 +5408,10 @@ Phaser_filters_iia(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread, q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread, q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5166,7 +5425,10 @@ Phaser_filters_iia(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread, q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread, q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5182,7 +5444,7 @@ Phaser_filters_iia(Phaser *self) {
 static void
 Phaser_filters_aia(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT spread = PyFloat_AS_DOUBLE(self->spread);
@@ -5191,7 +5453,10 @@ Phaser_filters_aia(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread, q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread, q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5205,7 +5470,10 @@ Phaser_filters_aia(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread, q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread, q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5221,7 +5489,7 @@ Phaser_filters_aia(Phaser *self) {
 static void
 Phaser_filters_iaa(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT freq = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *spread = Stream_getData((Stream *)self->spread_stream);
@@ -5230,7 +5498,10 @@ Phaser_filters_iaa(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread[i], q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread[k], q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5244,7 +5515,10 @@ Phaser_filters_iaa(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq, spread[i], q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq, spread[k], q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5260,7 +5534,7 @@ Phaser_filters_iaa(Phaser *self) {
 static void
 Phaser_filters_aaa(Phaser *self) {
     MYFLT val;
-    int i, j;
+    int i, j, k;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT *spread = Stream_getData((Stream *)self->spread_stream);
@@ -5269,7 +5543,10 @@ Phaser_filters_aaa(Phaser *self) {
     if (self->modebuffer[5] == 0) {
         MYFLT feed = Phaser_clip(PyFloat_AS_DOUBLE(self->feedback));
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread[i], q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread[k], q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * feed;
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5283,7 +5560,10 @@ Phaser_filters_aaa(Phaser *self) {
     else {
         MYFLT *feed = Stream_getData((Stream *)self->feedback_stream);
         for (i=0; i<self->bufsize; i++) {
-            Phaser_compute_variables(self, freq[i], spread[i], q[i]);
+            if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &k)) {
+                Phaser_compute_variables(self, freq[k], spread[k], q[k]);
+                CoeffsRamp_start(&self->ramp);
+            }
             self->tmp = in[i] + self->tmp * Phaser_clip(feed[i]);
             for (j=0; j<self->stages; j++) {
                 val = self->tmp + (self->y1[j] * -self->beta[j]) + (self->y2[j] * -self->alpha[j]);
@@ -5312,6 +5592,7 @@ Phaser_setProcMode(Phaser *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10 + self->modebuffer[4] * 100;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -5416,6 +5697,7 @@ static void
 Phaser_dealloc(Phaser* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     free(self->y1);
     free(self->y2);
     free(self->alpha);
@@ -5467,6 +5749,13 @@ Phaser_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->alpha = (MYFLT *)realloc(self->alpha, self->stages * sizeof(MYFLT));
     self->beta = (MYFLT *)realloc(self->beta, self->stages * sizeof(MYFLT));
 
+    self->ramp.rate = 1;
+    CoeffsRamp_alloc(&self->ramp, self->stages * 2);
+    for (i=0; i<self->stages; i++) {
+        self->alpha[i] = self->beta[i] = 0.0;
+        self->ramp.coeffs[i*2] = &self->alpha[i];
+        self->ramp.coeffs[i*2+1] = &self->beta[i];
+    }
 
     if (freqtmp) {
         PyObject_CallMethod((PyObject *)self, "setFreq", "O", freqtmp);
@@ -5509,6 +5798,7 @@ static PyObject * Phaser_setMul(Phaser *self, PyObject *arg) { SET_MUL };
 static PyObject * Phaser_setAdd(Phaser *self, PyObject *arg) { SET_ADD };
 static PyObject * Phaser_setSub(Phaser *self, PyObject *arg) { SET_SUB };
 static PyObject * Phaser_setDiv(Phaser *self, PyObject *arg) { SET_DIV };
+static PyObject * Phaser_setCoeffRate(Phaser *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * Phaser_play(Phaser *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * Phaser_out(Phaser *self, PyObject *args, PyObject *kwds) { OUT };
@@ -5684,6 +5974,7 @@ static PyMethodDef Phaser_methods[] = {
     {"setAdd", (PyCFunction)Phaser_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)Phaser_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)Phaser_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)Phaser_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -7063,6 +7354,7 @@ typedef struct {
     MYFLT y4;
     // variables
     MYFLT w;
+    CoeffsRamp ramp;
 } SVF;
 
 static void
@@ -7114,7 +7406,7 @@ SVF_filters_iii(SVF *self) {
 
 static void
 SVF_filters_aii(SVF *self) {
-    int i;
+    int i, j;
     MYFLT val, freq, q, type, q1, low, high, band, lowgain, highgain, bandgain;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
@@ -7134,15 +7426,21 @@ SVF_filters_aii(SVF *self) {
     highgain = (type >= 0.5) ? (type - 0.5) : 0.0;
     bandgain = (type <= 0.5) ? type : (1.0 - type);
     for (i=0; i<self->bufsize; i++) {
-        freq = fr[i];
-        if (freq < 0.1)
-            freq = 0.1;
-        else if (freq > self->srOverSix)
-            freq = self->srOverSix;
-
-        if (freq != self->last_freq) {
-            self->last_freq = freq;
-            self->w = 2.0 * MYSIN(freq * self->piOverSr);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            freq = fr[j];
+            if (freq < 0.1)
+                freq = 0.1;
+            else if (freq > self->srOverSix)
+                freq = self->srOverSix;
+
+            if (freq != self->last_freq) {
+                self->last_freq = freq;
+                if (self->ramp.fast)
+                    self->w = 2.0 * fast_sin(freq * self->piOverSr);
+                else
+                    self->w = 2.0 * MYSIN(freq * self->piOverSr);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         low = self->y2 + self->w * self->y1;
         high = in[i] - low - q1 * self->y1;
@@ -7208,7 +7506,7 @@ SVF_filters_iai(SVF *self) {
 
 static void
 SVF_filters_aai(SVF *self) {
-    int i;
+    int i, j;
     MYFLT val, freq, q, type, q1, low, high, band, lowgain, highgain, bandgain;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
@@ -7224,16 +7522,22 @@ SVF_filters_aai(SVF *self) {
     highgain = (type >= 0.5) ? (type - 0.5) : 0.0;
     bandgain = (type <= 0.5) ? type : (1.0 - type);
     for (i=0; i<self->bufsize; i++) {
-        freq = fr[i];
         q = qst[i];
-        if (freq < 0.1)
-            freq = 0.1;
-        else if (freq > self->srOverSix)
-            freq = self->srOverSix;
-
-        if (freq != self->last_freq) {
-            self->last_freq = freq;
-            self->w = 2.0 * MYSIN(freq * self->piOverSr);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            freq = fr[j];
+            if (freq < 0.1)
+                freq = 0.1;
+            else if (freq > self->srOverSix)
+                freq = self->srOverSix;
+
+            if (freq != self->last_freq) {
+                self->last_freq = freq;
+                if (self->ramp.fast)
+                    self->w = 2.0 * fast_sin(freq * self->piOverSr);
+                else
+                    self->w = 2.0 * MYSIN(freq * self->piOverSr);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         if (q < 0.5)
             q = 0.5;
@@ -7302,7 +7606,7 @@ SVF_filters_iia(SVF *self) {
 
 static void
 SVF_filters_aia(SVF *self) {
-    int i;
+    int i, j;
     MYFLT val, freq, q, type, q1, low, high, band, lowgain, highgain, bandgain;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
@@ -7314,16 +7618,22 @@ SVF_filters_aia(SVF *self) {
     q1 = 1.0 / q;
 
     for (i=0; i<self->bufsize; i++) {
-        freq = fr[i];
         type = tp[i];
-        if (freq < 0.1)
-            freq = 0.1;
-        else if (freq > self->srOverSix)
-            freq = self->srOverSix;
-
-        if (freq != self->last_freq) {
-            self->last_freq = freq;
-            self->w = 2.0 * MYSIN(freq * self->piOverSr);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            freq = fr[j];
+            if (freq < 0.1)
+                freq = 0.1;
+            else if (freq > self->srOverSix)
+                freq = self->srOverSix;
+
+            if (freq != self->last_freq) {
+                self->last_freq = freq;
+                if (self->ramp.fast)
+                    self->w = 2.0 * fast_sin(freq * self->piOverSr);
+                else
+                    self->w = 2.0 * MYSIN(freq * self->piOverSr);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         if (type < 0.0)
             type = 0.0;
@@ -7396,7 +7706,7 @@ SVF_filters_iaa(SVF *self) {
 
 static void
 SVF_filters_aaa(SVF *self) {
-    int i;
+    int i, j;
     MYFLT val, freq, q, type, q1, low, high, band, lowgain, highgain, bandgain;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
@@ -7404,17 +7714,23 @@ SVF_filters_aaa(SVF *self) {
     MYFLT *tp = Stream_getData((Stream *)self->type_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        freq = fr[i];
         q = qst[i];
         type = tp[i];
-        if (freq < 0.1)
-            freq = 0.1;
-        else if (freq > self->srOverSix)
-            freq = self->srOverSix;
-
-        if (freq != self->last_freq) {
-            self->last_freq = freq;
-            self->w = 2.0 * MYSIN(freq * self->piOverSr);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            freq = fr[j];
+            if (freq < 0.1)
+                freq = 0.1;
+            else if (freq > self->srOverSix)
+                freq = self->srOverSix;
+
+            if (freq != self->last_freq) {
+                self->last_freq = freq;
+                if (self->ramp.fast)
+                    self->w = 2.0 * fast_sin(freq * self->piOverSr);
+                else
+                    self->w = 2.0 * MYSIN(freq * self->piOverSr);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         if (q < 0.5)
             q = 0.5;
@@ -7457,6 +7773,7 @@ SVF_setProcMode(SVF *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10 + self->modebuffer[4] * 100;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -7556,6 +7873,7 @@ static void
 SVF_dealloc(SVF* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     SVF_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -7567,6 +7885,7 @@ SVF_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *typetmp=NULL, *multmp=NULL, *addtmp=NULL;
     SVF *self;
     self = (SVF *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 1, &self->w);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -7627,6 +7946,7 @@ static PyObject * SVF_setMul(SVF *self, PyObject *arg) { SET_MUL };
 static PyObject * SVF_setAdd(SVF *self, PyObject *arg) { SET_ADD };
 static PyObject * SVF_setSub(SVF *self, PyObject *arg) { SET_SUB };
 static PyObject * SVF_setDiv(SVF *self, PyObject *arg) { SET_DIV };
+static PyObject * SVF_setCoeffRate(SVF *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * SVF_play(SVF *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * SVF_out(SVF *self, PyObject *args, PyObject *kwds) { OUT };
@@ -7768,6 +8088,7 @@ static PyMethodDef SVF_methods[] = {
 	{"setAdd", (PyCFunction)SVF_setAdd, METH_O, "Sets add factor."},
     {"setSub", (PyCFunction)SVF_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)SVF_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)SVF_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -8223,6 +8544,7 @@ typedef struct {
     MYFLT b1;
     MYFLT b2;
     MYFLT a;
+    CoeffsRamp ramp;
 } Reson;
 
 static void
@@ -8240,7 +8562,10 @@ Reson_compute_coeffs(Reson *self, MYFLT freq, MYFLT q)
     bw = freq / q;
 
     self->b2 = MYEXP(-self->twopiOverSr * bw);
-    self->b1 = (-4.0 * self->b2) / (1.0 + self->b2) * MYCOS(freq * self->twopiOverSr);
+    if (self->ramp.fast)
+        self->b1 = (-4.0 * self->b2) / (1.0 + self->b2) * fast_cos(freq * self->twopiOverSr);
+    else
+        self->b1 = (-4.0 * self->b2) / (1.0 + self->b2) * MYCOS(freq * self->twopiOverSr);
     self->a = 1.0 - MYSQRT(self->b2);
 }
 
@@ -8270,17 +8595,20 @@ Reson_filters_ii(Reson *self) {
 static void
 Reson_filters_ai(Reson *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     q = PyFloat_AS_DOUBLE(self->q);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            Reson_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                Reson_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = (self->a * in[i]) - (self->a * self->x2) - (self->b1 * self->y1) - (self->b2 * self->y2);
         self->y2 = self->y1;
@@ -8293,17 +8621,20 @@ Reson_filters_ai(Reson *self) {
 static void
 Reson_filters_ia(Reson *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     fr = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            Reson_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                Reson_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = (self->a * in[i]) - (self->a * self->x2) - (self->b1 * self->y1) - (self->b2 * self->y2);
         self->y2 = self->y1;
@@ -8316,18 +8647,21 @@ Reson_filters_ia(Reson *self) {
 static void
 Reson_filters_aa(Reson *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            Reson_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                Reson_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = (self->a * in[i]) - (self->a * self->x2) - (self->b1 * self->y1) - (self->b2 * self->y2);
         self->y2 = self->y1;
@@ -8353,6 +8687,7 @@ Reson_setProcMode(Reson *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -8436,6 +8771,7 @@ static void
 Reson_dealloc(Reson* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     Reson_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -8447,6 +8783,7 @@ Reson_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Reson *self;
     self = (Reson *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 3, &self->b1, &self->b2, &self->a);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -8502,6 +8839,7 @@ static PyObject * Reson_setMul(Reson *self, PyObject *arg) { SET_MUL };
 static PyObject * Reson_setAdd(Reson *self, PyObject *arg) { SET_ADD };
 static PyObject * Reson_setSub(Reson *self, PyObject *arg) { SET_SUB };
 static PyObject * Reson_setDiv(Reson *self, PyObject *arg) { SET_DIV };
+static PyObject * Reson_setCoeffRate(Reson *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * Reson_play(Reson *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * Reson_out(Reson *self, PyObject *args, PyObject *kwds) { OUT };
@@ -8607,6 +8945,7 @@ static PyMethodDef Reson_methods[] = {
 	{"setAdd", (PyCFunction)Reson_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)Reson_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)Reson_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)Reson_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -9273,6 +9612,7 @@ typedef struct {
     MYFLT a2;
     MYFLT b1;
     MYFLT b2;
+    CoeffsRamp ramp;
 } ButLP;
 
 static void
@@ -9308,24 +9648,30 @@ ButLP_filters_i(ButLP *self) {
 static void
 ButLP_filters_a(ButLP *self) {
     MYFLT val, fr, c, c2;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        if (fr != self->lastFreq) {
-            if (fr <= 1.0)
-                fr = 1.0;
-            else if (fr >= self->nyquist)
-                fr = self->nyquist;
-            self->lastFreq = fr;
-            c = 1.0 / MYTAN(self->piOnSr * fr);
-            c2 = c * c;
-            self->a0 = self->a2 = 1.0 / (1.0 + self->sqrt2 * c + c2);
-            self->a1 = 2.0 * self->a0;
-            self->b1 = self->a1 * (1.0 - c2);
-            self->b2 = self->a0 * (1.0 - self->sqrt2 * c + c2);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            if (fr != self->lastFreq) {
+                if (fr <= 1.0)
+                    fr = 1.0;
+                else if (fr >= self->nyquist)
+                    fr = self->nyquist;
+                self->lastFreq = fr;
+                if (self->ramp.fast)
+                    c = fast_cos(self->piOnSr * fr) / fast_sin(self->piOnSr * fr);
+                else
+                    c = 1.0 / MYTAN(self->piOnSr * fr);
+                c2 = c * c;
+                self->a0 = self->a2 = 1.0 / (1.0 + self->sqrt2 * c + c2);
+                self->a1 = 2.0 * self->a0;
+                self->b1 = self->a1 * (1.0 - c2);
+                self->b2 = self->a0 * (1.0 - self->sqrt2 * c + c2);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a1 * self->x1 + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -9351,6 +9697,7 @@ ButLP_setProcMode(ButLP *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2];
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -9424,6 +9771,7 @@ static void
 ButLP_dealloc(ButLP* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     ButLP_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -9435,6 +9783,7 @@ ButLP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButLP *self;
     self = (ButLP *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 5, &self->a0, &self->a1, &self->a2, &self->b1, &self->b2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->lastFreq = -1.0;
@@ -9484,6 +9833,7 @@ static PyObject * ButLP_setMul(ButLP *self, PyObject *arg) { SET_MUL };
 static PyObject * ButLP_setAdd(ButLP *self, PyObject *arg) { SET_ADD };
 static PyObject * ButLP_setSub(ButLP *self, PyObject *arg) { SET_SUB };
 static PyObject * ButLP_setDiv(ButLP *self, PyObject *arg) { SET_DIV };
+static PyObject * ButLP_setCoeffRate(ButLP *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * ButLP_play(ButLP *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * ButLP_out(ButLP *self, PyObject *args, PyObject *kwds) { OUT };
@@ -9553,6 +9903,7 @@ static PyMethodDef ButLP_methods[] = {
 {"setAdd", (PyCFunction)ButLP_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)ButLP_setSub, METH_O, "Sets inverse add factor."},
 {"setDiv", (PyCFunction)ButLP_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)ButLP_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
 {NULL}  /* Sentinel */
 };
 
@@ -9665,6 +10016,7 @@ typedef struct {
     MYFLT a2;
     MYFLT b1;
     MYFLT b2;
+    CoeffsRamp ramp;
 } ButHP;
 
 static void
@@ -9700,24 +10052,30 @@ ButHP_filters_i(ButHP *self) {
 static void
 ButHP_filters_a(ButHP *self) {
     MYFLT val, fr, c, c2;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        if (fr != self->lastFreq) {
-            if (fr <= 1.0)
-                fr = 1.0;
-            else if (fr >= self->nyquist)
-                fr = self->nyquist;
-            self->lastFreq = fr;
-            c = MYTAN(self->piOnSr * fr);
-            c2 = c * c;
-            self->a0 = self->a2 = 1.0 / (1.0 + self->sqrt2 * c + c2);
-            self->a1 = -2.0 * self->a0;
-            self->b1 = 2.0 * self->a0 * (c2 - 1.0);
-            self->b2 = self->a0 * (1.0 - self->sqrt2 * c + c2);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            if (fr != self->lastFreq) {
+                if (fr <= 1.0)
+                    fr = 1.0;
+                else if (fr >= self->nyquist)
+                    fr = self->nyquist;
+                self->lastFreq = fr;
+                if (self->ramp.fast)
+                    c = fast_sin(self->piOnSr * fr) / fast_cos(self->piOnSr * fr);
+                else
+                    c = MYTAN(self->piOnSr * fr);
+                c2 = c * c;
+                self->a0 = self->a2 = 1.0 / (1.0 + self->sqrt2 * c + c2);
+                self->a1 = -2.0 * self->a0;
+                self->b1 = 2.0 * self->a0 * (c2 - 1.0);
+                self->b2 = self->a0 * (1.0 - self->sqrt2 * c + c2);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a1 * self->x1 + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -9743,6 +10101,7 @@ ButHP_setProcMode(ButHP *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2];
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -9816,6 +10175,7 @@ static void
 ButHP_dealloc(ButHP* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     ButHP_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -9827,6 +10187,7 @@ ButHP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButHP *self;
     self = (ButHP *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 5, &self->a0, &self->a1, &self->a2, &self->b1, &self->b2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->lastFreq = -1.0;
@@ -9876,6 +10237,7 @@ static PyObject * ButHP_setMul(ButHP *self, PyObject *arg) { SET_MUL };
 static PyObject * ButHP_setAdd(ButHP *self, PyObject *arg) { SET_ADD };
 static PyObject * ButHP_setSub(ButHP *self, PyObject *arg) { SET_SUB };
 static PyObject * ButHP_setDiv(ButHP *self, PyObject *arg) { SET_DIV };
+static PyObject * ButHP_setCoeffRate(ButHP *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * ButHP_play(ButHP *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * ButHP_out(ButHP *self, PyObject *args, PyObject *kwds) { OUT };
@@ -9945,6 +10307,7 @@ static PyMethodDef ButHP_methods[] = {
 {"setAdd", (PyCFunction)ButHP_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)ButHP_setSub, METH_O, "Sets inverse add factor."},
 {"setDiv", (PyCFunction)ButHP_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)ButHP_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
 {NULL}  /* Sentinel */
 };
 
@@ -10058,6 +10421,7 @@ typedef struct {
     MYFLT a2;
     MYFLT b1;
     MYFLT b2;
+    CoeffsRamp ramp;
 } ButBP;
 
 static void
@@ -10073,8 +10437,14 @@ ButBP_compute_coeffs(ButBP *self, MYFLT freq, MYFLT q)
         q = 1.0;
 
     bw = freq / q;
-    c = 1.0 / MYTAN(self->piOnSr * bw);
-    d = 2.0 * MYCOS(2.0 * self->piOnSr * freq);
+    if (self->ramp.fast) {
+        c = fast_cos(self->piOnSr * bw) / fast_sin(self->piOnSr * bw);
+        d = 2.0 * fast_cos(2.0 * self->piOnSr * freq);
+    }
+    else {
+        c = 1.0 / MYTAN(self->piOnSr * bw);
+        d = 2.0 * MYCOS(2.0 * self->piOnSr * freq);
+    }
 
     self->a0 = 1.0 / (1.0 + c);
     self->a2 = -self->a0;
@@ -10108,17 +10478,20 @@ ButBP_filters_ii(ButBP *self) {
 static void
 ButBP_filters_ai(ButBP *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     q = PyFloat_AS_DOUBLE(self->q);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBP_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBP_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10131,17 +10504,20 @@ ButBP_filters_ai(ButBP *self) {
 static void
 ButBP_filters_ia(ButBP *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     fr = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBP_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBP_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10154,18 +10530,21 @@ ButBP_filters_ia(ButBP *self) {
 static void
 ButBP_filters_aa(ButBP *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBP_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBP_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10191,6 +10570,7 @@ ButBP_setProcMode(ButBP *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -10274,6 +10654,7 @@ static void
 ButBP_dealloc(ButBP* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     ButBP_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -10285,6 +10666,7 @@ ButBP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButBP *self;
     self = (ButBP *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 4, &self->a0, &self->a2, &self->b1, &self->b2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -10340,6 +10722,7 @@ static PyObject * ButBP_setMul(ButBP *self, PyObject *arg) { SET_MUL };
 static PyObject * ButBP_setAdd(ButBP *self, PyObject *arg) { SET_ADD };
 static PyObject * ButBP_setSub(ButBP *self, PyObject *arg) { SET_SUB };
 static PyObject * ButBP_setDiv(ButBP *self, PyObject *arg) { SET_DIV };
+static PyObject * ButBP_setCoeffRate(ButBP *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * ButBP_play(ButBP *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * ButBP_out(ButBP *self, PyObject *args, PyObject *kwds) { OUT };
@@ -10445,6 +10828,7 @@ static PyMethodDef ButBP_methods[] = {
 	{"setAdd", (PyCFunction)ButBP_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)ButBP_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)ButBP_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)ButBP_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -10559,6 +10943,7 @@ typedef struct {
     MYFLT a2;
     MYFLT b1;
     MYFLT b2;
+    CoeffsRamp ramp;
 } ButBR;
 
 static void
@@ -10574,8 +10959,14 @@ ButBR_compute_coeffs(ButBR *self, MYFLT freq, MYFLT q)
         q = 1.0;
 
     bw = freq / q;
-    c = MYTAN(self->piOnSr * bw);
-    d = 2.0 * MYCOS(2.0 * self->piOnSr * freq);
+    if (self->ramp.fast) {
+        c = fast_sin(self->piOnSr * bw) / fast_cos(self->piOnSr * bw);
+        d = 2.0 * fast_cos(2.0 * self->piOnSr * freq);
+    }
+    else {
+        c = MYTAN(self->piOnSr * bw);
+        d = 2.0 * MYCOS(2.0 * self->piOnSr * freq);
+    }
 
     self->a0 = self->a2 = 1.0 / (1.0 + c);
     self->a1 = self->b1 = -self->a0 * d;
@@ -10608,17 +10999,20 @@ ButBR_filters_ii(ButBR *self) {
 static void
 ButBR_filters_ai(ButBR *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     q = PyFloat_AS_DOUBLE(self->q);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBR_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBR_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a1 * self->x1 + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10631,17 +11025,20 @@ ButBR_filters_ai(ButBR *self) {
 static void
 ButBR_filters_ia(ButBR *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     fr = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBR_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBR_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a1 * self->x1 + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10654,18 +11051,21 @@ ButBR_filters_ia(ButBR *self) {
 static void
 ButBR_filters_aa(ButBR *self) {
     MYFLT val, fr, q;
-    int i;
+    int i, j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *freq = Stream_getData((Stream *)self->freq_stream);
     MYFLT *qst = Stream_getData((Stream *)self->q_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        fr = freq[i];
-        q = qst[i];
-        if (fr != self->last_freq || q != self->last_q) {
-            self->last_freq = fr;
-            self->last_q = q;
-            ButBR_compute_coeffs(self, fr, q);
+        if (CoeffsRamp_next(&self->ramp, i, self->bufsize, &j)) {
+            fr = freq[j];
+            q = qst[j];
+            if (fr != self->last_freq || q != self->last_q) {
+                self->last_freq = fr;
+                self->last_q = q;
+                ButBR_compute_coeffs(self, fr, q);
+            }
+            CoeffsRamp_start(&self->ramp);
         }
         val = self->a0 * in[i] + self->a1 * self->x1 + self->a2 * self->x2 - self->b1 * self->y1 - self->b2 * self->y2;
         self->x2 = self->x1;
@@ -10691,6 +11091,7 @@ ButBR_setProcMode(ButBR *self)
     int procmode, muladdmode;
     procmode = self->modebuffer[2] + self->modebuffer[3] * 10;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+    CoeffsRamp_reset(&self->ramp);
 
 	switch (procmode) {
         case 0:
@@ -10774,6 +11175,7 @@ static void
 ButBR_dealloc(ButBR* self)
 {
     pyo_DEALLOC
+    CoeffsRamp_free(&self->ramp);
     ButBR_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -10785,6 +11187,7 @@ ButBR_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButBR *self;
     self = (ButBR *)type->tp_alloc(type, 0);
+    CoeffsRamp_init(&self->ramp, 5, &self->a0, &self->a1, &self->a2, &self->b1, &self->b2);
 
     self->freq = PyFloat_FromDouble(1000);
     self->q = PyFloat_FromDouble(1);
@@ -10840,6 +11243,7 @@ static PyObject * ButBR_setMul(ButBR *self, PyObject *arg) { SET_MUL };
 static PyObject * ButBR_setAdd(ButBR *self, PyObject *arg) { SET_ADD };
 static PyObject * ButBR_setSub(ButBR *self, PyObject *arg) { SET_SUB };
 static PyObject * ButBR_setDiv(ButBR *self, PyObject *arg) { SET_DIV };
+static PyObject * ButBR_setCoeffRate(ButBR *self, PyObject *arg) { SET_COEFF_RATE };
 
 static PyObject * ButBR_play(ButBR *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * ButBR_out(ButBR *self, PyObject *args, PyObject *kwds) { OUT };
@@ -10945,6 +11349,7 @@ static PyMethodDef ButBR_methods[] = {
 	{"setAdd", (PyCFunction)ButBR_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)ButBR_setSub, METH_O, "Sets inverse add factor."},
     {"setDiv", (PyCFunction)ButBR_setDiv, METH_O, "Sets inverse mul factor."},
+    {"setCoeffRate", (PyCFunction)ButBR_setCoeffRate, METH_O, "Sets the number of samples between two computations of the coefficients."},
     {NULL}  /* Sentinel */
 };
 
@@ -1323,7 +1323,7 @@ Looper_transform_i(Looper *self) {
                             self->pointerPos[j] = 0.0;
                         else if (self->pointerPos[j] >= self->loopend[j]) {
                             self->active[j] = 0;
-                            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                            Stream_requestStop(self->stream);
                         }
                         break;
                     case 1:
@@ -1494,7 +1494,7 @@ Looper_transform_a(Looper *self) {
                             self->pointerPos[j] = 0.0;
                         else if (self->pointerPos[j] >= self->loopend[j]) {
                             self->active[j] = 0;
-                            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                            Stream_requestStop(self->stream);
                         }
                         break;
                     case 1:
@@ -2206,6 +2206,58 @@ PyTypeObject LooperType = {
     Looper_new,                 /* tp_new */
 };
 
+/* Grain slots of Granule and MainParticle. Starting a grain pops a slot from the
+   free stack and pushes it on the active list, finished grains go back to the free
+   stack, so neither the allocation nor the rendering visit the unused slots. The
+   grains are rendered one at a time, over the whole block, from the sample where
+   they start (0 for a grain started in a previous block). */
+typedef struct {
+    int *active; /* slots of the grains playing, in no particular order */
+    int *free; /* stack of the unused slots */
+    int *start; /* first sample of the grain in the current block */
+    int nactive;
+    int nfree;
+} GrainPool;
+
+static void
+GrainPool_init(GrainPool *pool, int size) {
+    int i;
+    pool->active = (int *)realloc(pool->active, size * sizeof(int));
+    pool->free = (int *)realloc(pool->free, size * sizeof(int));
+    pool->start = (int *)realloc(pool->start, size * sizeof(int));
+    for (i=0; i<size; i++) {
+        pool->free[i] = size - 1 - i;
+        pool->active[i] = pool->start[i] = 0;
+    }
+    pool->nactive = 0;
+    pool->nfree = size;
+}
+
+static void
+GrainPool_dealloc(GrainPool *pool) {
+    free(pool->active);
+    free(pool->free);
+    free(pool->start);
+}
+
+/* Returns a slot for a grain starting at sample `offset` of the block, -1 if none is left. */
+static int
+GrainPool_alloc(GrainPool *pool, int offset) {
+    int j;
+    if (pool->nfree == 0)
+        return -1;
+    j = pool->free[--pool->nfree];
+    pool->active[pool->nactive++] = j;
+    pool->start[j] = offset;
+    return j;
+}
+
+/* Releases the last allocated slot. */
+static void
+GrainPool_cancel(GrainPool *pool) {
+    pool->free[pool->nfree++] = pool->active[--pool->nactive];
+}
+
 static const MYFLT Granule_MAX_GRAINS = 4096;
 typedef struct {
     pyo_audio_HEAD
@@ -2223,8 +2275,7 @@ typedef struct {
     MYFLT *glen;
     MYFLT *inc;
     MYFLT *phase;
-    int *flags;
-    int num;
+    GrainPool pool;
     int sync;
     double timer;
     MYFLT oneOnSr;
@@ -2232,10 +2283,46 @@ typedef struct {
     int modebuffer[6];
 } Granule;
 
+static void
+Granule_render(Granule *self, MYFLT *tablelist, MYFLT *envlist, int envsize) {
+    int i, j, k, n, ipart;
+    MYFLT index, amp, phase, inc, gpos, glen;
+    GrainPool *pool = &self->pool;
+
+    for (k=0, n=0; k<pool->nactive; k++) {
+        j = pool->active[k];
+        phase = self->phase[j];
+        inc = self->inc[j];
+        gpos = self->gpos[j];
+        glen = self->glen[j];
+        for (i=pool->start[j]; i<self->bufsize; i++) {
+            /* compute envelope */
+            index = phase * envsize;
+            ipart = (int)index;
+            amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
+            /* compute sampling */
+            index = phase * glen + gpos;
+            ipart = (int)index;
+            self->data[i] += (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
+            phase += inc;
+            if (phase >= 1.0)
+                break;
+        }
+        if (phase >= 1.0)
+            pool->free[pool->nfree++] = j;
+        else {
+            self->phase[j] = phase;
+            pool->start[j] = 0;
+            pool->active[n++] = j;
+        }
+    }
+    pool->nactive = n;
+}
+
 static void
 Granule_transform_i(Granule *self) {
-    MYFLT dens, inc, index, amp, phase;
-    int i, j, ipart, flag = 0;
+    MYFLT dens, inc;
+    int i, j, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -2268,69 +2355,45 @@ Granule_transform_i(Granule *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<Granule_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[3] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[5] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    break;
-                }
-            }
-        }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                /* compute envelope */
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                /* compute sampling */
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                self->data[i] += (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[3] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
                 else
-                    self->phase[j] = phase;
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
+                else
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[5] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
+                else
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
             }
         }
         flag = 0;
     }
+
+    Granule_render(self, tablelist, envlist, envsize);
 }
 
 static void
 Granule_transform_a(Granule *self) {
-    MYFLT index, amp, phase;
-    int i, j, ipart, flag = 0;
+    int i, j, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -2359,63 +2422,40 @@ Granule_transform_a(Granule *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<Granule_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[3] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[5] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    break;
-                }
-            }
-        }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                // compute envelope
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                // compute sampling
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                self->data[i] += (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[3] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
+                else
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
                 else
-                    self->phase[j] = phase;
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[5] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
+                else
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
             }
         }
         flag = 0;
     }
+
+    Granule_render(self, tablelist, envlist, envsize);
 }
 
 static void Granule_postprocessing_ii(Granule *self) { POST_PROCESSING_II };
@@ -2522,8 +2562,8 @@ Granule_dealloc(Granule* self)
     free(self->gpos);
     free(self->glen);
     free(self->inc);
-    free(self->flags);
     free(self->phase);
+    GrainPool_dealloc(&self->pool);
     Granule_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -2541,7 +2581,6 @@ Granule_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->pos = PyFloat_FromDouble(0.0);
     self->dur = PyFloat_FromDouble(0.1);
     self->timer = 1.0;
-    self->num = 0;
     self->sync = 1;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
@@ -2607,12 +2646,11 @@ Granule_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->glen = (MYFLT *)realloc(self->glen, Granule_MAX_GRAINS * sizeof(MYFLT));
     self->inc = (MYFLT *)realloc(self->inc, Granule_MAX_GRAINS * sizeof(MYFLT));
     self->phase = (MYFLT *)realloc(self->phase, Granule_MAX_GRAINS * sizeof(MYFLT));
-    self->flags = (int *)realloc(self->flags, Granule_MAX_GRAINS * sizeof(int));
 
     for (i=0; i<Granule_MAX_GRAINS; i++) {
         self->gpos[i] = self->glen[i] = self->inc[i] = self->phase[i] = 0.0;
-        self->flags[i] = 0;
     }
+    GrainPool_init(&self->pool, (int)Granule_MAX_GRAINS);
 
     Server_generateSeed((Server *)self->server, GRANULE_ID);
 
@@ -2979,10 +3017,9 @@ typedef struct {
     MYFLT *phase;
     MYFLT *amp1;
     MYFLT *amp2;
-    int *flags;
     int *k1;
     int *k2;
-    int num;
+    GrainPool pool;
     int chnls;
     double timer;
     double devFactor;
@@ -2993,10 +3030,89 @@ typedef struct {
     int modebuffer[6];
 } MainParticle;
 
+static void
+MainParticle_render_mono(MainParticle *self, MYFLT *tablelist, MYFLT *envlist, int envsize) {
+    int i, j, k, n, ipart;
+    MYFLT index, amp, phase, inc, gpos, glen;
+    GrainPool *pool = &self->pool;
+
+    for (k=0, n=0; k<pool->nactive; k++) {
+        j = pool->active[k];
+        phase = self->phase[j];
+        inc = self->inc[j];
+        gpos = self->gpos[j];
+        glen = self->glen[j];
+        for (i=pool->start[j]; i<self->bufsize; i++) {
+            /* compute envelope */
+            index = phase * envsize;
+            ipart = (int)index;
+            amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
+            /* compute sampling */
+            index = phase * glen + gpos;
+            ipart = (int)index;
+            self->buffer_streams[i] += (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
+            phase += inc;
+            if (phase >= 1.0)
+                break;
+        }
+        if (phase >= 1.0)
+            pool->free[pool->nfree++] = j;
+        else {
+            self->phase[j] = phase;
+            pool->start[j] = 0;
+            pool->active[n++] = j;
+        }
+    }
+    pool->nactive = n;
+}
+
+static void
+MainParticle_render(MainParticle *self, MYFLT *tablelist, MYFLT *envlist, int envsize) {
+    int i, j, k, n, ipart;
+    MYFLT index, amp, phase, inc, gpos, glen, val, amp1, amp2;
+    MYFLT *out1, *out2;
+    GrainPool *pool = &self->pool;
+
+    for (k=0, n=0; k<pool->nactive; k++) {
+        j = pool->active[k];
+        phase = self->phase[j];
+        inc = self->inc[j];
+        gpos = self->gpos[j];
+        glen = self->glen[j];
+        amp1 = self->amp1[j];
+        amp2 = self->amp2[j];
+        out1 = self->buffer_streams + self->k1[j];
+        out2 = self->buffer_streams + self->k2[j];
+        for (i=pool->start[j]; i<self->bufsize; i++) {
+            /* compute envelope */
+            index = phase * envsize;
+            ipart = (int)index;
+            amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
+            /* compute sampling */
+            index = phase * glen + gpos;
+            ipart = (int)index;
+            val = (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
+            out1[i] += val * amp1;
+            out2[i] += val * amp2;
+            phase += inc;
+            if (phase >= 1.0)
+                break;
+        }
+        if (phase >= 1.0)
+            pool->free[pool->nfree++] = j;
+        else {
+            self->phase[j] = phase;
+            pool->start[j] = 0;
+            pool->active[n++] = j;
+        }
+    }
+    pool->nactive = n;
+}
+
 static void
 MainParticle_transform_mono_i(MainParticle *self) {
-    MYFLT dens, inc, index, amp, phase, val;
-    int i, j, ipart, flag = 0;
+    MYFLT dens, inc;
+    int i, j, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0, dev = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -3004,6 +3120,7 @@ MainParticle_transform_mono_i(MainParticle *self) {
 
     MYFLT *envlist = TableStream_getData(self->env);
     int envsize = TableStream_getSize(self->env);
+    self->srScale = TableStream_getSamplingRate(self->table) / self->sr;
 
     dens = PyFloat_AS_DOUBLE(self->dens);
     if (dens < 0.0)
@@ -3024,79 +3141,55 @@ MainParticle_transform_mono_i(MainParticle *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<MAINPARTICLE_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[1] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[2] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[3] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        dev = PyFloat_AS_DOUBLE(self->dev);
-                    else
-                        dev = Stream_getData((Stream *)self->dev_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    if (dev < 0.0)
-                        dev = 0.0;
-                    else if (dev > 1.0)
-                        dev = 1.0;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit * self->srScale;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
-                    break;
-                }
-            }
-        }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                /* compute envelope */
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                /* compute sampling */
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                val = (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                self->buffer_streams[i] += val;
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[1] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
+                else
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[2] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
+                else
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[3] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
                 else
-                    self->phase[j] = phase;
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    dev = PyFloat_AS_DOUBLE(self->dev);
+                else
+                    dev = Stream_getData((Stream *)self->dev_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                if (dev < 0.0)
+                    dev = 0.0;
+                else if (dev > 1.0)
+                    dev = 1.0;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit * self->srScale;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
+                self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
             }
         }
         flag = 0;
     }
+
+    MainParticle_render_mono(self, tablelist, envlist, envsize);
 }
 
 static void
 MainParticle_transform_mono_a(MainParticle *self) {
-    MYFLT dens, index, amp, phase, val;
-    int i, j, ipart, flag = 0;
+    MYFLT dens;
+    int i, j, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0, dev = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -3104,6 +3197,7 @@ MainParticle_transform_mono_a(MainParticle *self) {
 
     MYFLT *envlist = TableStream_getData(self->env);
     int envsize = TableStream_getSize(self->env);
+    self->srScale = TableStream_getSamplingRate(self->table) / self->sr;
 
     MYFLT *density = Stream_getData((Stream *)self->dens_stream);
 
@@ -3124,79 +3218,55 @@ MainParticle_transform_mono_a(MainParticle *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<MAINPARTICLE_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[1] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[2] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[3] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        dev = PyFloat_AS_DOUBLE(self->dev);
-                    else
-                        dev = Stream_getData((Stream *)self->dev_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    if (dev < 0.0)
-                        dev = 0.0;
-                    else if (dev > 1.0)
-                        dev = 1.0;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit * self->srScale;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
-                    break;
-                }
-            }
-        }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                /* compute envelope */
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                /* compute sampling */
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                val = (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                self->buffer_streams[i] += val;
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[1] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
+                else
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[2] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
+                else
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[3] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
                 else
-                    self->phase[j] = phase;
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    dev = PyFloat_AS_DOUBLE(self->dev);
+                else
+                    dev = Stream_getData((Stream *)self->dev_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                if (dev < 0.0)
+                    dev = 0.0;
+                else if (dev > 1.0)
+                    dev = 1.0;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit * self->srScale;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
+                self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
             }
         }
         flag = 0;
     }
+
+    MainParticle_render_mono(self, tablelist, envlist, envsize);
 }
 
 static void
 MainParticle_transform_i(MainParticle *self) {
-    MYFLT dens, inc, index, amp, phase, val, min = 0;
-    int i, j, l, l1, ipart, flag = 0;
+    MYFLT dens, inc, min = 0;
+    int i, j, l, l1, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0, dev = 0, pan = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -3204,6 +3274,7 @@ MainParticle_transform_i(MainParticle *self) {
 
     MYFLT *envlist = TableStream_getData(self->env);
     int envsize = TableStream_getSize(self->env);
+    self->srScale = TableStream_getSamplingRate(self->table) / self->sr;
 
     dens = PyFloat_AS_DOUBLE(self->dens);
     if (dens < 0.0)
@@ -3224,113 +3295,88 @@ MainParticle_transform_i(MainParticle *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<MAINPARTICLE_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[1] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[2] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[3] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        dev = PyFloat_AS_DOUBLE(self->dev);
-                    else
-                        dev = Stream_getData((Stream *)self->dev_stream)[i];
-                    if (self->modebuffer[5] == 0)
-                        pan = PyFloat_AS_DOUBLE(self->pan);
-                    else
-                        pan = Stream_getData((Stream *)self->pan_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    if (dev < 0.0)
-                        dev = 0.0;
-                    else if (dev > 1.0)
-                        dev = 1.0;
-                    if (pan < 0.0)
-                        pan = 0.0;
-                    else if (pan > 1.0)
-                        pan = 1.0;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit * self->srScale;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
-                    if (self->chnls == 2) {
-                        self->k1[j] = 0;
-                        self->k2[j] = self->bufsize;
-                        self->amp1[j] = MYSQRT(1.0 - pan);
-                        self->amp2[j] = MYSQRT(pan);
-                    }
-                    else {
-                        self->amp1[j] = MYSQRT(1.0 - pan);
-                        self->amp2[j] = MYSQRT(pan);
-                        min = 0;
-                        self->k1[j] = 0;
-                        self->k2[j] = self->bufsize;
-                        for (l=self->chnls; l>0; l--) {
-                            l1 = l - 1;
-                            min = l1 / (MYFLT)self->chnls;
-                            if (pan > min) {
-                                self->k1[j] = l1 * self->bufsize;
-                                if (l == self->chnls)
-                                    self->k2[j] = 0;
-                                else
-                                    self->k2[j] = l * self->bufsize;
-                                break;
-                            }
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[1] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
+                else
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[2] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
+                else
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[3] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
+                else
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    dev = PyFloat_AS_DOUBLE(self->dev);
+                else
+                    dev = Stream_getData((Stream *)self->dev_stream)[i];
+                if (self->modebuffer[5] == 0)
+                    pan = PyFloat_AS_DOUBLE(self->pan);
+                else
+                    pan = Stream_getData((Stream *)self->pan_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                if (dev < 0.0)
+                    dev = 0.0;
+                else if (dev > 1.0)
+                    dev = 1.0;
+                if (pan < 0.0)
+                    pan = 0.0;
+                else if (pan > 1.0)
+                    pan = 1.0;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit * self->srScale;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
+                self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
+                if (self->chnls == 2) {
+                    self->k1[j] = 0;
+                    self->k2[j] = self->bufsize;
+                    self->amp1[j] = MYSQRT(1.0 - pan);
+                    self->amp2[j] = MYSQRT(pan);
+                }
+                else {
+                    self->amp1[j] = MYSQRT(1.0 - pan);
+                    self->amp2[j] = MYSQRT(pan);
+                    min = 0;
+                    self->k1[j] = 0;
+                    self->k2[j] = self->bufsize;
+                    for (l=self->chnls; l>0; l--) {
+                        l1 = l - 1;
+                        min = l1 / (MYFLT)self->chnls;
+                        if (pan > min) {
+                            self->k1[j] = l1 * self->bufsize;
+                            if (l == self->chnls)
+                                self->k2[j] = 0;
+                            else
+                                self->k2[j] = l * self->bufsize;
+                            break;
                         }
                     }
-                    break;
                 }
             }
         }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                /* compute envelope */
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                /* compute sampling */
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                val = (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                self->buffer_streams[i+self->k1[j]] += val * self->amp1[j];
-                self->buffer_streams[i+self->k2[j]] += val * self->amp2[j];
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
-                else
-                    self->phase[j] = phase;
-            }
-        }
         flag = 0;
     }
+
+    MainParticle_render(self, tablelist, envlist, envsize);
 }
 
 static void
 MainParticle_transform_a(MainParticle *self) {
-    MYFLT dens, index, amp, phase, val, min = 0;
-    int i, j, l, l1, ipart, flag = 0;
+    MYFLT dens, min = 0;
+    int i, j, l, l1, flag = 0;
     MYFLT pit = 0, pos = 0, dur = 0, dev = 0, pan = 0;
 
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -3338,6 +3384,7 @@ MainParticle_transform_a(MainParticle *self) {
 
     MYFLT *envlist = TableStream_getData(self->env);
     int envsize = TableStream_getSize(self->env);
+    self->srScale = TableStream_getSamplingRate(self->table) / self->sr;
 
     MYFLT *density = Stream_getData((Stream *)self->dens_stream);
 
@@ -3358,107 +3405,82 @@ MainParticle_transform_a(MainParticle *self) {
 
         /* need to start a new grain */
         if (flag) {
-            for (j=0; j<MAINPARTICLE_MAX_GRAINS; j++) {
-                if (self->flags[j] == 0) {
-                    self->flags[j] = 1;
-                    if (j >= self->num)
-                        self->num = j + 1;
-                    if (self->modebuffer[1] == 0)
-                        pit = PyFloat_AS_DOUBLE(self->pitch);
-                    else
-                        pit = Stream_getData((Stream *)self->pitch_stream)[i];
-                    if (self->modebuffer[2] == 0)
-                        pos = PyFloat_AS_DOUBLE(self->pos);
-                    else
-                        pos = Stream_getData((Stream *)self->pos_stream)[i];
-                    if (self->modebuffer[3] == 0)
-                        dur = PyFloat_AS_DOUBLE(self->dur);
-                    else
-                        dur = Stream_getData((Stream *)self->dur_stream)[i];
-                    if (self->modebuffer[4] == 0)
-                        dev = PyFloat_AS_DOUBLE(self->dev);
-                    else
-                        dev = Stream_getData((Stream *)self->dev_stream)[i];
-                    if (self->modebuffer[5] == 0)
-                        pan = PyFloat_AS_DOUBLE(self->pan);
-                    else
-                        pan = Stream_getData((Stream *)self->pan_stream)[i];
-                    if (pit < 0.0)
-                        pit = -pit;
-                    if (pos < 0.0)
-                        pos = 0.0;
-                    else if (pos >= size)
-                        pos = (MYFLT)size;
-                    if (dur < 0.0001)
-                        dur = 0.0001;
-                    if (dev < 0.0)
-                        dev = 0.0;
-                    else if (dev > 1.0)
-                        dev = 1.0;
-                    if (pan < 0.0)
-                        pan = 0.0;
-                    else if (pan > 1.0)
-                        pan = 1.0;
-                    self->gpos[j] = pos;
-                    self->glen[j] = dur * self->sr * pit * self->srScale;
-                    if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
-                        self->flags[j] = 0;
-                    self->phase[j] = 0.0;
-                    self->inc[j] = 1.0 / (dur * self->sr);
-                    self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
-                    if (self->chnls == 2) {
-                        self->k1[j] = 0;
-                        self->k2[j] = self->bufsize;
-                        self->amp1[j] = MYSQRT(1.0 - pan);
-                        self->amp2[j] = MYSQRT(pan);
-                    }
-                    else {
-                        self->amp1[j] = MYSQRT(1.0 - pan);
-                        self->amp2[j] = MYSQRT(pan);
-                        min = 0;
-                        self->k1[j] = 0;
-                        self->k2[j] = self->bufsize;
-                        for (l=self->chnls; l>0; l--) {
-                            l1 = l - 1;
-                            min = l1 / (MYFLT)self->chnls;
-                            if (pan > min) {
-                                self->k1[j] = l1 * self->bufsize;
-                                if (l == self->chnls)
-                                    self->k2[j] = 0;
-                                else
-                                    self->k2[j] = l * self->bufsize;
-                                break;
-                            }
+            j = GrainPool_alloc(&self->pool, i);
+            if (j >= 0) {
+                if (self->modebuffer[1] == 0)
+                    pit = PyFloat_AS_DOUBLE(self->pitch);
+                else
+                    pit = Stream_getData((Stream *)self->pitch_stream)[i];
+                if (self->modebuffer[2] == 0)
+                    pos = PyFloat_AS_DOUBLE(self->pos);
+                else
+                    pos = Stream_getData((Stream *)self->pos_stream)[i];
+                if (self->modebuffer[3] == 0)
+                    dur = PyFloat_AS_DOUBLE(self->dur);
+                else
+                    dur = Stream_getData((Stream *)self->dur_stream)[i];
+                if (self->modebuffer[4] == 0)
+                    dev = PyFloat_AS_DOUBLE(self->dev);
+                else
+                    dev = Stream_getData((Stream *)self->dev_stream)[i];
+                if (self->modebuffer[5] == 0)
+                    pan = PyFloat_AS_DOUBLE(self->pan);
+                else
+                    pan = Stream_getData((Stream *)self->pan_stream)[i];
+                if (pit < 0.0)
+                    pit = -pit;
+                if (pos < 0.0)
+                    pos = 0.0;
+                else if (pos >= size)
+                    pos = (MYFLT)size;
+                if (dur < 0.0001)
+                    dur = 0.0001;
+                if (dev < 0.0)
+                    dev = 0.0;
+                else if (dev > 1.0)
+                    dev = 1.0;
+                if (pan < 0.0)
+                    pan = 0.0;
+                else if (pan > 1.0)
+                    pan = 1.0;
+                self->gpos[j] = pos;
+                self->glen[j] = dur * self->sr * pit * self->srScale;
+                if ((pos + self->glen[j]) >= size || (pos + self->glen[j]) < 0)
+                    GrainPool_cancel(&self->pool);
+                self->phase[j] = 0.0;
+                self->inc[j] = 1.0 / (dur * self->sr);
+                self->devFactor = (rand() / (MYFLT)RAND_MAX * 2.0 - 1.0) * dev + 1.0;
+                if (self->chnls == 2) {
+                    self->k1[j] = 0;
+                    self->k2[j] = self->bufsize;
+                    self->amp1[j] = MYSQRT(1.0 - pan);
+                    self->amp2[j] = MYSQRT(pan);
+                }
+                else {
+                    self->amp1[j] = MYSQRT(1.0 - pan);
+                    self->amp2[j] = MYSQRT(pan);
+                    min = 0;
+                    self->k1[j] = 0;
+                    self->k2[j] = self->bufsize;
+                    for (l=self->chnls; l>0; l--) {
+                        l1 = l - 1;
+                        min = l1 / (MYFLT)self->chnls;
+                        if (pan > min) {
+                            self->k1[j] = l1 * self->bufsize;
+                            if (l == self->chnls)
+                                self->k2[j] = 0;
+                            else
+                                self->k2[j] = l * self->bufsize;
+                            break;
                         }
                     }
-                    break;
                 }
             }
         }
-
-        /* compute active grains */
-        for (j=0; j<self->num; j++) {
-            if (self->flags[j]) {
-                phase = self->phase[j];
-                /* compute envelope */
-                index = phase * envsize;
-                ipart = (int)index;
-                amp = envlist[ipart] + (envlist[ipart+1] - envlist[ipart]) * (index - ipart);
-                /* compute sampling */
-                index = phase * self->glen[j] + self->gpos[j];
-                ipart = (int)index;
-                val = (tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * (index - ipart)) * amp;
-                self->buffer_streams[i+self->k1[j]] += val * self->amp1[j];
-                self->buffer_streams[i+self->k2[j]] += val * self->amp2[j];
-                phase += self->inc[j];
-                if (phase >= 1.0)
-                    self->flags[j] = 0;
-                else
-                    self->phase[j] = phase;
-            }
-        }
         flag = 0;
     }
+
+    MainParticle_render(self, tablelist, envlist, envsize);
 }
 
 static void
@@ -3537,13 +3559,13 @@ MainParticle_dealloc(MainParticle* self)
     free(self->gpos);
     free(self->glen);
     free(self->inc);
-    free(self->flags);
     free(self->k1);
     free(self->k2);
     free(self->phase);
     free(self->amp1);
     free(self->amp2);
     free(self->buffer_streams);
+    GrainPool_dealloc(&self->pool);
     MainParticle_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -3570,7 +3592,6 @@ MainParticle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->pan = PyFloat_FromDouble(0.5);
     self->timer = self->devFactor = 1.0;
     self->srScale = 1.0;
-    self->num = 0;
     self->chnls = 1;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
@@ -3642,14 +3663,14 @@ MainParticle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->phase = (MYFLT *)realloc(self->phase, MAINPARTICLE_MAX_GRAINS * sizeof(MYFLT));
     self->amp1 = (MYFLT *)realloc(self->amp1, MAINPARTICLE_MAX_GRAINS * sizeof(MYFLT));
     self->amp2 = (MYFLT *)realloc(self->amp2, MAINPARTICLE_MAX_GRAINS * sizeof(MYFLT));
-    self->flags = (int *)realloc(self->flags, MAINPARTICLE_MAX_GRAINS * sizeof(int));
     self->k1 = (int *)realloc(self->k1, MAINPARTICLE_MAX_GRAINS * sizeof(int));
     self->k2 = (int *)realloc(self->k2, MAINPARTICLE_MAX_GRAINS * sizeof(int));
 
     for (i=0; i<MAINPARTICLE_MAX_GRAINS; i++) {
         self->gpos[i] = self->glen[i] = self->inc[i] = self->phase[i] = self->amp1[i] = self->amp2[i] = 0.0;
-        self->flags[i] = self->k1[i] = self->k2[i] = 0;
+        self->k1[i] = self->k2[i] = 0;
     }
+    GrainPool_init(&self->pool, (int)MAINPARTICLE_MAX_GRAINS);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->bufsize * self->chnls * sizeof(MYFLT));
     for (i=0; i<self->bufsize*self->chnls; i++) {
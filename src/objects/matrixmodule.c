@@ -121,6 +121,38 @@ MatrixStream_setHeight(MatrixStream *self, int size)
     self->height = size;
 }
 
+/* Rows are contiguous in memory, each one followed by a guard point. While views
+   are exported, the owner is kept alive and refuses to reallocate its samples
+   (see MATRIX_CHECK_EXPORTS). */
+static int
+MatrixStream_getbuffer(MatrixStream *self, Py_buffer *view, int flags)
+{
+    self->shape[0] = self->height;
+    self->shape[1] = self->width;
+    self->strides[0] = (self->width + 1) * sizeof(MYFLT);
+    self->strides[1] = sizeof(MYFLT);
+    if (Stream_fillBuffer(view, (PyObject *)self, self->data == NULL ? NULL : self->data[0], 2, self->shape, self->strides, 0, flags) < 0)
+        return -1;
+    if (view != NULL)
+        Stream_holdExport(&self->exports, self->owner);
+    return 0;
+}
+
+static void
+MatrixStream_releasebuffer(MatrixStream *self, Py_buffer *view)
+{
+    Stream_releaseExport(&self->exports, self->owner);
+}
+
+static PyBufferProcs MatrixStream_as_buffer = {
+0, /* bf_getreadbuffer */
+0, /* bf_getwritebuffer */
+0, /* bf_getsegcount */
+0, /* bf_getcharbuffer */
+(getbufferproc)MatrixStream_getbuffer, /* bf_getbuffer */
+(releasebufferproc)MatrixStream_releasebuffer, /* bf_releasebuffer */
+};
+
 PyTypeObject MatrixStreamType = {
 PyObject_HEAD_INIT(NULL)
 0, /*ob_size*/
@@ -141,8 +173,8 @@ sizeof(MatrixStream), /*tp_basicsize*/
 0, /*tp_str*/
 0, /*tp_getattro*/
 0, /*tp_setattro*/
-0, /*tp_as_buffer*/
-Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+&MatrixStream_as_buffer, /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
 "MatrixStream objects. For internal use only. Must never be instantiated by the user.", /* tp_doc */
 0, /* tp_traverse */
 0, /* tp_clear */
@@ -214,10 +246,7 @@ NewMatrix_clear(NewMatrix *self)
 static void
 NewMatrix_dealloc(NewMatrix* self)
 {
-    int i;
-    for (i=0; i<(self->height+1); i++) {
-        free(self->data[i]);
-    }
+    free(self->data[0]);
     free(self->data);
     NewMatrix_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -237,16 +266,18 @@ NewMatrix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->x_pointer = self->y_pointer = 0;
 
     MAKE_NEW_MATRIXSTREAM(self->matrixstream, &MatrixStreamType, NULL);
+    self->matrixstream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"width", "height", "init", NULL};
 
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "ii|O", kwlist, &self->width, &self->height, &inittmp))
         Py_RETURN_NONE;
 
+    /* Rows are allocated in a single block to be exported with the buffer protocol. */
     self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT *));
-
-    for (i=0; i<(self->height+1); i++) {
-        self->data[i] = (MYFLT *)malloc((self->width + 1) * sizeof(MYFLT));
+    self->data[0] = (MYFLT *)malloc((self->height + 1) * (self->width + 1) * sizeof(MYFLT));
+    for (i=1; i<(self->height+1); i++) {
+        self->data[i] = self->data[0] + i * (self->width + 1);
     }
 
     for(i=0; i<(self->height+1); i++) {
@@ -346,6 +377,29 @@ NewMatrix_setMatrix(NewMatrix *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    if (PyObject_CheckBuffer(value)) {
+        /* The rows are copied one by one to skip the guard points. */
+        Py_buffer view;
+        if (PyObject_GetBuffer(value, &view, PyBUF_STRIDES) < 0)
+            return NULL;
+        if (view.ndim != 2 || view.shape[0] != self->height || view.shape[1] != self->width) {
+            PyBuffer_Release(&view);
+            PyErr_SetString(PyExc_ValueError, "New matrix must be of the same size as actual matrix.");
+            return NULL;
+        }
+        PyBuffer_Release(&view);
+        MYFLT *tmp = (MYFLT *)malloc(self->width * self->height * sizeof(MYFLT));
+        if (Stream_copyFromBuffer(value, tmp, self->width * self->height) < 0) {
+            free(tmp);
+            return NULL;
+        }
+        for(i=0; i<self->height; i++) {
+            memcpy(self->data[i], tmp + i * self->width, self->width * sizeof(MYFLT));
+        }
+        free(tmp);
+        Py_RETURN_NONE;
+    }
+
     if (! PyList_Check(value)) {
         PyErr_SetString(PyExc_TypeError, "The matrix value value must be a list.");
         return PyInt_FromLong(-1);
@@ -983,6 +983,7 @@ typedef struct {
     int poly;
     int voiceCount;
     MYFLT *buffer_streams;
+    PyoRand rng;
 } Clouder;
 
 static void
@@ -1001,7 +1002,7 @@ Clouder_generate_i(Clouder *self) {
 
     dens *= 0.5;
     for (i=0; i<self->bufsize; i++) {
-        rnd = (int)(rand() / (MYFLT)RAND_MAX * self->sr);
+        rnd = (int)(pyorand_int(&self->rng) / (MYFLT)PYORAND_MAX * self->sr);
         if (rnd < dens) {
             self->buffer_streams[i + self->voiceCount++ * self->bufsize] = 1.0;
             if (self->voiceCount == self->poly)
@@ -1029,7 +1030,7 @@ Clouder_generate_a(Clouder *self) {
             dens = self->sr;
 
         dens *= 0.5;
-        rnd = (int)(rand() / (MYFLT)RAND_MAX * self->sr);
+        rnd = (int)(pyorand_int(&self->rng) / (MYFLT)PYORAND_MAX * self->sr);
         if (rnd < dens) {
             self->buffer_streams[i + self->voiceCount++ * self->bufsize] = 1.0;
             if (self->voiceCount == self->poly)
@@ -1123,7 +1124,7 @@ Clouder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     (*self->mode_func_ptr)(self);
 
-    Server_generateSeed((Server *)self->server, CLOUD_ID);
+    Server_seedRandom((Server *)self->server, CLOUD_ID, &self->rng);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->poly * self->bufsize * sizeof(MYFLT));
 
@@ -1766,16 +1767,17 @@ typedef struct {
     MYFLT *dur_buffer_streams;
     MYFLT *end_buffer_streams;
     MYFLT *amplitudes;
+    PyoRand rng;
 } Beater;
 
 static MYFLT
-Beater_defineAccent(int n) {
+Beater_defineAccent(PyoRand *rng, int n) {
 	if (n == 1)
-		return (MYFLT)((rand() % 15) + 112) / 127.; // 112 -> 127
+		return (MYFLT)((pyorand_int(rng) % 15) + 112) / 127.; // 112 -> 127
 	else if (n == 2)
-		return (MYFLT)((rand() % 20) + 70) / 127.; // 70 -> 90
+		return (MYFLT)((pyorand_int(rng) % 20) + 70) / 127.; // 70 -> 90
 	else if (n == 3)
-		return (MYFLT)((rand() % 20) + 40) / 127.; // 40 -> 60
+		return (MYFLT)((pyorand_int(rng) % 20) + 40) / 127.; // 40 -> 60
     else
         return 0.5;
 }
@@ -1821,15 +1823,15 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 4  || (i % len) == 2) {
                 self->tapProb[i] = w2;
-                self->accentTable[i] = Beater_defineAccent(2);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 2);
             }
             else if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1838,15 +1840,15 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 3) {
                 self->tapProb[i] = w2;
-                self->accentTable[i] = Beater_defineAccent(2);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 2);
             }
             else if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1855,15 +1857,15 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 3) {
                 self->tapProb[i] = w2;
-                self->accentTable[i] = Beater_defineAccent(2);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 2);
             }
             else if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1872,15 +1874,15 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 2) {
                 self->tapProb[i] = w2;
-                self->accentTable[i] = Beater_defineAccent(2);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 2);
             }
             else if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1889,11 +1891,11 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1902,11 +1904,11 @@ Beater_makeTable(Beater *self, int fill) {
 		for (i=0; i < self->taps; i++) {
             if ((i % len) == 0) {
                 self->tapProb[i] = w1;
-                self->accentTable[i] = Beater_defineAccent(1);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 1);
             }
             else {
                 self->tapProb[i] = w3;
-                self->accentTable[i] = Beater_defineAccent(3);
+                self->accentTable[i] = Beater_defineAccent(&self->rng, 3);
             }
 		}
 	}
@@ -1918,7 +1920,7 @@ Beater_makeSequence(Beater *self) {
 
 	j = 0;
 	for (i=0; i < self->taps; i++) {
-		if ((rand() % 100) < self->tapProb[i]) {
+		if ((pyorand_int(&self->rng) % 100) < self->tapProb[i]) {
 			self->sequence[i] = 1;
 			self->tapList[j++] = i;
 		}
@@ -2236,7 +2238,7 @@ Beater_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     (*self->mode_func_ptr)(self);
 
-    Server_generateSeed((Server *)self->server, BEATER_ID);
+    Server_seedRandom((Server *)self->server, BEATER_ID, &self->rng);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->poly * self->bufsize * sizeof(MYFLT));
     self->tap_buffer_streams = (MYFLT *)realloc(self->tap_buffer_streams, self->poly * self->bufsize * sizeof(MYFLT));
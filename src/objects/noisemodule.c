@@ -30,15 +30,18 @@ typedef struct {
     int modebuffer[2];
     int seed;
     int type;
+    PyoRand rng;
 } Noise;
 
 static void
 Noise_generate(Noise *self) {
-    int i;
+    pyorand_uniform_block(&self->rng, self->data, self->bufsize, 1.98, -0.99);
+}
 
-    for (i=0; i<self->bufsize; i++) {
-        self->data[i] = rand()/((MYFLT)(RAND_MAX)+1)*1.98-0.99;
-    }
+/* Gaussian noise, with a standard deviation of 0.33 to stay in the range of the uniform noise. */
+static void
+Noise_generate_gauss(Noise *self) {
+    pyorand_gauss_block(&self->rng, self->data, self->bufsize, 0.33, 0.0);
 }
 
 static void
@@ -74,6 +77,9 @@ Noise_setProcMode(Noise *self)
         case 1:
             self->proc_func_ptr = Noise_generate_cheap;
             break;
+        case 2:
+            self->proc_func_ptr = Noise_generate_gauss;
+            break;
     }
 	switch (muladdmode) {
         case 0:
@@ -166,9 +172,9 @@ Noise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, NOISE_ID);
+    Server_seedRandom((Server *)self->server, NOISE_ID, &self->rng);
 
-    self->seed = rand();
+    self->seed = pyorand_int(&self->rng);
 
     (*self->mode_func_ptr)(self);
 
@@ -207,6 +213,8 @@ Noise_setType(Noise *self, PyObject *arg)
         self->type = 0;
     else if (PyInt_AS_LONG(arg) == 1)
         self->type = 1;
+    else if (PyInt_AS_LONG(arg) == 2)
+        self->type = 2;
 
     (*self->mode_func_ptr)(self);
 
@@ -330,6 +338,7 @@ typedef struct {
     MYFLT c4;
     MYFLT c5;
     MYFLT c6;
+    PyoRand rng;
 } PinkNoise;
 
 static void
@@ -337,8 +346,9 @@ PinkNoise_generate(PinkNoise *self) {
     MYFLT in, val;
     int i;
 
+    pyorand_uniform_block(&self->rng, self->data, self->bufsize, 1.98, -0.99);
     for (i=0; i<self->bufsize; i++) {
-        in = rand()/((MYFLT)(RAND_MAX)+1)*1.98-0.99;
+        in = self->data[i];
         self->c0 = self->c0 * 0.99886 + in * 0.0555179;
         self->c1 = self->c1 * 0.99332 + in * 0.0750759;
         self->c2 = self->c2 * 0.96900 + in * 0.1538520;
@@ -460,7 +470,7 @@ PinkNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     (*self->mode_func_ptr)(self);
 
-    Server_generateSeed((Server *)self->server, PINKNOISE_ID);
+    Server_seedRandom((Server *)self->server, PINKNOISE_ID, &self->rng);
 
     return (PyObject *)self;
 }
@@ -596,6 +606,7 @@ typedef struct {
     MYFLT y1;
     MYFLT c1;
     MYFLT c2;
+    PyoRand rng;
 } BrownNoise;
 
 static void
@@ -603,8 +614,9 @@ BrownNoise_generate(BrownNoise *self) {
     MYFLT rnd, val;
     int i;
 
+    pyorand_uniform_block(&self->rng, self->data, self->bufsize, 1.98, -0.99);
     for (i=0; i<self->bufsize; i++) {
-        rnd = rand()/((MYFLT)(RAND_MAX)+1)*1.98-0.99;
+        rnd = self->data[i];
         val = self->c1 * rnd + self->c2 * self->y1;
         self->y1 = val;
         self->data[i] = val * 20.0; /* gain compensation */
@@ -725,7 +737,7 @@ BrownNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     (*self->mode_func_ptr)(self);
 
-    Server_generateSeed((Server *)self->server, BROWNNOISE_ID);
+    Server_seedRandom((Server *)self->server, BROWNNOISE_ID, &self->rng);
 
     return (PyObject *)self;
 }
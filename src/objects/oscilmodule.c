@@ -975,13 +975,16 @@ typedef struct {
     double pointerPos;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } Osc;
 
 static void
 Osc_readframes_ii(Osc *self) {
-    MYFLT fr, ph, fpart;
+    MYFLT fr, ph;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -996,17 +999,19 @@ Osc_readframes_ii(Osc *self) {
         pos = self->pointerPos + ph;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 Osc_readframes_ai(Osc *self) {
-    MYFLT ph, fpart, sizeOnSr;
+    MYFLT ph, sizeOnSr;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -1022,17 +1027,19 @@ Osc_readframes_ai(Osc *self) {
         pos = self->pointerPos + ph;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 Osc_readframes_ia(Osc *self) {
-    MYFLT fr, pha, fpart;
+    MYFLT fr, pha;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -1047,17 +1054,19 @@ Osc_readframes_ia(Osc *self) {
         pos = self->pointerPos + pha;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 Osc_readframes_aa(Osc *self) {
-    MYFLT pha, fpart, sizeOnSr;
+    MYFLT pha, sizeOnSr;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -1073,10 +1082,10 @@ Osc_readframes_aa(Osc *self) {
         pos = self->pointerPos + pha;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void Osc_postprocessing_ii(Osc *self) { POST_PROCESSING_II };
@@ -1234,6 +1243,7 @@ Osc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     return (PyObject *)self;
 }
@@ -1366,6 +1376,7 @@ Osc_setInterp(Osc *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2006,13 +2017,16 @@ typedef struct {
     double pointerPos;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } OscTrig;
 
 static void
 OscTrig_readframes_ii(OscTrig *self) {
-    MYFLT fr, ph, fpart;
+    MYFLT fr, ph;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -2032,17 +2046,19 @@ OscTrig_readframes_ii(OscTrig *self) {
         pos = self->pointerPos + ph;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 OscTrig_readframes_ai(OscTrig *self) {
-    MYFLT ph, fpart, sizeOnSr;
+    MYFLT ph, sizeOnSr;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -2063,17 +2079,19 @@ OscTrig_readframes_ai(OscTrig *self) {
         pos = self->pointerPos + ph;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 OscTrig_readframes_ia(OscTrig *self) {
-    MYFLT fr, pha, fpart;
+    MYFLT fr, pha;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -2093,17 +2111,19 @@ OscTrig_readframes_ia(OscTrig *self) {
         pos = self->pointerPos + pha;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void
 OscTrig_readframes_aa(OscTrig *self) {
-    MYFLT pha, fpart, sizeOnSr;
+    MYFLT pha, sizeOnSr;
     double inc, pos;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -2124,10 +2144,10 @@ OscTrig_readframes_aa(OscTrig *self) {
         pos = self->pointerPos + pha;
         if (pos >= size)
             pos -= size;
-        ipart = (int)pos;
-        fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        ipos[i] = (int)pos;
+        fpos[i] = pos - ipos[i];
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
 }
 
 static void OscTrig_postprocessing_ii(OscTrig *self) { POST_PROCESSING_II };
@@ -2293,6 +2313,7 @@ OscTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     return (PyObject *)self;
 }
@@ -2456,6 +2477,7 @@ OscTrig_setInterp(OscTrig *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -3412,33 +3434,35 @@ typedef struct {
     MYFLT c;
     MYFLT lastPh;
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } Pointer2;
 
 static void
 Pointer2_readframes_a(Pointer2 *self) {
-    MYFLT fpart, phdiff, b, fr;
+    MYFLT phdiff, b, fr;
     double ph;
-    int i, ipart;
+    int i;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
     double tableSr = TableStream_getSamplingRate(self->table);
 
     MYFLT *pha = Stream_getData((Stream *)self->index_stream);
 
+    for (i=0; i<self->bufsize; i++) {
+        ph = Osc_clip(pha[i] * size, size);
+        ipos[i] = (int)ph;
+        fpos[i] = ph - ipos[i];
+    }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
+
     if (!self->autosmooth) {
-        for (i=0; i<self->bufsize; i++) {
-            ph = Osc_clip(pha[i] * size, size);
-            ipart = (int)ph;
-            fpart = ph - ipart;
-            self->y1 = self->y2 = self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
-        }
+        self->y1 = self->y2 = self->data[self->bufsize-1];
     }
     else {
         for (i=0; i<self->bufsize; i++) {
             ph = Osc_clip(pha[i] * size, size);
-            ipart = (int)ph;
-            fpart = ph - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
             phdiff = MYFABS(ph - self->lastPh);
             self->lastPh = ph;
             if (phdiff < 1) {
@@ -3583,6 +3607,7 @@ Pointer2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     return (PyObject *)self;
 }
@@ -3676,6 +3701,7 @@ Pointer2_setInterp(Pointer2 *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -5386,12 +5412,15 @@ typedef struct {
     int init;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } TableRead;
 
 static void
 TableRead_readframes_i(TableRead *self) {
-    MYFLT fr, inc, fpart;
-    int i, ipart;
+    MYFLT fr, inc;
+    int i, num = 0;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -5399,7 +5428,7 @@ TableRead_readframes_i(TableRead *self) {
     inc = fr * size / self->sr;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Stream_requestStop(self->stream);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -5418,21 +5447,25 @@ TableRead_readframes_i(TableRead *self) {
                 self->go = 0;
         }
         if (self->go == 1) {
-            ipart = (int)self->pointerPos;
-            fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            ipos[num] = (int)self->pointerPos;
+            fpos[num] = self->pointerPos - ipos[num];
+            num++;
         }
         else
             self->data[i] = 0.0;
 
         self->pointerPos += inc;
     }
+    /* go only switches off inside the loop, the playing samples come first */
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, num);
 }
 
 static void
 TableRead_readframes_a(TableRead *self) {
-    MYFLT inc, fpart, sizeOnSr;
-    int i, ipart;
+    MYFLT inc, sizeOnSr;
+    int i, num = 0;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
 
@@ -5441,7 +5474,7 @@ TableRead_readframes_a(TableRead *self) {
     sizeOnSr = size / self->sr;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Stream_requestStop(self->stream);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -5460,9 +5493,9 @@ TableRead_readframes_a(TableRead *self) {
                 self->go = 0;
         }
         if (self->go == 1) {
-            ipart = (int)self->pointerPos;
-            fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            ipos[num] = (int)self->pointerPos;
+            fpos[num] = self->pointerPos - ipos[num];
+            num++;
         }
         else
             self->data[i] = 0.0;
@@ -5470,6 +5503,8 @@ TableRead_readframes_a(TableRead *self) {
         inc = fr[i] * sizeOnSr;
         self->pointerPos += inc;
     }
+    /* go only switches off inside the loop, the playing samples come first */
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, num);
 }
 
 static void TableRead_postprocessing_ii(TableRead *self) { POST_PROCESSING_II };
@@ -5629,6 +5664,7 @@ TableRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     self->init = 1;
 
@@ -5761,6 +5797,7 @@ TableRead_setInterp(TableRead *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -11361,6 +11398,7 @@ TableScale_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyErr_SetString(PyExc_TypeError, "\"outtable\" argument of TableScale must be a PyoTableObject.\n");
         Py_RETURN_NONE;
     }
+    MAKE_TABLE_WRITABLE(outtabletmp);
     Py_XDECREF(self->outtable);
     self->outtable = PyObject_CallMethod((PyObject *)outtabletmp, "getTableStream", "");
 
@@ -11442,6 +11480,7 @@ TableScale_setOuttable(TableScale *self, PyObject *arg)
 	}
 
 	tmp = arg;
+    MAKE_TABLE_WRITABLE(tmp);
 	Py_DECREF(self->outtable);
     self->outtable = PyObject_CallMethod((PyObject *)tmp, "getTableStream", "");
 
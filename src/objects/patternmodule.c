@@ -40,48 +40,44 @@ static void
 Pattern_generate_i(Pattern *self) {
     MYFLT tm;
     int i, flag;
-    PyObject *result;
 
-    flag = 0;
+    flag = -1;
     tm = PyFloat_AS_DOUBLE(self->time);
 
     for (i=0; i<self->bufsize; i++) {
         if (self->currentTime >= tm) {
-            flag = 1;
+            if (flag == -1)
+                flag = i;
             self->currentTime = 0.;
         }
 
         self->currentTime += self->sampleToSec;
     }
-    if (flag == 1 || self->init == 1) {
+    if (flag != -1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Server_callback((Server *)self->server, self->callable, NULL, flag == -1 ? 0 : flag);
     }
 }
 
 static void
 Pattern_generate_a(Pattern *self) {
     int i, flag;
-    PyObject *result;
 
     MYFLT *tm = Stream_getData((Stream *)self->time_stream);
 
-    flag = 0;
+    flag = -1;
     for (i=0; i<self->bufsize; i++) {
         if (self->currentTime >= tm[i]) {
-            flag = 1;
+            if (flag == -1)
+                flag = i;
             self->currentTime = 0.;
         }
 
         self->currentTime += self->sampleToSec;
     }
-    if (flag == 1 || self->init == 1) {
+    if (flag != -1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Server_callback((Server *)self->server, self->callable, NULL, flag == -1 ? 0 : flag);
     }
 }
 
@@ -471,20 +467,11 @@ typedef struct {
 static void
 CallAfter_generate(CallAfter *self) {
     int i;
-    PyObject *tuple, *result;
 
     for (i=0; i<self->bufsize; i++) {
         if (self->currentTime >= self->time) {
-            if (self->arg == Py_None)
-                tuple = PyTuple_New(0);
-            else {
-                tuple = PyTuple_New(1);
-                PyTuple_SET_ITEM(tuple, 0, self->arg);
-            }
-            result = PyObject_Call(self->callable, tuple, NULL);
-            if (result == NULL)
-                PyErr_Print();
-            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+            Server_callback((Server *)self->server, self->callable, self->arg == Py_None ? NULL : self->arg, i);
+            Stream_requestStop(self->stream);
             break;
         }
         self->currentTime += self->sampleToSec;
@@ -632,4 +619,340 @@ CallAfter_members,             /* tp_members */
 0,      /* tp_init */
 0,                         /* tp_alloc */
 CallAfter_new,                 /* tp_new */
-};
\ No newline at end of file
+};
+/****************/
+/*** Timeline ***/
+/****************/
+/* Output driven by the server's event scheduler. The events of a block are
+   delivered, in time order, before the block is computed, with their offset
+   in the block. In step mode, the output holds the value of the last event,
+   in trigger mode, it is 0 except at the samples of the events. */
+typedef struct {
+    pyo_audio_HEAD
+    int modebuffer[2];
+    int trig;
+    MYFLT value; /* current value of the step mode */
+    int count; /* events of the current block */
+    int size;
+    int *offsets;
+    MYFLT *values;
+} Timeline;
+
+static void
+Timeline_event(PyObject *target, int offset, MYFLT value, int arg)
+{
+    Timeline *self = (Timeline *)target;
+
+    if (Stream_getStreamActive(self->stream) == 0) {
+        /* Not computed, a trigger is lost and a step applies immediately. */
+        if (!self->trig)
+            self->value = value;
+        return;
+    }
+    if (self->count >= self->size) {
+        self->size = self->size * 2 + 8;
+        self->offsets = (int *)realloc(self->offsets, self->size * sizeof(int));
+        self->values = (MYFLT *)realloc(self->values, self->size * sizeof(MYFLT));
+    }
+    self->offsets[self->count] = offset;
+    self->values[self->count] = value;
+    self->count++;
+}
+
+static void
+Timeline_generate_steps(Timeline *self) {
+    int i, j, start = 0;
+
+    for (j=0; j<self->count; j++) {
+        for (i=start; i<self->offsets[j]; i++)
+            self->data[i] = self->value;
+        self->value = self->values[j];
+        start = self->offsets[j];
+    }
+    for (i=start; i<self->bufsize; i++)
+        self->data[i] = self->value;
+    self->count = 0;
+}
+
+static void
+Timeline_generate_trigs(Timeline *self) {
+    int j;
+
+    memset(self->data, 0, self->bufsize * sizeof(MYFLT));
+    for (j=0; j<self->count; j++)
+        self->data[self->offsets[j]] = self->values[j];
+    self->count = 0;
+}
+
+static void Timeline_postprocessing_ii(Timeline *self) { POST_PROCESSING_II };
+static void Timeline_postprocessing_ai(Timeline *self) { POST_PROCESSING_AI };
+static void Timeline_postprocessing_ia(Timeline *self) { POST_PROCESSING_IA };
+static void Timeline_postprocessing_aa(Timeline *self) { POST_PROCESSING_AA };
+static void Timeline_postprocessing_ireva(Timeline *self) { POST_PROCESSING_IREVA };
+static void Timeline_postprocessing_areva(Timeline *self) { POST_PROCESSING_AREVA };
+static void Timeline_postprocessing_revai(Timeline *self) { POST_PROCESSING_REVAI };
+static void Timeline_postprocessing_revaa(Timeline *self) { POST_PROCESSING_REVAA };
+static void Timeline_postprocessing_revareva(Timeline *self) { POST_PROCESSING_REVAREVA };
+
+static void
+Timeline_setProcMode(Timeline *self)
+{
+    int muladdmode;
+    muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+
+    if (self->trig)
+        self->proc_func_ptr = Timeline_generate_trigs;
+    else
+        self->proc_func_ptr = Timeline_generate_steps;
+
+	switch (muladdmode) {
+        case 0:
+            self->muladd_func_ptr = Timeline_postprocessing_ii;
+            break;
+        case 1:
+            self->muladd_func_ptr = Timeline_postprocessing_ai;
+            break;
+        case 2:
+            self->muladd_func_ptr = Timeline_postprocessing_revai;
+            break;
+        case 10:
+            self->muladd_func_ptr = Timeline_postprocessing_ia;
+            break;
+        case 11:
+            self->muladd_func_ptr = Timeline_postprocessing_aa;
+            break;
+        case 12:
+            self->muladd_func_ptr = Timeline_postprocessing_revaa;
+            break;
+        case 20:
+            self->muladd_func_ptr = Timeline_postprocessing_ireva;
+            break;
+        case 21:
+            self->muladd_func_ptr = Timeline_postprocessing_areva;
+            break;
+        case 22:
+            self->muladd_func_ptr = Timeline_postprocessing_revareva;
+            break;
+    }
+}
+
+static void
+Timeline_compute_next_data_frame(Timeline *self)
+{
+    (*self->proc_func_ptr)(self);
+    (*self->muladd_func_ptr)(self);
+}
+
+static int
+Timeline_traverse(Timeline *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    return 0;
+}
+
+static int
+Timeline_clear(Timeline *self)
+{
+    pyo_CLEAR
+    return 0;
+}
+
+static void
+Timeline_dealloc(Timeline* self)
+{
+    pyo_DEALLOC
+    free(self->offsets);
+    free(self->values);
+    Timeline_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+Timeline_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *multmp=NULL, *addtmp=NULL;
+    Timeline *self;
+    self = (Timeline *)type->tp_alloc(type, 0);
+
+    self->value = 0.0;
+    self->trig = 0;
+    self->count = self->size = 0;
+	self->modebuffer[0] = 0;
+	self->modebuffer[1] = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, Timeline_compute_next_data_frame);
+    self->mode_func_ptr = Timeline_setProcMode;
+
+    static char *kwlist[] = {"init", "trig", "mul", "add", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE__FIOO, kwlist, &self->value, &self->trig, &multmp, &addtmp))
+        Py_RETURN_NONE;
+
+    if (multmp) {
+        PyObject_CallMethod((PyObject *)self, "setMul", "O", multmp);
+    }
+
+    if (addtmp) {
+        PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
+    }
+
+    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static PyObject *
+Timeline_schedule(Timeline *self, PyObject *args)
+{
+    double time;
+    MYFLT value = 1.0;
+
+    if (! PyArg_ParseTuple(args, "d|"TYPE_F, &time, &value))
+        return NULL;
+    if (time < 0.0)
+        time = 0.0;
+    Server_scheduleEvent((Server *)self->server, (unsigned long)(time * self->sr + 0.5), Timeline_event, (PyObject *)self, value, 0);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Timeline_unschedule(Timeline *self)
+{
+    Server_unscheduleEvents((Server *)self->server, (PyObject *)self);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject * Timeline_getServer(Timeline* self) { GET_SERVER };
+static PyObject * Timeline_getStream(Timeline* self) { GET_STREAM };
+static PyObject * Timeline_setMul(Timeline *self, PyObject *arg) { SET_MUL };
+static PyObject * Timeline_setAdd(Timeline *self, PyObject *arg) { SET_ADD };
+static PyObject * Timeline_setSub(Timeline *self, PyObject *arg) { SET_SUB };
+static PyObject * Timeline_setDiv(Timeline *self, PyObject *arg) { SET_DIV };
+
+static PyObject * Timeline_play(Timeline *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * Timeline_out(Timeline *self, PyObject *args, PyObject *kwds) { OUT };
+static PyObject * Timeline_stop(Timeline *self) { STOP };
+
+static PyObject * Timeline_multiply(Timeline *self, PyObject *arg) { MULTIPLY };
+static PyObject * Timeline_inplace_multiply(Timeline *self, PyObject *arg) { INPLACE_MULTIPLY };
+static PyObject * Timeline_add(Timeline *self, PyObject *arg) { ADD };
+static PyObject * Timeline_inplace_add(Timeline *self, PyObject *arg) { INPLACE_ADD };
+static PyObject * Timeline_sub(Timeline *self, PyObject *arg) { SUB };
+static PyObject * Timeline_inplace_sub(Timeline *self, PyObject *arg) { INPLACE_SUB };
+static PyObject * Timeline_div(Timeline *self, PyObject *arg) { DIV };
+static PyObject * Timeline_inplace_div(Timeline *self, PyObject *arg) { INPLACE_DIV };
+
+static PyMemberDef Timeline_members[] = {
+{"server", T_OBJECT_EX, offsetof(Timeline, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(Timeline, stream), 0, "Stream object."},
+{"mul", T_OBJECT_EX, offsetof(Timeline, mul), 0, "Mul factor."},
+{"add", T_OBJECT_EX, offsetof(Timeline, add), 0, "Add factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef Timeline_methods[] = {
+{"getServer", (PyCFunction)Timeline_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)Timeline_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)Timeline_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"out", (PyCFunction)Timeline_out, METH_VARARGS|METH_KEYWORDS, "Starts computing and sends sound to soundcard channel speficied by argument."},
+{"stop", (PyCFunction)Timeline_stop, METH_NOARGS, "Stops computing."},
+{"schedule", (PyCFunction)Timeline_schedule, METH_VARARGS, "Schedules an event `time` seconds after the beginning of the next buffer."},
+{"unschedule", (PyCFunction)Timeline_unschedule, METH_NOARGS, "Drops the pending events."},
+{"setMul", (PyCFunction)Timeline_setMul, METH_O, "Sets Timeline mul factor."},
+{"setAdd", (PyCFunction)Timeline_setAdd, METH_O, "Sets Timeline add factor."},
+{"setSub", (PyCFunction)Timeline_setSub, METH_O, "Sets inverse add factor."},
+{"setDiv", (PyCFunction)Timeline_setDiv, METH_O, "Sets inverse mul factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyNumberMethods Timeline_as_number = {
+(binaryfunc)Timeline_add,                      /*nb_add*/
+(binaryfunc)Timeline_sub,                 /*nb_subtract*/
+(binaryfunc)Timeline_multiply,                 /*nb_multiply*/
+(binaryfunc)Timeline_div,                   /*nb_divide*/
+0,                /*nb_remainder*/
+0,                   /*nb_divmod*/
+0,                   /*nb_power*/
+0,                  /*nb_neg*/
+0,                /*nb_pos*/
+0,                  /*(unaryfunc)array_abs,*/
+0,                    /*nb_nonzero*/
+0,                    /*nb_invert*/
+0,               /*nb_lshift*/
+0,              /*nb_rshift*/
+0,              /*nb_and*/
+0,              /*nb_xor*/
+0,               /*nb_or*/
+0,                                          /*nb_coerce*/
+0,                       /*nb_int*/
+0,                      /*nb_long*/
+0,                     /*nb_float*/
+0,                       /*nb_oct*/
+0,                       /*nb_hex*/
+(binaryfunc)Timeline_inplace_add,              /*inplace_add*/
+(binaryfunc)Timeline_inplace_sub,         /*inplace_subtract*/
+(binaryfunc)Timeline_inplace_multiply,         /*inplace_multiply*/
+(binaryfunc)Timeline_inplace_div,           /*inplace_divide*/
+0,        /*inplace_remainder*/
+0,           /*inplace_power*/
+0,       /*inplace_lshift*/
+0,      /*inplace_rshift*/
+0,      /*inplace_and*/
+0,      /*inplace_xor*/
+0,       /*inplace_or*/
+0,             /*nb_floor_divide*/
+0,              /*nb_true_divide*/
+0,     /*nb_inplace_floor_divide*/
+0,      /*nb_inplace_true_divide*/
+0,                     /* nb_index */
+};
+
+PyTypeObject TimelineType = {
+PyObject_HEAD_INIT(NULL)
+0,                         /*ob_size*/
+"_pyo.Timeline_base",         /*tp_name*/
+sizeof(Timeline),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)Timeline_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_compare*/
+0,                         /*tp_repr*/
+&Timeline_as_number,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES, /*tp_flags*/
+"Timeline objects. Sample accurate values and triggers from the server's event scheduler.",           /* tp_doc */
+(traverseproc)Timeline_traverse,   /* tp_traverse */
+(inquiry)Timeline_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+Timeline_methods,             /* tp_methods */
+Timeline_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+Timeline_new,                 /* tp_new */
+};
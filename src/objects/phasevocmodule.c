@@ -29,6 +29,7 @@
 #include "tablemodule.h"
 #include "fft.h"
 #include "wind.h"
+#include "fastmath.h"
 
 static int
 isPowerOfTwo(int x) {
@@ -56,31 +57,35 @@ typedef struct {
     MYFLT *real;
     MYFLT *imag;
     MYFLT *lastPhase;
+    MYFLT *phase;
     MYFLT **twiddle;
     MYFLT *window;
     MYFLT **magn;
     MYFLT **freq;
     int *count;
+    PyoFrameSlot frames;
+    int fastmath; /* 1 = polynomial approximations of fastmath.h, 0 = libm */
 } PVAnal;
 
 
 static void
 PVAnal_realloc_memories(PVAnal *self) {
-    int i, j, n8;
+    int i, j;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->sr / (self->hopsize * TWOPI);
     self->scale = TWOPI * self->hopsize / self->size;
     self->inputLatency = self->size - self->hopsize;
-    self->incount = self->inputLatency;
+    /* Instances are offset from each other so that their frames don't fall in the same blocks. */
+    self->incount = self->inputLatency + Server_scheduleFrames((Server *)self->server, &self->frames, self->hopsize, self->size);
     self->overcount = 0;
-    n8 = self->size >> 3;
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
         self->input_buffer[i] = self->inframe[i] = self->outframe[i] = 0.0;
     self->lastPhase = (MYFLT *)realloc(self->lastPhase, self->hsize * sizeof(MYFLT));
+    self->phase = (MYFLT *)realloc(self->phase, self->hsize * sizeof(MYFLT));
     self->real = (MYFLT *)realloc(self->real, self->hsize * sizeof(MYFLT));
     self->imag = (MYFLT *)realloc(self->imag, self->hsize * sizeof(MYFLT));
     self->magn = (MYFLT **)realloc(self->magn, self->olaps * sizeof(MYFLT *));
@@ -92,13 +97,11 @@ PVAnal_realloc_memories(PVAnal *self) {
             self->magn[i][j] = self->freq[i][j] = 0.0;
     }
     for (i=0; i<self->hsize; i++)
-        self->lastPhase[i] = self->real[i] = self->imag[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+        self->lastPhase[i] = self->phase[i] = self->real[i] = self->imag[i] = 0.0;
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, self->wintype);
     for (i=0; i<self->bufsize; i++)
         self->count[i] = self->incount;
     PVStream_setFFTsize(self->pv_stream, self->size);
@@ -111,7 +114,7 @@ PVAnal_realloc_memories(PVAnal *self) {
 static void
 PVAnal_process(PVAnal *self) {
     int i, k, mod;
-    MYFLT real, imag, mag, phase, tmp;
+    MYFLT real, imag, mag, tmp;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     for (i=0; i<self->bufsize; i++) {
@@ -132,13 +135,18 @@ PVAnal_process(PVAnal *self) {
                 self->imag[k] = self->outframe[self->size - k];
             }
 
+            if (self->fastmath)
+                fast_atan2_block(self->imag, self->real, self->phase, self->hsize);
+            else {
+                for (k=0; k<self->hsize; k++)
+                    self->phase[k] = MYATAN2(self->imag[k], self->real[k]);
+            }
             for (k=0; k<self->hsize; k++) {
                 real = self->real[k];
                 imag = self->imag[k];
                 mag = MYSQRT(real*real + imag*imag);
-                phase = MYATAN2(imag, real);
-                tmp = phase - self->lastPhase[k];
-                self->lastPhase[k] = phase;
+                tmp = self->phase[k] - self->lastPhase[k];
+                self->lastPhase[k] = self->phase[k];
                 while (tmp > PI) tmp -= TWOPI;
                 while (tmp < -PI) tmp += TWOPI;
                 self->magn[self->overcount][k] = mag;
@@ -190,6 +198,8 @@ static void
 PVAnal_dealloc(PVAnal* self)
 {
     int i;
+    if (PyServer_get_server() != NULL)
+        Server_unscheduleFrames((Server *)self->server, &self->frames);
     pyo_DEALLOC
     free(self->input_buffer);
     free(self->inframe);
@@ -197,11 +207,9 @@ PVAnal_dealloc(PVAnal* self)
     free(self->real);
     free(self->imag);
     free(self->lastPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    free(self->phase);
+    fft_release_split_twiddle(self->twiddle);
+    release_window(self->window);
     for(i=0; i<self->olaps; i++) {
         free(self->magn[i]);
         free(self->freq[i]);
@@ -224,7 +232,9 @@ PVAnal_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 1024;
     self->olaps = 4;
     self->wintype = 2;
+    self->frames.slot = -1;
     INIT_OBJECT_COMMON
+    self->fastmath = Server_useFastMath((Server *)self->server);
     Stream_setFunctionPtr(self->stream, PVAnal_compute_next_data_frame);
     self->mode_func_ptr = PVAnal_setProcMode;
 
@@ -308,7 +318,19 @@ PVAnal_setWinType(PVAnal *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        release_window(self->window);
+        self->window = get_window(self->size, self->wintype);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+PVAnal_setFastMath(PVAnal *self, PyObject *arg)
+{
+    if (PyLong_Check(arg) || PyInt_Check(arg)) {
+        self->fastmath = PyInt_AsLong(arg) ? 1 : 0;
     }
 
     Py_INCREF(Py_None);
@@ -332,6 +354,7 @@ static PyMethodDef PVAnal_methods[] = {
 {"setSize", (PyCFunction)PVAnal_setSize, METH_O, "Sets a new FFT size."},
 {"setOverlaps", (PyCFunction)PVAnal_setOverlaps, METH_O, "Sets a new number of overlaps."},
 {"setWinType", (PyCFunction)PVAnal_setWinType, METH_O, "Sets a new window type."},
+{"setFastMath", (PyCFunction)PVAnal_setFastMath, METH_O, "Uses the polynomial approximations of the trigonometric functions if True."},
 {NULL}  /* Sentinel */
 };
 
@@ -405,12 +428,13 @@ typedef struct {
     MYFLT **twiddle;
     MYFLT *window;
     int modebuffer[2]; // need at least 2 slots for mul & add
+    int fastmath; /* 1 = polynomial approximations of fastmath.h, 0 = libm */
 } PVSynth;
 
 
 static void
 PVSynth_realloc_memories(PVSynth *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->hopsize * TWOPI / self->sr;
@@ -418,7 +442,6 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->inputLatency = self->size - self->hopsize;
     self->overcount = 0;
     self->ampscl = 1.0 / MYSQRT(self->olaps);
-    n8 = self->size >> 3;
     self->output_buffer = (MYFLT *)realloc(self->output_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -432,12 +455,10 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->outputAccum = (MYFLT *)realloc(self->outputAccum, (self->size+self->hopsize) * sizeof(MYFLT));
     for (i=0; i<(self->size+self->hopsize); i++)
         self->outputAccum[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    fft_release_split_twiddle(self->twiddle);
+    self->twiddle = fft_get_split_twiddle(self->size);
+    release_window(self->window);
+    self->window = get_window(self->size, self->wintype);
 }
 
 static void
@@ -460,13 +481,19 @@ PVSynth_process(PVSynth *self) {
         self->data[i] = self->output_buffer[count[i] - self->inputLatency];
         if (count[i] >= (self->size-1)) {
             for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
                 tmp = freq[self->overcount][k];
                 tmp = (tmp - k * self->scale) * self->factor;
                 self->sumPhase[k] += tmp;
-                phase = self->sumPhase[k];
-                self->real[k] = mag * MYCOS(phase);
-                self->imag[k] = mag * MYSIN(phase);
+            }
+            if (self->fastmath)
+                fast_sincos_block(magn[self->overcount], self->sumPhase, self->real, self->imag, self->hsize);
+            else {
+                for (k=0; k<self->hsize; k++) {
+                    mag = magn[self->overcount][k];
+                    phase = self->sumPhase[k];
+                    self->real[k] = mag * MYCOS(phase);
+                    self->imag[k] = mag * MYSIN(phase);
+                }
             }
 
             self->inframe[0] = self->real[0];
@@ -572,7 +599,6 @@ PVSynth_clear(PVSynth *self)
 static void
 PVSynth_dealloc(PVSynth* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->output_buffer);
     free(self->outputAccum);
@@ -581,11 +607,8 @@ PVSynth_dealloc(PVSynth* self)
     free(self->real);
     free(self->imag);
     free(self->sumPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    fft_release_split_twiddle(self->twiddle);
+    release_window(self->window);
     PVSynth_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -603,6 +626,7 @@ PVSynth_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->wintype = 2;
     INIT_OBJECT_COMMON
+    self->fastmath = Server_useFastMath((Server *)self->server);
     Stream_setFunctionPtr(self->stream, PVSynth_compute_next_data_frame);
     self->mode_func_ptr = PVSynth_setProcMode;
 
@@ -671,7 +695,8 @@ PVSynth_setWinType(PVSynth *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        release_window(self->window);
+        self->window = get_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
@@ -699,6 +724,17 @@ static PyObject * PVSynth_inplace_sub(PVSynth *self, PyObject *arg) { INPLACE_SU
 static PyObject * PVSynth_div(PVSynth *self, PyObject *arg) { DIV };
 static PyObject * PVSynth_inplace_div(PVSynth *self, PyObject *arg) { INPLACE_DIV };
 
+static PyObject *
+PVSynth_setFastMath(PVSynth *self, PyObject *arg)
+{
+    if (PyLong_Check(arg) || PyInt_Check(arg)) {
+        self->fastmath = PyInt_AsLong(arg) ? 1 : 0;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyMemberDef PVSynth_members[] = {
 {"server", T_OBJECT_EX, offsetof(PVSynth, server), 0, "Pyo server."},
 {"stream", T_OBJECT_EX, offsetof(PVSynth, stream), 0, "Stream object."},
@@ -718,6 +754,7 @@ static PyMethodDef PVSynth_methods[] = {
 {"stop", (PyCFunction)PVSynth_stop, METH_NOARGS, "Stops computing."},
 {"setInput", (PyCFunction)PVSynth_setInput, METH_O, "Sets a new input object."},
 {"setWinType", (PyCFunction)PVSynth_setWinType, METH_O, "Sets a new window type."},
+{"setFastMath", (PyCFunction)PVSynth_setFastMath, METH_O, "Uses the polynomial approximations of the trigonometric functions if True."},
 {"setMul", (PyCFunction)PVSynth_setMul, METH_O, "Sets oscillator mul factor."},
 {"setAdd", (PyCFunction)PVSynth_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)PVSynth_setSub, METH_O, "Sets inverse add factor."},
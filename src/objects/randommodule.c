@@ -39,6 +39,7 @@ typedef struct {
     MYFLT diff;
     MYFLT time;
     int modebuffer[5]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Randi;
 
 static void
@@ -58,7 +59,7 @@ Randi_generate_iii(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -82,7 +83,7 @@ Randi_generate_aii(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -106,7 +107,7 @@ Randi_generate_iai(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -130,7 +131,7 @@ Randi_generate_aai(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -154,7 +155,7 @@ Randi_generate_iia(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -178,7 +179,7 @@ Randi_generate_aia(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -202,7 +203,7 @@ Randi_generate_iaa(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -226,7 +227,7 @@ Randi_generate_aaa(Randi *self) {
         else if (self->time >= 1.0) {
             self->time -= 1.0;
             self->oldValue = self->value;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             self->diff = self->value - self->oldValue;
         }
         self->data[i] = self->oldValue + self->diff * self->time;
@@ -399,7 +400,7 @@ Randi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, RANDI_ID);
+    Server_seedRandom((Server *)self->server, RANDI_ID, &self->rng);
 
     if (self->modebuffer[2] == 0)
         mi = PyFloat_AS_DOUBLE(self->min);
@@ -664,6 +665,7 @@ typedef struct {
     MYFLT value;
     MYFLT time;
     int modebuffer[5]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Randh;
 
 static void
@@ -682,7 +684,7 @@ Randh_generate_iii(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
         }
         self->data[i] = self->value;
     }
@@ -704,7 +706,7 @@ Randh_generate_aii(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
         }
         self->data[i] = self->value;
     }
@@ -726,7 +728,7 @@ Randh_generate_iai(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
         }
         self->data[i] = self->value;
     }
@@ -748,7 +750,7 @@ Randh_generate_aai(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
         }
         self->data[i] = self->value;
     }
@@ -770,7 +772,7 @@ Randh_generate_iia(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
         }
         self->data[i] = self->value;
     }
@@ -792,7 +794,7 @@ Randh_generate_aia(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
         }
         self->data[i] = self->value;
     }
@@ -814,7 +816,7 @@ Randh_generate_iaa(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
         }
         self->data[i] = self->value;
     }
@@ -836,7 +838,7 @@ Randh_generate_aaa(Randh *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
         }
         self->data[i] = self->value;
     }
@@ -1008,7 +1010,7 @@ Randh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, RANDH_ID);
+    Server_seedRandom((Server *)self->server, RANDH_ID, &self->rng);
 
     if (self->modebuffer[2] == 0)
         mi = PyFloat_AS_DOUBLE(self->min);
@@ -1271,6 +1273,7 @@ typedef struct {
     MYFLT value;
     MYFLT time;
     int modebuffer[3]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Choice;
 
 static void
@@ -1286,7 +1289,7 @@ Choice_generate_i(Choice *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = self->choice[(int)((rand()/((MYFLT)(RAND_MAX))) * self->chSize)];
+            self->value = self->choice[(int)((pyorand_int(&self->rng)/((MYFLT)(PYORAND_MAX))) * self->chSize)];
         }
         self->data[i] = self->value;
     }
@@ -1305,7 +1308,7 @@ Choice_generate_a(Choice *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = self->choice[(int)((rand()/((MYFLT)(RAND_MAX))) * self->chSize)];
+            self->value = self->choice[(int)((pyorand_int(&self->rng)/((MYFLT)(PYORAND_MAX))) * self->chSize)];
         }
         self->data[i] = self->value;
     }
@@ -1443,7 +1446,7 @@ Choice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, CHOICE_ID);
+    Server_seedRandom((Server *)self->server, CHOICE_ID, &self->rng);
 
     (*self->mode_func_ptr)(self);
 
@@ -1649,6 +1652,7 @@ typedef struct {
     MYFLT value;
     MYFLT time;
     int modebuffer[4]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } RandInt;
 
 static void
@@ -1665,7 +1669,7 @@ RandInt_generate_ii(RandInt *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma));
         }
         self->data[i] = self->value;
     }
@@ -1685,7 +1689,7 @@ RandInt_generate_ai(RandInt *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma[i]));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma[i]));
         }
         self->data[i] = self->value;
     }
@@ -1705,7 +1709,7 @@ RandInt_generate_ia(RandInt *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma));
         }
         self->data[i] = self->value;
     }
@@ -1725,7 +1729,7 @@ RandInt_generate_aa(RandInt *self) {
             self->time += 1.0;
         else if (self->time >= 1.0) {
             self->time -= 1.0;
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma[i]));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma[i]));
         }
         self->data[i] = self->value;
     }
@@ -1874,7 +1878,7 @@ RandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, RANDINT_ID);
+    Server_seedRandom((Server *)self->server, RANDINT_ID, &self->rng);
 
     (*self->mode_func_ptr)(self);
 
@@ -2091,6 +2095,7 @@ typedef struct {
     MYFLT time;
     MYFLT inc;
     int modebuffer[4]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } RandDur;
 
 static void
@@ -2111,7 +2116,7 @@ RandDur_generate_ii(RandDur *self) {
             range = ma - mi;
             if (range < 0.0)
                 range = 0.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->inc = (1.0 / self->value) / self->sr;
         }
         self->data[i] = self->value;
@@ -2137,7 +2142,7 @@ RandDur_generate_ai(RandDur *self) {
             range = ma - mi;
             if (range < 0.0)
                 range = 0.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->inc = (1.0 / self->value) / self->sr;
         }
         self->data[i] = self->value;
@@ -2162,7 +2167,7 @@ RandDur_generate_ia(RandDur *self) {
             range = ma[i] - mi;
             if (range < 0.0)
                 range = 0.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->inc = (1.0 / self->value) / self->sr;
         }
         self->data[i] = self->value;
@@ -2188,7 +2193,7 @@ RandDur_generate_aa(RandDur *self) {
             range = ma[i] - mi;
             if (range < 0.0)
                 range = 0.0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             self->inc = (1.0 / self->value) / self->sr;
         }
         self->data[i] = self->value;
@@ -2339,7 +2344,7 @@ RandDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, RANDDUR_ID);
+    Server_seedRandom((Server *)self->server, RANDDUR_ID, &self->rng);
 
     if (self->modebuffer[2] == 0)
         mi = PyFloat_AS_DOUBLE(self->min);
@@ -2587,34 +2592,35 @@ typedef struct {
     int loopLen;
     int loopStop;
     int modebuffer[5]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Xnoise;
 
 // no parameter
 static MYFLT
 Xnoise_uniform(Xnoise *self) {
-    return RANDOM_UNIFORM;
+    return pyorand_uniform(&self->rng);
 }
 
 static MYFLT
 Xnoise_linear_min(Xnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a < b) return a;
     else return b;
 }
 
 static MYFLT
 Xnoise_linear_max(Xnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a > b) return a;
     else return b;
 }
 
 static MYFLT
 Xnoise_triangle(Xnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     return ((a + b) * 0.5);
 }
 
@@ -2622,7 +2628,7 @@ Xnoise_triangle(Xnoise *self) {
 static MYFLT
 Xnoise_expon_min(Xnoise *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = -MYLOG(RANDOM_UNIFORM) / self->xx1;
+    MYFLT val = -MYLOG(pyorand_uniform(&self->rng)) / self->xx1;
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -2631,7 +2637,7 @@ Xnoise_expon_min(Xnoise *self) {
 static MYFLT
 Xnoise_expon_max(Xnoise *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = 1.0 - (-MYLOG(RANDOM_UNIFORM) / self->xx1);
+    MYFLT val = 1.0 - (-MYLOG(pyorand_uniform(&self->rng)) / self->xx1);
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -2642,7 +2648,7 @@ static MYFLT
 Xnoise_biexpon(Xnoise *self) {
     MYFLT polar, val;
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT sum = RANDOM_UNIFORM * 2.0;
+    MYFLT sum = pyorand_uniform(&self->rng) * 2.0;
 
     if (sum > 1.0) {
         polar = -1;
@@ -2662,11 +2668,11 @@ static MYFLT
 Xnoise_cauchy(Xnoise *self) {
     MYFLT rnd, val, dir;
     do {
-        rnd = RANDOM_UNIFORM;
+        rnd = pyorand_uniform(&self->rng);
     }
     while (rnd == 0.5);
 
-    if (rand() < (RAND_MAX / 2))
+    if (pyorand_int(&self->rng) < (PYORAND_MAX / 2))
         dir = -1;
     else
         dir = 1;
@@ -2684,7 +2690,7 @@ Xnoise_weibull(Xnoise *self) {
     MYFLT rnd, val;
     if (self->xx2 <= 0.0) self->xx2 = 0.00001;
 
-    rnd = 1.0 / (1.0 - RANDOM_UNIFORM);
+    rnd = 1.0 / (1.0 - pyorand_uniform(&self->rng));
     val = self->xx1 * MYPOW(MYLOG(rnd), (1.0 / self->xx2));
 
     if (val < 0.0) return 0.0;
@@ -2697,7 +2703,7 @@ static MYFLT
 Xnoise_gaussian(Xnoise *self) {
     MYFLT rnd, val;
 
-    rnd = (RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM);
+    rnd = (pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng));
     val = (self->xx2 * (rnd - 3.0) * 0.33 + self->xx1);
 
     if (val < 0.0) return 0.0;
@@ -2727,7 +2733,7 @@ Xnoise_poisson(Xnoise *self) {
             }
         }
     }
-    val = self->poisson_buffer[rand() % self->poisson_tab] / 12.0 * self->xx2;
+    val = self->poisson_buffer[pyorand_int(&self->rng) % self->poisson_tab] / 12.0 * self->xx2;
 
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
@@ -2742,12 +2748,12 @@ Xnoise_walker(Xnoise *self) {
     if (self->xx2 < 0.002) self->xx2 = 0.002;
 
     modulo = (int)(self->xx2 * 1000.0);
-    dir = rand() % 2;
+    dir = pyorand_int(&self->rng) % 2;
 
     if (dir == 0)
-        self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
     else
-        self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
     if (self->walkerValue > self->xx1)
         self->walkerValue = self->xx1;
@@ -2769,12 +2775,12 @@ Xnoise_loopseg(Xnoise *self) {
         if (self->xx2 < 0.002) self->xx2 = 0.002;
 
         modulo = (int)(self->xx2 * 1000.0);
-        dir = rand() % 2;
+        dir = pyorand_int(&self->rng) % 2;
 
         if (dir == 0)
-            self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
         else
-            self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
         if (self->walkerValue > self->xx1)
             self->walkerValue = self->xx1;
@@ -2787,7 +2793,7 @@ Xnoise_loopseg(Xnoise *self) {
             self->loopChoice = 0;
         else {
             self->loopChoice = 1;
-            self->loopStop = (rand() % 4) + 1;
+            self->loopStop = (pyorand_int(&self->rng) % 4) + 1;
         }
     }
     else {
@@ -2804,7 +2810,7 @@ Xnoise_loopseg(Xnoise *self) {
 
         if (self->loopTime == self->loopStop) {
             self->loopChoice = 0;
-            self->loopLen = (rand() % 10) + 3;
+            self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
         }
     }
 
@@ -3171,7 +3177,7 @@ Xnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    Server_generateSeed((Server *)self->server, XNOISE_ID);
+    Server_seedRandom((Server *)self->server, XNOISE_ID, &self->rng);
 
     self->poisson_tab = 0;
     self->lastPoissonX1 = -99.0;
@@ -3182,7 +3188,7 @@ Xnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->loop_buffer[i] = 0.0;
     }
     self->loopChoice = self->loopCountPlay = self->loopTime = self->loopCountRec = self->loopStop = 0;
-    self->loopLen = (rand() % 10) + 3;
+    self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, Xnoise_compute_next_data_frame);
     self->mode_func_ptr = Xnoise_setProcMode;
@@ -3507,6 +3513,7 @@ typedef struct {
     int loopLen;
     int loopStop;
     int modebuffer[5]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } XnoiseMidi;
 
 static MYFLT
@@ -3536,29 +3543,29 @@ XnoiseMidi_convert(XnoiseMidi *self) {
 // no parameter
 static MYFLT
 XnoiseMidi_uniform(XnoiseMidi *self) {
-    return RANDOM_UNIFORM;
+    return pyorand_uniform(&self->rng);
 }
 
 static MYFLT
 XnoiseMidi_linear_min(XnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a < b) return a;
     else return b;
 }
 
 static MYFLT
 XnoiseMidi_linear_max(XnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a > b) return a;
     else return b;
 }
 
 static MYFLT
 XnoiseMidi_triangle(XnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     return ((a + b) * 0.5);
 }
 
@@ -3566,7 +3573,7 @@ XnoiseMidi_triangle(XnoiseMidi *self) {
 static MYFLT
 XnoiseMidi_expon_min(XnoiseMidi *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = -MYLOG(RANDOM_UNIFORM) / self->xx1;
+    MYFLT val = -MYLOG(pyorand_uniform(&self->rng)) / self->xx1;
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -3575,7 +3582,7 @@ XnoiseMidi_expon_min(XnoiseMidi *self) {
 static MYFLT
 XnoiseMidi_expon_max(XnoiseMidi *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = 1.0 - (-MYLOG(RANDOM_UNIFORM) / self->xx1);
+    MYFLT val = 1.0 - (-MYLOG(pyorand_uniform(&self->rng)) / self->xx1);
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -3586,7 +3593,7 @@ static MYFLT
 XnoiseMidi_biexpon(XnoiseMidi *self) {
     MYFLT polar, val;
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT sum = RANDOM_UNIFORM * 2.0;
+    MYFLT sum = pyorand_uniform(&self->rng) * 2.0;
 
     if (sum > 1.0) {
         polar = -1;
@@ -3606,11 +3613,11 @@ static MYFLT
 XnoiseMidi_cauchy(XnoiseMidi *self) {
     MYFLT rnd, val, dir;
     do {
-        rnd = RANDOM_UNIFORM;
+        rnd = pyorand_uniform(&self->rng);
     }
     while (rnd == 0.5);
 
-    if (rand() < (RAND_MAX / 2))
+    if (pyorand_int(&self->rng) < (PYORAND_MAX / 2))
         dir = -1;
     else
         dir = 1;
@@ -3628,7 +3635,7 @@ XnoiseMidi_weibull(XnoiseMidi *self) {
     MYFLT rnd, val;
     if (self->xx2 <= 0.0) self->xx2 = 0.00001;
 
-    rnd = 1.0 / (1.0 - RANDOM_UNIFORM);
+    rnd = 1.0 / (1.0 - pyorand_uniform(&self->rng));
     val = self->xx1 * MYPOW(MYLOG(rnd), (1.0 / self->xx2));
 
     if (val < 0.0) return 0.0;
@@ -3641,7 +3648,7 @@ static MYFLT
 XnoiseMidi_gaussian(XnoiseMidi *self) {
     MYFLT rnd, val;
 
-    rnd = (RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM);
+    rnd = (pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng));
     val = (self->xx2 * (rnd - 3.0) * 0.33 + self->xx1);
 
     if (val < 0.0) return 0.0;
@@ -3671,7 +3678,7 @@ XnoiseMidi_poisson(XnoiseMidi *self) {
             }
         }
     }
-    val = self->poisson_buffer[rand() % self->poisson_tab] / 12.0 * self->xx2;
+    val = self->poisson_buffer[pyorand_int(&self->rng) % self->poisson_tab] / 12.0 * self->xx2;
 
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
@@ -3686,12 +3693,12 @@ XnoiseMidi_walker(XnoiseMidi *self) {
     if (self->xx2 < 0.002) self->xx2 = 0.002;
 
     modulo = (int)(self->xx2 * 1000.0);
-    dir = rand() % 2;
+    dir = pyorand_int(&self->rng) % 2;
 
     if (dir == 0)
-        self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
     else
-        self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
     if (self->walkerValue > self->xx1)
         self->walkerValue = self->xx1;
@@ -3713,12 +3720,12 @@ XnoiseMidi_loopseg(XnoiseMidi *self) {
         if (self->xx2 < 0.002) self->xx2 = 0.002;
 
         modulo = (int)(self->xx2 * 1000.0);
-        dir = rand() % 2;
+        dir = pyorand_int(&self->rng) % 2;
 
         if (dir == 0)
-            self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
         else
-            self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
         if (self->walkerValue > self->xx1)
             self->walkerValue = self->xx1;
@@ -3731,7 +3738,7 @@ XnoiseMidi_loopseg(XnoiseMidi *self) {
             self->loopChoice = 0;
         else {
             self->loopChoice = 1;
-            self->loopStop = (rand() % 4) + 1;
+            self->loopStop = (pyorand_int(&self->rng) % 4) + 1;
         }
     }
     else {
@@ -3748,7 +3755,7 @@ XnoiseMidi_loopseg(XnoiseMidi *self) {
 
         if (self->loopTime == self->loopStop) {
             self->loopChoice = 0;
-            self->loopLen = (rand() % 10) + 3;
+            self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
         }
     }
 
@@ -4127,7 +4134,7 @@ XnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    Server_generateSeed((Server *)self->server, XNOISEMIDI_ID);
+    Server_seedRandom((Server *)self->server, XNOISEMIDI_ID, &self->rng);
 
     self->poisson_tab = 0;
     self->lastPoissonX1 = -99.0;
@@ -4138,7 +4145,7 @@ XnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->loop_buffer[i] = 0.0;
     }
     self->loopChoice = self->loopCountPlay = self->loopTime = self->loopCountRec = self->loopStop = 0;
-    self->loopLen = (rand() % 10) + 3;
+    self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, XnoiseMidi_compute_next_data_frame);
     self->mode_func_ptr = XnoiseMidi_setProcMode;
@@ -4511,34 +4518,35 @@ typedef struct {
     int loopLen;
     int loopStop;
     int modebuffer[6]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } XnoiseDur;
 
 // no parameter
 static MYFLT
 XnoiseDur_uniform(XnoiseDur *self) {
-    return RANDOM_UNIFORM;
+    return pyorand_uniform(&self->rng);
 }
 
 static MYFLT
 XnoiseDur_linear_min(XnoiseDur *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a < b) return a;
     else return b;
 }
 
 static MYFLT
 XnoiseDur_linear_max(XnoiseDur *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a > b) return a;
     else return b;
 }
 
 static MYFLT
 XnoiseDur_triangle(XnoiseDur *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     return ((a + b) * 0.5);
 }
 
@@ -4546,7 +4554,7 @@ XnoiseDur_triangle(XnoiseDur *self) {
 static MYFLT
 XnoiseDur_expon_min(XnoiseDur *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = -MYLOG(RANDOM_UNIFORM) / self->xx1;
+    MYFLT val = -MYLOG(pyorand_uniform(&self->rng)) / self->xx1;
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -4555,7 +4563,7 @@ XnoiseDur_expon_min(XnoiseDur *self) {
 static MYFLT
 XnoiseDur_expon_max(XnoiseDur *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = 1.0 - (-MYLOG(RANDOM_UNIFORM) / self->xx1);
+    MYFLT val = 1.0 - (-MYLOG(pyorand_uniform(&self->rng)) / self->xx1);
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -4566,7 +4574,7 @@ static MYFLT
 XnoiseDur_biexpon(XnoiseDur *self) {
     MYFLT polar, val;
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT sum = RANDOM_UNIFORM * 2.0;
+    MYFLT sum = pyorand_uniform(&self->rng) * 2.0;
 
     if (sum > 1.0) {
         polar = -1;
@@ -4586,11 +4594,11 @@ static MYFLT
 XnoiseDur_cauchy(XnoiseDur *self) {
     MYFLT rnd, val, dir;
     do {
-        rnd = RANDOM_UNIFORM;
+        rnd = pyorand_uniform(&self->rng);
     }
     while (rnd == 0.5);
 
-    if (rand() < (RAND_MAX / 2))
+    if (pyorand_int(&self->rng) < (PYORAND_MAX / 2))
         dir = -1;
     else
         dir = 1;
@@ -4608,7 +4616,7 @@ XnoiseDur_weibull(XnoiseDur *self) {
     MYFLT rnd, val;
     if (self->xx2 <= 0.0) self->xx2 = 0.00001;
 
-    rnd = 1.0 / (1.0 - RANDOM_UNIFORM);
+    rnd = 1.0 / (1.0 - pyorand_uniform(&self->rng));
     val = self->xx1 * MYPOW(MYLOG(rnd), (1.0 / self->xx2));
 
     if (val < 0.0) return 0.0;
@@ -4621,7 +4629,7 @@ static MYFLT
 XnoiseDur_gaussian(XnoiseDur *self) {
     MYFLT rnd, val;
 
-    rnd = (RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM);
+    rnd = (pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng));
     val = (self->xx2 * (rnd - 3.0) * 0.33 + self->xx1);
 
     if (val < 0.0) return 0.0;
@@ -4651,7 +4659,7 @@ XnoiseDur_poisson(XnoiseDur *self) {
             }
         }
     }
-    val = self->poisson_buffer[rand() % self->poisson_tab] / 12.0 * self->xx2;
+    val = self->poisson_buffer[pyorand_int(&self->rng) % self->poisson_tab] / 12.0 * self->xx2;
 
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
@@ -4666,12 +4674,12 @@ XnoiseDur_walker(XnoiseDur *self) {
     if (self->xx2 < 0.002) self->xx2 = 0.002;
 
     modulo = (int)(self->xx2 * 1000.0);
-    dir = rand() % 2;
+    dir = pyorand_int(&self->rng) % 2;
 
     if (dir == 0)
-        self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
     else
-        self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
     if (self->walkerValue > self->xx1)
         self->walkerValue = self->xx1;
@@ -4693,12 +4701,12 @@ XnoiseDur_loopseg(XnoiseDur *self) {
         if (self->xx2 < 0.002) self->xx2 = 0.002;
 
         modulo = (int)(self->xx2 * 1000.0);
-        dir = rand() % 2;
+        dir = pyorand_int(&self->rng) % 2;
 
         if (dir == 0)
-            self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
         else
-            self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
         if (self->walkerValue > self->xx1)
             self->walkerValue = self->xx1;
@@ -4711,7 +4719,7 @@ XnoiseDur_loopseg(XnoiseDur *self) {
             self->loopChoice = 0;
         else {
             self->loopChoice = 1;
-            self->loopStop = (rand() % 4) + 1;
+            self->loopStop = (pyorand_int(&self->rng) % 4) + 1;
         }
     }
     else {
@@ -4728,7 +4736,7 @@ XnoiseDur_loopseg(XnoiseDur *self) {
 
         if (self->loopTime == self->loopStop) {
             self->loopChoice = 0;
-            self->loopLen = (rand() % 10) + 3;
+            self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
         }
     }
 
@@ -4939,7 +4947,7 @@ XnoiseDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    Server_generateSeed((Server *)self->server, XNOISEDUR_ID);
+    Server_seedRandom((Server *)self->server, XNOISEDUR_ID, &self->rng);
 
     self->poisson_tab = 0;
     self->lastPoissonX1 = -99.0;
@@ -4950,7 +4958,7 @@ XnoiseDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->loop_buffer[i] = 0.0;
     }
     self->loopChoice = self->loopCountPlay = self->loopTime = self->loopCountRec = self->loopStop = 0;
-    self->loopLen = (rand() % 10) + 3;
+    self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, XnoiseDur_compute_next_data_frame);
     self->mode_func_ptr = XnoiseDur_setProcMode;
@@ -5313,6 +5321,7 @@ typedef struct {
     MYFLT *trigsBuffer;
     TriggerStream *trig_stream;
     int modebuffer[3]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Urn;
 
 static void
@@ -5332,9 +5341,9 @@ Urn_choose(Urn *self) {
     int value = 0;
     int i, pick;
 
-    pick = rand() % self->length;
+    pick = pyorand_int(&self->rng) % self->length;
     while (pick == self->lastvalue)
-        pick = rand() % self->length;
+        pick = pyorand_int(&self->rng) % self->length;
 
     for (i=0; i<self->length; i++) {
         if (i != pick)
@@ -5541,7 +5550,7 @@ Urn_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     Urn_reset(self);
 
-    Server_generateSeed((Server *)self->server, URN_ID);
+    Server_seedRandom((Server *)self->server, URN_ID, &self->rng);
 
     (*self->mode_func_ptr)(self);
 
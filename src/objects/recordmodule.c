@@ -318,7 +318,7 @@ ControlRec_process(ControlRec *self) {
             }
             self->time++;
             if (self->count >= self->size)
-                PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                Stream_requestStop(self->stream);
         }
     }
     else {
@@ -538,7 +538,7 @@ ControlRead_readframes_i(ControlRead *self) {
     MYFLT invmodulo = 1.0 / self->modulo;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Stream_requestStop(self->stream);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -1153,7 +1153,7 @@ NoteinRead_readframes_i(NoteinRead *self) {
     long i;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Stream_requestStop(self->stream);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -21,6 +21,8 @@
 #include <Python.h>
 #include "structmember.h"
 #include <math.h>
+#include <pthread.h>
+#include <sys/time.h>
 #include "pyomodule.h"
 #include "streammodule.h"
 #include "servermodule.h"
@@ -28,6 +30,17 @@
 #include "sndfile.h"
 #include "interpolation.h"
 
+#define SFSTREAM_THREADS 2
+#define SFSTREAM_SLOTS 8
+#define SFSTREAM_CHUNK 4096 /* frames per slot */
+
+/* A slot holds one chunk of interleaved frames of the sound. The chunk index is
+   written by a streamer thread only, -1 while the slot is empty or being filled. */
+typedef struct {
+    volatile int chunk;
+    MYFLT *data;
+} SfStreamSlot;
+
 /* SfPlayer object */
 typedef struct {
     pyo_audio_HEAD
@@ -50,6 +63,16 @@ typedef struct {
     TriggerStream *trig_stream;
     int init;
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
+    /* Disk streaming, slots are filled by the streamer threads */
+    SNDFILE *io_sf;
+    SF_INFO io_info;
+    SfStreamSlot slots[SFSTREAM_SLOTS];
+    volatile int head; /* frame under the read head, published after each buffer */
+    volatile int direction; /* 1 = forward, -1 = backward */
+    int last_chunk; /* chunk of the read head at the last notification */
+    int busy; /* being serviced by a streamer thread, protected by the streamer lock */
+    unsigned long underruns;
 } SfPlayer;
 
 MYFLT max_arr(MYFLT *a,int n)
@@ -76,10 +99,368 @@ MYFLT min_arr(MYFLT *a,int n)
     return m;
 }
 
+/***************************/
+/* Disk streaming of sounds */
+/***************************/
+/* Players register to a shared pool of streamer threads that keep the chunks around the
+   read head (and the loop start point) in memory. The audio thread only copies frames
+   from the slots. If a chunk is not available (underrun), its frames are replaced by
+   silence and the streamer threads are woken up. An offline server has no deadline and
+   reads them from the file itself. */
+
+typedef struct {
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    pthread_cond_t idle;
+    pthread_t threads[SFSTREAM_THREADS];
+    int running;
+    int quit;
+    SfPlayer **players;
+    int count;
+    int size;
+    int next;
+} SfStreamer;
+
+static SfStreamer sfstreamer = {PTHREAD_MUTEX_INITIALIZER, PTHREAD_COND_INITIALIZER, PTHREAD_COND_INITIALIZER};
+
+/* Fills `wanted` with the chunks needed soon, in order of priority. */
+static int
+SfStreamer_wanted(SfPlayer *self, int *wanted)
+{
+    int i, chunk, num = 0, nchunks, loopchunk;
+    int head = self->head;
+    int dir = self->direction;
+
+    if (self->sndSize <= 0)
+        return 0;
+    nchunks = (self->sndSize - 1) / SFSTREAM_CHUNK + 1;
+    if (dir > 0)
+        loopchunk = (int)self->startPos / SFSTREAM_CHUNK;
+    else
+        loopchunk = (self->startPos == 0. ? self->sndSize - 1 : (int)self->startPos) / SFSTREAM_CHUNK;
+
+    chunk = head / SFSTREAM_CHUNK;
+    if (chunk < 0 || chunk >= nchunks)
+        chunk = loopchunk;
+    while (num < (SFSTREAM_SLOTS - 2)) {
+        for (i=0; i<num; i++) {
+            if (wanted[i] == chunk)
+                break;
+        }
+        if (i < num)
+            break;
+        wanted[num++] = chunk;
+        chunk += dir;
+        if (chunk < 0 || chunk >= nchunks) {
+            if (self->loop == 0)
+                break;
+            chunk = loopchunk;
+        }
+    }
+
+    /* Look-ahead for the loop point. */
+    for (i=0; i<2; i++) {
+        chunk = loopchunk + i * dir;
+        if (chunk < 0 || chunk >= nchunks)
+            break;
+        if (num < SFSTREAM_SLOTS) {
+            int j, found = 0;
+            for (j=0; j<num; j++) {
+                if (wanted[j] == chunk)
+                    found = 1;
+            }
+            if (!found)
+                wanted[num++] = chunk;
+        }
+    }
+    return num;
+}
+
+static int
+SfStreamer_find_slot(SfPlayer *self, int chunk)
+{
+    int i;
+    for (i=0; i<SFSTREAM_SLOTS; i++) {
+        if (self->slots[i].chunk == chunk)
+            return i;
+    }
+    return -1;
+}
+
+/* Returns the first wanted chunk not in memory, or -1. Called with the streamer lock. */
+static int
+SfStreamer_missing(SfPlayer *self, int *wanted, int *num)
+{
+    int i;
+
+    if (self->io_sf == NULL)
+        return -1;
+    *num = SfStreamer_wanted(self, wanted);
+    for (i=0; i<*num; i++) {
+        if (SfStreamer_find_slot(self, wanted[i]) < 0)
+            return wanted[i];
+    }
+    return -1;
+}
+
+/* Loads a chunk in a slot not wanted anymore. Called without the streamer lock, the player is busy. */
+static void
+SfStreamer_load(SfPlayer *self, int chunk, int *wanted, int num)
+{
+    int i, j, slot = -1, frames;
+
+    for (i=0; i<SFSTREAM_SLOTS && slot < 0; i++) {
+        if (self->slots[i].chunk < 0)
+            slot = i;
+    }
+    for (i=0; i<SFSTREAM_SLOTS && slot < 0; i++) {
+        for (j=0; j<num; j++) {
+            if (self->slots[i].chunk == wanted[j])
+                break;
+        }
+        if (j == num)
+            slot = i;
+    }
+    if (slot < 0)
+        return;
+
+    self->slots[slot].chunk = -1;
+    __sync_synchronize();
+    frames = self->sndSize - chunk * SFSTREAM_CHUNK;
+    if (frames > SFSTREAM_CHUNK)
+        frames = SFSTREAM_CHUNK;
+    sf_seek(self->io_sf, chunk * SFSTREAM_CHUNK, SEEK_SET);
+    SF_READ(self->io_sf, self->slots[slot].data, frames * self->sndChnls);
+    __sync_synchronize();
+    self->slots[slot].chunk = chunk;
+}
+
+static void *
+SfStreamer_worker(void *arg)
+{
+    int i, chunk, num;
+    int wanted[SFSTREAM_SLOTS];
+    SfPlayer *player;
+    struct timeval now;
+    struct timespec timeout;
+
+    pthread_mutex_lock(&sfstreamer.lock);
+    while (!sfstreamer.quit) {
+        player = NULL;
+        chunk = -1;
+        for (i=0; i<sfstreamer.count; i++) {
+            SfPlayer *p = sfstreamer.players[(sfstreamer.next + i) % sfstreamer.count];
+            if (p->busy)
+                continue;
+            chunk = SfStreamer_missing(p, wanted, &num);
+            if (chunk >= 0) {
+                player = p;
+                sfstreamer.next = (sfstreamer.next + i + 1) % sfstreamer.count;
+                break;
+            }
+        }
+        if (player == NULL) {
+            gettimeofday(&now, NULL);
+            timeout.tv_sec = now.tv_sec;
+            timeout.tv_nsec = now.tv_usec * 1000 + 50000000;
+            if (timeout.tv_nsec >= 1000000000) {
+                timeout.tv_sec++;
+                timeout.tv_nsec -= 1000000000;
+            }
+            pthread_cond_timedwait(&sfstreamer.cond, &sfstreamer.lock, &timeout);
+            continue;
+        }
+        player->busy = 1;
+        pthread_mutex_unlock(&sfstreamer.lock);
+        SfStreamer_load(player, chunk, wanted, num);
+        pthread_mutex_lock(&sfstreamer.lock);
+        player->busy = 0;
+        pthread_cond_broadcast(&sfstreamer.idle);
+    }
+    pthread_mutex_unlock(&sfstreamer.lock);
+    return NULL;
+}
+
+/* Waits until no streamer thread is servicing the player. Called with the streamer lock. */
+static void
+SfStreamer_wait(SfPlayer *self)
+{
+    while (self->busy)
+        pthread_cond_wait(&sfstreamer.idle, &sfstreamer.lock);
+}
+
+static void
+SfStreamer_register(SfPlayer *self)
+{
+    int i;
+
+    pthread_mutex_lock(&sfstreamer.lock);
+    if (sfstreamer.count >= sfstreamer.size) {
+        sfstreamer.size = sfstreamer.size * 2 + 8;
+        sfstreamer.players = (SfPlayer **)realloc(sfstreamer.players, sfstreamer.size * sizeof(SfPlayer *));
+    }
+    sfstreamer.players[sfstreamer.count++] = self;
+    if (!sfstreamer.running) {
+        sfstreamer.quit = 0;
+        for (i=0; i<SFSTREAM_THREADS; i++)
+            pthread_create(&sfstreamer.threads[i], NULL, SfStreamer_worker, NULL);
+        sfstreamer.running = 1;
+    }
+    pthread_cond_broadcast(&sfstreamer.cond);
+    pthread_mutex_unlock(&sfstreamer.lock);
+}
+
+static void
+SfStreamer_unregister(SfPlayer *self)
+{
+    int i, j, stop = 0;
+
+    pthread_mutex_lock(&sfstreamer.lock);
+    for (i=0; i<sfstreamer.count; i++) {
+        if (sfstreamer.players[i] == self) {
+            SfStreamer_wait(self);
+            for (j=i; j<(sfstreamer.count-1); j++)
+                sfstreamer.players[j] = sfstreamer.players[j+1];
+            sfstreamer.count--;
+            sfstreamer.next = 0;
+            break;
+        }
+    }
+    if (sfstreamer.count == 0 && sfstreamer.running) {
+        sfstreamer.quit = 1;
+        sfstreamer.running = 0;
+        pthread_cond_broadcast(&sfstreamer.cond);
+        stop = 1;
+    }
+    pthread_mutex_unlock(&sfstreamer.lock);
+
+    if (stop) {
+        for (i=0; i<SFSTREAM_THREADS; i++)
+            pthread_join(sfstreamer.threads[i], NULL);
+    }
+}
+
+/* Wakes up the streamer threads without blocking the audio thread. */
+static void
+SfStreamer_notify(void)
+{
+    if (pthread_mutex_trylock(&sfstreamer.lock) == 0) {
+        pthread_cond_signal(&sfstreamer.cond);
+        pthread_mutex_unlock(&sfstreamer.lock);
+    }
+}
+
+/* (Re)opens the streaming handle of the sound and empties the slots. */
+static void
+SfPlayer_openStream(SfPlayer *self)
+{
+    int i;
+
+    pthread_mutex_lock(&sfstreamer.lock);
+    SfStreamer_wait(self);
+    if (self->io_sf != NULL)
+        sf_close(self->io_sf);
+    self->io_info.format = 0;
+    self->io_sf = sf_open(self->path, SFM_READ, &self->io_info);
+    for (i=0; i<SFSTREAM_SLOTS; i++) {
+        self->slots[i].chunk = -1;
+        self->slots[i].data = (MYFLT *)realloc(self->slots[i].data, SFSTREAM_CHUNK * self->sndChnls * sizeof(MYFLT));
+    }
+    pthread_cond_broadcast(&sfstreamer.cond);
+    pthread_mutex_unlock(&sfstreamer.lock);
+}
+
+/* Copies `frames` interleaved frames, starting at `frame`, from the slots in `buffer`.
+   Frames not in memory are zeros, or read from the file with an offline server.
+   Frames outside the sound are zeros. */
+static void
+SfPlayer_read(SfPlayer *self, int frame, MYFLT *buffer, int frames)
+{
+    int i, chunk, slot, start, num, offline, underrun = 0;
+    int chnls = self->sndChnls;
+    MYFLT *data;
+
+    while (frames > 0) {
+        if (frame < 0 || frame >= self->sndSize) {
+            for (i=0; i<chnls; i++)
+                buffer[i] = 0.0;
+            buffer += chnls;
+            frame++;
+            frames--;
+            continue;
+        }
+        chunk = frame / SFSTREAM_CHUNK;
+        start = frame - chunk * SFSTREAM_CHUNK;
+        num = SFSTREAM_CHUNK - start;
+        if (num > frames)
+            num = frames;
+        if ((frame + num) > self->sndSize)
+            num = self->sndSize - frame;
+
+        slot = SfStreamer_find_slot(self, chunk);
+        if (slot >= 0) {
+            __sync_synchronize();
+            data = self->slots[slot].data + start * chnls;
+            for (i=0; i<(num*chnls); i++)
+                buffer[i] = data[i];
+            __sync_synchronize();
+            if (self->slots[slot].chunk != chunk)
+                slot = -1;
+        }
+        if (slot < 0) {
+            underrun = 1;
+            offline = ((Server *)self->server)->audio_be_type == PyoOffline ||
+                      ((Server *)self->server)->audio_be_type == PyoOfflineNB;
+            if (offline) {
+                sf_seek(self->sf, frame, SEEK_SET);
+                SF_READ(self->sf, buffer, num * chnls);
+            }
+            else {
+                for (i=0; i<(num*chnls); i++)
+                    buffer[i] = 0.0;
+            }
+        }
+        buffer += num * chnls;
+        frame += num;
+        frames -= num;
+    }
+    if (underrun) {
+        self->underruns++;
+        SfStreamer_notify();
+    }
+}
+
+/* Number of frames in memory from the read head, in the reading direction. */
+static int
+SfPlayer_fillLevel(SfPlayer *self)
+{
+    int chunk, level = 0, dir = self->direction, head = self->head;
+
+    if (self->sndSize <= 0 || head < 0 || head >= self->sndSize)
+        return 0;
+    chunk = head / SFSTREAM_CHUNK;
+    if (SfStreamer_find_slot(self, chunk) < 0)
+        return 0;
+    if (dir > 0)
+        level = (chunk + 1) * SFSTREAM_CHUNK - head;
+    else
+        level = head - chunk * SFSTREAM_CHUNK + 1;
+    chunk += dir;
+    while (chunk >= 0 && (chunk * SFSTREAM_CHUNK) < self->sndSize && SfStreamer_find_slot(self, chunk) >= 0) {
+        level += SFSTREAM_CHUNK;
+        chunk += dir;
+    }
+    if (dir > 0 && (head + level) > self->sndSize)
+        level = self->sndSize - head;
+    return level;
+}
+
 static void
 SfPlayer_readframes_i(SfPlayer *self) {
-    MYFLT sp, frac, bufpos, delta, startPos;
-    int i, j, totlen, buflen, shortbuflen, pad, bufindex;
+    MYFLT sp, bufpos, delta, startPos;
+    int i, j, totlen, buflen, shortbuflen, pad;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     sf_count_t index;
 
     if (self->modebuffer[0] == 0)
@@ -97,7 +478,7 @@ SfPlayer_readframes_i(SfPlayer *self) {
         if (self->pointerPos >= self->sndSize) {
             self->pointerPos -= self->sndSize - self->startPos;
             if (self->loop == 0) {
-                PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                Stream_requestStop(self->stream);
                 for (i=0; i<(self->bufsize * self->sndChnls); i++) {
                     self->samplesBuffer[i] = 0.0;
                 }
@@ -108,30 +489,24 @@ SfPlayer_readframes_i(SfPlayer *self) {
             }
         }
         index = (int)self->pointerPos;
-        sf_seek(self->sf, index, SEEK_SET); /* sets position pointer in the file */
 
         /* fill a buffer with enough samples to satisfy speed reading */
         /* if not enough samples left in the file */
         if ((index+buflen) > self->sndSize) {
             shortbuflen = self->sndSize - index;
             pad = (buflen-shortbuflen)*self->sndChnls;
-            SF_READ(self->sf, buffer, shortbuflen*self->sndChnls);
+            SfPlayer_read(self, index, buffer, shortbuflen);
             if (self->loop == 0) { /* with zero padding if noloop */
                 for (i=0; i<pad; i++) {
                     buffer[i+shortbuflen*self->sndChnls] = 0.;
                 }
             }
             else { /* wrap around and read new samples if loop */
-                MYFLT buftemp[pad];
-                sf_seek(self->sf, (int)self->startPos, SEEK_SET);
-                SF_READ(self->sf, buftemp, pad);
-                for (i=0; i<(pad); i++) {
-                    buffer[i+shortbuflen*self->sndChnls] = buftemp[i];
-                }
+                SfPlayer_read(self, (int)self->startPos, buffer + shortbuflen*self->sndChnls, buflen-shortbuflen);
             }
         }
         else /* without zero padding */
-            SF_READ(self->sf, buffer, totlen);
+            SfPlayer_read(self, index, buffer, buflen);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -142,13 +517,13 @@ SfPlayer_readframes_i(SfPlayer *self) {
         for (i=0; i<self->bufsize; i++) {
             self->trigsBuffer[i] = 0.0;
             bufpos = self->pointerPos - index;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos += delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos >= self->sndSize)
             self->trigsBuffer[0] = 1.0;
     }
@@ -162,7 +537,7 @@ SfPlayer_readframes_i(SfPlayer *self) {
         if (self->pointerPos <= 0) {
             self->pointerPos += startPos;
             if (self->loop == 0) {
-                PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                Stream_requestStop(self->stream);
                 for (i=0; i<(self->bufsize * self->sndChnls); i++) {
                     self->samplesBuffer[i] = 0.0;
                 }
@@ -188,24 +563,13 @@ SfPlayer_readframes_i(SfPlayer *self) {
                 }
             }
             else { /* wrap around and read new samples if loop */
-                MYFLT buftemp[padlen];
-                sf_seek(self->sf, (int)startPos-pad, SEEK_SET);
-                SF_READ(self->sf, buftemp, padlen);
-                for (i=0; i<padlen; i++) {
-                    buffer[i] = buftemp[i];
-                }
+                SfPlayer_read(self, (int)startPos-pad, buffer, pad);
             }
 
-            MYFLT buftemp2[shortbuflen*self->sndChnls];
-            sf_seek(self->sf, 0, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buftemp2, shortbuflen*self->sndChnls);
-            for (i=0; i<(shortbuflen*self->sndChnls); i++) {
-                buffer[i+padlen] = buftemp2[i];
-            }
+            SfPlayer_read(self, 0, buffer + padlen, shortbuflen);
         }
         else /* without zero padding */
-            sf_seek(self->sf, index-buflen, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buffer, totlen);
+            SfPlayer_read(self, index-buflen, buffer, buflen);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -228,13 +592,13 @@ SfPlayer_readframes_i(SfPlayer *self) {
         for (i=0; i<self->bufsize; i++) {
             self->trigsBuffer[i] = 0.0;
             bufpos = index - self->pointerPos;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos -= delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos <= 0) {
             if (self->init == 0)
                 self->trigsBuffer[0] = 1.0;
@@ -247,6 +611,15 @@ SfPlayer_readframes_i(SfPlayer *self) {
             self->samplesBuffer[i] = 0.0;
         }
     }
+
+    self->head = (int)self->pointerPos;
+    if (sp != 0.0)
+        self->direction = sp > 0 ? 1 : -1;
+    /* The streamer threads only need to be woken up when the read head enters a new chunk. */
+    if ((self->head / SFSTREAM_CHUNK) != self->last_chunk) {
+        self->last_chunk = self->head / SFSTREAM_CHUNK;
+        SfStreamer_notify();
+    }
 }
 
 static void
@@ -284,9 +657,15 @@ SfPlayer_clear(SfPlayer *self)
 static void
 SfPlayer_dealloc(SfPlayer* self)
 {
+    int i;
     pyo_DEALLOC
+    SfStreamer_unregister(self);
     if (self->sf != NULL)
         sf_close(self->sf);
+    if (self->io_sf != NULL)
+        sf_close(self->io_sf);
+    for (i=0; i<SFSTREAM_SLOTS; i++)
+        free(self->slots[i].data);
     free(self->trigsBuffer);
     free(self->samplesBuffer);
     SfPlayer_clear(self);
@@ -326,6 +705,7 @@ SfPlayer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     /* Open the sound file. */
     self->info.format = 0;
@@ -355,6 +735,12 @@ SfPlayer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->pointerPos = self->startPos;
 
+    self->head = (int)self->startPos;
+    self->direction = 1;
+    self->last_chunk = -1;
+    SfPlayer_openStream(self);
+    SfStreamer_register(self);
+
     return (PyObject *)self;
 }
 
@@ -366,6 +752,7 @@ static PyObject * SfPlayer_play(SfPlayer *self, PyObject *args, PyObject *kwds)
 {
     self->init = 1;
     self->pointerPos = self->startPos;
+    self->head = (int)self->startPos;
     PLAY
 };
 
@@ -373,6 +760,7 @@ static PyObject * SfPlayer_out(SfPlayer *self, PyObject *args, PyObject *kwds)
 {
     self->init = 1;
     self->pointerPos = self->startPos;
+    self->head = (int)self->startPos;
     OUT
 };
 
@@ -441,6 +829,9 @@ SfPlayer_setSound(SfPlayer *self, PyObject *arg)
 
     self->startPos = 0.0;
     self->pointerPos = self->startPos;
+    self->head = 0;
+
+    SfPlayer_openStream(self);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -495,11 +886,26 @@ SfPlayer_setInterp(SfPlayer *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
 }
 
+static PyObject *
+SfPlayer_getFillLevel(SfPlayer *self)
+{
+    if (self->sndSr <= 0)
+        return PyFloat_FromDouble(0.0);
+    return PyFloat_FromDouble((double)SfPlayer_fillLevel(self) / self->sndSr);
+}
+
+static PyObject *
+SfPlayer_getUnderruns(SfPlayer *self)
+{
+    return PyInt_FromLong(self->underruns);
+}
+
 MYFLT *
 SfPlayer_getSamplesBuffer(SfPlayer *self)
 {
@@ -526,6 +932,8 @@ static PyMethodDef SfPlayer_methods[] = {
 {"setLoop", (PyCFunction)SfPlayer_setLoop, METH_O, "Sets sfplayer loop mode (0 = no loop, 1 = loop)."},
 {"setOffset", (PyCFunction)SfPlayer_setOffset, METH_O, "Sets sfplayer start position."},
 {"setInterp", (PyCFunction)SfPlayer_setInterp, METH_O, "Sets sfplayer interpolation mode."},
+{"getFillLevel", (PyCFunction)SfPlayer_getFillLevel, METH_NOARGS, "Returns the duration, in seconds, of sound in memory ahead of the read head."},
+{"getUnderruns", (PyCFunction)SfPlayer_getUnderruns, METH_NOARGS, "Returns the number of buffers read directly from disk."},
 {NULL}  /* Sentinel */
 };
 
@@ -856,6 +1264,7 @@ typedef struct {
     MYFLT *markers;
     int markers_size;
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } SfMarkerShuffler;
 
 /*** PROTOTYPES ***/
@@ -864,8 +1273,10 @@ static void SfMarkerShuffler_chooseNewMark(SfMarkerShuffler *self, int dir);
 
 static void
 SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
-    MYFLT sp, frac, bufpos, delta, tmp;
-    int i, j, totlen, buflen, shortbuflen, bufindex;
+    MYFLT sp, bufpos, delta, tmp;
+    int i, j, totlen, buflen, shortbuflen;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     sf_count_t index;
 
     if (self->modebuffer[0] == 0)
@@ -922,13 +1333,13 @@ SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
         /* fill data with samples */
         for (i=0; i<self->bufsize; i++) {
             bufpos = self->pointerPos - index;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos += delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos >= self->endPos) {
             MYFLT off = self->pointerPos - self->endPos;
             SfMarkerShuffler_chooseNewMark((SfMarkerShuffler *)self, 1);
@@ -989,13 +1400,13 @@ SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
         /* fill stream buffer with samples */
         for (i=0; i<self->bufsize; i++) {
             bufpos = index - self->pointerPos;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos -= delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos <= self->endPos) {
             MYFLT off = self->endPos - self->pointerPos;
             SfMarkerShuffler_chooseNewMark((SfMarkerShuffler *)self, 0);
@@ -1143,6 +1554,7 @@ SfMarkerShuffler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->interp_func_ptr = cosine;
     else if (self->interp == 4)
         self->interp_func_ptr = cubic;
+    SET_INTERP_BLOCK_POINTER
 
     /* Open the sound file. */
     self->info.format = 0;
@@ -1232,6 +1644,7 @@ SfMarkerShuffler_setInterp(SfMarkerShuffler *self, PyObject *arg)
         self->interp_func_ptr = cosine;
     else if (self->interp == 4)
         self->interp_func_ptr = cubic;
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -1591,6 +2004,7 @@ typedef struct {
     int old_mark;
     int lastDir;
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } SfMarkerLooper;
 
 /*** PROTOTYPES ***/
@@ -1599,8 +2013,10 @@ static void SfMarkerLooper_chooseNewMark(SfMarkerLooper *self, int dir);
 
 static void
 SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
-    MYFLT sp, frac, bufpos, delta, tmp;
-    int i, j, totlen, buflen, shortbuflen, bufindex;
+    MYFLT sp, bufpos, delta, tmp;
+    int i, j, totlen, buflen, shortbuflen;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
     sf_count_t index;
 
     if (self->modebuffer[0] == 0)
@@ -1657,13 +2073,13 @@ SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
         /* fill data with samples */
         for (i=0; i<self->bufsize; i++) {
             bufpos = self->pointerPos - index;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos += delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos >= self->endPos) {
             MYFLT off = self->pointerPos - self->endPos;
             SfMarkerLooper_chooseNewMark((SfMarkerLooper *)self, 1);
@@ -1724,13 +2140,13 @@ SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
         /* fill stream buffer with samples */
         for (i=0; i<self->bufsize; i++) {
             bufpos = index - self->pointerPos;
-            bufindex = (int)bufpos;
-            frac = bufpos - bufindex;
-            for (j=0; j<self->sndChnls; j++) {
-                self->samplesBuffer[i+(j*self->bufsize)] = (*self->interp_func_ptr)(buffer2[j], bufindex, frac, buflen);
-            }
+            ipos[i] = (int)bufpos;
+            fpos[i] = bufpos - ipos[i];
             self->pointerPos -= delta;
         }
+        for (j=0; j<self->sndChnls; j++) {
+            (*self->interp_block_func_ptr)(buffer2[j], ipos, fpos, buflen, self->samplesBuffer + j*self->bufsize, self->bufsize);
+        }
         if (self->pointerPos <= self->endPos) {
             MYFLT off = self->endPos - self->pointerPos;
             SfMarkerLooper_chooseNewMark((SfMarkerLooper *)self, 0);
@@ -1897,6 +2313,7 @@ SfMarkerLooper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->interp_func_ptr = cosine;
     else if (self->interp == 4)
         self->interp_func_ptr = cubic;
+    SET_INTERP_BLOCK_POINTER
 
     /* Open the sound file. */
     self->info.format = 0;
@@ -2016,6 +2433,7 @@ SfMarkerLooper_setInterp(SfMarkerLooper *self, PyObject *arg)
         self->interp_func_ptr = cosine;
     else if (self->interp == 4)
         self->interp_func_ptr = cubic;
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -27,6 +27,16 @@
 #include "dummymodule.h"
 #include "sndfile.h"
 #include "wind.h"
+#include "resampler.h"
+#include "sndcache.h"
+#include <pthread.h>
+#include <unistd.h>
+
+#ifndef _WIN32
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#endif
 
 #define __TABLE_MODULE
 #include "tablemodule.h"
@@ -85,6 +95,39 @@ TableStream_setSamplingRate(TableStream *self, double sr)
     self->samplingRate = sr;
 }
 
+static void SndTable_exportSamples(PyObject *self);
+
+/* While views are exported, the owner is kept alive and refuses to reallocate
+   its samples (see TABLE_CHECK_EXPORTS). */
+static int
+TableStream_getbuffer(TableStream *self, Py_buffer *view, int flags)
+{
+    if (view != NULL && self->exports == 0 && self->owner != NULL && PyObject_TypeCheck(self->owner, &SndTableType))
+        SndTable_exportSamples(self->owner);
+    self->shape[0] = self->size;
+    self->strides[0] = sizeof(MYFLT);
+    if (Stream_fillBuffer(view, (PyObject *)self, self->data, 1, self->shape, self->strides, 0, flags) < 0)
+        return -1;
+    if (view != NULL)
+        Stream_holdExport(&self->exports, self->owner);
+    return 0;
+}
+
+static void
+TableStream_releasebuffer(TableStream *self, Py_buffer *view)
+{
+    Stream_releaseExport(&self->exports, self->owner);
+}
+
+static PyBufferProcs TableStream_as_buffer = {
+0, /* bf_getreadbuffer */
+0, /* bf_getwritebuffer */
+0, /* bf_getsegcount */
+0, /* bf_getcharbuffer */
+(getbufferproc)TableStream_getbuffer, /* bf_getbuffer */
+(releasebufferproc)TableStream_releasebuffer, /* bf_releasebuffer */
+};
+
 PyTypeObject TableStreamType = {
 PyObject_HEAD_INIT(NULL)
 0, /*ob_size*/
@@ -105,8 +148,8 @@ sizeof(TableStream), /*tp_basicsize*/
 0, /*tp_str*/
 0, /*tp_getattro*/
 0, /*tp_setattro*/
-0, /*tp_as_buffer*/
-Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+&TableStream_as_buffer, /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
 "TableStream objects. For internal use only. Must never be instantiated by the user.", /* tp_doc */
 0, /* tp_traverse */
 0, /* tp_clear */
@@ -201,6 +244,7 @@ HarmTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -261,6 +305,8 @@ HarmTable_setSize(HarmTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -495,6 +541,7 @@ ChebyTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -555,6 +602,8 @@ ChebyTable_setSize(ChebyTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -803,6 +852,7 @@ HannTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"size", NULL};
 
@@ -857,6 +907,8 @@ HannTable_setSize(HannTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -1027,6 +1079,7 @@ SincTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->windowed = 0;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"freq", "windowed", "size", NULL};
 
@@ -1115,6 +1168,8 @@ SincTable_setSize(SincTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -1259,6 +1314,7 @@ WinTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->type = 2;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"type", "size", NULL};
 
@@ -1313,6 +1369,8 @@ WinTable_setSize(WinTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -1491,6 +1549,7 @@ ParaTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"size", NULL};
 
@@ -1545,6 +1604,8 @@ ParaTable_setSize(ParaTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -1725,6 +1786,7 @@ LinTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -1795,6 +1857,8 @@ LinTable_setSize(LinTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -2049,6 +2113,7 @@ LogTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -2119,6 +2184,8 @@ LogTable_setSize(LogTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -2351,6 +2418,7 @@ CosTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -2421,6 +2489,8 @@ CosTable_setSize(CosTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -2677,6 +2747,7 @@ CosLogTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = 8192;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "size", NULL};
 
@@ -2747,6 +2818,8 @@ CosLogTable_setSize(CosLogTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -3006,6 +3079,7 @@ CurveTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->bias = 0.0;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "tension", "bias", "size", NULL};
 
@@ -3118,6 +3192,8 @@ CurveTable_setSize(CurveTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -3376,6 +3452,7 @@ ExpTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->inverse = 1;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"list", "exp", "inverse", "size", NULL};
 
@@ -3488,6 +3565,8 @@ ExpTable_setSize(ExpTable *self, PyObject *value)
     }
 
     old_size = self->size;
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     factor = (MYFLT)(self->size) / old_size;
@@ -3646,79 +3725,537 @@ typedef struct {
     MYFLT stop;
     MYFLT crossfade;
     MYFLT insertPos;
+    int mode; /* 0 = load, 1 = memory-mapped, 2 = lazy memory-mapped */
+    int convSr; /* sampling rate of the table if the sound is converted, 0 otherwise */
+    char *map;
+    size_t maplen;
+    SndCacheEntry *cached; /* samples shared with other tables, NULL if the table owns them */
+    int writable; /* written from the audio thread, the samples are never shared */
+    unsigned int generation; /* incremented by each load or change of the samples */
 } SndTable;
 
+/* Number of frames decoded at once by the loader. */
+#define SNDTABLE_CHUNK_FRAMES 16384
+/* Length of the lowpass filter of the sampling rate conversion. */
+#define SNDTABLE_RESAMPLE_ORDER 256
+
+/* Releases the file mapping or the cached samples, if any. If `keep` is true,
+   the samples are first copied in a heap buffer so the table can be modified or
+   resized without affecting the other tables (copy-on-write). */
 static void
-SndTable_loadSound(SndTable *self) {
+SndTable_releaseShared(SndTable *self, int keep) {
+    MYFLT *data = NULL;
+
+    if (self->map == NULL && self->cached == NULL)
+        return;
+    if (keep) {
+        data = (MYFLT *)malloc((self->size + 1) * sizeof(MYFLT));
+        memcpy(data, self->data, (self->size + 1) * sizeof(MYFLT));
+    }
+    if (self->cached != NULL) {
+        SndCache_release(self->cached);
+        self->cached = NULL;
+    }
+    else {
+#ifndef _WIN32
+        munmap(self->map, self->maplen);
+#endif
+        self->map = NULL;
+        self->maplen = 0;
+    }
+    self->data = data;
+    TableStream_setData(self->tablestream, self->data);
+}
+
+/* Called before the samples are modified in place. Cached samples are copied,
+   mapped ones are already private to the table. */
+static void
+SndTable_makePrivate(SndTable *self) {
+    if (self->cached != NULL)
+        SndTable_releaseShared(self, 1);
+}
+
+/* Buffer views write in the samples, which can't stay shared with other tables. */
+static void
+SndTable_exportSamples(PyObject *self) {
+    SndTable_makePrivate((SndTable *)self);
+}
+
+/* Returns the byte offset of the sample data in a RIFF/WAVE file, or -1. */
+static long
+SndTable_wavDataOffset(char *path) {
+    FILE *f;
+    unsigned char head[12], chunk[8];
+    unsigned long size;
+    long offset = -1;
+
+    f = fopen(path, "rb");
+    if (f == NULL)
+        return -1;
+    if (fread(head, 1, 12, f) == 12 && memcmp(head, "RIFF", 4) == 0 && memcmp(head+8, "WAVE", 4) == 0) {
+        while (fread(chunk, 1, 8, f) == 8) {
+            size = chunk[4] | (chunk[5] << 8) | (chunk[6] << 16) | ((unsigned long)chunk[7] << 24);
+            if (memcmp(chunk, "data", 4) == 0) {
+                offset = ftell(f);
+                break;
+            }
+            if (fseek(f, size + (size & 1), SEEK_CUR) != 0)
+                break;
+        }
+    }
+    fclose(f);
+    return offset;
+}
+
+/* Samples of a table, owned by the table (`data` allocated with malloc), by the
+   sample cache or by a private file mapping. */
+typedef struct {
+    int chnl;
+    MYFLT *data;
+    SndCacheEntry *cached;
+    char *map;
+    size_t maplen;
+    unsigned int generation; /* of the table when the load was issued */
+} SndTableSamples;
+
+/* A sound loaded in `num` tables, one channel each. SndTable_decode fills the
+   samples without touching the tables, so it can run on any thread without the
+   GIL, then SndTable_install swaps them with the samples of the tables. */
+typedef struct {
+    char *path;
+    MYFLT start;
+    MYFLT stop;
+    int mode;
+    int convSr;
+    int shareable; /* 0 if one of the tables is writable */
+    int num;
+    SndTableSamples *samples;
+    unsigned int size;
+    int sr;
+} SndTableLoad;
+
+static void
+SndTable_releaseSamples(SndTableSamples *smp) {
+    if (smp->cached != NULL)
+        SndCache_release(smp->cached);
+#ifndef _WIN32
+    else if (smp->map != NULL)
+        munmap(smp->map, smp->maplen);
+#endif
+    else
+        free(smp->data);
+    smp->data = NULL;
+    smp->cached = NULL;
+    smp->map = NULL;
+    smp->maplen = 0;
+}
+
+/* Prepares the load of a sound in `tables`, with the path, start, stop and
+   conversion rate of the first one. Issuing the load supersedes the loads
+   still pending in these tables. */
+static void
+SndTable_initLoad(SndTableLoad *load, SndTable **tables, int num) {
+    int k;
+
+    load->path = (char *)malloc(strlen(tables[0]->path) + 1);
+    strcpy(load->path, tables[0]->path);
+    load->start = tables[0]->start;
+    load->stop = tables[0]->stop;
+    load->mode = tables[0]->mode;
+    load->convSr = tables[0]->convSr;
+    load->shareable = 1;
+    load->num = num;
+    load->samples = (SndTableSamples *)calloc(num, sizeof(SndTableSamples));
+    for (k=0; k<num; k++) {
+        load->samples[k].chnl = tables[k]->chnl;
+        load->samples[k].generation = ++tables[k]->generation;
+        if (tables[k]->writable)
+            load->shareable = 0;
+    }
+    load->size = 0;
+    load->sr = 0;
+}
+
+/* Releases the samples still held by the load (the previous samples of the
+   tables once installed) and frees it. */
+static void
+SndTable_freeLoad(SndTableLoad *load) {
+    int k;
+
+    for (k=0; k<load->num; k++)
+        SndTable_releaseSamples(&load->samples[k]);
+    free(load->samples);
+    free(load->path);
+}
+
+/* Maps the samples of a mono WAV file, stored in the same floating-point format as
+   MYFLT, directly in the samples of the table. The mapping is private, so the table can still be
+   modified in memory. Pages are read by the system when they are first touched.
+   Returns 0 on success, -1 if the file can't be mapped. */
+static int
+SndTable_mapSound(SndTableLoad *load, SndTableSamples *smp, SF_INFO *info, unsigned int start, unsigned int size) {
+#ifndef _WIN32
+    int fd, one = 1;
+    long offset, pagesize;
+    size_t pageoffset, delta, filelen, maplen;
+    char *map;
+    struct stat st;
+
+    if (*(char *)&one != 1)
+        return -1;
+    if ((info->format & SF_FORMAT_TYPEMASK) != SF_FORMAT_WAV || info->channels != 1)
+        return -1;
+    if ((info->format & SF_FORMAT_SUBMASK) != (sizeof(MYFLT) == sizeof(float) ? SF_FORMAT_FLOAT : SF_FORMAT_DOUBLE))
+        return -1;
+    offset = SndTable_wavDataOffset(load->path);
+    if (offset < 0 || (offset % sizeof(MYFLT)) != 0)
+        return -1;
+
+    fd = open(load->path, O_RDONLY);
+    if (fd < 0)
+        return -1;
+    if (fstat(fd, &st) != 0) {
+        close(fd);
+        return -1;
+    }
+
+    offset += (long)start * sizeof(MYFLT);
+    pagesize = sysconf(_SC_PAGESIZE);
+    pageoffset = offset - (offset % pagesize);
+    delta = offset - pageoffset;
+    /* One more sample for the guard point, which may fall after the end of file. */
+    maplen = delta + (size + 1) * sizeof(MYFLT);
+    filelen = st.st_size > pageoffset ? st.st_size - pageoffset : 0;
+    if (filelen > maplen)
+        filelen = maplen;
+
+    map = (char *)mmap(NULL, maplen, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (map == MAP_FAILED) {
+        close(fd);
+        return -1;
+    }
+    if (filelen > 0 && mmap(map, filelen, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_FIXED, fd, pageoffset) == MAP_FAILED) {
+        munmap(map, maplen);
+        close(fd);
+        return -1;
+    }
+    close(fd);
+
+    madvise(map, maplen, load->mode == 1 ? MADV_WILLNEED : MADV_RANDOM);
+
+    smp->map = map;
+    smp->maplen = maplen;
+    smp->data = (MYFLT *)(map + delta);
+    return 0;
+#else
+    return -1;
+#endif
+}
+
+/* Decodes the sound of a load. Every channel already decoded by another table
+   is shared from the sample cache. The others are decoded in a single pass over
+   the file, in chunks, then added to the cache. If the load has a conversion
+   rate, every chunk goes through a streaming resampler. Doesn't use the python
+   API. Returns -1 if the file can't be opened. */
+static int
+SndTable_decode(SndTableLoad *load) {
     SNDFILE *sf;
     SF_INFO info;
-    unsigned int i, num, num_items, num_chnls, snd_size, start, stop;
-    unsigned int num_count = 0;
-    MYFLT *tmp;
+    int k, tabsr, ndec = 0, num = load->num;
+    unsigned int i, num_chnls, snd_size, start, stop, size, frames, toread;
+    unsigned int count = 0, outsize, outcount = 0;
+    long produced = 0;
+    SndCacheStamp stamp, *key;
+    MYFLT *tmp, *in, *out;
+    PyoResampler **rs = NULL;
+    SndTableSamples **decode;
 
     info.format = 0;
-    sf = sf_open(self->path, SFM_READ, &info);
+    sf = sf_open(load->path, SFM_READ, &info);
     if (sf == NULL)
     {
         printf("SndTable failed to open the file.\n");
-        return;
+        return -1;
     }
     snd_size = info.frames;
-    self->sndSr = info.samplerate;
     num_chnls = info.channels;
+    key = load->shareable && SndCache_stamp(load->path, &stamp) == 0 ? &stamp : NULL;
 
-    if (self->stop <= 0 || self->stop <= self->start || (self->stop*self->sndSr) > snd_size)
+    if (load->stop <= 0 || load->stop <= load->start || (load->stop*info.samplerate) > snd_size)
         stop = snd_size;
     else
-        stop = (unsigned int)(self->stop * self->sndSr);
+        stop = (unsigned int)(load->stop * info.samplerate);
 
-    if (self->start < 0 || (self->start*self->sndSr) > snd_size)
+    if (load->start < 0 || (load->start*info.samplerate) > snd_size)
         start = 0;
     else
-        start = (unsigned int)(self->start * self->sndSr);
+        start = (unsigned int)(load->start * info.samplerate);
 
-    self->size = stop - start;
-    num_items = self->size * num_chnls;
+    size = stop - start;
+    outsize = size;
+    tabsr = info.samplerate;
 
-    /* Allocate space for the data to be read, then read it. */
-    self->data = (MYFLT *)realloc(self->data, (self->size + 1) * sizeof(MYFLT));
+    if (load->convSr > 0 && load->convSr != info.samplerate) {
+        rs = (PyoResampler **)malloc(num * sizeof(PyoResampler *));
+        for (k=0; k<num; k++)
+            rs[k] = PyoResampler_new(load->convSr, info.samplerate, SNDTABLE_RESAMPLE_ORDER);
+        outsize = (unsigned int)PyoResampler_length(rs[0], size);
+        tabsr = load->convSr;
+    }
+    load->size = outsize;
+    load->sr = tabsr;
 
-    /* For sound longer than 1 minute, load 30 sec chunks. */
-    if (self->size > (self->sndSr * 60 * num_chnls)) {
-        tmp = (MYFLT *)malloc(self->sndSr * 30 * num_chnls * sizeof(MYFLT));
-        sf_seek(sf, start, SEEK_SET);
-        num_items = self->sndSr * 30 * num_chnls;
-        do {
-            num = SF_READ(sf, tmp, num_items);
-            for (i=0; i<num; i++) {
-                if ((i % num_chnls) == self->chnl) {
-                    self->data[(int)(num_count++)] = tmp[i];
-                }
-            }
-        } while (num == num_items);
+    if (num == 1 && load->mode != 0 && rs == NULL && SndTable_mapSound(load, &load->samples[0], &info, start, size) == 0) {
         sf_close(sf);
+        load->samples[0].data[size] = load->samples[0].data[0];
+        return 0;
     }
-    /* For sound shorter than 1 minute, load sound in one pass. */
-    else {
-        tmp = (MYFLT *)malloc(num_items * sizeof(MYFLT));
-        sf_seek(sf, start, SEEK_SET);
-        num = SF_READ(sf, tmp, num_items);
-        sf_close(sf);
-        for (i=0; i<num_items; i++) {
-            if ((i % num_chnls) == self->chnl) {
-                self->data[(int)(i/num_chnls)] = tmp[i];
+
+    decode = (SndTableSamples **)malloc(num * sizeof(SndTableSamples *));
+    for (k=0; k<num; k++) {
+        load->samples[k].cached = SndCache_lookup(load->path, key, load->samples[k].chnl % num_chnls, start, stop, tabsr);
+        if (load->samples[k].cached != NULL)
+            load->samples[k].data = load->samples[k].cached->data;
+        else
+            decode[ndec++] = &load->samples[k];
+    }
+
+    /* Allocate space for the data to be read, then read it. */
+    for (k=0; k<ndec; k++)
+        decode[k]->data = (MYFLT *)malloc((outsize + 1) * sizeof(MYFLT));
+
+    tmp = (MYFLT *)malloc(SNDTABLE_CHUNK_FRAMES * num_chnls * sizeof(MYFLT));
+    sf_seek(sf, start, SEEK_SET);
+    while (ndec > 0 && count < size) {
+        toread = size - count;
+        if (toread > SNDTABLE_CHUNK_FRAMES)
+            toread = SNDTABLE_CHUNK_FRAMES;
+        frames = SF_READ(sf, tmp, toread * num_chnls) / num_chnls;
+        if (frames == 0)
+            break;
+        for (k=0; k<ndec; k++) {
+            in = tmp + (decode[k]->chnl % num_chnls);
+            if (rs != NULL) {
+                produced = PyoResampler_process(rs[k], in, num_chnls, frames, decode[k]->data + outcount, 1, outsize - outcount);
+                continue;
             }
+            out = decode[k]->data + count;
+            for (i=0; i<frames; i++)
+                out[i] = in[i*num_chnls];
         }
+        count += frames;
+        outcount += rs != NULL ? produced : frames;
     }
+    sf_close(sf);
+    free(tmp);
 
-    self->data[self->size] = self->data[0];
+    for (k=0; k<ndec; k++) {
+        if (rs != NULL) {
+            /* The missing frames and the tail of the filter. */
+            PyoResampler_flush(rs[k], decode[k]->data + outcount, 1, outsize - outcount);
+        }
+        else {
+            for (i=count; i<size; i++)
+                decode[k]->data[i] = 0.0;
+        }
+        decode[k]->data[outsize] = decode[k]->data[0];
+        decode[k]->cached = SndCache_insert(load->path, key, decode[k]->chnl % num_chnls, start, stop, tabsr, decode[k]->data, outsize);
+        if (decode[k]->cached != NULL)
+            decode[k]->data = decode[k]->cached->data;
+    }
+    if (rs != NULL) {
+        for (k=0; k<num; k++)
+            PyoResampler_free(rs[k]);
+        free(rs);
+    }
+    free(decode);
+    return 0;
+}
 
-    self->start = 0.0;
-    self->stop = -1.0;
-    free(tmp);
-    TableStream_setSize(self->tablestream, self->size);
-    TableStream_setSamplingRate(self->tablestream, self->sndSr);
-    TableStream_setData(self->tablestream, self->data);
+/* Gives the decoded samples to the tables. The previous samples of the tables
+   are left in the load, to be released by SndTable_freeLoad. Called with the GIL,
+   between two blocks: the readers see the new data, size and sampling rate
+   together at the beginning of the next block. A table loaded or modified since
+   the load was issued, or whose samples are exported, keeps its samples, the
+   decoded ones are dropped with the load. Returns the number of tables installed. */
+static int
+SndTable_install(SndTable **tables, SndTableLoad *load) {
+    int k, installed = 0;
+    SndTableSamples old;
+    SndTable *table;
+
+    for (k=0; k<load->num; k++) {
+        table = tables[k];
+        if (load->samples[k].generation != table->generation || table->tablestream->exports > 0)
+            continue;
+        old.chnl = table->chnl;
+        old.data = table->data;
+        old.cached = table->cached;
+        old.map = table->map;
+        old.maplen = table->maplen;
+        table->data = load->samples[k].data;
+        table->cached = load->samples[k].cached;
+        table->map = load->samples[k].map;
+        table->maplen = load->samples[k].maplen;
+        load->samples[k] = old;
+
+        table->size = load->size;
+        table->sndSr = load->sr;
+        table->start = 0.0;
+        table->stop = -1.0;
+        TableStream_setSize(table->tablestream, table->size);
+        TableStream_setSamplingRate(table->tablestream, table->sndSr);
+        TableStream_setData(table->tablestream, table->data);
+        /* Made writable while the sound was decoded. */
+        if (table->writable)
+            SndTable_makePrivate(table);
+        installed++;
+    }
+    return installed;
+}
+
+/* Sets a BufferError and returns -1 if the samples of one of the tables are exported. */
+static int
+SndTable_checkExports(SndTable **tables, int num) {
+    int k;
+    SndTable *self;
+
+    for (k=0; k<num; k++) {
+        self = tables[k];
+        TABLE_CHECK_EXPORTS(-1)
+    }
+    return 0;
+}
+
+/* Loads a sound in `num` tables sharing the same path, start and stop, each
+   table receiving its own channel. The GIL is released while the file is read. */
+static void
+SndTable_loadSounds(SndTable **tables, int num) {
+    int err;
+    SndTableLoad load;
+
+    SndTable_initLoad(&load, tables, num);
+    Py_BEGIN_ALLOW_THREADS
+    err = SndTable_decode(&load);
+    Py_END_ALLOW_THREADS
+    if (err == 0)
+        SndTable_install(tables, &load);
+    SndTable_freeLoad(&load);
+}
+
+static void
+SndTable_loadSound(SndTable *self) {
+    SndTable_loadSounds(&self, 1);
+}
+
+/* Asynchronous load. A thread decodes the sound without the GIL, then the new
+   samples are installed by the audio thread at the beginning of the next block,
+   as a server event, so a table never changes while the streams are computed.
+   If the server is not running, the loading thread installs them itself. The
+   previous samples are released by the loading thread, then `callback` is
+   called, from this thread, with True, or False if the file can't be read or
+   if the load was superseded by a later one. */
+typedef struct {
+    SndTableLoad load;
+    SndTable **tables; /* new references */
+    PyObject *callback; /* new reference, or NULL */
+    int installed; /* -1 until the install, then the number of tables installed */
+} SndTableJob;
+
+static void
+SndTable_installEvent(PyObject *target, int offset, MYFLT value, int arg) {
+    SndTableJob *job = (SndTableJob *)PyCapsule_GetPointer(target, NULL);
+
+    job->installed = SndTable_install(job->tables, &job->load);
+}
+
+static void *
+SndTable_loadThread(void *arg) {
+    int k, ok;
+    PyObject *event, *result;
+    PyGILState_STATE state;
+    Server *server;
+    SndTableJob *job = (SndTableJob *)arg;
+
+    ok = SndTable_decode(&job->load) == 0;
+
+    state = PyGILState_Ensure();
+    server = (Server *)job->tables[0]->server;
+    if (ok && server->server_started) {
+        event = PyCapsule_New(job, NULL, NULL);
+        Server_scheduleEvent(server, 0, SndTable_installEvent, event, 0.0, 0);
+        while (job->installed < 0) {
+            Py_BEGIN_ALLOW_THREADS
+            usleep(1000);
+            Py_END_ALLOW_THREADS
+            if (job->installed < 0 && !server->server_started) {
+                /* Stopped before the next block. */
+                Server_unscheduleEvents(server, event);
+                break;
+            }
+        }
+        Py_DECREF(event);
+    }
+    if (ok && job->installed < 0)
+        job->installed = SndTable_install(job->tables, &job->load);
+    ok = ok && job->installed > 0;
+
+    Py_BEGIN_ALLOW_THREADS
+    SndTable_freeLoad(&job->load);
+    Py_END_ALLOW_THREADS
+
+    if (job->callback != NULL) {
+        result = PyObject_CallFunctionObjArgs(job->callback, ok ? Py_True : Py_False, NULL);
+        if (result == NULL)
+            PyErr_Print();
+        else
+            Py_DECREF(result);
+        Py_DECREF(job->callback);
+    }
+    for (k=0; k<job->load.num; k++)
+        Py_DECREF(job->tables[k]);
+    free(job->tables);
+    free(job);
+    PyGILState_Release(state);
+    return NULL;
+}
+
+/* Starts the asynchronous load of the sound of `tables[0]` in `tables`. Called
+   with the GIL. Returns -1 if the thread can't be started. */
+static int
+SndTable_loadSoundsAsync(SndTable **tables, int num, PyObject *callback) {
+    int k;
+    pthread_t thread;
+    pthread_attr_t attr;
+    SndTableJob *job = (SndTableJob *)calloc(1, sizeof(SndTableJob));
+
+    SndTable_initLoad(&job->load, tables, num);
+    job->installed = -1;
+    job->tables = (SndTable **)malloc(num * sizeof(SndTable *));
+    for (k=0; k<num; k++) {
+        Py_INCREF(tables[k]);
+        job->tables[k] = tables[k];
+    }
+    if (callback != NULL && callback != Py_None) {
+        Py_INCREF(callback);
+        job->callback = callback;
+    }
+
+    PyEval_InitThreads();
+    pthread_attr_init(&attr);
+    pthread_attr_setdetachstate(&attr, PTHREAD_CREATE_DETACHED);
+    k = pthread_create(&thread, &attr, SndTable_loadThread, job);
+    pthread_attr_destroy(&attr);
+    if (k != 0) {
+        SndTable_freeLoad(&job->load);
+        for (k=0; k<num; k++)
+            Py_DECREF(job->tables[k]);
+        free(job->tables);
+        Py_XDECREF(job->callback);
+        free(job);
+        return -1;
+    }
+    return 0;
 }
 
 static void
@@ -4040,6 +4577,7 @@ SndTable_clear(SndTable *self)
 static void
 SndTable_dealloc(SndTable* self)
 {
+    SndTable_releaseShared(self, 0);
     free(self->data);
     SndTable_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -4060,12 +4598,20 @@ SndTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->stop = -1.0;
     self->crossfade = 0.0;
     self->insertPos = 0.0;
+    self->mode = 0;
+    self->convSr = 0;
+    self->map = NULL;
+    self->maplen = 0;
+    self->cached = NULL;
+    self->writable = 0;
+    self->generation = 0;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
-    static char *kwlist[] = {"path", "chnl", "start", "stop", NULL};
+    static char *kwlist[] = {"path", "chnl", "start", "stop", "mode", "sr", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_IFF, kwlist, &self->path, &self->chnl, &self->start, &self->stop))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_IFFII, kwlist, &self->path, &self->chnl, &self->start, &self->stop, &self->mode, &self->convSr))
         return PyInt_FromLong(-1);
 
     if (strcmp(self->path, "") == 0) {
@@ -4091,26 +4637,40 @@ SndTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
 static PyObject * SndTable_getServer(SndTable* self) { GET_SERVER };
 static PyObject * SndTable_getTableStream(SndTable* self) { GET_TABLE_STREAM };
-static PyObject * SndTable_setData(SndTable *self, PyObject *arg) { SET_TABLE_DATA };
-static PyObject * SndTable_normalize(SndTable *self) { NORMALIZE };
-static PyObject * SndTable_reset(SndTable *self) { TABLE_RESET };
-static PyObject * SndTable_removeDC(SndTable *self) { REMOVE_DC };
-static PyObject * SndTable_reverse(SndTable *self) { REVERSE };
-static PyObject * SndTable_invert(SndTable *self) { INVERT };
-static PyObject * SndTable_rectify(SndTable *self) { RECTIFY };
-static PyObject * SndTable_bipolarGain(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_BIPOLAR_GAIN };
-static PyObject * SndTable_lowpass(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_LOWPASS };
-static PyObject * SndTable_fadein(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_FADEIN };
-static PyObject * SndTable_fadeout(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_FADEOUT };
-static PyObject * SndTable_pow(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_POWER };
-static PyObject * SndTable_copy(SndTable *self, PyObject *arg) { COPY };
-static PyObject * SndTable_setTable(SndTable *self, PyObject *arg) { SET_TABLE };
+
+static PyObject *
+SndTable_setData(SndTable *self, PyObject *arg)
+{
+    /* The shared samples are dropped only once the new ones are valid. */
+    if (! PyList_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "The data must be a list of floats.");
+        return PyInt_FromLong(-1);
+    }
+    TABLE_CHECK_EXPORTS(NULL)
+    SndTable_releaseShared(self, 0);
+    self->generation++;
+    { SET_TABLE_DATA }
+};
+
+static PyObject * SndTable_normalize(SndTable *self) { SndTable_makePrivate(self); { NORMALIZE } };
+static PyObject * SndTable_reset(SndTable *self) { SndTable_makePrivate(self); { TABLE_RESET } };
+static PyObject * SndTable_removeDC(SndTable *self) { SndTable_makePrivate(self); { REMOVE_DC } };
+static PyObject * SndTable_reverse(SndTable *self) { SndTable_makePrivate(self); { REVERSE } };
+static PyObject * SndTable_invert(SndTable *self) { SndTable_makePrivate(self); { INVERT } };
+static PyObject * SndTable_rectify(SndTable *self) { SndTable_makePrivate(self); { RECTIFY } };
+static PyObject * SndTable_bipolarGain(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_BIPOLAR_GAIN } };
+static PyObject * SndTable_lowpass(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_LOWPASS } };
+static PyObject * SndTable_fadein(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_FADEIN } };
+static PyObject * SndTable_fadeout(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_FADEOUT } };
+static PyObject * SndTable_pow(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_POWER } };
+static PyObject * SndTable_copy(SndTable *self, PyObject *arg) { SndTable_makePrivate(self); { COPY } };
+static PyObject * SndTable_setTable(SndTable *self, PyObject *arg) { SndTable_makePrivate(self); { SET_TABLE } };
 static PyObject * SndTable_getTable(SndTable *self) { GET_TABLE };
-static PyObject * SndTable_put(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_PUT };
+static PyObject * SndTable_put(SndTable *self, PyObject *args, PyObject *kwds) { SndTable_makePrivate(self); { TABLE_PUT } };
 static PyObject * SndTable_get(SndTable *self, PyObject *args, PyObject *kwds) { TABLE_GET };
-static PyObject * SndTable_add(SndTable *self, PyObject *arg) { TABLE_ADD };
-static PyObject * SndTable_sub(SndTable *self, PyObject *arg) { TABLE_SUB };
-static PyObject * SndTable_mul(SndTable *self, PyObject *arg) { TABLE_MUL };
+static PyObject * SndTable_add(SndTable *self, PyObject *arg) { SndTable_makePrivate(self); { TABLE_ADD } };
+static PyObject * SndTable_sub(SndTable *self, PyObject *arg) { SndTable_makePrivate(self); { TABLE_SUB } };
+static PyObject * SndTable_mul(SndTable *self, PyObject *arg) { SndTable_makePrivate(self); { TABLE_MUL } };
 
 static PyObject *
 SndTable_getViewTable(SndTable *self, PyObject *args, PyObject *kwds) {
@@ -4258,6 +4818,8 @@ SndTable_setSound(SndTable *self, PyObject *args, PyObject *kwds)
 
     MYFLT stoptmp = -1.0;
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_IFF, kwlist, &self->path, &self->chnl, &self->start, &stoptmp)) {
         Py_INCREF(Py_None);
         return Py_None;
@@ -4270,6 +4832,112 @@ SndTable_setSound(SndTable *self, PyObject *args, PyObject *kwds)
     return Py_None;
 }
 
+static PyObject *
+SndTable_setSoundChannels(SndTable *self, PyObject *args, PyObject *kwds)
+{
+    int i, num;
+    PyObject *others;
+    SndTable **tables;
+    static char *kwlist[] = {"path", "tables", "start", "stop", NULL};
+
+    MYFLT stoptmp = -1.0;
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_SO_FF, kwlist, &self->path, &others, &self->start, &stoptmp)) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+
+    if (! PyList_Check(others)) {
+        PyErr_SetString(PyExc_TypeError, "\"tables\" argument must be a list of SndTable_base objects.");
+        return NULL;
+    }
+    num = PyList_Size(others) + 1;
+    for (i=1; i<num; i++) {
+        if (! PyObject_TypeCheck(PyList_GET_ITEM(others, i-1), &SndTableType)) {
+            PyErr_SetString(PyExc_TypeError, "\"tables\" argument must be a list of SndTable_base objects.");
+            return NULL;
+        }
+    }
+
+    tables = (SndTable **)malloc(num * sizeof(SndTable *));
+    tables[0] = self;
+    for (i=1; i<num; i++)
+        tables[i] = (SndTable *)PyList_GET_ITEM(others, i-1);
+    if (SndTable_checkExports(tables, num) < 0) {
+        free(tables);
+        return NULL;
+    }
+    for (i=0; i<num; i++) {
+        tables[i]->chnl = i;
+        tables[i]->convSr = self->convSr;
+        tables[i]->path = self->path;
+        tables[i]->start = self->start;
+        tables[i]->stop = stoptmp;
+    }
+
+    SndTable_loadSounds(tables, num);
+    free(tables);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+SndTable_setSoundAsync(SndTable *self, PyObject *args, PyObject *kwds)
+{
+    int i, num;
+    PyObject *others, *callback = NULL;
+    SndTable **tables;
+    static char *kwlist[] = {"path", "tables", "start", "stop", "callback", NULL};
+
+    MYFLT stoptmp = -1.0;
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_SO_FFO, kwlist, &self->path, &others, &self->start, &stoptmp, &callback))
+        return NULL;
+
+    if (! PyList_Check(others)) {
+        PyErr_SetString(PyExc_TypeError, "\"tables\" argument must be a list of SndTable_base objects.");
+        return NULL;
+    }
+    num = PyList_Size(others) + 1;
+    for (i=1; i<num; i++) {
+        if (! PyObject_TypeCheck(PyList_GET_ITEM(others, i-1), &SndTableType)) {
+            PyErr_SetString(PyExc_TypeError, "\"tables\" argument must be a list of SndTable_base objects.");
+            return NULL;
+        }
+    }
+    if (callback != NULL && callback != Py_None && ! PyCallable_Check(callback)) {
+        PyErr_SetString(PyExc_TypeError, "\"callback\" argument must be callable.");
+        return NULL;
+    }
+
+    tables = (SndTable **)malloc(num * sizeof(SndTable *));
+    tables[0] = self;
+    for (i=1; i<num; i++)
+        tables[i] = (SndTable *)PyList_GET_ITEM(others, i-1);
+    if (SndTable_checkExports(tables, num) < 0) {
+        free(tables);
+        return NULL;
+    }
+    for (i=0; i<num; i++) {
+        tables[i]->chnl = i;
+        tables[i]->convSr = self->convSr;
+        tables[i]->path = self->path;
+        tables[i]->start = self->start;
+        tables[i]->stop = stoptmp;
+    }
+
+    i = SndTable_loadSoundsAsync(tables, num, callback);
+    free(tables);
+    if (i < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "SndTable could not start the loading thread.");
+        return NULL;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyObject *
 SndTable_append(SndTable *self, PyObject *args, PyObject *kwds)
 {
@@ -4278,6 +4946,8 @@ SndTable_append(SndTable *self, PyObject *args, PyObject *kwds)
     MYFLT stoptmp = -1.0;
     MYFLT crosstmp = 0.0;
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_FIFF, kwlist, &self->path, &crosstmp, &self->chnl, &self->start, &stoptmp)) {
         Py_INCREF(Py_None);
         return Py_None;
@@ -4289,6 +4959,8 @@ SndTable_append(SndTable *self, PyObject *args, PyObject *kwds)
     else
         self->crossfade = crosstmp;
 
+    SndTable_releaseShared(self, 1);
+    self->generation++;
     SndTable_appendSound(self);
 
     Py_INCREF(Py_None);
@@ -4304,6 +4976,8 @@ SndTable_insert(SndTable *self, PyObject *args, PyObject *kwds)
     MYFLT crosstmp = 0.0;
     MYFLT postmp = 0.0;
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_FFIFF, kwlist, &self->path, &postmp, &crosstmp, &self->chnl, &self->start, &stoptmp)) {
         Py_INCREF(Py_None);
         return Py_None;
@@ -4315,6 +4989,8 @@ SndTable_insert(SndTable *self, PyObject *args, PyObject *kwds)
     else
         self->crossfade = crosstmp;
 
+    SndTable_releaseShared(self, 1);
+    self->generation++;
     if (postmp <= 0.0)
         SndTable_prependSound(self);
     else if (postmp >= ((self->size-1) / self->sndSr))
@@ -4333,6 +5009,10 @@ SndTable_setSize(SndTable *self, PyObject *value)
 {
     Py_ssize_t i;
 
+    TABLE_CHECK_EXPORTS(NULL)
+
+    SndTable_releaseShared(self, 0);
+    self->generation++;
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -4350,6 +5030,29 @@ SndTable_setSize(SndTable *self, PyObject *value)
     return Py_None;
 }
 
+static PyObject *
+SndTable_unshare(SndTable *self)
+{
+    SndTable_makePrivate(self);
+    Py_INCREF(Py_None);
+    return Py_None;
+};
+
+static PyObject *
+SndTable_makeWritable(SndTable *self)
+{
+    self->writable = 1;
+    SndTable_makePrivate(self);
+    Py_INCREF(Py_None);
+    return Py_None;
+};
+
+static PyObject *
+SndTable_isShared(SndTable *self)
+{
+    return PyBool_FromLong(self->cached != NULL);
+};
+
 static PyObject *
 SndTable_getSize(SndTable *self)
 {
@@ -4392,10 +5095,15 @@ static PyMethodDef SndTable_methods[] = {
 {"put", (PyCFunction)SndTable_put, METH_VARARGS|METH_KEYWORDS, "Puts a value at specified position in the table."},
 {"get", (PyCFunction)SndTable_get, METH_VARARGS|METH_KEYWORDS, "Gets the value at specified position in the table."},
 {"setSound", (PyCFunction)SndTable_setSound, METH_VARARGS|METH_KEYWORDS, "Load a new sound in the table."},
+{"setSoundChannels", (PyCFunction)SndTable_setSoundChannels, METH_VARARGS|METH_KEYWORDS, "Load a new sound in this table and the given ones, decoding the file once."},
+{"setSoundAsync", (PyCFunction)SndTable_setSoundAsync, METH_VARARGS|METH_KEYWORDS, "Load a new sound in this table and the given ones on a thread, and swap it at the beginning of a block."},
 {"append", (PyCFunction)SndTable_append, METH_VARARGS|METH_KEYWORDS, "Append a sound in the table."},
 {"insert", (PyCFunction)SndTable_insert, METH_VARARGS|METH_KEYWORDS, "Insert a sound in the table."},
 {"setSize", (PyCFunction)SndTable_setSize, METH_O, "Sets the size of the table in samples"},
 {"getSize", (PyCFunction)SndTable_getSize, METH_NOARGS, "Return the size of the table in samples."},
+{"unshare", (PyCFunction)SndTable_unshare, METH_NOARGS, "Copy the cached samples shared with other tables, if any, in a buffer owned by the table."},
+{"makeWritable", (PyCFunction)SndTable_makeWritable, METH_NOARGS, "Keep the samples private to the table, an object writes in them from the audio thread."},
+{"isShared", (PyCFunction)SndTable_isShared, METH_NOARGS, "Return True if the samples are shared with other tables through the sample cache."},
 {"getRate", (PyCFunction)SndTable_getRate, METH_NOARGS, "Return the frequency (in cps) that reads the sound without pitch transposition."},
 {"add", (PyCFunction)SndTable_add, METH_O, "Performs table addition."},
 {"sub", (PyCFunction)SndTable_sub, METH_O, "Performs table substraction."},
@@ -4529,6 +5237,7 @@ NewTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->feedback = 0.0;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"length", "init", "feedback", NULL};
 
@@ -4844,6 +5553,7 @@ DataTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->pointer = 0;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"size", "init", NULL};
 
@@ -5047,6 +5757,7 @@ AtanTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->slope = 0.5;
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
+    self->tablestream->owner = (PyObject *)self;
 
     static char *kwlist[] = {"slope", "size", NULL};
 
@@ -5122,6 +5833,8 @@ AtanTable_setSize(AtanTable *self, PyObject *value)
         return PyInt_FromLong(-1);
     }
 
+    TABLE_CHECK_EXPORTS(NULL)
+
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -5240,7 +5953,7 @@ TableRec_compute_next_data_frame(TableRec *self)
 {
     int i, num, upBound;
     MYFLT val;
-    int size = PyInt_AsLong(NewTable_getSize((NewTable *)self->table));
+    int size = self->table->size;
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -5364,6 +6077,7 @@ TableRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->table);
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
@@ -5416,6 +6130,7 @@ TableRec_setTable(TableRec *self, PyObject *arg)
     Py_INCREF(tmp);
 	Py_DECREF(self->table);
     self->table = (NewTable *)tmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -5852,6 +6567,7 @@ TableMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->table);
     Py_INCREF(tabletmp);
     self->table = (PyObject *)tabletmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
     Py_XDECREF(self->sources);
     Py_INCREF(sourcestmp);
@@ -5884,6 +6600,7 @@ TableMorph_setTable(TableMorph *self, PyObject *arg)
     Py_INCREF(tmp);
 	Py_DECREF(self->table);
     self->table = (PyObject *)tmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -5995,7 +6712,7 @@ TrigTableRec_compute_next_data_frame(TrigTableRec *self)
 {
     int i, j, num, upBound;
     MYFLT val;
-    int size = PyInt_AsLong(NewTable_getSize((NewTable *)self->table));
+    int size = self->table->size;
 
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *trig = Stream_getData((Stream *)self->trigger_stream);
@@ -6170,6 +6887,7 @@ TrigTableRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->table);
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
@@ -6215,6 +6933,7 @@ TrigTableRec_setTable(TrigTableRec *self, PyObject *arg)
     Py_INCREF(tmp);
 	Py_DECREF(self->table);
     self->table = (NewTable *)tmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -6545,7 +7264,7 @@ static void
 TablePut_compute_next_data_frame(TablePut *self)
 {
     int i;
-    int size = PyInt_AsLong(DataTable_getSize((DataTable *)self->table));
+    int size = self->table->size;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     for (i=0; i<self->bufsize; i++) {
@@ -6629,6 +7348,7 @@ TablePut_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->table);
     Py_INCREF(tabletmp);
     self->table = (DataTable *)tabletmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
@@ -6671,6 +7391,7 @@ TablePut_setTable(TablePut *self, PyObject *arg)
     Py_INCREF(tmp);
 	Py_DECREF(self->table);
     self->table = (DataTable *)tmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -6835,6 +7556,7 @@ TableWrite_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->table);
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
@@ -6890,6 +7612,7 @@ TableWrite_setTable(TableWrite *self, PyObject *arg)
     Py_INCREF(tmp);
 	Py_DECREF(self->table);
     self->table = (NewTable *)tmp;
+    MAKE_TABLE_WRITABLE(self->table);
 
 	Py_INCREF(Py_None);
 	return Py_None;
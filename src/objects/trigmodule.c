@@ -35,6 +35,7 @@ typedef struct {
     Stream *max_stream;
     MYFLT value;
     int modebuffer[3]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } TrigRandInt;
 
 static void
@@ -45,7 +46,7 @@ TrigRandInt_generate_i(TrigRandInt *self) {
 
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1)
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma));
 
         self->data[i] = self->value;
     }
@@ -59,7 +60,7 @@ TrigRandInt_generate_a(TrigRandInt *self) {
 
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1)
-            self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma[i]));
+            self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma[i]));
 
         self->data[i] = self->value;
     }
@@ -198,13 +199,13 @@ TrigRandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, TRIGRANDINT_ID);
+    Server_seedRandom((Server *)self->server, TRIGRANDINT_ID, &self->rng);
 
     if (self->modebuffer[2] == 0)
         ma = PyFloat_AS_DOUBLE(PyNumber_Float(self->max));
     else
         ma = Stream_getData((Stream *)self->max_stream)[0];
-    self->value = (MYFLT)((int)(rand()/((MYFLT)(RAND_MAX)+1)*ma));
+    self->value = (MYFLT)((int)(pyorand_uniform(&self->rng)*ma));
 
     (*self->mode_func_ptr)(self);
 
@@ -388,6 +389,7 @@ typedef struct {
     MYFLT stepVal;
     int timeCount;
     int modebuffer[4]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } TrigRand;
 
 static void
@@ -401,7 +403,7 @@ TrigRand_generate_ii(TrigRand *self) {
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1) {
             self->timeCount = 0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             if (self->time <= 0.0)
                 self->currentValue = self->value;
             else
@@ -432,7 +434,7 @@ TrigRand_generate_ai(TrigRand *self) {
         MYFLT range = ma - mi[i];
         if (in[i] == 1) {
             self->timeCount = 0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             if (self->time <= 0.0)
                 self->currentValue = self->value;
             else
@@ -463,7 +465,7 @@ TrigRand_generate_ia(TrigRand *self) {
         MYFLT range = ma[i] - mi;
         if (in[i] == 1) {
             self->timeCount = 0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi;
+            self->value = range * (pyorand_uniform(&self->rng)) + mi;
             if (self->time <= 0.0)
                 self->currentValue = self->value;
             else
@@ -494,7 +496,7 @@ TrigRand_generate_aa(TrigRand *self) {
         MYFLT range = ma[i] - mi[i];
         if (in[i] == 1) {
             self->timeCount = 0;
-            self->value = range * (rand()/((MYFLT)(RAND_MAX)+1)) + mi[i];
+            self->value = range * (pyorand_uniform(&self->rng)) + mi[i];
             if (self->time <= 0.0)
                 self->currentValue = self->value;
             else
@@ -666,7 +668,7 @@ TrigRand_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, TRIGRAND_ID);
+    Server_seedRandom((Server *)self->server, TRIGRAND_ID, &self->rng);
 
     self->value = self->currentValue = inittmp;
     self->timeStep = (int)(self->time * self->sr);
@@ -914,6 +916,7 @@ typedef struct {
     MYFLT stepVal;
     int timeCount;
     int modebuffer[2]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } TrigChoice;
 
 static void
@@ -924,7 +927,7 @@ TrigChoice_generate(TrigChoice *self) {
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1) {
             self->timeCount = 0;
-            self->value = self->choice[(int)((rand()/((MYFLT)(RAND_MAX))) * self->chSize)];
+            self->value = self->choice[(int)((pyorand_int(&self->rng)/((MYFLT)(PYORAND_MAX))) * self->chSize)];
             if (self->time <= 0.0)
                 self->currentValue = self->value;
             else
@@ -1068,7 +1071,7 @@ TrigChoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, TRIGCHOICE_ID);
+    Server_seedRandom((Server *)self->server, TRIGCHOICE_ID, &self->rng);
 
     self->value = self->currentValue = inittmp;
     self->timeStep = (int)(self->time * self->sr);
@@ -1268,27 +1271,12 @@ typedef struct {
 static void
 TrigFunc_generate(TrigFunc *self) {
     int i;
-    PyObject *tuple, *result;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1) {
-            if (self->arg == Py_None) {
-                result = PyObject_Call(self->func, PyTuple_New(0), NULL);
-                if (result == NULL) {
-                    PyErr_Print();
-                    return;
-                }
-            }
-            else {
-                tuple = PyTuple_New(1);
-                PyTuple_SET_ITEM(tuple, 0, self->arg);
-                result = PyObject_Call(self->func, tuple, NULL);
-                if (result == NULL) {
-                    PyErr_Print();
-                    return;
-                }
-            }
+            if (Server_callback((Server *)self->server, self->func, self->arg == Py_None ? NULL : self->arg, i) < 0)
+                return;
         }
     }
 }
@@ -1480,12 +1468,15 @@ typedef struct {
     TriggerStream *trig_stream;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     MYFLT (*interp_func_ptr)(MYFLT *, int, MYFLT, int);
+    void (*interp_block_func_ptr)(MYFLT *, int *, MYFLT *, int, MYFLT *, int);
 } TrigEnv;
 
 static void
 TrigEnv_readframes_i(TrigEnv *self) {
-    MYFLT fpart;
-    int i, ipart;
+    int i, silent = 0;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
+    int on[self->bufsize];
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
@@ -1506,26 +1497,39 @@ TrigEnv_readframes_i(TrigEnv *self) {
             }
             self->pointerPos = 0.;
         }
+        on[i] = self->active;
         if (self->active == 1) {
-            ipart = (int)self->pointerPos;
-            fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            ipos[i] = (int)self->pointerPos;
+            fpos[i] = self->pointerPos - ipos[i];
             self->pointerPos += self->inc;
         }
-        else
-            self->data[i] = 0.;
+        else {
+            ipos[i] = 0;
+            fpos[i] = 0.0;
+            silent = 1;
+        }
 
         if (self->pointerPos > size && self->active == 1) {
             self->trigsBuffer[i] = 1.0;
             self->active = 0;
         }
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
+    if (silent) {
+        for (i=0; i<self->bufsize; i++) {
+            if (on[i] == 0)
+                self->data[i] = 0.0;
+        }
+    }
 }
 
 static void
 TrigEnv_readframes_a(TrigEnv *self) {
-    MYFLT fpart, dur;
-    int i, ipart;
+    MYFLT dur;
+    int i, silent = 0;
+    int ipos[self->bufsize];
+    MYFLT fpos[self->bufsize];
+    int on[self->bufsize];
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *dur_st = Stream_getData((Stream *)self->dur_stream);
     MYFLT *tablelist = TableStream_getData(self->table);
@@ -1547,20 +1551,30 @@ TrigEnv_readframes_a(TrigEnv *self) {
             }
             self->pointerPos = 0.;
         }
+        on[i] = self->active;
         if (self->active == 1) {
-            ipart = (int)self->pointerPos;
-            fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            ipos[i] = (int)self->pointerPos;
+            fpos[i] = self->pointerPos - ipos[i];
             self->pointerPos += self->inc;
         }
-        else
-            self->data[i] = 0.;
+        else {
+            ipos[i] = 0;
+            fpos[i] = 0.0;
+            silent = 1;
+        }
 
         if (self->pointerPos > size && self->active == 1) {
             self->trigsBuffer[i] = 1.0;
             self->active = 0;
         }
     }
+    (*self->interp_block_func_ptr)(tablelist, ipos, fpos, size, self->data, self->bufsize);
+    if (silent) {
+        for (i=0; i<self->bufsize; i++) {
+            if (on[i] == 0)
+                self->data[i] = 0.0;
+        }
+    }
 }
 
 static void TrigEnv_postprocessing_ii(TrigEnv *self) { POST_PROCESSING_II };
@@ -1622,8 +1636,15 @@ TrigEnv_setProcMode(TrigEnv *self)
 static void
 TrigEnv_compute_next_data_frame(TrigEnv *self)
 {
+    int idle = self->active == 0;
+    double pos = self->pointerPos;
+
     (*self->proc_func_ptr)(self);
     (*self->muladd_func_ptr)(self);
+
+    /* Not triggered during this block, objects using the envelope as multiplier can sleep. */
+    if (idle && self->active == 0 && self->pointerPos == pos && self->modebuffer[1] == 0 && PyFloat_AS_DOUBLE(self->add) == 0)
+        Stream_setStreamSilent(self->stream, 1);
 }
 
 static int
@@ -1724,6 +1745,7 @@ TrigEnv_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     (*self->mode_func_ptr)(self);
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     return (PyObject *)self;
 }
@@ -1823,6 +1845,7 @@ TrigEnv_setInterp(TrigEnv *self, PyObject *arg)
     }
 
     SET_INTERP_POINTER
+    SET_INTERP_BLOCK_POINTER
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2780,34 +2803,35 @@ typedef struct {
     int loopLen;
     int loopStop;
     int modebuffer[4]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } TrigXnoise;
 
 // no parameter
 static MYFLT
 TrigXnoise_uniform(TrigXnoise *self) {
-    return RANDOM_UNIFORM;
+    return pyorand_uniform(&self->rng);
 }
 
 static MYFLT
 TrigXnoise_linear_min(TrigXnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a < b) return a;
     else return b;
 }
 
 static MYFLT
 TrigXnoise_linear_max(TrigXnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a > b) return a;
     else return b;
 }
 
 static MYFLT
 TrigXnoise_triangle(TrigXnoise *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     return ((a + b) * 0.5);
 }
 
@@ -2815,7 +2839,7 @@ TrigXnoise_triangle(TrigXnoise *self) {
 static MYFLT
 TrigXnoise_expon_min(TrigXnoise *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = -MYLOG(RANDOM_UNIFORM) / self->xx1;
+    MYFLT val = -MYLOG(pyorand_uniform(&self->rng)) / self->xx1;
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -2824,7 +2848,7 @@ TrigXnoise_expon_min(TrigXnoise *self) {
 static MYFLT
 TrigXnoise_expon_max(TrigXnoise *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = 1.0 - (-MYLOG(RANDOM_UNIFORM) / self->xx1);
+    MYFLT val = 1.0 - (-MYLOG(pyorand_uniform(&self->rng)) / self->xx1);
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -2835,7 +2859,7 @@ static MYFLT
 TrigXnoise_biexpon(TrigXnoise *self) {
     MYFLT polar, val;
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT sum = RANDOM_UNIFORM * 2.0;
+    MYFLT sum = pyorand_uniform(&self->rng) * 2.0;
 
     if (sum > 1.0) {
         polar = -1;
@@ -2855,11 +2879,11 @@ static MYFLT
 TrigXnoise_cauchy(TrigXnoise *self) {
     MYFLT rnd, val, dir;
     do {
-        rnd = RANDOM_UNIFORM;
+        rnd = pyorand_uniform(&self->rng);
     }
     while (rnd == 0.5);
 
-    if (rand() < (RAND_MAX / 2))
+    if (pyorand_int(&self->rng) < (PYORAND_MAX / 2))
         dir = -1;
     else
         dir = 1;
@@ -2877,7 +2901,7 @@ TrigXnoise_weibull(TrigXnoise *self) {
     MYFLT rnd, val;
     if (self->xx2 <= 0.0) self->xx2 = 0.00001;
 
-    rnd = 1.0 / (1.0 - RANDOM_UNIFORM);
+    rnd = 1.0 / (1.0 - pyorand_uniform(&self->rng));
     val = self->xx1 * MYPOW(MYLOG(rnd), (1.0 / self->xx2));
 
     if (val < 0.0) return 0.0;
@@ -2890,7 +2914,7 @@ static MYFLT
 TrigXnoise_gaussian(TrigXnoise *self) {
     MYFLT rnd, val;
 
-    rnd = (RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM);
+    rnd = (pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng));
     val = (self->xx2 * (rnd - 3.0) * 0.33 + self->xx1);
 
     if (val < 0.0) return 0.0;
@@ -2920,7 +2944,7 @@ TrigXnoise_poisson(TrigXnoise *self) {
             }
         }
     }
-    val = self->poisson_buffer[rand() % self->poisson_tab] / 12.0 * self->xx2;
+    val = self->poisson_buffer[pyorand_int(&self->rng) % self->poisson_tab] / 12.0 * self->xx2;
 
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
@@ -2935,12 +2959,12 @@ TrigXnoise_walker(TrigXnoise *self) {
     if (self->xx2 < 0.002) self->xx2 = 0.002;
 
     modulo = (int)(self->xx2 * 1000.0);
-    dir = rand() % 2;
+    dir = pyorand_int(&self->rng) % 2;
 
     if (dir == 0)
-        self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
     else
-        self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
     if (self->walkerValue > self->xx1)
         self->walkerValue = self->xx1;
@@ -2962,12 +2986,12 @@ TrigXnoise_loopseg(TrigXnoise *self) {
         if (self->xx2 < 0.002) self->xx2 = 0.002;
 
         modulo = (int)(self->xx2 * 1000.0);
-        dir = rand() % 2;
+        dir = pyorand_int(&self->rng) % 2;
 
         if (dir == 0)
-            self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
         else
-            self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
         if (self->walkerValue > self->xx1)
             self->walkerValue = self->xx1;
@@ -2980,7 +3004,7 @@ TrigXnoise_loopseg(TrigXnoise *self) {
             self->loopChoice = 0;
         else {
             self->loopChoice = 1;
-            self->loopStop = (rand() % 4) + 1;
+            self->loopStop = (pyorand_int(&self->rng) % 4) + 1;
         }
     }
     else {
@@ -2997,7 +3021,7 @@ TrigXnoise_loopseg(TrigXnoise *self) {
 
         if (self->loopTime == self->loopStop) {
             self->loopChoice = 0;
-            self->loopLen = (rand() % 10) + 3;
+            self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
         }
     }
 
@@ -3236,7 +3260,7 @@ TrigXnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    Server_generateSeed((Server *)self->server, TRIGXNOISE_ID);
+    Server_seedRandom((Server *)self->server, TRIGXNOISE_ID, &self->rng);
 
     self->poisson_tab = 0;
     self->lastPoissonX1 = -99.0;
@@ -3247,7 +3271,7 @@ TrigXnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->loop_buffer[i] = 0.0;
     }
     self->loopChoice = self->loopCountPlay = self->loopTime = self->loopCountRec = self->loopStop = 0;
-    self->loopLen = (rand() % 10) + 3;
+    self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, TrigXnoise_compute_next_data_frame);
     self->mode_func_ptr = TrigXnoise_setProcMode;
@@ -3534,6 +3558,7 @@ typedef struct {
     int loopLen;
     int loopStop;
     int modebuffer[4]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } TrigXnoiseMidi;
 
 static MYFLT
@@ -3564,29 +3589,29 @@ TrigXnoiseMidi_convert(TrigXnoiseMidi *self) {
 // no parameter
 static MYFLT
 TrigXnoiseMidi_uniform(TrigXnoiseMidi *self) {
-    return RANDOM_UNIFORM;
+    return pyorand_uniform(&self->rng);
 }
 
 static MYFLT
 TrigXnoiseMidi_linear_min(TrigXnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a < b) return a;
     else return b;
 }
 
 static MYFLT
 TrigXnoiseMidi_linear_max(TrigXnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     if (a > b) return a;
     else return b;
 }
 
 static MYFLT
 TrigXnoiseMidi_triangle(TrigXnoiseMidi *self) {
-    MYFLT a = RANDOM_UNIFORM;
-    MYFLT b = RANDOM_UNIFORM;
+    MYFLT a = pyorand_uniform(&self->rng);
+    MYFLT b = pyorand_uniform(&self->rng);
     return ((a + b) * 0.5);
 }
 
@@ -3594,7 +3619,7 @@ TrigXnoiseMidi_triangle(TrigXnoiseMidi *self) {
 static MYFLT
 TrigXnoiseMidi_expon_min(TrigXnoiseMidi *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = -MYLOG10(RANDOM_UNIFORM) / self->xx1;
+    MYFLT val = -MYLOG10(pyorand_uniform(&self->rng)) / self->xx1;
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -3603,7 +3628,7 @@ TrigXnoiseMidi_expon_min(TrigXnoiseMidi *self) {
 static MYFLT
 TrigXnoiseMidi_expon_max(TrigXnoiseMidi *self) {
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT val = 1.0 - (-MYLOG10(RANDOM_UNIFORM) / self->xx1);
+    MYFLT val = 1.0 - (-MYLOG10(pyorand_uniform(&self->rng)) / self->xx1);
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
     else return val;
@@ -3614,7 +3639,7 @@ static MYFLT
 TrigXnoiseMidi_biexpon(TrigXnoiseMidi *self) {
     MYFLT polar, val;
     if (self->xx1 <= 0.0) self->xx1 = 0.00001;
-    MYFLT sum = RANDOM_UNIFORM * 2.0;
+    MYFLT sum = pyorand_uniform(&self->rng) * 2.0;
 
     if (sum > 1.0) {
         polar = -1;
@@ -3634,11 +3659,11 @@ static MYFLT
 TrigXnoiseMidi_cauchy(TrigXnoiseMidi *self) {
     MYFLT rnd, val, dir;
     do {
-        rnd = RANDOM_UNIFORM;
+        rnd = pyorand_uniform(&self->rng);
     }
     while (rnd == 0.5);
 
-    if (rand() < (RAND_MAX / 2))
+    if (pyorand_int(&self->rng) < (PYORAND_MAX / 2))
         dir = -1;
     else
         dir = 1;
@@ -3656,7 +3681,7 @@ TrigXnoiseMidi_weibull(TrigXnoiseMidi *self) {
     MYFLT rnd, val;
     if (self->xx2 <= 0.0) self->xx2 = 0.00001;
 
-    rnd = 1.0 / (1.0 - RANDOM_UNIFORM);
+    rnd = 1.0 / (1.0 - pyorand_uniform(&self->rng));
     val = self->xx1 * MYPOW(MYLOG(rnd), (1.0 / self->xx2));
 
     if (val < 0.0) return 0.0;
@@ -3669,7 +3694,7 @@ static MYFLT
 TrigXnoiseMidi_gaussian(TrigXnoiseMidi *self) {
     MYFLT rnd, val;
 
-    rnd = (RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM + RANDOM_UNIFORM);
+    rnd = (pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng) + pyorand_uniform(&self->rng));
     val = (self->xx2 * (rnd - 3.0) * 0.33 + self->xx1);
 
     if (val < 0.0) return 0.0;
@@ -3699,7 +3724,7 @@ TrigXnoiseMidi_poisson(TrigXnoiseMidi *self) {
             }
         }
     }
-    val = self->poisson_buffer[rand() % self->poisson_tab] / 12.0 * self->xx2;
+    val = self->poisson_buffer[pyorand_int(&self->rng) % self->poisson_tab] / 12.0 * self->xx2;
 
     if (val < 0.0) return 0.0;
     else if (val > 1.0) return 1.0;
@@ -3714,12 +3739,12 @@ TrigXnoiseMidi_walker(TrigXnoiseMidi *self) {
     if (self->xx2 < 0.002) self->xx2 = 0.002;
 
     modulo = (int)(self->xx2 * 1000.0);
-    dir = rand() % 2;
+    dir = pyorand_int(&self->rng) % 2;
 
     if (dir == 0)
-        self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
     else
-        self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+        self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
     if (self->walkerValue > self->xx1)
         self->walkerValue = self->xx1;
@@ -3741,12 +3766,12 @@ TrigXnoiseMidi_loopseg(TrigXnoiseMidi *self) {
         if (self->xx2 < 0.002) self->xx2 = 0.002;
 
         modulo = (int)(self->xx2 * 1000.0);
-        dir = rand() % 2;
+        dir = pyorand_int(&self->rng) % 2;
 
         if (dir == 0)
-            self->walkerValue = self->walkerValue + (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue + (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
         else
-            self->walkerValue = self->walkerValue - (((rand() % modulo) - (modulo / 2)) * 0.001);
+            self->walkerValue = self->walkerValue - (((pyorand_int(&self->rng) % modulo) - (modulo / 2)) * 0.001);
 
         if (self->walkerValue > self->xx1)
             self->walkerValue = self->xx1;
@@ -3759,7 +3784,7 @@ TrigXnoiseMidi_loopseg(TrigXnoiseMidi *self) {
             self->loopChoice = 0;
         else {
             self->loopChoice = 1;
-            self->loopStop = (rand() % 4) + 1;
+            self->loopStop = (pyorand_int(&self->rng) % 4) + 1;
         }
     }
     else {
@@ -3776,7 +3801,7 @@ TrigXnoiseMidi_loopseg(TrigXnoiseMidi *self) {
 
         if (self->loopTime == self->loopStop) {
             self->loopChoice = 0;
-            self->loopLen = (rand() % 10) + 3;
+            self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
         }
     }
 
@@ -4024,7 +4049,7 @@ TrigXnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    Server_generateSeed((Server *)self->server, TRIGXNOISEMIDI_ID);
+    Server_seedRandom((Server *)self->server, TRIGXNOISEMIDI_ID, &self->rng);
 
     self->poisson_tab = 0;
     self->lastPoissonX1 = -99.0;
@@ -4035,7 +4060,7 @@ TrigXnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->loop_buffer[i] = 0.0;
     }
     self->loopChoice = self->loopCountPlay = self->loopTime = self->loopCountRec = self->loopStop = 0;
-    self->loopLen = (rand() % 10) + 3;
+    self->loopLen = (pyorand_int(&self->rng) % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, TrigXnoiseMidi_compute_next_data_frame);
     self->mode_func_ptr = TrigXnoiseMidi_setProcMode;
@@ -5141,6 +5166,7 @@ typedef struct {
     PyObject *percent;
     Stream *percent_stream;
     int modebuffer[3];
+    PyoRand rng;
 } Percent;
 
 static void
@@ -5152,7 +5178,7 @@ Percent_generates_i(Percent *self) {
     for (i=0; i<self->bufsize; i++) {
         self->data[i] = 0.0;
         if (in[i] == 1.0) {
-            guess = (rand()/((MYFLT)(RAND_MAX)+1)) * 100.0;
+            guess = (pyorand_uniform(&self->rng)) * 100.0;
             if (guess <= perc)
                 self->data[i] = 1.0;
         }
@@ -5169,7 +5195,7 @@ Percent_generates_a(Percent *self) {
     for (i=0; i<self->bufsize; i++) {
         self->data[i] = 0.0;
         if (in[i] == 1.0) {
-            guess = (rand()/((MYFLT)(RAND_MAX)+1)) * 100.0;
+            guess = (pyorand_uniform(&self->rng)) * 100.0;
             if (guess <= perc[i])
                 self->data[i] = 1.0;
         }
@@ -5306,7 +5332,7 @@ Percent_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, PERCENT_ID);
+    Server_seedRandom((Server *)self->server, PERCENT_ID, &self->rng);
 
     (*self->mode_func_ptr)(self);
 
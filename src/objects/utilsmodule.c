@@ -2609,9 +2609,9 @@ PyTypeObject BetweenType = {
 /* Denorm */
 /************/
 #ifndef USE_DOUBLE
-#define DENORM_RAND  ((MYFLT) ((rand()/((MYFLT)(RAND_MAX)*0.5+1) - 1.0) * (MYFLT)(1.0e-24)))
+#define DENORM_RAND  ((MYFLT) ((pyorand_int(&self->rng)/((MYFLT)(PYORAND_MAX)*0.5+1) - 1.0) * (MYFLT)(1.0e-24)))
 #else
-#define DENORM_RAND  ((MYFLT) ((rand()/((MYFLT)(RAND_MAX)*0.5+1) - 1.0) * (MYFLT)(1.0e-60)))
+#define DENORM_RAND  ((MYFLT) ((pyorand_int(&self->rng)/((MYFLT)(PYORAND_MAX)*0.5+1) - 1.0) * (MYFLT)(1.0e-60)))
 #endif
 
 typedef struct {
@@ -2619,6 +2619,7 @@ typedef struct {
     PyObject *input;
     Stream *input_stream;
     int modebuffer[2]; // need at least 2 slots for mul & add
+    PyoRand rng;
 } Denorm;
 
 static void
@@ -2745,7 +2746,7 @@ Denorm_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    Server_generateSeed((Server *)self->server, DENORM_ID);
+    Server_seedRandom((Server *)self->server, DENORM_ID, &self->rng);
 
     (*self->mode_func_ptr)(self);
 